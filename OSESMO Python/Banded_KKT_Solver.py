@@ -0,0 +1,297 @@
+## KKT Symbolic Analysis Cache
+
+# The symbolic analysis of the KKT system (the variable ordering, bandwidth, and the position of every
+# matrix entry in the banded and border blocks) depends only on the sparsity patterns of G and A.
+# Every interior-point iteration, and every month and model run with the same constraint structure,
+# reuses the same analysis. Only the numerical values are recalculated.
+
+from LRU_Cache import LRU_Cache
+
+# Maximum number of symbolic analyses stored in the cache (see LRU_Cache.py).
+KKT_Symbolic_Cache_Size = 16
+
+KKT_Symbolic_Cache = LRU_Cache(KKT_Symbolic_Cache_Size)
+
+# Rows of G or A with more nonzero entries than this (ex. monthly cycling and RTE constraints),
+# and columns with more nonzero entries than this (ex. the demand charge decision variables),
+# couple many timesteps together, and are moved out of the banded block into the border block.
+Dense_Entry_Threshold = 32
+
+# Largest bandwidth and border block size handled by this solver.
+# Larger systems are solved using Sparse_KKT_Solver instead.
+Maximum_Bandwidth = 100
+Maximum_Border_Size = 1000
+
+
+def Banded_KKT_Solver(G=None, A=None):
+
+    # Load Python Packages
+    import numpy as np
+    from cvxopt import matrix
+    from Sparse_KKT_Solver import Sparse_KKT_Solver
+
+    # scipy is used for the banded LU factorization. If it is not installed, Sparse_KKT_Solver is used instead.
+
+    try:
+        from scipy.linalg import lapack, lu_factor, lu_solve
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import reverse_cuthill_mckee
+    except ImportError:
+        return Sparse_KKT_Solver(G, A)
+
+    # This function returns a custom KKT solver for cvxopt.solvers.lp (passed using the kktsolver argument),
+    # which exploits the time structure of OSESMO linear programs.
+
+    # cvxopt.solvers.lp solves KKT systems of the form
+
+    # [ 0    A'   G'     ] [ ux ]   [ bx ]
+    # [ A    0    0      ] [ uy ] = [ by ]
+    # [ G    0    -W' * W ] [ uz ]   [ bz ]
+
+    # and returns W * uz. Inequality constraint rows with a single entry (the variable bounds added by Solve_LP)
+    # are eliminated, which adds W_jj^-2 * G_ji^2 to the diagonal entry of ux_i (as in Sparse_KKT_Solver).
+    # Every other inequality constraint row keeps its own uz_j variable. Eliminating these rows as well
+    # (forming G' * W^-1 * W^-T * G) is numerically unstable near the optimum, where W_jj ranges over many
+    # orders of magnitude (ex. when both the cycling and RTE constraints are active).
+
+    # Most constraints only involve decision variables in one or two neighbouring timesteps
+    # (ex. the state of charge constraint couples P_ES_in[t], P_ES_out[t], Ene_Lvl[t], and Ene_Lvl[t+1]),
+    # so after reordering the variables in time, this system is banded, with a small bandwidth.
+    # The few exceptions are the demand charge decision variables, which appear in the demand charge constraint
+    # for every peak timestep, and single constraints summed across the whole month (ex. cycling, RTE,
+    # and charge/discharge time constraints). These variables are moved into the border of the system:
+
+    # [ B    C ] [ u ]   [ r ]
+    # [ C'   F ] [ v ] = [ s ]
+
+    # B is factored using a banded LU factorization, and the border variables v are found using
+    # the small dense Schur complement F - C' * B^-1 * C.
+    # Each interior-point iteration costs O(n) operations, rather than a general sparse factorization.
+
+    n = G.size[1]
+    m = G.size[0]
+    p = A.size[0]
+
+    G_I = np.array(G.I, dtype = int).flatten()
+    G_J = np.array(G.J, dtype = int).flatten()
+    G_V = np.array(G.V, dtype = float).flatten()
+
+    A_I = np.array(A.I, dtype = int).flatten()
+    A_J = np.array(A.J, dtype = int).flatten()
+    A_V = np.array(A.V, dtype = float).flatten()
+
+
+    ## Symbolic Analysis
+
+    def Symbolic_Analysis():
+
+        # Eliminated, Dense, and Border Rows and Columns
+
+        G_Row_Counts = np.bincount(G_I, minlength = m)
+        A_Row_Counts = np.bincount(A_I, minlength = p)
+
+        # Rows of G with a single entry (variable bounds) are eliminated. Every other row of G has a uz variable.
+
+        Is_Eliminated_G_Row = G_Row_Counts <= 1
+        Constraint_G_Rows = np.flatnonzero(~Is_Eliminated_G_Row)
+
+        Is_Dense_G_Entry = G_Row_Counts[G_I] > Dense_Entry_Threshold
+
+        Column_Counts = np.bincount(G_J[~Is_Dense_G_Entry], minlength = n) + np.bincount(A_J, minlength = n)
+
+        # KKT system indices: ux = [0, n), uy = [n, n + p), uz = [n + p, n + p + number of non-eliminated G rows).
+
+        Number_of_KKT_Indices = n + p + len(Constraint_G_Rows)
+
+        Is_Border = np.zeros((Number_of_KKT_Indices,), dtype = bool)
+        Is_Border[0:n] = Column_Counts > Dense_Entry_Threshold
+        Is_Border[n:(n + p)] = A_Row_Counts > Dense_Entry_Threshold
+        Is_Border[(n + p):] = G_Row_Counts[Constraint_G_Rows] > Dense_Entry_Threshold
+
+        Constraint_Row_Index = np.full((m,), -1, dtype = int)
+        Constraint_Row_Index[Constraint_G_Rows] = np.arange(0, len(Constraint_G_Rows))
+
+        # KKT Matrix Entries
+        # Each eliminated row r of G contributes G_ri^2 * W_rr^-2 to diagonal entry (i, i).
+
+        Eliminated_Entries = np.flatnonzero(Is_Eliminated_G_Row[G_I])
+
+        Constraint_Entries = np.flatnonzero(~Is_Eliminated_G_Row[G_I])
+        Constraint_Entry_KKT_Rows = n + p + Constraint_Row_Index[G_I[Constraint_Entries]]
+
+        # Entries are listed in this order: eliminated G rows, A and A', the other G rows and their transpose,
+        # and the diagonal of the uz variables.
+
+        Entry_Rows = np.concatenate((G_J[Eliminated_Entries], n + A_I, A_J, Constraint_Entry_KKT_Rows, G_J[Constraint_Entries],
+                                     n + p + np.arange(0, len(Constraint_G_Rows))))
+        Entry_Cols = np.concatenate((G_J[Eliminated_Entries], A_J, n + A_I, G_J[Constraint_Entries], Constraint_Entry_KKT_Rows,
+                                     n + p + np.arange(0, len(Constraint_G_Rows))))
+
+        # Ordering of the Banded Block
+        # The reverse Cuthill-McKee ordering gives a small bandwidth for chains of timesteps.
+
+        Band_Indices = np.flatnonzero(~Is_Border)
+        Border_Indices = np.flatnonzero(Is_Border)
+
+        Band_Position = np.full((Number_of_KKT_Indices,), -1, dtype = int)
+        Band_Position[Band_Indices] = np.arange(0, len(Band_Indices))
+
+        Border_Position = np.full((Number_of_KKT_Indices,), -1, dtype = int)
+        Border_Position[Border_Indices] = np.arange(0, len(Border_Indices))
+
+        Is_Band_Entry = ~Is_Border[Entry_Rows] & ~Is_Border[Entry_Cols]
+
+        Band_Pattern = csr_matrix((np.ones((np.count_nonzero(Is_Band_Entry),)),
+                                   (Band_Position[Entry_Rows[Is_Band_Entry]], Band_Position[Entry_Cols[Is_Band_Entry]])),
+                                  shape = (len(Band_Indices), len(Band_Indices)))
+
+        Band_Order = np.asarray(reverse_cuthill_mckee(Band_Pattern, symmetric_mode = True), dtype = int)
+        Band_Indices = Band_Indices[Band_Order]
+        Band_Position[Band_Indices] = np.arange(0, len(Band_Indices))
+
+        Band_Rows = Band_Position[Entry_Rows[Is_Band_Entry]]
+        Band_Cols = Band_Position[Entry_Cols[Is_Band_Entry]]
+
+        Bandwidth = int(np.max(np.abs(Band_Rows - Band_Cols))) if len(Band_Rows) > 0 else 0
+
+        # Positions in the LAPACK banded storage used by dgbtrf, with Bandwidth extra rows for fill-in from pivoting.
+        # Entry (i, j) is stored in row (2 * Bandwidth + i - j) of column j.
+
+        Band_Storage_Positions = (2 * Bandwidth + Band_Rows - Band_Cols) * len(Band_Indices) + Band_Cols
+
+        # Border Block Positions
+        # Only the lower-left coupling block C (banded rows, border columns) is stored, because the system is symmetric.
+
+        Is_Coupling_Entry = ~Is_Border[Entry_Rows] & Is_Border[Entry_Cols]
+        Is_Border_Entry = Is_Border[Entry_Rows] & Is_Border[Entry_Cols]
+
+        Coupling_Positions = Band_Position[Entry_Rows[Is_Coupling_Entry]] * len(Border_Indices) + \
+                             Border_Position[Entry_Cols[Is_Coupling_Entry]]
+
+        Border_Block_Positions = Border_Position[Entry_Rows[Is_Border_Entry]] * len(Border_Indices) + \
+                                 Border_Position[Entry_Cols[Is_Border_Entry]]
+
+        return {"Number_of_KKT_Indices": Number_of_KKT_Indices, "Constraint_G_Rows": Constraint_G_Rows,
+                "Eliminated_Entries": Eliminated_Entries, "Constraint_Entries": Constraint_Entries,
+                "Band_Indices": Band_Indices, "Border_Indices": Border_Indices, "Bandwidth": Bandwidth,
+                "Is_Band_Entry": Is_Band_Entry, "Band_Storage_Positions": Band_Storage_Positions,
+                "Is_Coupling_Entry": Is_Coupling_Entry, "Coupling_Positions": Coupling_Positions,
+                "Is_Border_Entry": Is_Border_Entry, "Border_Block_Positions": Border_Block_Positions}
+
+
+    ## Retrieve or Calculate Symbolic Analysis
+
+    Symbolic_Key = (n, m, p, G_I.tobytes(), G_J.tobytes(), A_I.tobytes(), A_J.tobytes())
+
+    Symbolic = KKT_Symbolic_Cache.Get(Symbolic_Key)
+
+    if Symbolic is None:
+
+        Symbolic = Symbolic_Analysis()
+
+        KKT_Symbolic_Cache.Save(Symbolic_Key, Symbolic)
+
+    Band_Indices = Symbolic["Band_Indices"]
+    Border_Indices = Symbolic["Border_Indices"]
+    Bandwidth = Symbolic["Bandwidth"]
+    Constraint_G_Rows = Symbolic["Constraint_G_Rows"]
+
+    if Bandwidth > Maximum_Bandwidth or len(Border_Indices) > Maximum_Border_Size:
+        return Sparse_KKT_Solver(G, A)
+
+    Band_Size = len(Band_Indices)
+    Border_Size = len(Border_Indices)
+
+
+    ## Constant Entry Values
+
+    # Squares of the eliminated G entries, and the values of A and the other G rows, only change between solves.
+
+    Eliminated_Squares = G_V[Symbolic["Eliminated_Entries"]] ** 2
+    Eliminated_Rows = G_I[Symbolic["Eliminated_Entries"]]
+
+    Constant_Values = np.concatenate((A_V, A_V, G_V[Symbolic["Constraint_Entries"]], G_V[Symbolic["Constraint_Entries"]]))
+
+    G_CSR = csr_matrix((G_V, (G_I, G_J)), shape = (m, n))
+
+    Eliminated_G_CSR_Transpose = csr_matrix((G_V[Symbolic["Eliminated_Entries"]],
+                                             (G_J[Symbolic["Eliminated_Entries"]], Eliminated_Rows)), shape = (n, m))
+
+
+    def kktsolver(W):
+
+        di = np.array(W['di']).flatten()
+        di_Squared = di ** 2
+
+        # KKT Matrix Values
+
+        Entry_Values = np.concatenate((Eliminated_Squares * di_Squared[Eliminated_Rows], Constant_Values,
+                                       -1 / di_Squared[Constraint_G_Rows]))
+
+        # Banded LU Factorization
+
+        Band_Storage = np.bincount(Symbolic["Band_Storage_Positions"], weights = Entry_Values[Symbolic["Is_Band_Entry"]],
+                                   minlength = (3 * Bandwidth + 1) * Band_Size).reshape((3 * Bandwidth + 1, Band_Size))
+
+        Band_LU, Band_Pivots, Info = lapack.dgbtrf(Band_Storage, Bandwidth, Bandwidth, overwrite_ab = True)
+
+        if Info != 0:
+            raise ArithmeticError("singular KKT matrix")
+
+        # Schur Complement of the Border Block
+
+        if Border_Size > 0:
+
+            Coupling_Block = np.bincount(Symbolic["Coupling_Positions"], weights = Entry_Values[Symbolic["Is_Coupling_Entry"]],
+                                         minlength = Band_Size * Border_Size).reshape((Band_Size, Border_Size))
+
+            Border_Block = np.bincount(Symbolic["Border_Block_Positions"], weights = Entry_Values[Symbolic["Is_Border_Entry"]],
+                                       minlength = Border_Size * Border_Size).reshape((Border_Size, Border_Size))
+
+            Band_Solved_Coupling, Info = lapack.dgbtrs(Band_LU, Bandwidth, Bandwidth, Coupling_Block, Band_Pivots)
+
+            if Info != 0:
+                raise ArithmeticError("banded KKT solve failed")
+
+            Schur_LU = lu_factor(Border_Block - np.dot(Coupling_Block.T, Band_Solved_Coupling))
+
+        def f(x, y, z):
+
+            bz = np.array(z).flatten()
+
+            KKT_RHS = np.zeros((Symbolic["Number_of_KKT_Indices"],))
+            KKT_RHS[0:n] = np.array(x).flatten() + Eliminated_G_CSR_Transpose.dot(di_Squared * bz)
+            KKT_RHS[n:(n + p)] = np.array(y).flatten()
+            KKT_RHS[(n + p):] = bz[Constraint_G_Rows]
+
+            KKT_Solution = np.zeros((Symbolic["Number_of_KKT_Indices"],))
+
+            Band_Solution, Info = lapack.dgbtrs(Band_LU, Bandwidth, Bandwidth, KKT_RHS[Band_Indices], Band_Pivots)
+
+            if Info != 0:
+                raise ArithmeticError("banded KKT solve failed")
+
+            if Border_Size > 0:
+
+                Border_Solution = lu_solve(Schur_LU, KKT_RHS[Border_Indices] - np.dot(Coupling_Block.T, Band_Solution))
+
+                Band_Solution = Band_Solution - np.dot(Band_Solved_Coupling, Border_Solution)
+
+                KKT_Solution[Border_Indices] = Border_Solution
+
+            KKT_Solution[Band_Indices] = Band_Solution
+
+            ux = KKT_Solution[0:n]
+
+            # W * uz, where uz = W^-1 * W^-T * (G * ux - bz) for the eliminated rows.
+
+            W_uz = di * (G_CSR.dot(ux) - bz)
+            W_uz[Constraint_G_Rows] = KKT_Solution[(n + p):] / di[Constraint_G_Rows]
+
+            x[:] = matrix(ux, tc = 'd')
+            y[:] = matrix(KKT_Solution[n:(n + p)], tc = 'd')
+            z[:] = matrix(W_uz, tc = 'd')
+
+        return f
+
+    return kktsolver
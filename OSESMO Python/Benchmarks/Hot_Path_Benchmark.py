@@ -0,0 +1,341 @@
+## Script Description Header
+
+# File Name: Hot_Path_Benchmark.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Benchmarks"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Times data import, constraint assembly, linear program solves, bill calculation, and data export
+# for a fixed set of sample scenarios and linear program horizons, and appends the results to a benchmark history file.
+# The benchmark fails if any timing is much slower than recent runs on the same machine.
+
+import os
+import sys
+import io
+import json
+import time
+import platform
+import tempfile
+import contextlib
+import subprocess
+import datetime as dt
+import importlib.metadata
+import numpy as np
+
+
+## Set Directories
+
+OSESMO_Git_Repo_Directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+Input_Output_Data_Directory_Location = os.path.join(os.path.dirname(OSESMO_Git_Repo_Directory), "Sample Input and Output Data")
+
+sys.path.insert(0, OSESMO_Git_Repo_Directory)
+
+import pandas  # Imported before timing data export, as in a model run that exports data.
+import Banded_KKT_Solver
+import Build_Month_LP_Constraints
+import Build_Tariff_Vectors
+import Calculate_Without_Storage_Results
+import Import_Resampled_Vector_Data
+import Solve_LP
+import Solve_Month_LP
+from OSESMO import OSESMO
+from Build_Annual_LP_Constraints import Build_Annual_LP_Constraints
+from Calculate_Bills import Calculate_Bills
+from Export_Model_Data import Export_Model_Data
+from Import_Retail_Rate_Data import Import_Retail_Rate_Data
+from Preload_Scenario_Data import Preload_Scenario_Data
+
+
+## Benchmark Settings
+
+Solver_Backend = "cvxopt"
+
+# Constraint assembly and bill calculation for each horizon are timed this many times, and the fastest time is recorded.
+# Linear program solves for each horizon are timed Number_of_Solve_Trials times, because multi-year solves are slow.
+Number_of_Trials = 3
+Number_of_Solve_Trials = 1
+
+# Benchmark history file. Each benchmark run is appended as one line of JSON.
+Benchmark_History_Filepath = os.environ.get("OSESMO_BENCHMARK_HISTORY",
+                                            os.path.join(os.path.dirname(os.path.abspath(__file__)), "Benchmark_History.jsonl"))
+
+# A timing is a regression if it is longer than Regression_Tolerance times the median of the same timing
+# in the last Number_of_History_Runs benchmark runs on the same machine, plus Regression_Minimum_Seconds.
+Number_of_History_Runs = 5
+Regression_Tolerance = 1.5
+Regression_Minimum_Seconds = 0.05
+
+
+## Benchmark Scenarios
+
+# Sample scenario from Model_Input_Single_Run.py. Every other scenario changes one input,
+# so that each model type, timestep resolution, GHG reduction solution, and storage control algorithm is covered.
+# Scenarios whose input data is not available are skipped.
+
+Base_Scenario_Inputs = dict(Modeling_Team_Input = "Benchmark", Model_Run_Number_Input = 1, Model_Type_Input = "Solar Plus Storage",
+                            Model_Timestep_Resolution = 15, Customer_Class_Input = "Commercial and Industrial",
+                            Load_Profile_Name_Input = "EnerNOC GreenButton San Francisco Office",
+                            Retail_Rate_Name_Input = "PG&E E-19S (OLD)", Solar_Profile_Name_Input = "CSI PG&E Commercial & Industrial",
+                            Solar_Size_Input = 256, Storage_Type_Input = "Lithium-Ion Battery",
+                            Storage_Power_Rating_Input = 250, Usable_Storage_Capacity_Input = 500,
+                            Single_Cycle_RTE_Input = 0.85, Parasitic_Storage_Load_Input = 0.003,
+                            Storage_Control_Algorithm_Name = "OSESMO Economic Dispatch",
+                            GHG_Reduction_Solution_Input = "GHG Signal Co-Optimization",
+                            Equivalent_Cycling_Constraint_Input = 0, Annual_RTE_Constraint_Input = 0, ITC_Constraint_Input = 1,
+                            Carbon_Adder_Incentive_Value_Input = 15, Emissions_Forecast_Signal_Input = "NP15 RT5M",
+                            OSESMO_Git_Repo_Directory = OSESMO_Git_Repo_Directory,
+                            Input_Output_Data_Directory_Location = Input_Output_Data_Directory_Location,
+                            Start_Time_Input = dt.datetime(2017, 1, 1, 0, 0),
+                            Show_Plots = 0, Export_Plots = 0, Export_Data = 0,
+                            Solar_Installed_Cost_per_kW = 3000, Storage_Installed_Cost_per_kWh = 681.5,
+                            Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh = 100,
+                            Cycle_Life = 10 * 365.25, Storage_Depth_of_Discharge = 0.8, Initial_Final_SOC = 0.3,
+                            End_of_Month_Padding_Days = 3, Solver_Backend = Solver_Backend)
+
+Benchmark_Scenarios = [("Solar Plus Storage, 15-Minute", {}),
+                       ("Storage Only, 15-Minute", {"Model_Type_Input": "Storage Only"}),
+                       ("Solar Plus Storage, 5-Minute", {"Model_Timestep_Resolution": 5}),
+                       ("No GHG Reduction Solution", {"GHG_Reduction_Solution_Input": "No GHG Reduction Solution"}),
+                       ("No-Charging Time Constraint", {"GHG_Reduction_Solution_Input": "No-Charging Time Constraint"}),
+                       ("Charging and Discharging Time Constraints",
+                        {"GHG_Reduction_Solution_Input": "Charging and Discharging Time Constraints"}),
+                       ("IOU-Proposed Charge-Discharge Time Constraints",
+                        {"GHG_Reduction_Solution_Input": "IOU-Proposed Charge-Discharge Time Constraints"}),
+                       ("Non-Economic Solar Self-Supply", {"Storage_Control_Algorithm_Name": "OSESMO Non-Economic Solar Self-Supply"})]
+
+# Linear program horizons, in months. Horizons longer than one month are solved as a single linear program
+# (as in the "Annual" month solve mode), and horizons longer than one year repeat the sample year.
+Linear_Program_Horizons = [("One Month", 1), ("One Year", 12), ("Two Years", 24)]
+
+
+## Benchmark Functions
+
+# In-memory input data, tariff, without-storage results, constraint template, KKT solver, and warm start caches
+# are cleared before each timed model run, so that every scenario is timed the same way regardless of the order
+# they run in. The binary input data cache on disk is filled before the benchmark starts, as in a scenario sweep.
+
+def Clear_Model_Caches():
+    Import_Resampled_Vector_Data.Resampled_Vector_Cache.Clear()
+    Build_Tariff_Vectors.Tariff_Vector_Cache.Clear()
+    Calculate_Without_Storage_Results.Without_Storage_Results_Cache.Clear()
+    Build_Month_LP_Constraints.LP_Template_Cache.Clear()
+    Banded_KKT_Solver.KKT_Symbolic_Cache.Clear()
+    Solve_LP.LP_Warm_Start_Cache.Clear()
+
+def Fastest_Time(Benchmark_Function, Number_of_Trials = Number_of_Trials):
+    Trial_Times = []
+    for Trial in range(Number_of_Trials):
+        Trial_Start_Time = time.perf_counter()
+        Benchmark_Function()
+        Trial_Times.append(time.perf_counter() - Trial_Start_Time)
+    return min(Trial_Times)
+
+Benchmark_Results = []
+
+def Record_Benchmark_Result(Benchmark_Name, Measurement_Name, Seconds):
+    Benchmark_Results.append({"Benchmark": Benchmark_Name, "Measurement": Measurement_Name, "Seconds": Seconds})
+    print("  %-55s %-22s %8.3f s" % (Benchmark_Name, Measurement_Name, Seconds))
+
+
+## Preload Input Data
+
+Preload_Scenario_Data([dict(Base_Scenario_Inputs, **Scenario_Changes) for Scenario_Name, Scenario_Changes in Benchmark_Scenarios])
+
+
+## Run Model Run Benchmarks
+
+# Monthly linear programs of the base scenario without padding days are recorded for the horizon benchmarks.
+
+Solve_Month_LP_Function = Solve_Month_LP.Solve_Month_LP
+Recorded_Month_LPs = []
+
+def Recorded_Solve_Month_LP(Month_Builder_Inputs, c_Month, *args, **kwargs):
+    Recorded_Month_LPs.append((Month_Builder_Inputs, c_Month))
+    return Solve_Month_LP_Function(Month_Builder_Inputs, c_Month, *args, **kwargs)
+
+Skipped_Scenarios = {}
+
+print("Model runs (" + Solver_Backend + "):")
+
+for Scenario_Name, Scenario_Changes in Benchmark_Scenarios:
+
+    Clear_Model_Caches()
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            OSESMO_Results = OSESMO(**dict(Base_Scenario_Inputs, **Scenario_Changes))
+    except (OSError, KeyError) as Scenario_Error:
+        Skipped_Scenarios[Scenario_Name] = repr(Scenario_Error)
+        print("  %-55s skipped, input data not available: %r" % (Scenario_Name, Scenario_Error))
+        continue
+
+    Phase_Times = OSESMO_Results["Model_Run_Metrics"]["Phase_Times_Seconds"]
+    Solver_Statistics = OSESMO_Results["Solver_Statistics"]
+
+    with tempfile.TemporaryDirectory() as Export_Directory:
+        Export_Start_Time = time.perf_counter()
+        Export_Model_Data(dict(OSESMO_Results, Output_Directory_Filepath = Export_Directory))
+        Export_Time = time.perf_counter() - Export_Start_Time
+
+    Record_Benchmark_Result(Scenario_Name, "Data Import", sum(Phase_Time for Phase_Name, Phase_Time in Phase_Times.items()
+                                                              if Phase_Name.startswith("Import ")))
+    Record_Benchmark_Result(Scenario_Name, "Constraint Assembly", sum(Month_Statistics["Build_Time_Seconds"] for Month_Statistics in Solver_Statistics))
+    Record_Benchmark_Result(Scenario_Name, "Linear Program Solve", sum(Month_Statistics["Solve_Time_Seconds"] for Month_Statistics in Solver_Statistics))
+    Record_Benchmark_Result(Scenario_Name, "Bill Calculation", Phase_Times["Calculate Results without Storage"] +
+                                                               Phase_Times["Calculate Bills with Storage"])
+    Record_Benchmark_Result(Scenario_Name, "Data Export", Export_Time)
+    Record_Benchmark_Result(Scenario_Name, "Model Run Total", OSESMO_Results["Model_Run_Metrics"]["Total_Time_Seconds"] + Export_Time)
+
+Solve_Month_LP.Solve_Month_LP = Recorded_Solve_Month_LP
+
+with contextlib.redirect_stdout(io.StringIO()):
+    OSESMO_Results = OSESMO(**dict(Base_Scenario_Inputs, End_of_Month_Padding_Days = 0))
+
+Solve_Month_LP.Solve_Month_LP = Solve_Month_LP_Function
+
+
+## Run Linear Program Horizon Benchmarks
+
+print("Linear program horizons (" + Solver_Backend + "):")
+
+for Horizon_Name, Number_of_Months in Linear_Program_Horizons:
+
+    Horizon_Month_LPs = [Recorded_Month_LPs[Month_Index % 12] for Month_Index in range(Number_of_Months)]
+
+    Horizon_Builder_Inputs = [Month_Builder_Inputs for Month_Builder_Inputs, c_Month in Horizon_Month_LPs]
+    Horizon_c = np.concatenate([c_Month for Month_Builder_Inputs, c_Month in Horizon_Month_LPs])
+
+    def Build_Horizon_LP():
+        if Number_of_Months == 1:
+            return Build_Month_LP_Constraints.Build_Month_LP_Constraints(**Horizon_Builder_Inputs[0])
+        else:
+            return Build_Annual_LP_Constraints(Month_Builder_Inputs = Horizon_Builder_Inputs,
+                                               Initial_Energy_Level = Horizon_Builder_Inputs[0]["Initial_Energy_Level"],
+                                               Usable_Storage_Capacity = Horizon_Builder_Inputs[0]["Usable_Storage_Capacity"])
+
+    # The constraint template of each month is cached after the first build, so constraint assembly is timed
+    # as in later model runs of a scenario sweep.
+
+    Clear_Model_Caches()
+
+    Horizon_LP = Build_Horizon_LP()
+
+    Record_Benchmark_Result(Horizon_Name, "Constraint Assembly", Fastest_Time(Build_Horizon_LP))
+
+    # Each trial starts without a cached KKT solver structure or warm start.
+
+    def Solve_Horizon_LP():
+        Banded_KKT_Solver.KKT_Symbolic_Cache.Clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            Solve_LP.Solve_LP(Horizon_c, *Horizon_LP, Solver_Backend = Solver_Backend)
+
+    Record_Benchmark_Result(Horizon_Name, "Linear Program Solve", Fastest_Time(Solve_Horizon_LP, Number_of_Solve_Trials))
+
+
+## Run Bill Calculation Benchmarks
+
+# Net load profiles with solar and storage from the base scenario are billed for each horizon.
+# Horizons longer than one year repeat the sample year, and are billed as if each month of the year were one billing period.
+
+print("Bill calculation:")
+
+Net_Load_Profile_Data = OSESMO_Results["Time_Series"]["Net_Load"]
+
+[Retail_Rate_Master_Index, Retail_Rate_Effective_Date,
+ Volumetric_Rate_Data, Summer_Peak_DC, Summer_Part_Peak_DC, Summer_Noncoincident_DC,
+ Winter_Peak_DC, Winter_Part_Peak_DC, Winter_Noncoincident_DC,
+ Fixed_Per_Meter_Day_Charge, Fixed_Per_Meter_Month_Charge,
+ First_Summer_Month, Last_Summer_Month, Month_Data,
+ Summer_Peak_Binary_Data, Summer_Part_Peak_Binary_Data,
+ Winter_Peak_Binary_Data, Winter_Part_Peak_Binary_Data] = Import_Retail_Rate_Data(
+    Input_Output_Data_Directory_Location, OSESMO_Git_Repo_Directory,
+    Base_Scenario_Inputs["Model_Timestep_Resolution"] / 60, Base_Scenario_Inputs["Retail_Rate_Name_Input"],
+    Base_Scenario_Inputs["Start_Time_Input"])
+
+Month_Data = Month_Data.astype(int)
+
+for Horizon_Name, Number_of_Months in Linear_Program_Horizons:
+
+    # Timesteps in the horizon, from the start of the year.
+    Horizon_Timesteps = np.flatnonzero(Month_Data <= Number_of_Months) if Number_of_Months < 12 else \
+        np.tile(np.arange(len(Month_Data)), Number_of_Months // 12)
+
+    def Calculate_Horizon_Bills():
+        Calculate_Bills(Net_Load_Profile_Data[Horizon_Timesteps], Base_Scenario_Inputs["Model_Timestep_Resolution"] / 60,
+                        Month_Data[Horizon_Timesteps], Volumetric_Rate_Data[Horizon_Timesteps],
+                        Summer_Peak_DC, Summer_Part_Peak_DC, Summer_Noncoincident_DC,
+                        Winter_Peak_DC, Winter_Part_Peak_DC, Winter_Noncoincident_DC,
+                        Fixed_Per_Meter_Day_Charge, Fixed_Per_Meter_Month_Charge,
+                        First_Summer_Month, Last_Summer_Month,
+                        Summer_Peak_Binary_Data[Horizon_Timesteps], Summer_Part_Peak_Binary_Data[Horizon_Timesteps],
+                        Winter_Peak_Binary_Data[Horizon_Timesteps], Winter_Part_Peak_Binary_Data[Horizon_Timesteps])
+
+    Record_Benchmark_Result(Horizon_Name, "Bill Calculation", Fastest_Time(Calculate_Horizon_Bills))
+
+
+## Check for Regressions
+
+# Benchmark runs are compared with earlier runs on the same machine, with the same solver backend.
+
+def Package_Version(Package_Name):
+    try:
+        return importlib.metadata.version(Package_Name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+Benchmark_Machine = {"Platform": platform.platform(), "Processor": platform.processor() or platform.machine(),
+                     "CPU_Count": os.cpu_count(), "Hostname": platform.node()}
+
+Package_Versions = {Package_Name: Package_Version(Package_Name) for Package_Name in ["numpy", "scipy", "cvxopt", "highspy"]}
+Package_Versions["python"] = platform.python_version()
+
+try:
+    Git_Commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd = OSESMO_Git_Repo_Directory, check = True,
+                                capture_output = True, text = True).stdout.strip()
+except (OSError, subprocess.CalledProcessError):
+    Git_Commit = None
+
+History_Runs = []
+
+if os.path.isfile(Benchmark_History_Filepath):
+    with open(Benchmark_History_Filepath) as Benchmark_History_File:
+        for History_Line in Benchmark_History_File:
+            if History_Line.strip() != "":
+                History_Run = json.loads(History_Line)
+                if History_Run["Machine"] == Benchmark_Machine and History_Run["Solver_Backend"] == Solver_Backend:
+                    History_Runs.append(History_Run)
+
+History_Runs = History_Runs[-Number_of_History_Runs:]
+
+Benchmark_Failures = []
+
+for Benchmark_Result in Benchmark_Results:
+
+    History_Times = [History_Result["Seconds"] for History_Run in History_Runs for History_Result in History_Run["Results"]
+                     if History_Result["Benchmark"] == Benchmark_Result["Benchmark"] and
+                     History_Result["Measurement"] == Benchmark_Result["Measurement"]]
+
+    if len(History_Times) > 0:
+
+        Median_History_Time = float(np.median(History_Times))
+
+        if Benchmark_Result["Seconds"] > Regression_Tolerance * Median_History_Time + Regression_Minimum_Seconds:
+            Benchmark_Failures.append("%s, %s took %0.3f s (median of last %d runs: %0.3f s)." %
+                                      (Benchmark_Result["Benchmark"], Benchmark_Result["Measurement"],
+                                       Benchmark_Result["Seconds"], len(History_Times), Median_History_Time))
+
+if len(History_Runs) == 0:
+    print("No earlier benchmark runs on this machine in " + Benchmark_History_Filepath + ".")
+
+
+## Save Benchmark History
+
+with open(Benchmark_History_Filepath, "a") as Benchmark_History_File:
+    Benchmark_History_File.write(json.dumps({"Benchmark_Date_Time": dt.datetime.now().replace(microsecond = 0).isoformat(),
+                                             "Git_Commit": Git_Commit, "Machine": Benchmark_Machine,
+                                             "Package_Versions": Package_Versions, "Solver_Backend": Solver_Backend,
+                                             "Skipped_Scenarios": Skipped_Scenarios, "Results": Benchmark_Results}) + "\n")
+
+for Benchmark_Failure in Benchmark_Failures:
+    print("FAILED: " + Benchmark_Failure)
+
+if len(Benchmark_Failures) > 0:
+    sys.exit(1)
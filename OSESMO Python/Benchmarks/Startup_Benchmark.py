@@ -0,0 +1,78 @@
+## Script Description Header
+
+# File Name: Startup_Benchmark.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Benchmarks"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Measures the time taken to import OSESMO in a new Python interpreter,
+# as in each scenario sweep worker process, and checks that plotting and data export packages are not imported.
+
+import os
+import sys
+import json
+import subprocess
+
+
+## Set Directories
+
+OSESMO_Git_Repo_Directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+## Benchmark Settings
+
+Number_of_Trials = 10
+
+# Packages that OSESMO should only import when a model run needs them.
+Deferred_Packages = ["matplotlib", "pandas"]
+
+# The benchmark fails if the median import time is longer than this (in seconds).
+# Importing OSESMO with matplotlib and pandas took roughly 1 second on a laptop.
+Maximum_Median_Import_Time = 0.5
+
+Import_Script = """
+import json, sys, time
+sys.path.insert(0, %r)
+Import_Start_Time = time.perf_counter()
+import OSESMO
+Import_Time = time.perf_counter() - Import_Start_Time
+print(json.dumps({"Import_Time": Import_Time,
+                  "Deferred_Packages_Imported": [Package for Package in %r if Package in sys.modules]}))
+""" % (OSESMO_Git_Repo_Directory, Deferred_Packages)
+
+
+## Run Benchmark
+
+Import_Times = []
+Deferred_Packages_Imported = set()
+
+for Trial in range(Number_of_Trials):
+
+    Trial_Output = subprocess.run([sys.executable, "-c", Import_Script], check = True,
+                                  capture_output = True, text = True).stdout
+
+    Trial_Result = json.loads(Trial_Output.strip().split("\n")[-1])
+
+    Import_Times.append(Trial_Result["Import_Time"])
+    Deferred_Packages_Imported.update(Trial_Result["Deferred_Packages_Imported"])
+
+Import_Times.sort()
+Median_Import_Time = Import_Times[len(Import_Times) // 2]
+
+print("import OSESMO: median %0.3f s, minimum %0.3f s, maximum %0.3f s over %d trials" %
+      (Median_Import_Time, Import_Times[0], Import_Times[-1], Number_of_Trials))
+
+
+## Check Results
+
+Benchmark_Failures = []
+
+if len(Deferred_Packages_Imported) > 0:
+    Benchmark_Failures.append("import OSESMO also imports " + ", ".join(sorted(Deferred_Packages_Imported)) + ".")
+
+if Median_Import_Time > Maximum_Median_Import_Time:
+    Benchmark_Failures.append("Median import time is longer than %0.2f s." % Maximum_Median_Import_Time)
+
+for Benchmark_Failure in Benchmark_Failures:
+    print("FAILED: " + Benchmark_Failure)
+
+if len(Benchmark_Failures) > 0:
+    sys.exit(1)
@@ -0,0 +1,101 @@
+## Script Description Header
+
+# File Name: Warm_Start_Benchmark.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Benchmarks"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Compares solver iterations and solve times for cold-started and warm-started
+# monthly linear programs, using the sample input data.
+
+import os
+import sys
+import io
+import time
+import contextlib
+import datetime as dt
+
+
+## Set Directories
+
+OSESMO_Git_Repo_Directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+Input_Output_Data_Directory_Location = os.path.join(os.path.dirname(OSESMO_Git_Repo_Directory), "Sample Input and Output Data")
+
+sys.path.insert(0, OSESMO_Git_Repo_Directory)
+
+import Solve_LP
+from OSESMO import OSESMO
+
+
+## Benchmark Scenario
+
+# Sample scenario from Model_Input_Single_Run.py. The neighbouring scenario has a 4% larger storage power rating.
+
+Scenario_Inputs = dict(Modeling_Team_Input = "Benchmark", Model_Run_Number_Input = 1, Model_Type_Input = "Solar Plus Storage",
+                       Model_Timestep_Resolution = 15, Customer_Class_Input = "Commercial and Industrial",
+                       Load_Profile_Name_Input = "EnerNOC GreenButton San Francisco Office",
+                       Retail_Rate_Name_Input = "PG&E E-19S (OLD)", Solar_Profile_Name_Input = "CSI PG&E Commercial & Industrial",
+                       Solar_Size_Input = 256, Storage_Type_Input = "Lithium-Ion Battery",
+                       Storage_Power_Rating_Input = 250, Usable_Storage_Capacity_Input = 500,
+                       Single_Cycle_RTE_Input = 0.85, Parasitic_Storage_Load_Input = 0.003,
+                       Storage_Control_Algorithm_Name = "OSESMO Economic Dispatch",
+                       GHG_Reduction_Solution_Input = "GHG Signal Co-Optimization",
+                       Equivalent_Cycling_Constraint_Input = 0, Annual_RTE_Constraint_Input = 0, ITC_Constraint_Input = 1,
+                       Carbon_Adder_Incentive_Value_Input = 15, Emissions_Forecast_Signal_Input = "NP15 RT5M",
+                       OSESMO_Git_Repo_Directory = OSESMO_Git_Repo_Directory,
+                       Input_Output_Data_Directory_Location = Input_Output_Data_Directory_Location,
+                       Start_Time_Input = dt.datetime(2017, 1, 1, 0, 0),
+                       Show_Plots = 0, Export_Plots = 0, Export_Data = 0,
+                       Solar_Installed_Cost_per_kW = 3000, Storage_Installed_Cost_per_kWh = 681.5,
+                       Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh = 100,
+                       Cycle_Life = 10 * 365.25, Storage_Depth_of_Discharge = 0.8, Initial_Final_SOC = 0.3,
+                       End_of_Month_Padding_Days = 3)
+
+Neighbouring_Storage_Power_Rating = 260
+
+
+## Record Solver Iterations
+
+# OSESMO imports Solve_LP when it is run, so replacing the module's function records every monthly solve.
+
+Solve_LP_Function = Solve_LP.Solve_LP
+Solver_Statistics = []
+
+def Recorded_Solve_LP(*args, **kwargs):
+    Solve_Start_Time = time.perf_counter()
+    LP_Solution = Solve_LP_Function(*args, **kwargs)
+    Solver_Statistics.append((LP_Solution["iterations"], time.perf_counter() - Solve_Start_Time))
+    return LP_Solution
+
+Solve_LP.Solve_LP = Recorded_Solve_LP
+
+def Run_Scenario(Solver_Backend, LP_Warm_Start_Input, Storage_Power_Rating_Input):
+    del Solver_Statistics[:]
+    with contextlib.redirect_stdout(io.StringIO()):
+        OSESMO(**dict(Scenario_Inputs, Storage_Power_Rating_Input = Storage_Power_Rating_Input,
+                      Solver_Backend = Solver_Backend, LP_Warm_Start_Input = LP_Warm_Start_Input))
+    return [Iterations for Iterations, Solve_Time in Solver_Statistics], sum(Solve_Time for Iterations, Solve_Time in Solver_Statistics)
+
+
+## Run Benchmark
+
+for Solver_Backend in ["cvxopt", "HiGHS"]:
+
+    print("Solver backend: " + Solver_Backend)
+
+    Solve_LP.LP_Warm_Start_Cache.Clear()
+
+    # Base scenario, which also fills the warm start cache for the neighbouring scenario.
+    Benchmark_Results = [("Base scenario, cold start",) + Run_Scenario(Solver_Backend, "Neighbouring Scenario", 250)]
+
+    Benchmark_Results.append(("Neighbour, cold start",) + Run_Scenario(Solver_Backend, "No Warm Start", Neighbouring_Storage_Power_Rating))
+
+    Benchmark_Results.append(("Neighbour, neighbouring scenario warm start",) +
+                             Run_Scenario(Solver_Backend, "Neighbouring Scenario", Neighbouring_Storage_Power_Rating))
+
+    Solve_LP.LP_Warm_Start_Cache.Clear()
+
+    Benchmark_Results.append(("Neighbour, previous month warm start",) +
+                             Run_Scenario(Solver_Backend, "Previous Month", Neighbouring_Storage_Power_Rating))
+
+    for Benchmark_Name, Monthly_Iterations, Total_Solve_Time in Benchmark_Results:
+        print("  %-45s %7d iterations  %7.2f s   monthly: %s" % (Benchmark_Name, sum(Monthly_Iterations), Total_Solve_Time,
+                                                                 " ".join(str(Iterations) for Iterations in Monthly_Iterations)))
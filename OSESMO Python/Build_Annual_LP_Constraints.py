@@ -0,0 +1,130 @@
+def Build_Annual_LP_Constraints(Month_Builder_Inputs=None, Initial_Energy_Level=None, Usable_Storage_Capacity=None):
+
+    # Load Python Packages
+    import numpy as np
+    from cvxopt import matrix, spmatrix
+    from Build_Month_LP_Constraints import Build_Month_LP_Constraints
+
+    # This function assembles a single linear program covering the whole year, from the
+    # monthly linear programs built by Build_Month_LP_Constraints.
+    # Month_Builder_Inputs is a list of 12 dictionaries of Build_Month_LP_Constraints keyword arguments
+    # (one per month, without padding days), not including Initial_Energy_Level and Usable_Storage_Capacity.
+
+    # The annual decision variable vector is the concatenation of the monthly decision variable vectors,
+    # so each month keeps its own demand charge decision variables (P_max_NC, P_max_peak, P_max_part_peak).
+    # The annual constraint matrices are block-diagonal, with one block per month,
+    # plus one equality constraint linking the energy level at the start of each month
+    # to the energy level and power at the end of the previous month.
+
+    # Only the first month has an initial state of charge constraint,
+    # and only the last month has a final state of charge constraint.
+    # Because capacity fade is calculated from the optimal dispatch,
+    # every month uses the same usable storage capacity.
+
+    Number_of_Months = len(Month_Builder_Inputs)
+
+
+    ## Build Monthly Constraint Blocks
+
+    Constraint_Blocks = {"G": [], "A": []}
+    Lower_Bounds = []
+    Upper_Bounds = []
+
+    # Offset of each month's decision variables in the annual decision variable vector.
+    Month_Offsets = [0]
+
+    for Month_Index, Month_Inputs in enumerate(Month_Builder_Inputs):
+
+        G_Month, h_Month, A_Month, b_Month, Lower_Bounds_Month, Upper_Bounds_Month = Build_Month_LP_Constraints(
+            **dict(Month_Inputs,
+                   Initial_Energy_Level = Initial_Energy_Level if Month_Index == 0 else None,
+                   Final_Energy_Level = Month_Inputs["Final_Energy_Level"] if Month_Index == (Number_of_Months - 1) else None,
+                   Usable_Storage_Capacity = Usable_Storage_Capacity))
+
+        Constraint_Blocks["G"].append((G_Month, h_Month))
+        Constraint_Blocks["A"].append((A_Month, b_Month))
+        Lower_Bounds.append(Lower_Bounds_Month)
+        Upper_Bounds.append(Upper_Bounds_Month)
+
+        Month_Offsets.append(Month_Offsets[-1] + len(Lower_Bounds_Month))
+
+    length_x = Month_Offsets[-1]
+
+
+    ## Monthly Energy Level Linking Constraints
+
+    # The energy level at the start of each month (after the first) is equal to the energy level at the
+    # end of the previous month, plus the energy that flows into and out of storage in its last timestep.
+    # As in the month-by-month model, the parasitic storage load is included in the charging power here.
+
+    # E_m(0) = E_m-1(N) + [Eff_c * (P_ES_in_m-1(N) + Parasitic_Storage_Load) - (1/Eff_d) * P_ES_out_m-1(N)] * delta_t
+
+    # E_m(0) - E_m-1(N) - Eff_c * P_ES_in_m-1(N) * delta_t + (1/Eff_d) * P_ES_out_m-1(N) * delta_t =
+    # Eff_c * Parasitic_Storage_Load * delta_t
+
+    Linking_Rows = []
+    Linking_Cols = []
+    Linking_Values = []
+    Linking_RHS = []
+
+    for Month_Index in range(1, Number_of_Months):
+
+        Previous_Month_Inputs = Month_Builder_Inputs[Month_Index - 1]
+        Previous_numtsteps = Previous_Month_Inputs["numtsteps"]
+        Previous_Month_Offset = Month_Offsets[Month_Index - 1]
+
+        Eff_c = Previous_Month_Inputs["Eff_c"]
+        Eff_d = Previous_Month_Inputs["Eff_d"]
+        delta_t = Previous_Month_Inputs["delta_t"]
+
+        Linking_Rows.extend([Month_Index - 1] * 4)
+        Linking_Cols.extend([Month_Offsets[Month_Index] + 2 * Month_Builder_Inputs[Month_Index]["numtsteps"],  # E_m(0)
+                             Previous_Month_Offset + 3 * Previous_numtsteps - 1,  # -E_m-1(N)
+                             Previous_Month_Offset + Previous_numtsteps - 1,  # -Eff_c * P_ES_in_m-1(N) * delta_t
+                             Previous_Month_Offset + 2 * Previous_numtsteps - 1])  # (1/Eff_d) * P_ES_out_m-1(N) * delta_t
+        Linking_Values.extend([1., -1., -Eff_c * delta_t, (1 / Eff_d) * delta_t])
+        Linking_RHS.append(Eff_c * Previous_Month_Inputs["Parasitic_Storage_Load"] * delta_t)
+
+
+    ## Assemble Block Constraint Matrices
+
+    # The monthly constraint matrices are shifted to their row and column offsets,
+    # and the annual matrices are built from the combined triplets in a single step.
+
+    def Assemble_Blocks(Blocks, Extra_Rows = None, Extra_Cols = None, Extra_Values = None, Extra_RHS = None):
+
+        Rows = []
+        Cols = []
+        Values = []
+        RHS = []
+
+        Row_Offset = 0
+
+        for Month_Index, (Block_Matrix, Block_RHS) in enumerate(Blocks):
+
+            Rows.append(np.array(Block_Matrix.I, dtype = int).flatten() + Row_Offset)
+            Cols.append(np.array(Block_Matrix.J, dtype = int).flatten() + Month_Offsets[Month_Index])
+            Values.append(np.array(Block_Matrix.V).flatten())
+            RHS.append(np.array(Block_RHS).flatten())
+
+            Row_Offset = Row_Offset + Block_Matrix.size[0]
+
+        if Extra_Rows is not None and len(Extra_Rows) > 0:
+
+            Rows.append(np.array(Extra_Rows, dtype = int) + Row_Offset)
+            Cols.append(np.array(Extra_Cols, dtype = int))
+            Values.append(np.array(Extra_Values, dtype = float))
+            RHS.append(np.array(Extra_RHS, dtype = float))
+
+            Row_Offset = Row_Offset + len(Extra_RHS)
+
+        Annual_Matrix = spmatrix(np.concatenate(Values), np.concatenate(Rows), np.concatenate(Cols),
+                                 (Row_Offset, length_x), tc = 'd')
+
+        return Annual_Matrix, matrix(np.concatenate(RHS), tc = 'd')
+
+    G_Annual, h_Annual = Assemble_Blocks(Constraint_Blocks["G"])
+
+    A_Annual, b_Annual = Assemble_Blocks(Constraint_Blocks["A"], Linking_Rows, Linking_Cols, Linking_Values, Linking_RHS)
+
+    return G_Annual, h_Annual, A_Annual, b_Annual, np.concatenate(Lower_Bounds), np.concatenate(Upper_Bounds)
@@ -0,0 +1,577 @@
+## Structural LP Template Cache
+
+# The sparsity pattern of the monthly constraint matrices depends only on the number of timesteps,
+# the timestep length, which demand charge and optional constraint blocks are active,
+# and the peak/part-peak and charge/discharge hour index sets.
+# Most months of a model run, and most runs in a storage sizing sweep using the same
+# rate and load profile, share the same structure. Each structure is assembled once and stored
+# in this cache. Later months and runs with the same structure only patch the coefficients that
+# depend on the storage system and input data (efficiency, timestep, storage capacity,
+# RTE requirement, and marginal emissions rates), and recalculate the right-hand-side vectors and bounds.
+
+import collections
+from LRU_Cache import LRU_Cache
+
+# Maximum number of constraint structures stored in the cache (see LRU_Cache.py).
+LP_Template_Cache_Size = 64
+
+LP_Template_Cache = LRU_Cache(LP_Template_Cache_Size)
+
+
+def Build_Month_LP_Constraints(Model_Type_Input=None, Storage_Control_Algorithm_Name=None, GHG_Reduction_Solution_Input=None,
+                               Equivalent_Cycling_Constraint_Input=None, Annual_RTE_Constraint_Input=None, ITC_Constraint_Active=None,
+                               numtsteps=None, numtsteps_unpadded=None, numtsteps_year=None, delta_t=None,
+                               Eff_c=None, Eff_d=None, Storage_Power_Rating_Input=None, Usable_Storage_Capacity=None,
+                               Total_Storage_Capacity=None, Parasitic_Storage_Load=None,
+                               Initial_Energy_Level=None, Final_Energy_Level=None,
+                               Noncoincident_DC=None, Peak_DC=None, Part_Peak_DC=None,
+                               Load_Profile_Data_Month_Padded=None, Solar_PV_Profile_Data_Month_Padded=None,
+                               Marginal_Emissions_Rate_Data_Month_Padded=None,
+                               Peak_Binary_Data_Month_Padded=None, Part_Peak_Binary_Data_Month_Padded=None,
+                               Peak_Timestep_Indices_Month_Padded=None, Part_Peak_Timestep_Indices_Month_Padded=None,
+                               PGE_Charge_Hour_Binary_Data_Month_Padded=None, PGE_No_Charge_Hour_Binary_Data_Month_Padded=None,
+                               PGE_Discharge_Hour_Binary_Data_Month_Padded=None,
+                               IOU_Charge_Hour_Binary_Data_Month_Padded=None, IOU_Discharge_Hour_Binary_Data_Month_Padded=None):
+
+    # Load Python Packages
+    import numpy as np
+    from cvxopt import matrix, spmatrix
+
+    # This function assembles the constraints of the monthly OSESMO linear program:
+    # the inequality constraints G_Month * x <= h_Month, the equality constraints
+    # A_Month * x = b_Month, and lower and upper bounds on each decision variable.
+    # Each constraint block is built as NumPy arrays of (row, column, value) triplets,
+    # using offsets into the decision variable vector rather than assigning matrix
+    # elements one at a time. All of the blocks are concatenated and sorted into
+    # compressed-column order once per constraint structure (see LP_Template_Cache above).
+
+    # Simple bounds are returned as vectors rather than constraint rows, so that
+    # solvers which support variable bounds natively can use them directly.
+    # Solvers without native bounds (such as cvxopt) must add them as constraint rows.
+
+    # Decision Variable Indices
+    # P_ES_in = x(1:numtsteps)
+    # P_ES_out = x(numtsteps+1:2*numtsteps)
+    # Ene_Lvl = x(2*numtsteps+1:3*numtsteps)
+    # P_max_NC = x(3*numtsteps+1)
+    # P_max_peak = x(3*numtsteps+2)
+    # P_max_part_peak = x(3*numsteps+3)
+
+    length_x = (3 * numtsteps) + 3
+
+    P_ES_in_Offset = 0
+    P_ES_out_Offset = numtsteps
+    Ene_Lvl_Offset = 2 * numtsteps
+    P_max_NC_Index = 3 * numtsteps
+    P_max_peak_Index = (3 * numtsteps) + 1
+    P_max_part_peak_Index = (3 * numtsteps) + 2
+
+    all_tsteps = np.arange(0, numtsteps)
+
+
+    ## Identify Constraint Structure
+
+    # Demand Charge Timestep Indices
+    # The noncoincident demand charge applies across all 15-minute intervals,
+    # while the coincident demand charges only apply to peak or part-peak intervals.
+
+    Demand_Charge_Indices = collections.OrderedDict()
+
+    if Noncoincident_DC > 0:
+        Demand_Charge_Indices["Noncoincident_DC"] = (all_tsteps, P_max_NC_Index)
+
+    # Peak and part-peak timestep indices can be provided directly (ex. from the month time index),
+    # instead of peak and part-peak binary data.
+
+    if Peak_DC > 0:
+        if Peak_Timestep_Indices_Month_Padded is None:
+            Peak_Timestep_Indices_Month_Padded = all_tsteps[Peak_Binary_Data_Month_Padded == 1]
+        Demand_Charge_Indices["Peak_DC"] = (Peak_Timestep_Indices_Month_Padded, P_max_peak_Index)
+
+    if Part_Peak_DC > 0:
+        if Part_Peak_Timestep_Indices_Month_Padded is None:
+            Part_Peak_Timestep_Indices_Month_Padded = all_tsteps[Part_Peak_Binary_Data_Month_Padded == 1]
+        Demand_Charge_Indices["Part_Peak_DC"] = (Part_Peak_Timestep_Indices_Month_Padded, P_max_part_peak_Index)
+
+    # Binary data vectors only affect the constraint structure through the timesteps where they are equal to 1.
+
+    def Binary_Data_Key(Binary_Data):
+        return np.packbits(np.asarray(Binary_Data) == 1).tobytes()
+
+    if GHG_Reduction_Solution_Input in ["No-Charging Time Constraint", "Charging and Discharging Time Constraints"]:
+        Time_Constraint_Binary_Data = [PGE_Charge_Hour_Binary_Data_Month_Padded, PGE_No_Charge_Hour_Binary_Data_Month_Padded,
+                                       PGE_Discharge_Hour_Binary_Data_Month_Padded]
+    elif GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
+        Time_Constraint_Binary_Data = [IOU_Charge_Hour_Binary_Data_Month_Padded, IOU_Discharge_Hour_Binary_Data_Month_Padded]
+    else:
+        Time_Constraint_Binary_Data = []
+
+    Structure_Key = (numtsteps, numtsteps_unpadded, delta_t,
+                     Model_Type_Input == "Storage Only",
+                     Storage_Control_Algorithm_Name == "OSESMO Non-Economic Solar Self-Supply",
+                     GHG_Reduction_Solution_Input,
+                     Equivalent_Cycling_Constraint_Input > 0,
+                     Annual_RTE_Constraint_Input > 0,
+                     bool(ITC_Constraint_Active),
+                     Initial_Energy_Level is not None,
+                     Final_Energy_Level is not None,
+                     tuple((Demand_Charge_Name, DC_Indices.tobytes())
+                           for Demand_Charge_Name, (DC_Indices, P_max_Index) in Demand_Charge_Indices.items()),
+                     tuple(Binary_Data_Key(Binary_Data) for Binary_Data in Time_Constraint_Binary_Data))
+
+
+    def Build_LP_Template():
+
+        # Lists of triplet arrays for each constraint block, for the inequality (G) and equality (A) constraints.
+        # Row indices in each block are relative to the first row of that block.
+        # Each block records the name of its right-hand-side values, which are calculated for every solve.
+        # Coefficients that change between solves with the same structure are labelled with the name of a
+        # "value slot", and are filled in for every solve.
+
+        Triplets = {}
+
+        for Constraint_Type in ["G", "A"]:
+            Triplets[Constraint_Type] = {"Rows": [np.zeros((0,), dtype = int)],
+                                         "Cols": [np.zeros((0,), dtype = int)],
+                                         "Values": [np.zeros((0,))],
+                                         "Slots": [np.zeros((0,), dtype = object)],
+                                         "RHS": []}
+
+        # Number of inequality and equality rows added so far.
+        Row_Count = {"G": 0, "A": 0}
+
+        def Add_Constraint_Block(Block_Rows, Block_Cols, Block_Values, Block_Slots, RHS_Name, Number_of_Rows, Constraint_Type = "G"):
+
+            Block_Rows = np.asarray(Block_Rows, dtype = int)
+
+            Triplets[Constraint_Type]["Rows"].append(Block_Rows + Row_Count[Constraint_Type])
+            Triplets[Constraint_Type]["Cols"].append(np.asarray(Block_Cols, dtype = int))
+            Triplets[Constraint_Type]["Values"].append(np.broadcast_to(np.asarray(Block_Values, dtype = float), Block_Rows.shape))
+            Triplets[Constraint_Type]["Slots"].append(np.broadcast_to(np.asarray(Block_Slots, dtype = object), Block_Rows.shape))
+            Triplets[Constraint_Type]["RHS"].append((RHS_Name, Number_of_Rows))
+
+            Row_Count[Constraint_Type] = Row_Count[Constraint_Type] + Number_of_Rows
+
+
+        ## State of Charge Constraint
+
+        # This constraint represents conservation of energy as it flows into and out of the
+        # energy storage system, while accounting for efficiency losses.
+
+        # For t in [0, numsteps-1]:
+
+        # E[t+1] = E[t] + [Eff_c * P_ES_in[t] - (1/Eff_d) * P_ES_out[t]] * delta_t
+
+        # E[t] - E[t+1] + Eff_c * P_ES_in[t] * delta_t - (1/Eff_d) * P_ES_out[t] * delta_t = 0
+
+        # Number of rows in equality constraint matrix = (numtsteps - 1)
+
+        E_Steps = np.arange(0, numtsteps - 1)
+
+        Add_Constraint_Block(np.concatenate((E_Steps, E_Steps, E_Steps, E_Steps)),
+                             np.concatenate((Ene_Lvl_Offset + E_Steps,  # E[t]
+                                             Ene_Lvl_Offset + E_Steps + 1,  # -E[t+1]
+                                             P_ES_in_Offset + E_Steps,  # Eff_c * P_ES_in[t] * delta_t
+                                             P_ES_out_Offset + E_Steps)),  # - (1/Eff_d) * P_ES_out[t] * delta_t
+                             np.repeat([1., -1., 0., 0.], numtsteps - 1),
+                             np.repeat(["", "", "Charge_Efficiency", "Discharge_Efficiency"], numtsteps - 1),
+                             "Zero", numtsteps - 1, "A")
+
+
+        ## Initial State of Charge Constraint
+
+        # In the first month, this constraint initializes the energy level of the battery at
+        # a user-defined percentage of the original battery capacity.
+        # In all other month, this constraints initializes the energy level of
+        # the battery at the final battery level from the previous month.
+
+        # E(0) = Initial_Energy_Level
+
+        # If Initial_Energy_Level is None, the initial energy level is not constrained here.
+        # This is used when months are linked together in the annual linear program (see Build_Annual_LP_Constraints.py).
+
+        if Initial_Energy_Level is not None:
+
+            Add_Constraint_Block([0], [Ene_Lvl_Offset], 1., "", "Initial_Energy_Level", 1, "A")
+
+
+        ## Final State of Charge Constraints
+
+        # This constraint fixes the final state of charge of the battery at a user-defined percentage
+        # of the original battery capacity,
+        # to prevent it from discharging completely in the final timesteps.
+
+        # E(N) = Final_Energy_Level
+
+        if Final_Energy_Level is not None:
+
+            Add_Constraint_Block([0], [Ene_Lvl_Offset + numtsteps - 1], 1., "", "Final_Energy_Level", 1, "A")
+
+
+        ## Demand Charge Constraints
+
+        # These constraints linearize the noncoincident, coincident peak, and coincident part-peak
+        # demand charges. Setting the demand charge value as a decision variable incentivizes
+        # "demand capping" to reduce the value of max(P_load(t)) to an optimal
+        # level without using the nonlinear max() operator.
+
+        # P_load(t) - P_PV(t) + P_ES_in(t) - P_ES_out(t) <= P_max for all applicable t
+        # P_ES_in(t) - P_ES_out(t) - P_max <= - P_load(t) + P_PV(t) for all applicable t
+
+        for Demand_Charge_Name, (DC_Indices, P_max_Index) in Demand_Charge_Indices.items():
+
+            DC_Rows = np.arange(0, len(DC_Indices))
+
+            Add_Constraint_Block(np.concatenate((DC_Rows, DC_Rows, DC_Rows)),
+                                 np.concatenate((P_ES_in_Offset + DC_Indices,
+                                                 P_ES_out_Offset + DC_Indices,
+                                                 np.full(len(DC_Indices), P_max_Index))),
+                                 np.repeat([1., -1., -1.], len(DC_Indices)), "",
+                                 Demand_Charge_Name, len(DC_Indices))
+
+
+        ## Optional Constraint - Solar ITC Charging Constraint
+
+        # This constraint requires that the storage system be charged 100% from
+        # solar. This ensures that the customer receives 100% of the
+        # solar Incentive Tax Credit. The ITC amount is prorated by the amount
+        # of energy entering into the battery that comes from solar
+        # (ex. a storage system charged 90% from solar receives 90% of the ITC).
+        # As a result, the optimal amount of solar charging is likely higher
+        # than the minimum requirement of 75%, and likely very close to 100%.
+
+        # P_ES_in(t) <= P_PV(t)
+
+        if ITC_Constraint_Active:
+
+            Add_Constraint_Block(all_tsteps, P_ES_in_Offset + all_tsteps, 1., "", "ITC", numtsteps)
+
+
+        ## Optional Constraint - PG&E-Proposed Charging and Discharging Time Constraints
+
+        # PG&E has suggested a set of time-based constraints on storage charging.
+        # At least 50% of total charging would need to occur between 9:00 am and 2:00 pm,
+        # and at least 50% of total discharging would need to occur between 4:00 pm and 9:00 pm.
+        # In addition, storage would not be allowed to charge between 4:00 pm and 9:00 pm.
+        # The "No-Charging Time Constraint" option only applies this last constraint.
+
+        # Derivation of charging constraint in standard linear form Ax <= 0:
+        # Sum of all P_ES_in(t) between 9:00 and 2:00/sum of all P_ES_in(t) >= 0.5
+        # Sum of all P_ES_in(t) between 9:00 and 2:00 >= 0.5 * sum of all P_ES_in(t)
+        # 0.5 * sum of all P_ES_in(t) not between 9:00 and 2:00 - 0.5 * sum of all P_ES_in(t)
+        # between 9:00 and 2:00 <= 0.
+        # The discharging constraint is derived in the same way for P_ES_out(t) between 4:00 and 9:00.
+
+        # No-Charging Constraint
+        # Because charging power is constrained to be greater than
+        # zero, setting the sum of all charging power timesteps to 0 (a
+        # single constraint across all timesteps) ensures that all values will be zero
+        # without needing to set a constraint for each timestep.
+
+        if GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
+
+            # Charging Constraint
+            Add_Constraint_Block(np.zeros((numtsteps,)), P_ES_in_Offset + all_tsteps,
+                                 np.where(PGE_Charge_Hour_Binary_Data_Month_Padded == 1, -0.5, 0.5), "", "Zero", 1)
+
+        if GHG_Reduction_Solution_Input == "No-Charging Time Constraint" or \
+                GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
+
+            # Sum of all P_ES_in(t) between 4:00 and 9:00 = 0
+            PGE_No_Charge_Hour_Indices = all_tsteps[PGE_No_Charge_Hour_Binary_Data_Month_Padded == 1]
+
+            Add_Constraint_Block(np.zeros((len(PGE_No_Charge_Hour_Indices),)), P_ES_in_Offset + PGE_No_Charge_Hour_Indices,
+                                 1., "", "Zero", 1)
+
+        if GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
+
+            # Discharging Constraint
+            Add_Constraint_Block(np.zeros((numtsteps,)), P_ES_out_Offset + all_tsteps,
+                                 np.where(PGE_Discharge_Hour_Binary_Data_Month_Padded == 1, -0.5, 0.5), "", "Zero", 1)
+
+
+        ## Optional Constraint - Investor-Owned-Utility-Proposed Charge-Discharge Hours
+
+        # The Investor-Owned Utilities have suggested constraints on charging in particular hours
+        # as a proposed method for reducing greenhouse gas emissions associated with storage dispatch.
+        # Specifically, at least 50% of total charging would need to occur between 12:00 noon and 4:00 pm,
+        # and at least 50% of total discharging would need to occur between 4:00 pm and 9:00 pm.
+        # These constraints are derived in the same way as the PG&E-proposed constraints above.
+
+        if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
+
+            # Charging Constraint
+            Add_Constraint_Block(np.zeros((numtsteps,)), P_ES_in_Offset + all_tsteps,
+                                 np.where(IOU_Charge_Hour_Binary_Data_Month_Padded == 1, -0.5, 0.5), "", "Zero", 1)
+
+            # Discharging Constraint
+            Add_Constraint_Block(np.zeros((numtsteps,)), P_ES_out_Offset + all_tsteps,
+                                 np.where(IOU_Discharge_Hour_Binary_Data_Month_Padded == 1, -0.5, 0.5), "", "Zero", 1)
+
+
+        ## Optional Constraint - Non-Positive GHG Emissions Impact
+
+        # Note - the system is following the forecast signal to obey
+        # this constraint, not the evaluation signal. It may be necessary
+        # to adjust this constraint to aim for a negative GHG impact
+        # based on the forecast signal, in order to achieve a non-positive
+        # GHG impact as measured by the evaluation signal.
+
+        if GHG_Reduction_Solution_Input == "Non-Positive GHG Constraint":
+
+            # The sum of the net battery charge/discharge load in each
+            # timestep, multiplied by the marginal emissions rate in each
+            # timestep, must be less than or equal to 0.
+
+            Add_Constraint_Block(np.zeros((2 * numtsteps,)),
+                                 np.concatenate((P_ES_in_Offset + all_tsteps, P_ES_out_Offset + all_tsteps)),
+                                 0., np.repeat(["Emissions_Charge", "Emissions_Discharge"], numtsteps), "Zero", 1)
+
+
+        ## Optional Constraint - Equivalent Cycling Constraint
+
+        # Note: due to the OSESMO model structure, the annual cycling requirement
+        # must be converted to an equivalent monthly cycling requirement.
+        # All cycling must occur outside of the "padding" days at the end, which are removed after optimization.
+
+        # Equivalent Cycles = sum((P_ES_in(t) * (((Eff_c)/(2 * Size_ES)) * delta_t)) + \
+        #    (P_ES_out(t) * ((1/(Eff_d * 2 * Size_ES)) * delta_t)))
+
+        # Equivalent Cycles >= SGIP_Monthly_Cycling Requirement
+        # -Equivalent Cycles <= -SGIP_Monthly_Cycling_Requirement
+
+        if Equivalent_Cycling_Constraint_Input > 0:
+
+            Unpadded_tsteps = np.arange(0, numtsteps_unpadded)
+
+            Add_Constraint_Block(np.zeros((2 * numtsteps_unpadded,)),
+                                 np.concatenate((P_ES_in_Offset + Unpadded_tsteps, P_ES_out_Offset + Unpadded_tsteps)),
+                                 0., np.repeat(["Cycles_Charge", "Cycles_Discharge"], numtsteps_unpadded),
+                                 "Equivalent_Cycles", 1)
+
+
+        ## Optional Constraint - Operational/SGIP Round-Trip Efficiency Constraint
+
+        # Note: due to the OSESMO model structure, the annual RTE requirement
+        # must be converted to an equivalent monthly RTE requirement.
+
+        # Operational RTE Percent >= 0.696
+        # (sum(P_ES_out) * delta_t)/((sum(P_ES_in) * delta_t) + (sum(Auxiliary_Storage_Load) * delta_t) >= 0.696
+        # 0.696 * (sum(P_ES_in) * delta_t) -(sum(P_ES_out) * delta_t) <= -(sum(Auxiliary_Storage_Load) * delta_t)
+
+        if Annual_RTE_Constraint_Input > 0:
+
+            Add_Constraint_Block(np.zeros((2 * numtsteps,)),
+                                 np.concatenate((P_ES_in_Offset + all_tsteps, P_ES_out_Offset + all_tsteps)),
+                                 0., np.repeat(["RTE_Charge", "RTE_Discharge"], numtsteps), "SGIP_RTE", 1)
+
+
+        ## Optional Constraint - No-Export Constraint
+
+        # This constraint prevents the standalone energy-storage systems from
+        # backfeeding power from the storage system onto the distribution grid.
+        # Solar-plus storage systems are allowed to export to the grid.
+
+        # P_load(t) + P_ES_in(t) - P_ES_out(t) >= 0
+        # -P_ES_in(t) + P_ES_out(t) <= P_load(t)
+
+        if Model_Type_Input == "Storage Only":
+
+            Add_Constraint_Block(np.concatenate((all_tsteps, all_tsteps)),
+                                 np.concatenate((P_ES_in_Offset + all_tsteps, P_ES_out_Offset + all_tsteps)),
+                                 np.repeat([-1., 1.], numtsteps), "", "No_Export", numtsteps)
+
+
+        ## Optional Constraint - Solar Self-Supply
+
+        # In the Economic Dispatch mode, this constraint is not necessary -
+        # the presence of a positive cost on battery charging ensures that
+        # simultaneous charging and discharging does not occur.
+        # However, in the Non-Economic Solar Self-Consumption, which negative
+        # costs on both charging and discharging, the battery charges and
+        # discharges simultaneously so as to minimize total cost.
+        # This constraint ensures that simultaneous charging and
+        # discharging does not occur, and ensures that the storage system
+        # only charges when there is excess solar power (net load is negative)
+        # and discharges when net load is positive.
+
+        if Storage_Control_Algorithm_Name == "OSESMO Non-Economic Solar Self-Supply":
+
+            # P_ES_in <= Non-negative(P_PV - P_Load)
+
+            Add_Constraint_Block(all_tsteps, P_ES_in_Offset + all_tsteps, 1., "", "Self_Supply_Charge", numtsteps)
+
+            # P_ES_out <= Non-negative(P_Load - P_PV)
+
+            Add_Constraint_Block(all_tsteps, P_ES_out_Offset + all_tsteps, 1., "", "Self_Supply_Discharge", numtsteps)
+
+
+        ## Build Template Constraint Matrices
+
+        # The triplets are converted into sparse matrices once, when the template is built.
+        # cvxopt stores the values of a sparse matrix in compressed-column order (sorted by column, then by row),
+        # so the position of each value slot is recorded in that order.
+
+        LP_Template = {}
+
+        for Constraint_Type in ["G", "A"]:
+
+            Rows = np.concatenate(Triplets[Constraint_Type]["Rows"])
+            Cols = np.concatenate(Triplets[Constraint_Type]["Cols"])
+            Values = np.concatenate(Triplets[Constraint_Type]["Values"])
+            Slots = np.concatenate(Triplets[Constraint_Type]["Slots"])
+
+            Sort_Order = np.lexsort((Rows, Cols))
+
+            Sorted_Positions = np.empty_like(Sort_Order)
+            Sorted_Positions[Sort_Order] = np.arange(0, len(Sort_Order))
+
+            LP_Template[Constraint_Type] = {"Matrix": spmatrix(Values[Sort_Order], Rows[Sort_Order], Cols[Sort_Order],
+                                                               (Row_Count[Constraint_Type], length_x), tc = 'd'),
+                                            "Values": Values[Sort_Order],
+                                            "Slots": [(Slot_Name, Sorted_Positions[Slots == Slot_Name])
+                                                      for Slot_Name in sorted(set(Slots)) if Slot_Name != ""],
+                                            "RHS": Triplets[Constraint_Type]["RHS"]}
+
+        return LP_Template
+
+
+    ## Retrieve or Build Constraint Template
+
+    LP_Template = LP_Template_Cache.Get(Structure_Key)
+
+    if LP_Template is None:
+
+        LP_Template = Build_LP_Template()
+
+        LP_Template_Cache.Save(Structure_Key, LP_Template)
+
+
+    ## Constraint Coefficients
+
+    # Coefficients that can change between solves with the same constraint structure.
+
+    Slot_Values = {"Charge_Efficiency": Eff_c * delta_t,
+                   "Discharge_Efficiency": (-1 / Eff_d) * delta_t}
+
+    if GHG_Reduction_Solution_Input == "Non-Positive GHG Constraint":
+        Slot_Values["Emissions_Charge"] = Marginal_Emissions_Rate_Data_Month_Padded * delta_t
+        Slot_Values["Emissions_Discharge"] = -Marginal_Emissions_Rate_Data_Month_Padded * delta_t
+
+    if Equivalent_Cycling_Constraint_Input > 0:
+        Slot_Values["Cycles_Charge"] = -(((Eff_c) / (2 * Total_Storage_Capacity)) * delta_t)
+        Slot_Values["Cycles_Discharge"] = -((1 / (Eff_d * 2 * Total_Storage_Capacity)) * delta_t)
+
+    if Annual_RTE_Constraint_Input > 0:
+
+        Slot_Values["RTE_Charge"] = Annual_RTE_Constraint_Input * delta_t
+        Slot_Values["RTE_Discharge"] = -delta_t
+
+        # If it's impossible for the storage system to achieve the RTE requirement
+        # even if it were constantly cycling, stop the model, because the linear program has no solution.
+
+        if (Eff_c * Eff_d * Storage_Power_Rating_Input) / (
+                Storage_Power_Rating_Input + Parasitic_Storage_Load) < Annual_RTE_Constraint_Input:
+
+            raise ValueError('No solution - could not achieve SGIP RTE requirement' \
+                             ' with the provided nameplate efficiency and auxiliary storage load values.')
+
+
+    ## Right-Hand-Side Values
+
+    def Calculate_RHS(RHS_Name, Number_of_Rows):
+
+        if RHS_Name == "Zero":
+            return np.zeros((Number_of_Rows,))
+
+        elif RHS_Name == "Initial_Energy_Level":
+            return np.array([Initial_Energy_Level], dtype = float)
+
+        elif RHS_Name == "Final_Energy_Level":
+            return np.array([Final_Energy_Level], dtype = float)
+
+        elif RHS_Name in Demand_Charge_Indices:
+            DC_Indices = Demand_Charge_Indices[RHS_Name][0]
+            return -Load_Profile_Data_Month_Padded[DC_Indices] + Solar_PV_Profile_Data_Month_Padded[DC_Indices]
+
+        elif RHS_Name == "ITC":
+            # Note that P_PV(t) can sometimes be negative for some PV profiles, if
+            # the solar inverter is consuming energy at night. As a result, P_PV(t)
+            # here refers to a modified version of the solar profile where all
+            # negative values are set to 0. Otherwise, the model would break
+            # because P_ES_in must be >= 0, and can't also be <= P_PV(t) if P_PV(t)
+            # <= 0.
+            return np.maximum(Solar_PV_Profile_Data_Month_Padded, 0.)
+
+        elif RHS_Name == "Equivalent_Cycles":
+            SGIP_Monthly_Cycling_Requirement = Equivalent_Cycling_Constraint_Input * \
+                                               (numtsteps_unpadded / numtsteps_year)
+            return np.array([-SGIP_Monthly_Cycling_Requirement])
+
+        elif RHS_Name == "SGIP_RTE":
+            return np.array([-((numtsteps * Parasitic_Storage_Load) * delta_t)])
+
+        elif RHS_Name == "No_Export":
+            return np.asarray(Load_Profile_Data_Month_Padded, dtype = float)
+
+        elif RHS_Name == "Self_Supply_Charge":
+            return np.maximum(Solar_PV_Profile_Data_Month_Padded - Load_Profile_Data_Month_Padded, 0.)
+
+        elif RHS_Name == "Self_Supply_Discharge":
+            return np.maximum(Load_Profile_Data_Month_Padded - Solar_PV_Profile_Data_Month_Padded, 0.)
+
+
+    ## Assemble Constraint Matrices
+
+    # Each constraint matrix is a copy of the template matrix, with the value slots filled in.
+    # Copying the template and replacing its values is much faster than building a new sparse matrix.
+
+    Constraint_Matrices = {}
+
+    for Constraint_Type in ["G", "A"]:
+
+        Template = LP_Template[Constraint_Type]
+
+        Values = Template["Values"].copy()
+
+        for Slot_Name, Slot_Positions in Template["Slots"]:
+            Values[Slot_Positions] = Slot_Values[Slot_Name]
+
+        Constraint_Matrix = +Template["Matrix"]
+        Constraint_Matrix.V = matrix(Values, tc = 'd')
+
+        RHS_Values = [np.zeros((0,))] + [Calculate_RHS(RHS_Name, Number_of_Rows) for RHS_Name, Number_of_Rows in Template["RHS"]]
+
+        Constraint_Matrices[Constraint_Type] = (Constraint_Matrix, matrix(np.concatenate(RHS_Values), tc = 'd'))
+
+    G_Month, h_Month = Constraint_Matrices["G"]
+    A_Month, b_Month = Constraint_Matrices["A"]
+
+
+    ## Decision Variable Bounds
+
+    # Energy Storage Charging and Discharging Power
+    # The minimum is 0 kW, and the maximum is Storage_Power_Rating_Input.
+    # 0 <= P_ES_in(t) <= Storage_Power_Rating_Input
+    # 0 <= P_ES_out(t) <= Storage_Power_Rating_Input
+
+    # State of Charge Minimum/Maximum
+    # The minimum value is 0, and the maximum value is Usable_Storage_Capacity, the size of the
+    # battery. Note: this optimization defines the range [0, Usable_Storage_Capacity] as the
+    # effective storage capacity of the battery, without accounting for
+    # depth of discharge.
+    # 0 <= Ene_Lvl(t) <= Usable_Storage_Capacity
+
+    # Demand Charge Decision Variables
+    # P_max_NC, P_max_peak, and P_max_part_peak >= 0
+    # Note: these non-negativity bounds are added even if the demand charges are $0/kW for this tariff.
+    # This ensures that the decision variables go to zero, and are not negative.
+
+    Lower_Bounds = np.zeros((length_x,))
+
+    Upper_Bounds = np.concatenate((Storage_Power_Rating_Input * np.ones((numtsteps,)),
+                                   Storage_Power_Rating_Input * np.ones((numtsteps,)),
+                                   Usable_Storage_Capacity * np.ones((numtsteps,)),
+                                   np.full((3,), np.inf)))
+
+    return G_Month, h_Month, A_Month, b_Month, Lower_Bounds, Upper_Bounds
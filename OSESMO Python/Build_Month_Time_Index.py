@@ -0,0 +1,88 @@
+def Build_Month_Time_Index(Month_Data=None, delta_t=None, End_of_Month_Padding_Days=None,
+                           Peak_Binary_Data=None, Part_Peak_Binary_Data=None):
+
+    # Load Python Packages
+    import numpy as np
+
+    # This function builds an index of the timesteps in each month of a model run, so that monthly data
+    # can be taken from full-year data vectors as slices, instead of filtering each vector with Month_Data == Month_Iter.
+
+    # Month_Data is the month number (1-12) of each model timestep.
+    # Months 1 through 11 are padded with their last End_of_Month_Padding_Days days, repeated.
+    # Month 12 is not padded, because the final state of charge is constrained to equal the original state of charge.
+
+    # Peak_Binary_Data and Part_Peak_Binary_Data are the coincident peak and part-peak binary variable vectors
+    # for the season of each timestep (ex. the summer vector in summer months), if needed.
+
+    # Returns a dictionary containing:
+    #  * "Month_Order" - timestep indices sorted by month (keeping their order within each month),
+    #    or None if Month_Data is already sorted by month (ex. for a calendar-year model run).
+    #  * "Month_Start" and "Month_End" - offsets of the first and last + 1 timestep of each month (array of 12),
+    #    in the timesteps sorted by month.
+    #  * "Padded_Index" - timestep indices of the padded data of all months, one month after another,
+    #    or None if no month is padded and Month_Data is sorted by month.
+    #  * "Padded_Start" and "Padded_End" - offsets of the first and last + 1 timestep of each month (array of 12),
+    #    in the padded data. The first Month_End - Month_Start timesteps of each padded month are its unpadded data.
+    #  * "Peak_Indices" and "Part_Peak_Indices" - lists of the coincident peak and part-peak timestep indices
+    #    of each padded month, relative to the start of the month, or None if the binary vectors are not provided.
+
+    # Padded data vectors are built once per model run, by indexing each full-year data vector with Padded_Index,
+    # and monthly data are taken from them as slices (views), without copying.
+
+    Month_Data = np.asarray(Month_Data).astype(int).reshape((-1,))
+
+    if End_of_Month_Padding_Days is None:
+        End_of_Month_Padding_Days = 0
+
+    Padding_Timesteps = End_of_Month_Padding_Days * 24 * int(1 / delta_t)
+
+
+    ## Month Offsets
+
+    if np.all(np.diff(Month_Data) >= 0):
+        Month_Order = None
+        Month_Ordered_Timesteps = np.arange(len(Month_Data))
+    else:
+        Month_Order = np.argsort(Month_Data, kind = "stable")
+        Month_Ordered_Timesteps = Month_Order
+
+    Month_Timesteps = np.bincount(Month_Data, minlength = 13)[1:13]
+
+    Month_End = np.cumsum(Month_Timesteps)
+    Month_Start = Month_End - Month_Timesteps
+
+
+    ## Padded Month Offsets
+
+    Month_Padding_Timesteps = np.zeros(12, dtype = int)
+
+    if Padding_Timesteps > 0:
+        # Padding is limited to the length of the month, as in Month_Data_Month[-Padding_Timesteps:].
+        Month_Padding_Timesteps[0:11] = np.minimum(Padding_Timesteps, Month_Timesteps[0:11])
+
+    Padded_End = np.cumsum(Month_Timesteps + Month_Padding_Timesteps)
+    Padded_Start = Padded_End - Month_Timesteps - Month_Padding_Timesteps
+
+    if np.sum(Month_Padding_Timesteps) == 0 and Month_Order is None:
+        Padded_Index = None
+    else:
+        Padded_Index = np.concatenate([np.concatenate((Month_Ordered_Timesteps[Month_Start[Month_Index]:Month_End[Month_Index]],
+                                                       Month_Ordered_Timesteps[(Month_End[Month_Index] - Month_Padding_Timesteps[Month_Index]):Month_End[Month_Index]]))
+                                       for Month_Index in range(12)])
+
+
+    ## Coincident Peak and Part-Peak Timestep Indices
+
+    def Padded_Period_Indices(Binary_Data):
+
+        if Binary_Data is None:
+            return None
+
+        Padded_Binary_Data = np.reshape(Binary_Data, (-1,)) if Padded_Index is None else np.reshape(Binary_Data, (-1,))[Padded_Index]
+
+        return [np.flatnonzero(Padded_Binary_Data[Padded_Start[Month_Index]:Padded_End[Month_Index]] == 1) for Month_Index in range(12)]
+
+    return {"Month_Order": Month_Order, "Month_Start": Month_Start, "Month_End": Month_End,
+            "Padded_Index": Padded_Index, "Padded_Start": Padded_Start, "Padded_End": Padded_End,
+            "Peak_Indices": Padded_Period_Indices(Peak_Binary_Data),
+            "Part_Peak_Indices": Padded_Period_Indices(Part_Peak_Binary_Data)}
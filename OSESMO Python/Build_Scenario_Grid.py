@@ -0,0 +1,189 @@
+def Build_Scenario_Grid(Fixed_Inputs=None, Load_Profile_Inputs=None, Model_Type_Inputs=None, Solar_Sizing_Fraction=None,
+                        Storage_Type_Inputs=None, Self_Supply_Retail_Rate_Name_Inputs=None,
+                        GHG_Reduction_Solution_Inputs=None, Carbon_Adder_Incentive_Value_Inputs=None,
+                        Equivalent_Cycling_Constraint_Inputs=None, Annual_RTE_Constraint_Inputs=None):
+
+    # Load Python Packages
+    import numpy as np
+    from Import_Load_Profile_Data import Import_Load_Profile_Data
+    from Import_Solar_PV_Profile_Data import Import_Solar_PV_Profile_Data
+    from Solar_Installed_Cost_per_kW_Calculator import Solar_Installed_Cost_per_kW_Calculator
+    from Storage_Installed_Cost_per_kWh_Calculator import Storage_Installed_Cost_per_kWh_Calculator
+
+    # This function builds the list of OSESMO model runs in a scenario sweep, following the nested
+    # model input iterations used in the MATLAB *_Iterations.m scripts
+    # (model type x load profile x retail rate x storage type x storage size x RTE x GHG reduction solution).
+    # Each model run is returned as a dictionary of OSESMO keyword arguments, to be run using Run_Scenario_Sweep.
+
+    # Fixed_Inputs is a dictionary of OSESMO inputs shared by all model runs (ex. Modeling_Team_Input,
+    # Model_Timestep_Resolution, Customer_Class_Input, Parasitic_Storage_Load_Input, directory locations,
+    # plot and data export toggles, Start_Time_Input, Initial_Final_SOC, and End_of_Month_Padding_Days).
+
+    # Load_Profile_Inputs is a dictionary with one entry for each load profile name, containing:
+    #  * "Solar_Profile_Name_Input" - solar profile used for Solar Plus Storage model runs.
+    #  * "Retail_Rate_Name_Inputs" - list of retail rates used for all model runs.
+    #  * "Solar_Plus_Storage_Retail_Rate_Name_Inputs" (optional) - additional retail rates only available
+    #    to customers with solar (ex. SDG&E DR-SES).
+    #  * "Storage_Power_Rating_Inputs" - list of storage power ratings (kW).
+    #  * "Emissions_Forecast_Signal_Inputs" - list of emissions forecast signals used for GHG Signal Co-Optimization.
+
+    # Solar Sizing Rule
+    # Solar PV systems are sized to meet Solar_Sizing_Fraction of annual electricity consumption
+    # (80% for residential and small commercial customers, 40% for medium and large commercial and industrial customers).
+
+    # Storage_Type_Inputs is a dictionary with one entry for each storage type, containing:
+    #  * "Storage_Duration" - usable storage capacity (kWh) per kW of storage power rating.
+    #  * "Single_Cycle_RTE_Inputs" - list of single-cycle round-trip efficiencies.
+
+    # Solar Plus Storage model runs on retail rates in Self_Supply_Retail_Rate_Name_Inputs use the
+    # OSESMO Non-Economic Solar Self-Supply control algorithm. All other model runs use OSESMO Economic Dispatch.
+
+    if Model_Type_Inputs is None:
+        Model_Type_Inputs = ["Storage Only", "Solar Plus Storage"]
+
+    if Self_Supply_Retail_Rate_Name_Inputs is None:
+        Self_Supply_Retail_Rate_Name_Inputs = []
+
+    if Equivalent_Cycling_Constraint_Inputs is None:
+        Equivalent_Cycling_Constraint_Inputs = [0]
+
+    if Annual_RTE_Constraint_Inputs is None:
+        Annual_RTE_Constraint_Inputs = [0]
+
+    Customer_Class_Input = Fixed_Inputs["Customer_Class_Input"]
+
+    delta_t = (Fixed_Inputs["Model_Timestep_Resolution"] / 60)
+
+
+    ## Solar PV System Size Inputs
+
+    # Annual solar production is calculated for a 1 kW system, and scaled to meet the selected
+    # fraction of each load profile's annual consumption. Sizes are rounded to 0.1 kW.
+
+    Solar_Size_Inputs = {}
+
+    if "Solar Plus Storage" in Model_Type_Inputs:
+
+        for Load_Profile_Name_Input, Load_Profile_Options in Load_Profile_Inputs.items():
+
+            Load_Profile_Data, Load_Profile_Master_Index = Import_Load_Profile_Data(Fixed_Inputs["Input_Output_Data_Directory_Location"],
+                                                                                  Fixed_Inputs["OSESMO_Git_Repo_Directory"],
+                                                                                  delta_t, Load_Profile_Name_Input)
+
+            Solar_Profile_Master_Index, Solar_Profile_Description, Solar_PV_Profile_Data = Import_Solar_PV_Profile_Data(
+                Fixed_Inputs["Input_Output_Data_Directory_Location"], Fixed_Inputs["OSESMO_Git_Repo_Directory"],
+                delta_t, Load_Profile_Options["Solar_Profile_Name_Input"], 1)
+
+            Total_Annual_Consumption = np.sum(Load_Profile_Data) * delta_t
+            Solar_PV_Annual_Production_per_kW = np.sum(Solar_PV_Profile_Data) * delta_t
+
+            Solar_Size_Inputs[Load_Profile_Name_Input] = float(round(Solar_Sizing_Fraction * Total_Annual_Consumption / Solar_PV_Annual_Production_per_kW, 1))
+
+
+    ## Model Input Iteration
+
+    Scenario_Grid = []
+
+    Model_Run_Number_Input = Fixed_Inputs.get("Model_Run_Number_Input", 0)  # Initialize value, gets updated every model run.
+
+    for Model_Type_Input in Model_Type_Inputs:
+
+        for Load_Profile_Name_Input, Load_Profile_Options in Load_Profile_Inputs.items():
+
+            if Model_Type_Input == "Storage Only":
+
+                Solar_Profile_Name_Input = "No Solar"
+                Solar_Size_Input = 0
+                ITC_Constraint_Input = 0
+                Solar_Installed_Cost_per_kW = 0
+
+                Retail_Rate_Name_Inputs = list(Load_Profile_Options["Retail_Rate_Name_Inputs"])
+
+            elif Model_Type_Input == "Solar Plus Storage":
+
+                Solar_Profile_Name_Input = Load_Profile_Options["Solar_Profile_Name_Input"]
+                Solar_Size_Input = Solar_Size_Inputs[Load_Profile_Name_Input]
+                ITC_Constraint_Input = 1
+                Solar_Installed_Cost_per_kW = Solar_Installed_Cost_per_kW_Calculator(Customer_Class_Input, Solar_Size_Input)
+
+                # Only sites with solar are eligible for some rates (ex. SDG&E DR-SES).
+                Retail_Rate_Name_Inputs = list(Load_Profile_Options["Retail_Rate_Name_Inputs"]) + \
+                                          list(Load_Profile_Options.get("Solar_Plus_Storage_Retail_Rate_Name_Inputs", []))
+
+            for Retail_Rate_Name_Input in Retail_Rate_Name_Inputs:
+
+                for Storage_Type_Input, Storage_Type_Options in Storage_Type_Inputs.items():
+
+                    for Storage_Power_Rating_Input in Load_Profile_Options["Storage_Power_Rating_Inputs"]:
+
+                        Usable_Storage_Capacity_Input = Storage_Power_Rating_Input * Storage_Type_Options["Storage_Duration"]
+
+                        # Storage Cost per kWh
+                        Storage_Installed_Cost_per_kWh = Storage_Installed_Cost_per_kWh_Calculator(Customer_Class_Input, Storage_Type_Input)
+
+                        # Estimated Future Lithium-Ion Battery Installed Cost per kWh
+                        # Used to calculate cycling penalty for lithium-ion batteries.
+                        Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh = 100
+
+                        # Storage Cycle Lifetime and Depth of Discharge
+                        if Storage_Type_Input == "Lithium-Ion Battery":
+                            Cycle_Life = 10 * 365.25
+                            Storage_Depth_of_Discharge = 0.8
+                        elif Storage_Type_Input == "Flow Battery":
+                            Cycle_Life = 20 * 365.25
+                            Storage_Depth_of_Discharge = 1
+
+                        # Storage Control Algorithm Name
+                        if Retail_Rate_Name_Input in Self_Supply_Retail_Rate_Name_Inputs and Model_Type_Input == "Solar Plus Storage":
+                            Storage_Control_Algorithm_Name = "OSESMO Non-Economic Solar Self-Supply"
+                        else:
+                            Storage_Control_Algorithm_Name = "OSESMO Economic Dispatch"
+
+                        for Single_Cycle_RTE_Input in Storage_Type_Options["Single_Cycle_RTE_Inputs"]:
+
+                            for GHG_Reduction_Solution_Input in GHG_Reduction_Solution_Inputs:
+
+                                for Equivalent_Cycling_Constraint_Input in Equivalent_Cycling_Constraint_Inputs:
+
+                                    for Annual_RTE_Constraint_Input in Annual_RTE_Constraint_Inputs:
+
+                                        if GHG_Reduction_Solution_Input == "GHG Signal Co-Optimization":
+                                            Carbon_Adder_Incentive_Value_Input_Iter = Carbon_Adder_Incentive_Value_Inputs
+                                            Emissions_Forecast_Signal_Input_Iter = Load_Profile_Options["Emissions_Forecast_Signal_Inputs"]
+                                        else:
+                                            Carbon_Adder_Incentive_Value_Input_Iter = [0]
+                                            Emissions_Forecast_Signal_Input_Iter = ["No Emissions Forecast Signal"]
+
+                                        for Carbon_Adder_Incentive_Value_Input in Carbon_Adder_Incentive_Value_Input_Iter:
+
+                                            for Emissions_Forecast_Signal_Input in Emissions_Forecast_Signal_Input_Iter:
+
+                                                # Add Model Run, Increase Model Run Number Counter
+
+                                                Model_Run_Number_Input = Model_Run_Number_Input + 1
+
+                                                Scenario_Grid.append(dict(Fixed_Inputs,
+                                                    Model_Run_Number_Input = Model_Run_Number_Input,
+                                                    Model_Type_Input = Model_Type_Input,
+                                                    Load_Profile_Name_Input = Load_Profile_Name_Input,
+                                                    Retail_Rate_Name_Input = Retail_Rate_Name_Input,
+                                                    Solar_Profile_Name_Input = Solar_Profile_Name_Input,
+                                                    Solar_Size_Input = Solar_Size_Input,
+                                                    Storage_Type_Input = Storage_Type_Input,
+                                                    Storage_Power_Rating_Input = Storage_Power_Rating_Input,
+                                                    Usable_Storage_Capacity_Input = Usable_Storage_Capacity_Input,
+                                                    Single_Cycle_RTE_Input = Single_Cycle_RTE_Input,
+                                                    Storage_Control_Algorithm_Name = Storage_Control_Algorithm_Name,
+                                                    GHG_Reduction_Solution_Input = GHG_Reduction_Solution_Input,
+                                                    Equivalent_Cycling_Constraint_Input = Equivalent_Cycling_Constraint_Input,
+                                                    Annual_RTE_Constraint_Input = Annual_RTE_Constraint_Input,
+                                                    ITC_Constraint_Input = ITC_Constraint_Input,
+                                                    Carbon_Adder_Incentive_Value_Input = Carbon_Adder_Incentive_Value_Input,
+                                                    Emissions_Forecast_Signal_Input = Emissions_Forecast_Signal_Input,
+                                                    Solar_Installed_Cost_per_kW = Solar_Installed_Cost_per_kW,
+                                                    Storage_Installed_Cost_per_kWh = Storage_Installed_Cost_per_kWh,
+                                                    Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh = Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh,
+                                                    Cycle_Life = Cycle_Life,
+                                                    Storage_Depth_of_Discharge = Storage_Depth_of_Discharge))
+
+    return Scenario_Grid
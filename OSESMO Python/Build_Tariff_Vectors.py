@@ -0,0 +1,216 @@
+## Tariff Vector Cache
+
+# Tariff vectors built from the same tariff definition, start time, timestep, and number of timesteps
+# are reused within a Python process. Cached arrays are read-only.
+
+from LRU_Cache import LRU_Cache
+
+Tariff_Vector_Cache_Size = 32
+
+Tariff_Vector_Cache = LRU_Cache(Tariff_Vector_Cache_Size)
+
+
+## Holiday Calendars
+
+# Holidays are defined by rules, so that tariff vectors can be built for any year.
+# Each rule is either ("Fixed", Month, Day) or ("Weekday", Month, Weekday, n), where Weekday is a numpy weekmask day
+# (ex. "Mon") and n is the occurrence of that weekday in the month (1 = first, -1 = last).
+# If a holiday falls on a Sunday, the following Monday is also a holiday.
+
+Holiday_Calendars = {
+
+    # PG&E holidays - https://www.pge.com/tariffs/toudates.shtml
+    "PG&E": [("Fixed", 1, 1),  # New Year's Day
+             ("Weekday", 2, "Mon", 3),  # Presidents' Day
+             ("Weekday", 5, "Mon", -1),  # Memorial Day
+             ("Fixed", 7, 4),  # Independence Day
+             ("Weekday", 9, "Mon", 1),  # Labor Day
+             ("Fixed", 11, 11),  # Veterans Day
+             ("Weekday", 11, "Thu", 4),  # Thanksgiving Day
+             ("Fixed", 12, 25)]}  # Christmas Day
+
+
+def Build_Tariff_Vectors(Tariff_Definition=None, Start_Time_Input=None, delta_t=None, Number_of_Timesteps=None):
+
+    # Load Python Packages
+    import json
+    import numpy as np
+
+    # This function builds the time-series vectors used by OSESMO for a retail rate (volumetric energy rates,
+    # month and day numbers, and coincident peak and part-peak demand charge binary variables),
+    # from a compact time-of-use tariff definition, for any start time and timestep.
+    # It replaces the offline "Tariff Vectors Creator.R" scripts that pre-expand each rate into .csv files.
+
+    # Tariff_Definition is a dictionary (as listed in Data_Catalog.json) containing:
+    #  * "Summer_Months" - list of summer months (1-12). All other months are winter months.
+    #  * "Holiday_Calendar" - name of a holiday calendar in Holiday_Calendars (optional).
+    #  * "Additional_Holidays" - list of additional holiday dates, formatted as "YYYY-MM-DD" (optional).
+    #  * "Time_Basis" - "Standard Time" (default) if period hours, months, and days are in local standard time all year,
+    #    or "Local Time" if they follow the local clock, which is one hour ahead of standard time
+    #    between 2 am on the second Sunday in March and 2 am on the first Sunday in November (optional).
+    #  * "DST_Period_Adjustment" - if true, time-of-use periods are shifted back by one hour between the second Sunday
+    #    in March and the first Sunday in April, and between the last Sunday in October and the first Sunday in November,
+    #    as in PG&E schedules whose period definitions do not shift with Daylight Savings Time (optional).
+    #  * "TOU_Periods" - list of time-of-use periods. Each period contains:
+    #      * "Season" - "Summer", "Winter", or "All".
+    #      * "Months" - list of months the period applies to, within its season (optional, default all months).
+    #      * "Day_Types" - list including "Weekday" and/or "Weekend/Holiday" (optional, default both).
+    #      * "Hours" - list of [start hour, end hour) intervals, in decimal hours (ex. [[8.5, 12], [18, 21.5]]).
+    #      * "Energy_Rate" - volumetric energy rate ($ per kWh).
+    #      * "Binary_Variable" - name of the demand charge binary variable vector set to 1 during this period
+    #        (ex. "Summer_Peak_Binary_Data"), if any.
+
+    # Each timestep is assigned to the first period in the list that matches it,
+    # so off-peak periods can be listed last, covering all hours.
+
+    # Timestamps are in local standard time, with no Daylight Savings Time gaps or overlaps,
+    # matching the input data vectors used by OSESMO. Tariffs with a "Local Time" basis are evaluated on the local clock.
+
+    Timestep_Length = int(round(delta_t * 60))  # Timestep length, in minutes
+
+    Start_Time = np.datetime64(Start_Time_Input, 'm')
+
+    if Number_of_Timesteps is None:
+        # Default to the end of the calendar year that the start time falls in.
+        End_Time = (Start_Time.astype('datetime64[Y]') + 1).astype('datetime64[m]')
+        Number_of_Timesteps = int((End_Time - Start_Time) / np.timedelta64(Timestep_Length, 'm'))
+
+    Tariff_Vector_Key = (json.dumps(Tariff_Definition, sort_keys=True), str(Start_Time), Timestep_Length, Number_of_Timesteps)
+
+    Cached_Tariff_Vectors = Tariff_Vector_Cache.Get(Tariff_Vector_Key)
+
+    if Cached_Tariff_Vectors is not None:
+        return Cached_Tariff_Vectors
+
+
+    ## Calendar Variables
+
+    Date_Time = Start_Time + np.arange(Number_of_Timesteps) * np.timedelta64(Timestep_Length, 'm')
+    Date = Date_Time.astype('datetime64[D]')
+
+    Years = range(int(Date[0].astype('datetime64[Y]').astype(int)) + 1970,
+                  int(Date[-1].astype('datetime64[Y]').astype(int)) + 1971)
+
+    def Nth_Weekday(Year, Month_Number, Weekday, n):
+        # Roll forward to the first given weekday in the month (or the next month, for the last weekday), then offset.
+        if n > 0:
+            return np.busday_offset(np.datetime64("%04d-%02d" % (Year, Month_Number), 'D'), n - 1, roll='forward', weekmask=Weekday)
+        else:
+            return np.busday_offset((np.datetime64("%04d-%02d" % (Year, Month_Number), 'M') + 1).astype('datetime64[D]'),
+                                    n, roll='forward', weekmask=Weekday)
+
+    if Tariff_Definition.get("Time_Basis", "Standard Time") == "Local Time":
+
+        # Daylight Savings Time starts at 2 am standard time, and ends at 2 am daylight time (1 am standard time).
+        Daylight_Savings_Time_Flag = np.zeros(Number_of_Timesteps, dtype=bool)
+
+        for Year in Years:
+            Daylight_Savings_Time_Flag |= (Date_Time >= Nth_Weekday(Year, 3, "Sun", 2) + np.timedelta64(2, 'h')) & \
+                                          (Date_Time < Nth_Weekday(Year, 11, "Sun", 1) + np.timedelta64(1, 'h'))
+
+        Date_Time = Date_Time + Daylight_Savings_Time_Flag * np.timedelta64(60, 'm')
+        Date = Date_Time.astype('datetime64[D]')
+
+    Month = Date.astype('datetime64[M]').astype(int) % 12 + 1
+    Day = (Date - Date.astype('datetime64[M]')).astype(int) + 1
+    Hour_Decimal = (Date_Time - Date).astype(int) / 60  # ex. 8:30 am = 8.5
+
+
+    ## Holidays
+
+    Holidays = [np.datetime64(Holiday, 'D') for Holiday in Tariff_Definition.get("Additional_Holidays", [])]
+
+    for Year in Years:
+        for Holiday_Rule in Holiday_Calendars.get(Tariff_Definition.get("Holiday_Calendar"), []):
+            if Holiday_Rule[0] == "Fixed":
+                Holidays.append(np.datetime64("%04d-%02d-%02d" % (Year, Holiday_Rule[1], Holiday_Rule[2]), 'D'))
+            elif Holiday_Rule[0] == "Weekday":
+                Holidays.append(Nth_Weekday(Year, Holiday_Rule[1], Holiday_Rule[2], Holiday_Rule[3]))
+
+    # If a holiday falls on a Sunday, include the following Monday as an observed holiday.
+    Holidays = np.array(Holidays, dtype='datetime64[D]')
+    Holidays = np.concatenate([Holidays, Holidays[np.is_busday(Holidays, weekmask="Sun")] + 1])
+
+    Weekend_Holiday = ~np.is_busday(Date, weekmask="Mon Tue Wed Thu Fri") | np.isin(Date, Holidays)
+
+
+    ## Assign Time-of-Use Periods
+
+    Season = np.where(np.isin(Month, Tariff_Definition["Summer_Months"]), "Summer", "Winter")
+
+    TOU_Period_Index = np.full(Number_of_Timesteps, -1)
+
+    for Period_Index, TOU_Period in enumerate(Tariff_Definition["TOU_Periods"]):
+
+        Period_Flag = TOU_Period_Index == -1
+
+        if TOU_Period["Season"] != "All":
+            Period_Flag &= Season == TOU_Period["Season"]
+
+        if "Months" in TOU_Period:
+            Period_Flag &= np.isin(Month, TOU_Period["Months"])
+
+        Day_Types = TOU_Period.get("Day_Types", ["Weekday", "Weekend/Holiday"])
+
+        if "Weekday" not in Day_Types:
+            Period_Flag &= Weekend_Holiday
+        if "Weekend/Holiday" not in Day_Types:
+            Period_Flag &= ~Weekend_Holiday
+
+        Hour_Flag = np.zeros(Number_of_Timesteps, dtype=bool)
+
+        for Start_Hour, End_Hour in TOU_Period["Hours"]:
+            Hour_Flag |= (Hour_Decimal >= Start_Hour) & (Hour_Decimal < End_Hour)
+
+        TOU_Period_Index[Period_Flag & Hour_Flag] = Period_Index
+
+    if np.any(TOU_Period_Index == -1):
+        raise ValueError("Tariff definition does not assign a time-of-use period to " +
+                         str(np.sum(TOU_Period_Index == -1)) + " timesteps, starting at " +
+                         str(Date_Time[np.argmax(TOU_Period_Index == -1)]) + ".")
+
+
+    ## Daylight Savings Time Period Adjustment
+
+    # Period definitions are shifted back by one hour, so each timestep in the adjustment period
+    # takes the period of the timestep one hour earlier.
+
+    if Tariff_Definition.get("DST_Period_Adjustment", False):
+
+        DST_Adjustment_Flag = np.zeros(Number_of_Timesteps, dtype=bool)
+
+        for Year in Years:
+            # Second Sunday in March until the day before the first Sunday in April,
+            # and last Sunday in October until the day before the first Sunday in November.
+            DST_Adjustment_Flag |= (Date >= Nth_Weekday(Year, 3, "Sun", 2)) & (Date < Nth_Weekday(Year, 4, "Sun", 1))
+            DST_Adjustment_Flag |= (Date >= Nth_Weekday(Year, 10, "Sun", -1)) & (Date < Nth_Weekday(Year, 11, "Sun", 1))
+
+        Timesteps_per_Hour = int(60 / Timestep_Length)
+        DST_Adjustment_Flag[:Timesteps_per_Hour] = False
+
+        DST_Adjustment_Indices = np.nonzero(DST_Adjustment_Flag)[0]
+        TOU_Period_Index[DST_Adjustment_Indices] = TOU_Period_Index[DST_Adjustment_Indices - Timesteps_per_Hour]
+
+
+    ## Build Tariff Vectors
+
+    Energy_Rates = np.array([TOU_Period["Energy_Rate"] for TOU_Period in Tariff_Definition["TOU_Periods"]], dtype=float)
+
+    Tariff_Vectors = {"Volumetric_Rate_Data": Energy_Rates[TOU_Period_Index],
+                      "Month_Data": Month.astype(float),
+                      "Day_Data": Day.astype(float)}
+
+    for Binary_Variable_Name in ["Summer_Peak_Binary_Data", "Summer_Part_Peak_Binary_Data",
+                                 "Winter_Peak_Binary_Data", "Winter_Part_Peak_Binary_Data"]:
+
+        Binary_Variable_Periods = [Period_Index for Period_Index, TOU_Period in enumerate(Tariff_Definition["TOU_Periods"])
+                                   if TOU_Period.get("Binary_Variable") == Binary_Variable_Name]
+
+        Tariff_Vectors[Binary_Variable_Name] = np.isin(TOU_Period_Index, Binary_Variable_Periods).astype(float)
+
+    for Tariff_Vector in Tariff_Vectors.values():
+        Tariff_Vector.flags.writeable = False
+
+    Tariff_Vector_Cache.Save(Tariff_Vector_Key, Tariff_Vectors)
+
+    return Tariff_Vectors
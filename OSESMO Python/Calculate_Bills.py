@@ -0,0 +1,158 @@
+def Calculate_Bills(Net_Load_Profile_Data=None, delta_t=None, Month_Data=None, Volumetric_Rate_Data=None,
+                    Summer_Peak_DC=None, Summer_Part_Peak_DC=None, Summer_Noncoincident_DC=None,
+                    Winter_Peak_DC=None, Winter_Part_Peak_DC=None, Winter_Noncoincident_DC=None,
+                    Fixed_Per_Meter_Day_Charge=None, Fixed_Per_Meter_Month_Charge=None,
+                    First_Summer_Month=None, Last_Summer_Month=None,
+                    Summer_Peak_Binary_Data=None, Summer_Part_Peak_Binary_Data=None,
+                    Winter_Peak_Binary_Data=None, Winter_Part_Peak_Binary_Data=None,
+                    Demand_Averaging_Window=None):
+
+    # Load Python Packages
+    import numpy as np
+
+    # This function calculates the monthly retail electricity bill components of one or more net load profiles.
+
+    # Net_Load_Profile_Data is a net load profile (kW) with one value per model timestep,
+    # or a (number of profiles, number of timesteps) array containing one net load profile per row
+    # (ex. baseline load, net load with solar only, and net load for many candidate storage dispatch schedules).
+    # All profiles are billed in one pass, using the retail rate vectors and charges returned by Import_Retail_Rate_Data.
+
+    # Demand_Averaging_Window is the demand charge averaging interval, in minutes (default 15 minutes).
+    # Billing demand is the maximum of the average demand in each averaging interval, starting at the first timestep.
+    # If the model timestep is at least as long as the averaging window (ex. hourly screening runs),
+    # billing demand is approximated using the average demand in each model timestep.
+    # Coincident peak and part-peak demand are calculated using the intervals that start in each period.
+
+    # Returns a dictionary of (number of profiles, 12) arrays, with one column per month:
+    #  * "Fixed_Charge", "NC_DC", "CPK_DC", "CPP_DC", and "Energy_Charge" - monthly fixed charges,
+    #    noncoincident, coincident peak, and coincident part-peak demand charges, and volumetric energy charges ($).
+    #  * "P_max_NC", "P_max_CPK", and "P_max_CPP" - monthly noncoincident, coincident peak,
+    #    and coincident part-peak billing demand (kW). Coincident demand is 0 kW in months whose
+    #    coincident demand charge is $0/kW, or that have no coincident peak or part-peak period.
+    # Months that are not in Month_Data have no charges.
+
+    if Demand_Averaging_Window is None:
+        Demand_Averaging_Window = 15
+
+    Net_Load_Profile_Data = np.atleast_2d(np.asarray(Net_Load_Profile_Data, dtype = float))
+
+    numtsteps = Net_Load_Profile_Data.shape[1]
+
+    Month_Data = np.asarray(Month_Data).astype(int).reshape((-1,))
+
+    if len(Month_Data) != numtsteps:
+        raise ValueError("Net load profiles have " + str(numtsteps) + " timesteps, but retail rate vectors have " +
+                         str(len(Month_Data)) + " timesteps.")
+
+
+    ## Monthly Charge Rates
+
+    Months = np.arange(1, 13)
+
+    Summer_Months = (Months >= First_Summer_Month) & (Months <= Last_Summer_Month)
+
+    Noncoincident_DC_Month = np.where(Summer_Months, Summer_Noncoincident_DC, Winter_Noncoincident_DC)
+    Peak_DC_Month = np.where(Summer_Months, Summer_Peak_DC, Winter_Peak_DC)
+    Part_Peak_DC_Month = np.where(Summer_Months, Summer_Part_Peak_DC, Winter_Part_Peak_DC)
+
+    # Coincident peak and part-peak periods of each timestep, based on the season of its month.
+    Summer_Timesteps = Summer_Months[Month_Data - 1]
+
+    Peak_Binary_Data = np.where(Summer_Timesteps, np.reshape(Summer_Peak_Binary_Data, (-1,)), np.reshape(Winter_Peak_Binary_Data, (-1,))) == 1
+    Part_Peak_Binary_Data = np.where(Summer_Timesteps, np.reshape(Summer_Part_Peak_Binary_Data, (-1,)), np.reshape(Winter_Part_Peak_Binary_Data, (-1,))) == 1
+
+
+    ## Fixed Charges
+
+    Month_Timesteps = np.bincount(Month_Data, minlength = 13)[1:13]
+
+    Fixed_Charge = np.where(Month_Timesteps > 0,
+                            Fixed_Per_Meter_Month_Charge + (Fixed_Per_Meter_Day_Charge * Month_Timesteps / (24 * (1 / delta_t))), 0)
+
+    Fixed_Charge = np.tile(Fixed_Charge, (Net_Load_Profile_Data.shape[0], 1))
+
+
+    ## Energy Charges
+
+    # Each month is a set of consecutive timesteps (a segment). Segments are summed using np.add.reduceat,
+    # and then added to their month, so that month numbers don't need to be in order or consecutive.
+
+    def Month_Segment_Starts(Segment_Month_Data):
+        return np.concatenate(([0], np.flatnonzero(np.diff(Segment_Month_Data)) + 1))
+
+    Segment_Starts = Month_Segment_Starts(Month_Data)
+    Segment_Months = Month_Data[Segment_Starts]
+
+    Energy_Charge_Segments = np.add.reduceat(Net_Load_Profile_Data * np.reshape(Volumetric_Rate_Data, (1, -1)), Segment_Starts, axis = 1) * delta_t
+
+    Energy_Charge = np.zeros((Net_Load_Profile_Data.shape[0], 12))
+    np.add.at(Energy_Charge.T, Segment_Months - 1, Energy_Charge_Segments.T)
+
+
+    ## Billing Demand
+
+    Model_Timestep = int(round(delta_t * 60))  # Model timestep resolution, in minutes
+
+    if Demand_Averaging_Window > Model_Timestep:
+
+        if Demand_Averaging_Window % Model_Timestep != 0:
+            raise ValueError("The demand averaging window (" + str(Demand_Averaging_Window) + " minutes) " +
+                             "must be a multiple of the model timestep (" + str(Model_Timestep) + " minutes).")
+
+        # Number of timesteps to average to get demand averaging window data.
+        Reshaped_Rows_Num = Demand_Averaging_Window // Model_Timestep
+
+        if numtsteps % Reshaped_Rows_Num != 0:
+            raise ValueError("The number of timesteps (" + str(numtsteps) + ") must be a multiple of the number of timesteps " +
+                             "in the demand averaging window (" + str(Reshaped_Rows_Num) + ").")
+
+        # Reshape net load data so that each averaging interval's data is in the same row
+        # (ex. 3 columns for 5-minute data and a 15-minute averaging window), and average each row.
+        Demand_Data = np.mean(np.reshape(Net_Load_Profile_Data, (Net_Load_Profile_Data.shape[0], -1, Reshaped_Rows_Num)), 2)
+
+        # Each interval takes the month and coincident periods of its first timestep.
+        Demand_Month_Data = Month_Data[::Reshaped_Rows_Num]
+        Demand_Peak_Binary_Data = Peak_Binary_Data[::Reshaped_Rows_Num]
+        Demand_Part_Peak_Binary_Data = Part_Peak_Binary_Data[::Reshaped_Rows_Num]
+
+    else:
+
+        Demand_Data = Net_Load_Profile_Data
+        Demand_Month_Data = Month_Data
+        Demand_Peak_Binary_Data = Peak_Binary_Data
+        Demand_Part_Peak_Binary_Data = Part_Peak_Binary_Data
+
+    Demand_Segment_Starts = Month_Segment_Starts(Demand_Month_Data)
+    Demand_Segment_Months = Demand_Month_Data[Demand_Segment_Starts]
+
+    def Maximum_Monthly_Demand(Period_Binary_Data):
+
+        # Intervals outside of the period are excluded from each segment's maximum using -inf.
+        if Period_Binary_Data is None:
+            Period_Demand_Data = Demand_Data
+        else:
+            Period_Demand_Data = np.where(Period_Binary_Data, Demand_Data, -np.inf)
+
+        Maximum_Segment_Demand = np.maximum.reduceat(Period_Demand_Data, Demand_Segment_Starts, axis = 1)
+
+        Maximum_Month_Demand = np.full((Net_Load_Profile_Data.shape[0], 12), -np.inf)
+        np.maximum.at(Maximum_Month_Demand.T, Demand_Segment_Months - 1, Maximum_Segment_Demand.T)
+
+        # Months without any intervals in the period have no billing demand.
+        Maximum_Month_Demand[np.isneginf(Maximum_Month_Demand)] = 0
+
+        return Maximum_Month_Demand
+
+    P_max_NC = Maximum_Monthly_Demand(None)
+    P_max_CPK = np.where(Peak_DC_Month > 0, Maximum_Monthly_Demand(Demand_Peak_Binary_Data), 0)
+    P_max_CPP = np.where(Part_Peak_DC_Month > 0, Maximum_Monthly_Demand(Demand_Part_Peak_Binary_Data), 0)
+
+
+    ## Demand Charges
+
+    NC_DC = Noncoincident_DC_Month * P_max_NC
+    CPK_DC = Peak_DC_Month * P_max_CPK
+    CPP_DC = Part_Peak_DC_Month * P_max_CPP
+
+    return {"Fixed_Charge": Fixed_Charge, "NC_DC": NC_DC, "CPK_DC": CPK_DC, "CPP_DC": CPP_DC, "Energy_Charge": Energy_Charge,
+            "P_max_NC": P_max_NC, "P_max_CPK": P_max_CPK, "P_max_CPP": P_max_CPP}
@@ -0,0 +1,19 @@
+def Calculate_Scenario_ID(OSESMO_Inputs=None):
+
+    # Load Python Packages
+    import hashlib
+    import json
+    from Memoize_Model_Run import Model_Run_Memo_Excluded_Inputs
+
+    # This function returns the scenario ID of a model run: a SHA-256 hash of the OSESMO inputs that affect model results.
+    # OSESMO_Inputs is a dictionary of OSESMO keyword arguments.
+
+    # The same inputs are excluded as in the model run memo key (see Memoize_Model_Run.py), so model runs that only differ
+    # in their labels (ex. Model_Run_Number_Input) have the same scenario ID. Input_Output_Data_Directory_Location
+    # is also excluded, so that a scenario has the same ID on every computer.
+    # Unlike the memo key, the scenario ID doesn't change when the model code or input data files change.
+
+    Scenario_Inputs = {Input_Name: Input_Value for Input_Name, Input_Value in OSESMO_Inputs.items()
+                       if Input_Name not in Model_Run_Memo_Excluded_Inputs + ["Input_Output_Data_Directory_Location"]}
+
+    return hashlib.sha256(json.dumps(Scenario_Inputs, sort_keys = True, default = repr).encode("utf-8")).hexdigest()
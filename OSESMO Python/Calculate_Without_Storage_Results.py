@@ -0,0 +1,167 @@
+## Without-Storage Results Cache
+
+# Baseline (no solar or storage) and solar-only results depend on the load profile, retail rate, solar profile,
+# solar system size, start time, and timestep resolution, but not on any storage system or control inputs.
+# In storage sizing sweeps, they are calculated once for each combination of these inputs,
+# and reused by every model run in the sweep. Cached arrays are read-only.
+
+# Like the other input data caches, this cache assumes that input data files are not modified
+# while a Python process is running.
+
+from LRU_Cache import LRU_Cache
+
+Without_Storage_Results_Cache_Size = 64
+
+Without_Storage_Results_Cache = LRU_Cache(Without_Storage_Results_Cache_Size)
+
+
+def Calculate_Without_Storage_Results(Input_Output_Data_Directory_Location=None, Load_Profile_Name_Input=None,
+                                      Retail_Rate_Name_Input=None, Start_Time_Input=None, Model_Type_Input=None,
+                                      Solar_Profile_Name_Input=None, Solar_Size_Input=None, delta_t=None,
+                                      Load_Profile_Data=None, Solar_PV_Profile_Data=None, Volumetric_Rate_Data=None, Month_Data=None,
+                                      Summer_Peak_DC=None, Summer_Part_Peak_DC=None, Summer_Noncoincident_DC=None,
+                                      Winter_Peak_DC=None, Winter_Part_Peak_DC=None, Winter_Noncoincident_DC=None,
+                                      Fixed_Per_Meter_Day_Charge=None, Fixed_Per_Meter_Month_Charge=None,
+                                      First_Summer_Month=None, Last_Summer_Month=None,
+                                      Summer_Peak_Binary_Data=None, Summer_Part_Peak_Binary_Data=None,
+                                      Winter_Peak_Binary_Data=None, Winter_Part_Peak_Binary_Data=None,
+                                      Generation_Cost_Data=None, Representative_Distribution_Cost_Data=None,
+                                      Marginal_Emissions_Rate_Evaluation_Data=None):
+
+    # Load Python Packages
+    import os
+    import numpy as np
+    from Calculate_Bills import Calculate_Bills
+    from Build_Month_Time_Index import Build_Month_Time_Index
+
+    # This function calculates the monthly bill components (fixed charges, demand charges, and energy charges),
+    # annual peak demand and energy consumption, grid costs, and GHG emissions of the customer
+    # without storage, both before solar (baseline) and with solar only.
+
+    # Returns a dictionary of results, using the same variable names as OSESMO.
+    # Monthly bill components are (12, 1) column vectors, and monthly grid costs are (12, 2) arrays
+    # of generation and distribution costs.
+
+    # For "Storage Only" model runs, Solar_PV_Profile_Data is all zeros, and solar-only results equal baseline results.
+
+    Model_Timestep = int(round(delta_t * 60))  # Model timestep resolution, in minutes
+
+    if Model_Type_Input == "Solar Plus Storage" and Solar_Profile_Name_Input != "No Solar":
+        Solar_Key = (Solar_Profile_Name_Input, Solar_Size_Input)
+    else:
+        Solar_Key = None
+
+    Without_Storage_Results_Key = (None if Input_Output_Data_Directory_Location is None else os.path.abspath(Input_Output_Data_Directory_Location),
+                                   Load_Profile_Name_Input, Retail_Rate_Name_Input, str(Start_Time_Input), Solar_Key, Model_Timestep)
+
+    Cached_Without_Storage_Results = Without_Storage_Results_Cache.Get(Without_Storage_Results_Key)
+
+    if Cached_Without_Storage_Results is not None:
+        return Cached_Without_Storage_Results
+
+
+    ## Calculate Monthly Bill Components without Storage
+
+    # Baseline load and net load with solar only are billed together.
+    Bills_without_Storage = Calculate_Bills(np.vstack((np.reshape(Load_Profile_Data, (1, -1)),
+                                                       np.reshape(Load_Profile_Data - Solar_PV_Profile_Data, (1, -1)))),
+                                            delta_t, Month_Data, Volumetric_Rate_Data,
+                                            Summer_Peak_DC, Summer_Part_Peak_DC, Summer_Noncoincident_DC,
+                                            Winter_Peak_DC, Winter_Part_Peak_DC, Winter_Noncoincident_DC,
+                                            Fixed_Per_Meter_Day_Charge, Fixed_Per_Meter_Month_Charge,
+                                            First_Summer_Month, Last_Summer_Month,
+                                            Summer_Peak_Binary_Data, Summer_Part_Peak_Binary_Data,
+                                            Winter_Peak_Binary_Data, Winter_Part_Peak_Binary_Data)
+
+    # Monthly bill components are saved as column vectors, with one row per month.
+    Fixed_Charge_Vector = Bills_without_Storage["Fixed_Charge"][0].reshape((-1, 1))
+
+    NC_DC_Baseline_Vector = Bills_without_Storage["NC_DC"][0].reshape((-1, 1))
+    NC_DC_with_Solar_Only_Vector = Bills_without_Storage["NC_DC"][1].reshape((-1, 1))
+
+    CPK_DC_Baseline_Vector = Bills_without_Storage["CPK_DC"][0].reshape((-1, 1))
+    CPK_DC_with_Solar_Only_Vector = Bills_without_Storage["CPK_DC"][1].reshape((-1, 1))
+
+    CPP_DC_Baseline_Vector = Bills_without_Storage["CPP_DC"][0].reshape((-1, 1))
+    CPP_DC_with_Solar_Only_Vector = Bills_without_Storage["CPP_DC"][1].reshape((-1, 1))
+
+    Energy_Charge_Baseline_Vector = Bills_without_Storage["Energy_Charge"][0].reshape((-1, 1))
+    Energy_Charge_with_Solar_Only_Vector = Bills_without_Storage["Energy_Charge"][1].reshape((-1, 1))
+
+
+    ## Calculate Annual Peak Demand and Energy Consumption without Storage
+
+    Annual_Peak_Demand_Baseline = np.max(Load_Profile_Data)
+    Annual_Total_Energy_Consumption_Baseline = np.sum(Load_Profile_Data) * delta_t
+
+    Annual_Peak_Demand_with_Solar_Only = np.max(Load_Profile_Data - Solar_PV_Profile_Data)
+    Annual_Total_Energy_Consumption_with_Solar_Only = np.sum(Load_Profile_Data - Solar_PV_Profile_Data) * delta_t
+
+
+    ## Calculate Grid Costs without Storage
+
+    numtsteps_year = len(Load_Profile_Data)
+
+    Annual_Grid_Cost_Baseline = np.dot(Generation_Cost_Data + Representative_Distribution_Cost_Data, Load_Profile_Data) * (1 / 1000) * delta_t
+
+    Annual_Grid_Cost_with_Solar_Only = np.dot(Generation_Cost_Data + Representative_Distribution_Cost_Data, Load_Profile_Data - Solar_PV_Profile_Data) * (1 / 1000) * delta_t
+
+    Grid_Cost_Timestep_Baseline = np.concatenate((np.multiply(Generation_Cost_Data, Load_Profile_Data).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t, \
+                                   np.multiply(Representative_Distribution_Cost_Data, Load_Profile_Data).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t), axis = 1)
+
+    Grid_Cost_Timestep_with_Solar_Only = np.concatenate((np.multiply(Generation_Cost_Data, (Load_Profile_Data - Solar_PV_Profile_Data)).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t, \
+                                                         np.multiply(Representative_Distribution_Cost_Data, (Load_Profile_Data - Solar_PV_Profile_Data)).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t), axis = 1)
+
+    Grid_Cost_Month_Baseline = np.zeros((12, 2))
+    Grid_Cost_Month_with_Solar_Only = np.zeros((12, 2))
+
+    Month_Time_Index = Build_Month_Time_Index(Month_Data, delta_t)
+
+    for Month_Iter in range(1, 12 + 1):
+
+        if Month_Time_Index["Month_Order"] is None:
+            Month_Timesteps = slice(Month_Time_Index["Month_Start"][Month_Iter - 1], Month_Time_Index["Month_End"][Month_Iter - 1])
+        else:
+            Month_Timesteps = Month_Time_Index["Month_Order"][Month_Time_Index["Month_Start"][Month_Iter - 1]:Month_Time_Index["Month_End"][Month_Iter - 1]]
+
+        Grid_Cost_Month_Baseline[Month_Iter - 1, :] = np.sum(Grid_Cost_Timestep_Baseline[Month_Timesteps,:], axis = 0)
+        Grid_Cost_Month_with_Solar_Only[Month_Iter - 1, :] = np.sum(Grid_Cost_Timestep_with_Solar_Only[Month_Timesteps,:], axis = 0)
+
+
+    ## Calculate GHG Emissions without Storage
+
+    # (tons/kWh) = (tons/MWh) * (MWh/kWh)
+    Annual_GHG_Emissions_Baseline = np.dot(Marginal_Emissions_Rate_Evaluation_Data, Load_Profile_Data) * (1 / 1000) * delta_t
+
+    Annual_GHG_Emissions_with_Solar_Only = np.dot(Marginal_Emissions_Rate_Evaluation_Data, (Load_Profile_Data - Solar_PV_Profile_Data)) * (1 / 1000) * delta_t
+
+
+    ## Save Results to Cache
+
+    Without_Storage_Results = {"Fixed_Charge_Vector": Fixed_Charge_Vector,
+                               "NC_DC_Baseline_Vector": NC_DC_Baseline_Vector,
+                               "NC_DC_with_Solar_Only_Vector": NC_DC_with_Solar_Only_Vector,
+                               "CPK_DC_Baseline_Vector": CPK_DC_Baseline_Vector,
+                               "CPK_DC_with_Solar_Only_Vector": CPK_DC_with_Solar_Only_Vector,
+                               "CPP_DC_Baseline_Vector": CPP_DC_Baseline_Vector,
+                               "CPP_DC_with_Solar_Only_Vector": CPP_DC_with_Solar_Only_Vector,
+                               "Energy_Charge_Baseline_Vector": Energy_Charge_Baseline_Vector,
+                               "Energy_Charge_with_Solar_Only_Vector": Energy_Charge_with_Solar_Only_Vector,
+                               "Annual_Peak_Demand_Baseline": Annual_Peak_Demand_Baseline,
+                               "Annual_Peak_Demand_with_Solar_Only": Annual_Peak_Demand_with_Solar_Only,
+                               "Annual_Total_Energy_Consumption_Baseline": Annual_Total_Energy_Consumption_Baseline,
+                               "Annual_Total_Energy_Consumption_with_Solar_Only": Annual_Total_Energy_Consumption_with_Solar_Only,
+                               "Annual_Grid_Cost_Baseline": Annual_Grid_Cost_Baseline,
+                               "Annual_Grid_Cost_with_Solar_Only": Annual_Grid_Cost_with_Solar_Only,
+                               "Grid_Cost_Month_Baseline": Grid_Cost_Month_Baseline,
+                               "Grid_Cost_Month_with_Solar_Only": Grid_Cost_Month_with_Solar_Only,
+                               "Annual_GHG_Emissions_Baseline": Annual_GHG_Emissions_Baseline,
+                               "Annual_GHG_Emissions_with_Solar_Only": Annual_GHG_Emissions_with_Solar_Only}
+
+    for Result_Value in Without_Storage_Results.values():
+        if isinstance(Result_Value, np.ndarray):
+            Result_Value.flags.writeable = False
+
+    Without_Storage_Results_Cache.Save(Without_Storage_Results_Key, Without_Storage_Results)
+
+    return Without_Storage_Results
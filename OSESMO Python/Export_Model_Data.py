@@ -0,0 +1,26 @@
+def Export_Model_Data(OSESMO_Results=None):
+
+    # Load Python Packages
+    import os
+    import numpy as np
+    import pandas as pd
+
+    # This function writes the model output summary and storage dispatch profile .csv files
+    # for a model results dictionary returned by OSESMO, to the model run's output directory.
+
+    Model_Inputs_and_Outputs = OSESMO_Results["Model_Inputs_and_Outputs"]
+    Output_Directory_Filepath = OSESMO_Results["Output_Directory_Filepath"]
+
+    os.makedirs(Output_Directory_Filepath, exist_ok = True)
+
+    Model_Inputs_and_Outputs_Data = pd.DataFrame(np.array([list(Model_Inputs_and_Outputs.values())]),
+                                                 columns = list(Model_Inputs_and_Outputs.keys()))
+
+    # Timestamps are written as Python datetime values (ex. "2017-01-01 00:15:00").
+    t = OSESMO_Results["Time_Series"]["t"].astype(object)
+
+    Storage_Dispatch_Outputs = np.array([t, OSESMO_Results["Time_Series"]["P_ES"]]).transpose()
+    Storage_Dispatch_Outputs = pd.DataFrame(Storage_Dispatch_Outputs, columns = ["Date_Time_Pacific_No_DST", "Storage_Output_kW"])
+
+    Model_Inputs_and_Outputs_Data.to_csv(os.path.join(Output_Directory_Filepath, Model_Inputs_and_Outputs["Output_Summary_Filename"]), index = False)
+    Storage_Dispatch_Outputs.to_csv(os.path.join(Output_Directory_Filepath, "Storage Dispatch Profile Output.csv"), index = False)
@@ -0,0 +1,516 @@
+def Generate_Synthetic_Scenario_Data(Input_Output_Data_Directory_Location=None, Synthetic_Data_Name=None,
+                                     Number_of_Customers=None, Customer_Class_Input=None, Years=None,
+                                     Timestep_Resolution=None, Random_Seed=None):
+
+    # Load Python Packages
+    import os
+    import json
+    import datetime
+    import numpy as np
+    import scipy.signal
+    from Build_Tariff_Vectors import Build_Tariff_Vectors
+    from Import_Data_Catalog import Import_Data_Catalog
+
+    # This function generates synthetic OSESMO input data - customer load profiles, a solar PV profile,
+    # real-time and day-ahead marginal emissions rate signals, generation and distribution marginal costs,
+    # and time-of-use retail rates - for stress testing and benchmarking OSESMO beyond the sample input data
+    # (ex. 1-minute timesteps, many years, and thousands of customers).
+
+    # Data vectors are written as .csv files in the same format as the sample input data, under
+    # "Synthetic Data/<Synthetic_Data_Name>" in the input/output data directory, and are listed in a catalog
+    # (Synthetic_Data_Catalog.json) in the same format as Data_Catalog.json, which is added to the data catalog
+    # using Import_Data_Catalog. Retail rates are listed as tariff definitions, and are built for any start time and timestep.
+
+    # OSESMO model runs cover one calendar year, so one set of vectors is generated for each year in Years,
+    # and each customer has one load profile per year (ex. "Synthetic Customer 0001 2030"), mapped to that year's
+    # emissions signal and marginal costs. Customer characteristics are kept from year to year.
+
+    # Customer_Class_Input is "Residential" or "Commercial and Industrial" (default).
+    # Timestep_Resolution is the timestep resolution of the generated data, in minutes (default 15),
+    # and must divide one hour (ex. 1, 5, 15, or 60).
+
+    # Data are repeatable: the same Random_Seed always generates the same data. Each customer's data only depend on
+    # the seed, its customer number, and the year, so adding customers or years doesn't change existing customers.
+
+    # Returns a dictionary containing:
+    #  * "Data_Catalog_Filepath" - path of the synthetic data catalog.
+    #  * "Data_Catalog" - the synthetic data catalog.
+    #  * "Scenario_Inputs" - a list of OSESMO inputs (load profile, retail rate, solar profile, emissions forecast signal,
+    #    start time, and customer class) for each customer and year, to be combined with other model inputs.
+
+    if Synthetic_Data_Name is None:
+        Synthetic_Data_Name = "Synthetic"
+
+    if Number_of_Customers is None:
+        Number_of_Customers = 10
+
+    if Customer_Class_Input is None:
+        Customer_Class_Input = "Commercial and Industrial"
+
+    if Years is None:
+        Years = [2017]
+
+    if Timestep_Resolution is None:
+        Timestep_Resolution = 15
+
+    if Random_Seed is None:
+        Random_Seed = 0
+
+    if Customer_Class_Input not in ["Residential", "Commercial and Industrial"]:
+        raise ValueError("Customer class \"" + str(Customer_Class_Input) + "\" is not recognized. " +
+                         "Available customer classes are \"Residential\" and \"Commercial and Industrial\".")
+
+    if 60 % Timestep_Resolution != 0:
+        raise ValueError("The synthetic data timestep resolution (" + str(Timestep_Resolution) + " minutes) must divide one hour.")
+
+    Years = sorted(int(Year) for Year in Years)
+
+    delta_t = Timestep_Resolution / 60  # Timestep length, in hours
+
+    Timesteps_per_Hour = 60 // Timestep_Resolution
+
+
+    ## Synthetic Data Settings
+
+    # Site location (San Francisco Bay Area), used for solar geometry.
+    Latitude = 37.8  # degrees North
+    Longitude = -122.3  # degrees East
+    Standard_Meridian = -120  # Pacific Standard Time meridian, degrees East
+
+    # Solar PV systems are fixed-tilt, facing south and tilted at the site latitude, with a 1 kW-DC base size.
+    Base_Solar_Size = 1
+    Solar_Derate = 0.8
+
+    # Customer loads grow (or shrink) at a constant annual rate from the base year, so that each year's load doesn't depend on Years.
+    Load_Growth_Base_Year = 2017
+
+    # Annual distribution capacity value ($/kW-year), allocated to the highest summer feeder load timesteps.
+    Distribution_Capacity_Value = 40
+
+    Synthetic_Data_Directory = "Synthetic Data/" + Synthetic_Data_Name
+    Synthetic_File_Prefix = Synthetic_Data_Name.replace(" ", "_")
+    Resolution_Directory = str(Timestep_Resolution) + "-Minute Data"
+
+    Customer_Number_Width = max(4, len(str(Number_of_Customers)))
+
+
+    ## Random Number Streams
+
+    # Each stream is seeded by the random seed, a stream number, and the year and customer number where relevant.
+    Customer_Stream = 0
+    Load_Stream = 1
+    Weather_Stream = 2
+    Solar_Stream = 3
+    Grid_Stream = 4
+    Retail_Rate_Stream = 5
+
+    def Random_Generator(*Stream_Key):
+        return np.random.default_rng([Random_Seed] + list(Stream_Key))
+
+    def AR1_Noise(Generator, Number_of_Steps, Correlation_Minutes, Step_Minutes=None):
+
+        # Unit-variance first-order autoregressive noise with the given correlation time.
+        # Noise at timesteps longer than the correlation time is scaled to the variance of the average of
+        # continuous noise over each timestep, so that data at any resolution match averaged finer data.
+        if Step_Minutes is None:
+            Step_Minutes = Timestep_Resolution
+
+        Step_Ratio = Step_Minutes / Correlation_Minutes
+        Autocorrelation = np.exp(-Step_Ratio)
+        Averaged_Variance = 2 * (Step_Ratio - 1 + np.exp(-Step_Ratio)) / Step_Ratio ** 2
+
+        Innovations = Generator.standard_normal(Number_of_Steps) * np.sqrt(1 - Autocorrelation ** 2)
+        Innovations[0] = Innovations[0] / np.sqrt(1 - Autocorrelation ** 2)
+
+        return scipy.signal.lfilter([1], [1, -Autocorrelation], Innovations) * np.sqrt(Averaged_Variance)
+
+    def Add_Events(Vector_Data, Generator, Event_Weights, Event_Power, Event_Minutes):
+
+        # Adds rectangular events (ex. appliance use or price spikes), starting at timesteps drawn with probability
+        # proportional to Event_Weights. Events shorter than a timestep are averaged over the timestep.
+        Event_Starts = Generator.choice(len(Vector_Data), size = len(Event_Power), p = Event_Weights / np.sum(Event_Weights))
+        Event_Steps = np.ceil(Event_Minutes / Timestep_Resolution).astype(int)
+        Event_Step_Power = Event_Power * Event_Minutes / (Event_Steps * Timestep_Resolution)
+
+        Event_Changes = np.zeros(len(Vector_Data) + 1)
+        np.add.at(Event_Changes, Event_Starts, Event_Step_Power)
+        np.add.at(Event_Changes, np.minimum(Event_Starts + Event_Steps, len(Vector_Data)), -Event_Step_Power)
+
+        return Vector_Data + np.cumsum(Event_Changes)[:len(Vector_Data)]
+
+    def Bump(Hour, Center_Hour, Width_Hours):
+        return np.exp(-0.5 * ((Hour - Center_Hour) / Width_Hours) ** 2)
+
+    def Write_Vector(Relative_File_Path, Vector_Data):
+
+        File_Path = os.path.join(Input_Output_Data_Directory_Location, Relative_File_Path)
+        os.makedirs(os.path.dirname(File_Path), exist_ok = True)
+
+        # Values are rounded to 6 decimal places, and written one per line (about 3 times faster than np.savetxt).
+        with open(File_Path, "w") as Vector_File:
+            Vector_File.write("\n".join(map(repr, np.round(Vector_Data, 6).tolist())) + "\n")
+
+        return {str(Timestep_Resolution): Relative_File_Path}
+
+
+    ## Retail Rates
+
+    # Rates are modeled on PG&E E-19 (commercial and industrial, with demand charges) and E-TOU-C (residential),
+    # with rate levels scaled by a random factor.
+
+    Rate_Scale = Random_Generator(Retail_Rate_Stream).uniform(0.85, 1.15, size = 2)
+
+    Commercial_Rate_Name = Synthetic_Data_Name + " Commercial TOU"
+    Residential_Rate_Name = Synthetic_Data_Name + " Residential TOU"
+
+    Synthetic_Data_Catalog = {"Load Profiles": {}, "Retail Rates": {}, "Solar Profiles": {}, "Emissions Signals": {},
+                              "Generation Cost Regions": {}, "Distribution Cost Profiles": {}}
+
+    Synthetic_Data_Catalog["Retail Rates"][Commercial_Rate_Name] = {
+        "Retail_Rate_Master_Index": "SC1",
+        "Retail_Rate_Effective_Date": "%04d-01-01" % Years[0],
+        "Summer_Peak_DC": round(18.64 * Rate_Scale[0], 2),
+        "Summer_Part_Peak_DC": round(5.18 * Rate_Scale[0], 2),
+        "Summer_Noncoincident_DC": round(17.56 * Rate_Scale[0], 2),
+        "Winter_Peak_DC": 0,
+        "Winter_Part_Peak_DC": round(0.12 * Rate_Scale[0], 2),
+        "Winter_Noncoincident_DC": round(17.56 * Rate_Scale[0], 2),
+        "Fixed_Per_Meter_Day_Charge": 19.71253,
+        "Fixed_Per_Meter_Month_Charge": 0,
+        "First_Summer_Month": 5,
+        "Last_Summer_Month": 10,
+        "Tariff_Definition": {
+            "Summer_Months": [5, 6, 7, 8, 9, 10],
+            "Holiday_Calendar": "PG&E",
+            "Time_Basis": "Standard Time",
+            "DST_Period_Adjustment": True,
+            "TOU_Periods": [
+                {"Season": "Summer", "Day_Types": ["Weekday"], "Hours": [[12, 18]],
+                 "Energy_Rate": round(0.15178 * Rate_Scale[0], 5), "Binary_Variable": "Summer_Peak_Binary_Data"},
+                {"Season": "Summer", "Day_Types": ["Weekday"], "Hours": [[8.5, 12], [18, 21.5]],
+                 "Energy_Rate": round(0.11127 * Rate_Scale[0], 5), "Binary_Variable": "Summer_Part_Peak_Binary_Data"},
+                {"Season": "Summer", "Hours": [[0, 24]], "Energy_Rate": round(0.08445 * Rate_Scale[0], 5)},
+                {"Season": "Winter", "Day_Types": ["Weekday"], "Hours": [[8.5, 21.5]],
+                 "Energy_Rate": round(0.10573 * Rate_Scale[0], 5), "Binary_Variable": "Winter_Part_Peak_Binary_Data"},
+                {"Season": "Winter", "Hours": [[0, 24]], "Energy_Rate": round(0.09111 * Rate_Scale[0], 5)}]}}
+
+    Synthetic_Data_Catalog["Retail Rates"][Residential_Rate_Name] = {
+        "Retail_Rate_Master_Index": "SR1",
+        "Retail_Rate_Effective_Date": "%04d-01-01" % Years[0],
+        "Summer_Peak_DC": 0,
+        "Summer_Part_Peak_DC": 0,
+        "Summer_Noncoincident_DC": 0,
+        "Winter_Peak_DC": 0,
+        "Winter_Part_Peak_DC": 0,
+        "Winter_Noncoincident_DC": 0,
+        "Fixed_Per_Meter_Day_Charge": 0,
+        "Fixed_Per_Meter_Month_Charge": 0,
+        "First_Summer_Month": 6,
+        "Last_Summer_Month": 9,
+        "Tariff_Definition": {
+            "Summer_Months": [6, 7, 8, 9],
+            "Holiday_Calendar": "PG&E",
+            "Time_Basis": "Local Time",
+            "TOU_Periods": [
+                {"Season": "Summer", "Hours": [[16, 21]], "Energy_Rate": round(0.35 * Rate_Scale[1], 5)},
+                {"Season": "Summer", "Hours": [[0, 24]], "Energy_Rate": round(0.28 * Rate_Scale[1], 5)},
+                {"Season": "Winter", "Hours": [[16, 21]], "Energy_Rate": round(0.27 * Rate_Scale[1], 5)},
+                {"Season": "Winter", "Hours": [[0, 24]], "Energy_Rate": round(0.25 * Rate_Scale[1], 5)}]}}
+
+    Retail_Rate_Name_Input = Commercial_Rate_Name if Customer_Class_Input == "Commercial and Industrial" else Residential_Rate_Name
+
+    # Weekdays (excluding holidays) are flagged using a one-period tariff definition.
+    Weekday_Tariff_Definition = {"Summer_Months": [], "Holiday_Calendar": "PG&E",
+                                 "TOU_Periods": [{"Season": "All", "Day_Types": ["Weekday"], "Hours": [[0, 24]], "Energy_Rate": 1},
+                                                 {"Season": "All", "Hours": [[0, 24]], "Energy_Rate": 0}]}
+
+
+    ## Customer Characteristics
+
+    # Characteristics are drawn once per customer, and used for every year.
+
+    Customer_Characteristics = []
+
+    for Customer_Number in range(1, Number_of_Customers + 1):
+
+        Customer_Generator = Random_Generator(Customer_Stream, Customer_Number)
+
+        if Customer_Class_Input == "Commercial and Industrial":
+
+            # Occupied-hours demand (kW) is lognormally distributed across customers, from small offices to large facilities.
+            Customer_Characteristics.append({"Occupied_Demand": Customer_Generator.lognormal(np.log(150), 0.9),
+                                             "Base_Load_Fraction": Customer_Generator.uniform(0.25, 0.55),
+                                             "Opening_Hour": Customer_Generator.uniform(5.5, 9),
+                                             "Closing_Hour": Customer_Generator.uniform(16.5, 21),
+                                             "Weekend_Occupancy": Customer_Generator.uniform(0.05, 0.6),
+                                             "Cooling_Sensitivity": Customer_Generator.uniform(0.01, 0.04),  # fraction per deg C
+                                             "Heating_Sensitivity": Customer_Generator.uniform(0, 0.015),  # fraction per deg C
+                                             "Noise": Customer_Generator.uniform(0.03, 0.08),
+                                             "Annual_Growth": Customer_Generator.normal(0.01, 0.02)})
+
+        else:
+
+            Customer_Characteristics.append({"Base_Load": Customer_Generator.lognormal(np.log(0.3), 0.4),
+                                             "Morning_Demand": Customer_Generator.uniform(0.2, 0.8),
+                                             "Morning_Hour": Customer_Generator.normal(7, 0.6),
+                                             "Evening_Demand": Customer_Generator.uniform(0.6, 2.0),
+                                             "Evening_Hour": Customer_Generator.normal(19, 0.7),
+                                             # About 60% of homes have air conditioning.
+                                             "Cooling_Sensitivity": Customer_Generator.uniform(0.05, 0.25) * (Customer_Generator.random() < 0.6),  # kW per deg C
+                                             "Heating_Sensitivity": Customer_Generator.uniform(0, 0.05),  # kW per deg C
+                                             "Appliance_Events_per_Day": Customer_Generator.uniform(1, 4),
+                                             "Noise": Customer_Generator.uniform(0.05, 0.12),
+                                             "Annual_Growth": Customer_Generator.normal(0.005, 0.01)})
+
+
+    ## Generate Data for Each Year
+
+    Scenario_Inputs = []
+
+    for Year in Years:
+
+        Start_Time_Input = datetime.datetime(Year, 1, 1, 0, 0, 0)
+
+        def Year_Directory(Data_Type):
+            return "/".join([Synthetic_Data_Directory, Data_Type, str(Year), Resolution_Directory])
+
+        # Calendar variables are in local standard time, like the sample input data.
+        Weekday_Tariff_Vectors = Build_Tariff_Vectors(Weekday_Tariff_Definition, Start_Time_Input, delta_t)
+
+        Weekday = Weekday_Tariff_Vectors["Volumetric_Rate_Data"] == 1
+        Month = Weekday_Tariff_Vectors["Month_Data"].astype(int)
+
+        numtsteps_year = len(Weekday)
+        Number_of_Days = numtsteps_year // (24 * Timesteps_per_Hour)
+
+        Day_Index = np.arange(numtsteps_year) // (24 * Timesteps_per_Hour)
+        Day_of_Year = np.arange(1, Number_of_Days + 1)
+
+        # Hour of the day at the middle of each timestep, since data are averages over each timestep.
+        Hour = ((np.arange(numtsteps_year) % (24 * Timesteps_per_Hour)) + 0.5) * delta_t
+
+
+        ## Weather
+
+        Weather_Generator = Random_Generator(Weather_Stream, Year)
+
+        # Daily mean temperature (deg C) follows a seasonal cycle with multi-day weather fluctuations,
+        # and a daily cycle peaking in mid-afternoon.
+        Daily_Temperature = 15 + 6 * np.cos(2 * np.pi * (Day_of_Year - 200) / 365.25) + \
+                            2.5 * AR1_Noise(Weather_Generator, Number_of_Days, 3 * 1440, 1440)
+
+        Temperature = Daily_Temperature[Day_Index] + 5 * np.cos(2 * np.pi * (Hour - 15) / 24)
+
+
+        ## Solar PV Profile
+
+        Solar_Generator = Random_Generator(Solar_Stream, Year)
+
+        # Clear-sky irradiance on the panel, from solar geometry and an air mass attenuation model.
+        Timestep_Day_of_Year = Day_Index + 1
+
+        Equation_of_Time_Angle = 2 * np.pi * (Timestep_Day_of_Year - 81) / 364
+        Equation_of_Time = 9.87 * np.sin(2 * Equation_of_Time_Angle) - 7.53 * np.cos(Equation_of_Time_Angle) - \
+                           1.5 * np.sin(Equation_of_Time_Angle)  # minutes
+
+        Solar_Hour = Hour + (4 * (Longitude - Standard_Meridian) + Equation_of_Time) / 60
+        Hour_Angle = np.radians(15 * (Solar_Hour - 12))
+        Declination = np.radians(23.45) * np.sin(2 * np.pi * (284 + Timestep_Day_of_Year) / 365)
+
+        Sine_Solar_Elevation = np.sin(np.radians(Latitude)) * np.sin(Declination) + \
+                               np.cos(np.radians(Latitude)) * np.cos(Declination) * np.cos(Hour_Angle)
+
+        # For a panel tilted at the site latitude, the cosine of the angle of incidence is cos(declination) * cos(hour angle).
+        Cosine_Incidence_Angle = np.cos(Declination) * np.cos(Hour_Angle)
+
+        Air_Mass = 1 / np.maximum(Sine_Solar_Elevation, 0.01)
+        Direct_Normal_Irradiance = 1.353 * 0.7 ** (Air_Mass ** 0.678)  # kW/m^2
+
+        Clear_Sky_Irradiance = np.where(Sine_Solar_Elevation > 0,
+                                        Direct_Normal_Irradiance * np.maximum(Cosine_Incidence_Angle, 0) +
+                                        0.1 * Direct_Normal_Irradiance * Sine_Solar_Elevation, 0)
+
+        # Cloudy days are more likely in winter. Clearness varies within cloudy days as clouds pass.
+        Cloudy_Day = Solar_Generator.random(Number_of_Days) < 0.2 + 0.15 * np.cos(2 * np.pi * (Day_of_Year - 15) / 365.25)
+
+        Daily_Clearness = np.where(Cloudy_Day, Solar_Generator.beta(2, 3, Number_of_Days), Solar_Generator.beta(20, 1.5, Number_of_Days))
+
+        Clearness = np.clip(Daily_Clearness[Day_Index] +
+                            np.where(Cloudy_Day[Day_Index], 0.2, 0.03) * AR1_Noise(Solar_Generator, numtsteps_year, 20),
+                            0.05, 1)
+
+        Solar_PV_Profile_Data = Base_Solar_Size * Solar_Derate * Clear_Sky_Irradiance * Clearness
+
+
+        ## System and Feeder Load
+
+        # Normalized system load drives marginal emissions rates and generation costs.
+        # System-wide solar generation lowers midday net load, especially on clear spring days.
+        System_Load = 0.75 + 0.1 * Weekday + 0.15 * Bump(Hour, 18.5, 2) + 0.08 * Bump(Hour, 10, 2) + \
+                      0.02 * np.maximum(Temperature - 20, 0) + 0.005 * np.maximum(10 - Temperature, 0)
+
+        System_Net_Load = System_Load - 0.35 * Solar_PV_Profile_Data / Base_Solar_Size
+
+        Normalized_System_Net_Load = (System_Net_Load - np.mean(System_Net_Load)) / np.std(System_Net_Load)
+
+        # Renewable generation is curtailed, and is on the margin, at the lowest daytime net load timesteps.
+        Curtailment_Flag = (System_Net_Load < np.percentile(System_Net_Load, 3)) & (Solar_PV_Profile_Data > 0)
+
+
+        ## Marginal Emissions Rates
+
+        Grid_Generator = Random_Generator(Grid_Stream, Year)
+
+        # Real-time marginal emissions rates (metric tons/MWh) rise with net load, from efficient combined-cycle
+        # gas plants to peaking plants, and are zero when renewable generation is curtailed.
+        Marginal_Emissions_Rate_Real_Time_Data = np.where(Curtailment_Flag, 0,
+                                                          np.clip(0.33 + 0.06 * Normalized_System_Net_Load +
+                                                                  0.03 * AR1_Noise(Grid_Generator, numtsteps_year, 30), 0, 0.6))
+
+        # Day-ahead forecasts are hourly averages of real-time rates, with a slowly-varying forecast error.
+        Marginal_Emissions_Rate_Day_Ahead_Data = np.clip(np.repeat(np.mean(np.reshape(Marginal_Emissions_Rate_Real_Time_Data, (-1, Timesteps_per_Hour)), 1),
+                                                                   Timesteps_per_Hour) +
+                                                         0.03 * AR1_Noise(Grid_Generator, numtsteps_year, 180), 0, 0.6)
+
+
+        ## Generation Costs
+
+        # Generation costs ($/MWh) follow natural gas prices (higher in winter) and marginal heat rates,
+        # with occasional price spikes at high net load, and negative prices when renewable generation is curtailed.
+        Natural_Gas_Price = 4 + 0.6 * np.cos(2 * np.pi * (Timestep_Day_of_Year - 15) / 365.25)  # $/MMBtu
+        Marginal_Heat_Rate = 8 + 3 * np.tanh(Normalized_System_Net_Load)  # MMBtu/MWh
+
+        Generation_Cost_Data = Natural_Gas_Price * Marginal_Heat_Rate + 4 * AR1_Noise(Grid_Generator, numtsteps_year, 60)
+
+        Number_of_Price_Spikes = Grid_Generator.poisson(25)
+
+        Generation_Cost_Data = Add_Events(Generation_Cost_Data, Grid_Generator, np.exp(2 * Normalized_System_Net_Load),
+                                          Grid_Generator.lognormal(np.log(250), 0.8, Number_of_Price_Spikes),
+                                          Grid_Generator.uniform(5, 30, Number_of_Price_Spikes))
+
+        Generation_Cost_Data = np.where(Curtailment_Flag, -Grid_Generator.uniform(5, 25, numtsteps_year), Generation_Cost_Data)
+
+        # Convert to $/kWh, like the sample marginal cost data.
+        Generation_Cost_Data = Generation_Cost_Data / 1000
+
+
+        ## Distribution Costs
+
+        # The annual distribution capacity value is allocated to the top 1% of feeder load timesteps in summer (June - September),
+        # in proportion to their load above the threshold.
+        Feeder_Load = System_Load + 0.03 * AR1_Noise(Grid_Generator, numtsteps_year, 60)
+
+        Feeder_Peak_Weight = np.maximum(Feeder_Load - np.percentile(Feeder_Load, 99), 0) * ((Month >= 6) & (Month <= 9))
+
+        if np.sum(Feeder_Peak_Weight) > 0:
+            Representative_Distribution_Cost_Data = Distribution_Capacity_Value * Feeder_Peak_Weight / (np.sum(Feeder_Peak_Weight) * delta_t)
+        else:
+            Representative_Distribution_Cost_Data = np.zeros(numtsteps_year)
+
+
+        ## Save Solar, Emissions, and Marginal Cost Data
+
+        Solar_Profile_Name = Synthetic_Data_Name + " Solar " + str(Year)
+        Emissions_Real_Time_Signal_Name = Synthetic_Data_Name + " " + str(Year) + " RT"
+        Emissions_Day_Ahead_Signal_Name = Synthetic_Data_Name + " " + str(Year) + " DA"
+        Grid_Cost_Name = Synthetic_Data_Name + " " + str(Year)
+
+        Synthetic_Data_Catalog["Solar Profiles"][Solar_Profile_Name] = {
+            "Solar_Profile_Master_Index": "S1",
+            "Solar_Profile_Description": "Synthetic Solar Profile (Random Seed " + str(Random_Seed) + ")",
+            "Base_Solar_Size": Base_Solar_Size,
+            "Files": Write_Vector(Year_Directory("Solar PV Data") + "/Vector_" + str(Year) + "_" + Synthetic_File_Prefix + "_Solar_Profile.csv",
+                                  Solar_PV_Profile_Data)}
+
+        Synthetic_Data_Catalog["Emissions Signals"][Emissions_Real_Time_Signal_Name] = {
+            "Files": Write_Vector(Year_Directory("Emissions Data") + "/" + str(Year) + "_" + Synthetic_File_Prefix + "_RT_Marginal_Emissions_Rate_Vector.csv",
+                                  Marginal_Emissions_Rate_Real_Time_Data)}
+
+        Synthetic_Data_Catalog["Emissions Signals"][Emissions_Day_Ahead_Signal_Name] = {
+            "Files": Write_Vector(Year_Directory("Emissions Data") + "/" + str(Year) + "_" + Synthetic_File_Prefix + "_DA_Marginal_Emissions_Rate_Vector.csv",
+                                  Marginal_Emissions_Rate_Day_Ahead_Data)}
+
+        Synthetic_Data_Catalog["Generation Cost Regions"][Grid_Cost_Name] = {
+            "Files": Write_Vector(Year_Directory("Utility Marginal Cost Data") + "/" + str(Year) + "_" + Synthetic_File_Prefix + "_Generation_Cost_Vector.csv",
+                                  Generation_Cost_Data)}
+
+        Synthetic_Data_Catalog["Distribution Cost Profiles"][Grid_Cost_Name] = {
+            "Files": Write_Vector(Year_Directory("Utility Marginal Cost Data") + "/" + str(Year) + "_" + Synthetic_File_Prefix + "_Distribution_Cost_Vector.csv",
+                                  Representative_Distribution_Cost_Data)}
+
+
+        ## Customer Load Profiles
+
+        for Customer_Number, Customer in enumerate(Customer_Characteristics, start = 1):
+
+            Load_Generator = Random_Generator(Load_Stream, Year, Customer_Number)
+
+            Growth_Factor = (1 + Customer["Annual_Growth"]) ** (Year - Load_Growth_Base_Year)
+
+            if Customer_Class_Input == "Commercial and Industrial":
+
+                # Building occupancy ramps up and down around opening and closing hours, which vary slightly from day to day.
+                Opening_Hour = Customer["Opening_Hour"] + 0.25 * Load_Generator.standard_normal(Number_of_Days)
+                Closing_Hour = Customer["Closing_Hour"] + 0.25 * Load_Generator.standard_normal(Number_of_Days)
+
+                Occupancy = np.where(Weekday, 1, Customer["Weekend_Occupancy"]) / \
+                            ((1 + np.exp(-(Hour - Opening_Hour[Day_Index]) / 0.35)) * (1 + np.exp(-(Closing_Hour[Day_Index] - Hour) / 0.35)))
+
+                Load_Profile_Data = Customer["Occupied_Demand"] * \
+                                    (Customer["Base_Load_Fraction"] + (1 - Customer["Base_Load_Fraction"]) * Occupancy) * \
+                                    (1 + Customer["Cooling_Sensitivity"] * np.maximum(Temperature - 18, 0) * (0.3 + 0.7 * Occupancy) +
+                                     Customer["Heating_Sensitivity"] * np.maximum(12 - Temperature, 0))
+
+                Load_Profile_Data = Load_Profile_Data * np.exp(Customer["Noise"] * AR1_Noise(Load_Generator, numtsteps_year, 45) -
+                                                               Customer["Noise"] ** 2 / 2)
+
+            else:
+
+                # Household activity peaks in the morning and evening, with a later morning and more daytime activity on weekends.
+                Activity = Customer["Morning_Demand"] * Bump(Hour, Customer["Morning_Hour"] + np.where(Weekday, 0, 1.5), 1.2) + \
+                           Customer["Evening_Demand"] * Bump(Hour, Customer["Evening_Hour"], 2) + \
+                           np.where(Weekday, 0, 0.3 * Customer["Evening_Demand"] * Bump(Hour, 13, 3))
+
+                Load_Profile_Data = (Customer["Base_Load"] + Activity +
+                                     Customer["Cooling_Sensitivity"] * np.maximum(Temperature - 22, 0) +
+                                     Customer["Heating_Sensitivity"] * np.maximum(12 - Temperature, 0)) * \
+                                    np.exp(Customer["Noise"] * AR1_Noise(Load_Generator, numtsteps_year, 30) - Customer["Noise"] ** 2 / 2)
+
+                # Large appliances (ex. dryers, ovens, and electric vehicle chargers) run at random times, mostly during activity peaks.
+                Number_of_Appliance_Events = Load_Generator.poisson(Customer["Appliance_Events_per_Day"] * Number_of_Days)
+
+                Load_Profile_Data = Add_Events(Load_Profile_Data, Load_Generator, 0.1 + Activity,
+                                               Load_Generator.uniform(1, 4, Number_of_Appliance_Events),
+                                               Load_Generator.uniform(10, 60, Number_of_Appliance_Events))
+
+            Load_Profile_Data = Growth_Factor * Load_Profile_Data
+
+            Customer_Name = "Customer " + str(Customer_Number).zfill(Customer_Number_Width)
+            Load_Profile_Name_Input = Synthetic_Data_Name + " " + Customer_Name + " " + str(Year)
+
+            Synthetic_Data_Catalog["Load Profiles"][Load_Profile_Name_Input] = {
+                "Load_Profile_Master_Index": "S" + str(Customer_Number),
+                "Emissions_Evaluation_Signal": Emissions_Real_Time_Signal_Name,
+                "Generation_Cost_Region": Grid_Cost_Name,
+                "Representative_Distribution_Cost_Profile": Grid_Cost_Name,
+                "Files": Write_Vector(Year_Directory("Load Profile Data") + "/Vector_" + Synthetic_File_Prefix + "_" +
+                                      Customer_Name.replace(" ", "_") + "_" + str(Year) + ".csv", Load_Profile_Data)}
+
+            Scenario_Inputs.append({"Load_Profile_Name_Input": Load_Profile_Name_Input,
+                                    "Retail_Rate_Name_Input": Retail_Rate_Name_Input,
+                                    "Solar_Profile_Name_Input": Solar_Profile_Name,
+                                    "Emissions_Forecast_Signal_Input": Emissions_Day_Ahead_Signal_Name,
+                                    "Start_Time_Input": Start_Time_Input,
+                                    "Customer_Class_Input": Customer_Class_Input})
+
+
+    ## Save Synthetic Data Catalog
+
+    Data_Catalog_Filepath = os.path.join(Input_Output_Data_Directory_Location, Synthetic_Data_Directory, "Synthetic_Data_Catalog.json")
+
+    with open(Data_Catalog_Filepath, "w") as Data_Catalog_File:
+        json.dump(Synthetic_Data_Catalog, Data_Catalog_File, indent = 1)
+
+    Import_Data_Catalog(Data_Catalog_Filepath)
+
+    return {"Data_Catalog_Filepath": Data_Catalog_Filepath, "Data_Catalog": Synthetic_Data_Catalog, "Scenario_Inputs": Scenario_Inputs}
@@ -0,0 +1,116 @@
+## Binary Input Data Cache
+
+# Model input data (load profiles, retail rates, solar profiles, emissions rates, marginal costs,
+# and time constraint binary vectors) is stored as year-long .csv vectors, which are slow to parse.
+# Each .csv file is converted once into a binary .npy file in the cache directory below,
+# and later model runs load the .npy file as a read-only memory-mapped array.
+# Worker processes in a scenario sweep that load the same file share its pages, instead of each holding a private copy.
+
+# Cached files are identified by the absolute path of the source .csv file.
+# A cached file is used if the source file's size and modification time match those recorded when it was cached.
+# If only the modification time has changed (ex. the file was copied or checked out again),
+# the source file's SHA-256 hash is compared instead, and the cached file is reused if the contents are unchanged.
+
+# The cache directory can be changed using the OSESMO_INPUT_CACHE_DIRECTORY environment variable.
+# Setting Use_CSV_Vector_Cache to False parses every .csv file directly.
+
+import os
+
+Use_CSV_Vector_Cache = True
+
+CSV_Vector_Cache_Directory = os.environ.get("OSESMO_INPUT_CACHE_DIRECTORY",
+                                            os.path.join(os.path.expanduser("~"), ".cache", "OSESMO Input Data Cache"))
+
+
+def Import_CSV_Vector_Data(CSV_File_Path=None, delimiter=None):
+
+    # Load Python Packages
+    import hashlib
+    import json
+    import threading
+    import numpy as np
+
+    if delimiter is None:
+        delimiter = ','
+
+    if not Use_CSV_Vector_Cache:
+        return np.genfromtxt(CSV_File_Path, delimiter=delimiter)
+
+
+    ## Identify Cached File
+
+    # Paths are made absolute before hashing, so that the same file is always identified by the same path.
+
+    Source_File_Path = os.path.abspath(CSV_File_Path)
+    Source_File_Status = os.stat(Source_File_Path)
+
+    Cache_File_Name = hashlib.sha1((Source_File_Path + "|" + delimiter).encode("utf-8")).hexdigest()
+    Cached_Data_Path = os.path.join(CSV_Vector_Cache_Directory, Cache_File_Name + ".npy")
+    Cache_Metadata_Path = os.path.join(CSV_Vector_Cache_Directory, Cache_File_Name + ".json")
+
+    def Hash_Source_File():
+
+        Source_File_Hash = hashlib.sha256()
+
+        with open(Source_File_Path, "rb") as Source_File:
+            for Source_File_Block in iter(lambda: Source_File.read(1 << 20), b""):
+                Source_File_Hash.update(Source_File_Block)
+
+        return Source_File_Hash.hexdigest()
+
+    def Write_Cache_Metadata(Cache_Metadata):
+
+        # Cached files are written to a temporary file and then renamed,
+        # so that worker processes never read a partially-written file.
+        Temporary_Metadata_Path = Cache_Metadata_Path + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp"
+
+        with open(Temporary_Metadata_Path, "w") as Metadata_File:
+            json.dump(Cache_Metadata, Metadata_File)
+
+        os.replace(Temporary_Metadata_Path, Cache_Metadata_Path)
+
+
+    ## Load Cached File
+
+    try:
+
+        with open(Cache_Metadata_Path) as Metadata_File:
+            Cache_Metadata = json.load(Metadata_File)
+
+        if Cache_Metadata["Source_File_Size"] == Source_File_Status.st_size:
+
+            if Cache_Metadata["Source_File_Modification_Time"] == Source_File_Status.st_mtime_ns:
+                return np.load(Cached_Data_Path, mmap_mode='r')
+
+            if Cache_Metadata["Source_File_SHA256"] == Hash_Source_File():
+                Cached_Data = np.load(Cached_Data_Path, mmap_mode='r')
+                Cache_Metadata["Source_File_Modification_Time"] = Source_File_Status.st_mtime_ns
+                Write_Cache_Metadata(Cache_Metadata)
+                return Cached_Data
+
+    except (OSError, ValueError, KeyError):
+        pass
+
+
+    ## Parse Source File and Update Cache
+
+    CSV_Vector_Data = np.genfromtxt(Source_File_Path, delimiter=delimiter)
+
+    try:
+
+        os.makedirs(CSV_Vector_Cache_Directory, exist_ok=True)
+
+        Temporary_Data_Path = Cached_Data_Path + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp.npy"
+        np.save(Temporary_Data_Path, CSV_Vector_Data)
+        os.replace(Temporary_Data_Path, Cached_Data_Path)
+
+        Write_Cache_Metadata({"Source_File_Path": Source_File_Path,
+                              "Source_File_Size": Source_File_Status.st_size,
+                              "Source_File_Modification_Time": Source_File_Status.st_mtime_ns,
+                              "Source_File_SHA256": Hash_Source_File()})
+
+    except OSError:
+        print("Could not write input data cache file for " + CSV_File_Path + ". Using .csv file directly.")
+        return CSV_Vector_Data
+
+    return np.load(Cached_Data_Path, mmap_mode='r')
@@ -0,0 +1,71 @@
+## Input Data Catalog
+
+# Data_Catalog.json lists every retail rate, load profile, solar profile, emissions signal, utility marginal cost profile,
+# and time constraint available to OSESMO, along with its metadata (master index, demand charges, fixed charges,
+# summer months, base solar size, emissions evaluation signal, and utility marginal cost mapping)
+# and the paths of its .csv vector files, relative to the input/output data directory.
+
+# File paths are listed by timestep resolution in minutes ("5", "15", or "60").
+# Vectors that are not listed at the model timestep resolution are resampled from another listed resolution
+# by Import_Resampled_Vector_Data, so each vector only needs to be stored at its finest available resolution.
+# Retail rates without a coincident peak or part-peak demand charge have null binary variable file paths,
+# and are given all-zero binary variable vectors by Import_Retail_Rate_Data.
+# Retail rates can instead list a "Tariff_Definition" (time-of-use periods, energy rates, and holiday calendar),
+# in which case their vectors are built in memory by Build_Tariff_Vectors, for any start time and timestep.
+
+# The catalog is loaded once per Python process, and each lookup is a dictionary lookup.
+# Only the files used by a model run are loaded (through the Import_CSV_Vector_Data cache),
+# when the corresponding import function is called.
+
+# New rates, load profiles, or other input data can be added to OSESMO by adding entries to Data_Catalog.json.
+
+# Additional catalogs (ex. the catalog of synthetic input data written by Generate_Synthetic_Scenario_Data)
+# are merged into the catalog, section by section. Their file paths are also relative to the input/output data directory.
+# Additional catalogs are listed in the OSESMO_ADDITIONAL_DATA_CATALOGS environment variable
+# (separated by os.pathsep), so that they are also loaded by scenario sweep worker processes.
+
+import os
+
+Data_Catalog_Filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data_Catalog.json")
+
+Data_Catalog = None
+
+
+def Import_Data_Catalog(Additional_Data_Catalog_Filename=None):
+
+    # Load Python Packages
+    import json
+
+    global Data_Catalog
+
+    def Merge_Data_Catalog(Catalog_Filename):
+
+        with open(Catalog_Filename) as Data_Catalog_File:
+            Additional_Data_Catalog = json.load(Data_Catalog_File)
+
+        for Catalog_Section, Catalog_Entries in Additional_Data_Catalog.items():
+            Data_Catalog.setdefault(Catalog_Section, {}).update(Catalog_Entries)
+
+    if Data_Catalog is None:
+
+        with open(Data_Catalog_Filename) as Data_Catalog_File:
+            Data_Catalog = json.load(Data_Catalog_File)
+
+        for Catalog_Filename in os.environ.get("OSESMO_ADDITIONAL_DATA_CATALOGS", "").split(os.pathsep):
+            if Catalog_Filename != "":
+                Merge_Data_Catalog(os.path.abspath(Catalog_Filename))
+
+    if Additional_Data_Catalog_Filename is not None:
+
+        Additional_Data_Catalog_Filename = os.path.abspath(Additional_Data_Catalog_Filename)
+
+        # Catalogs that are added again (ex. after regenerating synthetic data) replace their earlier entries.
+        Merge_Data_Catalog(Additional_Data_Catalog_Filename)
+
+        Listed_Catalog_Filenames = [Catalog_Filename for Catalog_Filename in os.environ.get("OSESMO_ADDITIONAL_DATA_CATALOGS", "").split(os.pathsep)
+                                    if Catalog_Filename != ""]
+
+        if Additional_Data_Catalog_Filename not in Listed_Catalog_Filenames:
+            os.environ["OSESMO_ADDITIONAL_DATA_CATALOGS"] = os.pathsep.join(Listed_Catalog_Filenames + [Additional_Data_Catalog_Filename])
+
+    return Data_Catalog
@@ -1,32 +1,17 @@
 def Import_IOU_Time_Constraint_Binary_Data(Input_Output_Data_Directory_Location=None, OSESMO_Git_Repo_Directory=None, delta_t=None):
 
     # Load Python Packages
-    import os
-    import numpy as np
-
-    # Set Directory to Box Sync Folder
-    os.chdir(Input_Output_Data_Directory_Location)
+    from Import_Resampled_Vector_Data import Import_Resampled_Vector_Data
+    from Import_Data_Catalog import Import_Data_Catalog
 
     # Import IOU Charge/Discharge Binary Data
-    if delta_t == (5 / 60):
-
-        IOU_Charge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/Joint-IOU-Proposed Charge-Discharge Constraint/2017/5-Minute Data/Vector Format/2017_IOU_Charge_Hour_Flag_Vector.csv', delimiter=',')
-
-        IOU_Discharge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/Joint-IOU-Proposed Charge-Discharge Constraint/2017/5-Minute Data/Vector Format/2017_IOU_Discharge_Hour_Flag_Vector.csv', delimiter=',')
+    # Time constraint file paths are listed in Data_Catalog.json.
 
-    elif delta_t == (15 / 60):
+    Time_Constraint_Files = Import_Data_Catalog()["Time Constraint Binary Data"][
+        "IOU-Proposed Charge-Discharge Time Constraints"]["Files"]
 
-        IOU_Charge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/Joint-IOU-Proposed Charge-Discharge Constraint/2017/15-Minute Data/Vector Format/2017_IOU_Charge_Hour_Flag_Vector.csv', delimiter=',')
+    IOU_Charge_Hour_Binary_Data = Import_Resampled_Vector_Data(Time_Constraint_Files, delta_t, "Hold", "IOU_Charge_Hour_Binary_Data", Input_Output_Data_Directory_Location)
 
-        IOU_Discharge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/Joint-IOU-Proposed Charge-Discharge Constraint/2017/15-Minute Data/Vector Format/2017_IOU_Discharge_Hour_Flag_Vector.csv', delimiter=',')
-
-    # Return to OSESMO Git Repository Directory
-    os.chdir(OSESMO_Git_Repo_Directory)
+    IOU_Discharge_Hour_Binary_Data = Import_Resampled_Vector_Data(Time_Constraint_Files, delta_t, "Hold", "IOU_Discharge_Hour_Binary_Data", Input_Output_Data_Directory_Location)
 
     return IOU_Charge_Hour_Binary_Data, IOU_Discharge_Hour_Binary_Data
-
-
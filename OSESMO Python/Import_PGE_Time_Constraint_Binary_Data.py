@@ -1,37 +1,19 @@
 def Import_PGE_Time_Constraint_Binary_Data(Input_Output_Data_Directory_Location=None, OSESMO_Git_Repo_Directory=None, delta_t=None):
 
     # Load Python Packages
-    import os
-    import numpy as np
+    from Import_Resampled_Vector_Data import Import_Resampled_Vector_Data
+    from Import_Data_Catalog import Import_Data_Catalog
 
-    # Set Directory to Box Sync Folder
-    os.chdir(Input_Output_Data_Directory_Location)
+    # Import PG&E Charge/No-Charge/Discharge Binary Data
+    # Time constraint file paths are listed in Data_Catalog.json.
 
-    if delta_t == (5 / 60):
+    Time_Constraint_Files = Import_Data_Catalog()["Time Constraint Binary Data"][
+        "PG&E-Proposed Charge-Discharge Time Constraints"]["Files"]
 
-        PGE_Charge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/PG&E-Proposed Charge-Discharge Constraint/2017/5-Minute Data/Vector Format/2017_PGE_Charge_Hour_Flag_Vector.csv', delimiter=',')
+    PGE_Charge_Hour_Binary_Data = Import_Resampled_Vector_Data(Time_Constraint_Files, delta_t, "Hold", "PGE_Charge_Hour_Binary_Data", Input_Output_Data_Directory_Location)
 
-        PGE_No_Charge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/PG&E-Proposed Charge-Discharge Constraint/2017/5-Minute Data/Vector Format/2017_PGE_No_Charge_Hour_Flag_Vector.csv', delimiter=',')
+    PGE_No_Charge_Hour_Binary_Data = Import_Resampled_Vector_Data(Time_Constraint_Files, delta_t, "Hold", "PGE_No_Charge_Hour_Binary_Data", Input_Output_Data_Directory_Location)
 
-        PGE_Discharge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/PG&E-Proposed Charge-Discharge Constraint/2017/5-Minute Data/Vector Format/2017_PGE_Discharge_Hour_Flag_Vector.csv', delimiter=',')
+    PGE_Discharge_Hour_Binary_Data = Import_Resampled_Vector_Data(Time_Constraint_Files, delta_t, "Hold", "PGE_Discharge_Hour_Binary_Data", Input_Output_Data_Directory_Location)
 
-
-    elif delta_t == (15 / 60):
-
-        PGE_Charge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/PG&E-Proposed Charge-Discharge Constraint/2017/15-Minute Data/Vector Format/2017_PGE_Charge_Hour_Flag_Vector.csv', delimiter=',')
-
-        PGE_No_Charge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/PG&E-Proposed Charge-Discharge Constraint/2017/15-Minute Data/Vector Format/2017_PGE_No_Charge_Hour_Flag_Vector.csv', delimiter=',')
-
-        PGE_Discharge_Hour_Binary_Data = np.genfromtxt(
-            'Emissions Data/PG&E-Proposed Charge-Discharge Constraint/2017/15-Minute Data/Vector Format/2017_PGE_Discharge_Hour_Flag_Vector.csv', delimiter=',')
-
-
-    # Return to OSESMO Git Repository Directory
-    os.chdir(OSESMO_Git_Repo_Directory)
-
-    return PGE_Charge_Hour_Binary_Data, PGE_No_Charge_Hour_Binary_Data, PGE_Discharge_Hour_Binary_Data
\ No newline at end of file
+    return PGE_Charge_Hour_Binary_Data, PGE_No_Charge_Hour_Binary_Data, PGE_Discharge_Hour_Binary_Data
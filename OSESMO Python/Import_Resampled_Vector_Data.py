@@ -0,0 +1,124 @@
+## Resampled Vector Cache
+
+# Input data vectors are listed in Data_Catalog.json by timestep resolution in minutes (ex. "5", "15", "60").
+# If a vector is not available at the model timestep resolution, it is resampled from another available resolution.
+# Resampled vectors are reused within a Python process, and are read-only.
+
+from LRU_Cache import LRU_Cache
+
+Resampled_Vector_Cache_Size = 64
+
+Resampled_Vector_Cache = LRU_Cache(Resampled_Vector_Cache_Size)
+
+
+def Import_Resampled_Vector_Data(Catalog_Files=None, delta_t=None, Resampling_Method=None, Variable_Name=None,
+                                 Input_Output_Data_Directory_Location=None):
+
+    # Load Python Packages
+    import os
+    import numpy as np
+    from Import_CSV_Vector_Data import Import_CSV_Vector_Data
+
+    # This function imports an input data vector at the model timestep resolution delta_t (in hours).
+
+    # Catalog_Files is the "Files" dictionary of a Data_Catalog.json entry, mapping timestep resolutions to file paths.
+    # For entries listing several vectors per resolution (ex. retail rates), Variable_Name selects one of them.
+
+    # If the vector is available at the model timestep resolution, it is loaded directly.
+    # Otherwise, it is aggregated from the coarsest listed resolution that divides the model timestep
+    # (ex. 5-minute or 15-minute data for a 60-minute model run), or repeated from the finest listed resolution
+    # that the model timestep divides (ex. 5-minute data for a 1-minute model run).
+
+    # Resampling_Method sets how timesteps are aggregated:
+    #  * "Mean" - average of the timesteps in each interval, for load, solar, emissions rate, and marginal cost data.
+    #  * "Hold" - value at the start of each interval, for retail rates, month numbers, and binary variables,
+    #    which are constant within each time-of-use period.
+
+    # File paths are relative to Input_Output_Data_Directory_Location if it is provided,
+    # or to the current working directory otherwise.
+
+    # Returns None if the vector's file path is null (ex. a rate without a coincident peak demand charge).
+
+    Model_Timestep = int(round(delta_t * 60))  # Model timestep resolution, in minutes
+
+    Available_Files = {}
+
+    for Timestep_Key, Files in Catalog_Files.items():
+        Available_Files[int(Timestep_Key)] = Files if Variable_Name is None else Files.get(Variable_Name)
+
+    if all(File_Path is None for File_Path in Available_Files.values()):
+        return None
+
+    Available_Files = {Timestep: File_Path for Timestep, File_Path in Available_Files.items() if File_Path is not None}
+
+    if Input_Output_Data_Directory_Location is not None:
+        Available_Files = {Timestep: os.path.join(Input_Output_Data_Directory_Location, File_Path)
+                           for Timestep, File_Path in Available_Files.items()}
+
+    # Listed resolutions whose files are missing (ex. redundant 15-minute copies of 5-minute data that have been deleted)
+    # are skipped. If none of the listed files are present, the file selected below is loaded anyway,
+    # so that the missing file is reported.
+
+    Existing_Files = {Timestep: File_Path for Timestep, File_Path in Available_Files.items() if os.path.isfile(File_Path)}
+
+    if len(Existing_Files) > 0:
+        Available_Files = Existing_Files
+
+
+    ## Select Source Resolution
+
+    Finer_Timesteps = [Timestep for Timestep in Available_Files if Model_Timestep % Timestep == 0]
+    Coarser_Timesteps = [Timestep for Timestep in Available_Files if Timestep % Model_Timestep == 0]
+
+    if len(Finer_Timesteps) > 0:
+        Source_Timestep = max(Finer_Timesteps)
+    elif len(Coarser_Timesteps) > 0:
+        Source_Timestep = min(Coarser_Timesteps)
+    else:
+        raise ValueError("Input data is not available at a timestep resolution compatible with " + str(Model_Timestep) +
+                         " minutes. Available resolutions are " +
+                         ", ".join(str(Timestep) for Timestep in sorted(Available_Files)) + " minutes.")
+
+    Source_File_Path = Available_Files[Source_Timestep]
+
+    if Source_Timestep == Model_Timestep:
+        return Import_CSV_Vector_Data(Source_File_Path, delimiter=',')
+
+    Resampled_Vector_Key = (os.path.abspath(Source_File_Path), Model_Timestep, Resampling_Method)
+
+    Cached_Resampled_Vector_Data = Resampled_Vector_Cache.Get(Resampled_Vector_Key)
+
+    if Cached_Resampled_Vector_Data is not None:
+        return Cached_Resampled_Vector_Data
+
+
+    ## Resample Vector
+
+    Source_Vector_Data = Import_CSV_Vector_Data(Source_File_Path, delimiter=',')
+
+    if Source_Timestep < Model_Timestep:
+
+        # Reshape the vector so that each row holds the source timesteps in one model timestep.
+        Timesteps_per_Interval = Model_Timestep // Source_Timestep
+
+        Source_Vector_Data_Reshaped = np.reshape(Source_Vector_Data[:(len(Source_Vector_Data) // Timesteps_per_Interval) * Timesteps_per_Interval],
+                                                 (-1, Timesteps_per_Interval))
+
+        if Resampling_Method == "Mean":
+            Resampled_Vector_Data = np.mean(Source_Vector_Data_Reshaped, 1)
+        elif Resampling_Method == "Hold":
+            Resampled_Vector_Data = Source_Vector_Data_Reshaped[:, 0].copy()
+        else:
+            raise ValueError("Resampling method \"" + str(Resampling_Method) + "\" is not recognized. " +
+                             "Available resampling methods are \"Mean\" and \"Hold\".")
+
+    else:
+
+        # Each source timestep is held constant across the model timesteps it contains.
+        Resampled_Vector_Data = np.repeat(Source_Vector_Data, Source_Timestep // Model_Timestep)
+
+    Resampled_Vector_Data.flags.writeable = False
+
+    Resampled_Vector_Cache.Save(Resampled_Vector_Key, Resampled_Vector_Data)
+
+    return Resampled_Vector_Data
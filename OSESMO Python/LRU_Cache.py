@@ -0,0 +1,52 @@
+## Least-Recently-Used Cache
+
+# In-memory caches used within a Python process (ex. tariff vectors, resampled input data vectors,
+# constraint templates, KKT symbolic analyses, and LP warm starts) store at most Cache_Size entries.
+# The least-recently-used entry is removed when the cache is full.
+
+# Each cache is shared by model runs in different threads, and its entries are only accessed while holding its lock.
+# Values are calculated outside the lock, so two threads may calculate the same value, and the last one is saved.
+
+import collections
+import threading
+
+
+class LRU_Cache:
+
+    def __init__(self, Cache_Size=None):
+
+        self.Cache_Size = Cache_Size
+        self.Cache_Entries = collections.OrderedDict()
+        self.Cache_Lock = threading.Lock()
+
+    def Get(self, Cache_Key):
+
+        # Returns the cached value for Cache_Key, or None if it isn't in the cache.
+
+        with self.Cache_Lock:
+
+            if Cache_Key not in self.Cache_Entries:
+                return None
+
+            self.Cache_Entries.move_to_end(Cache_Key)
+
+            return self.Cache_Entries[Cache_Key]
+
+    def Save(self, Cache_Key, Cache_Value):
+
+        with self.Cache_Lock:
+
+            self.Cache_Entries[Cache_Key] = Cache_Value
+            self.Cache_Entries.move_to_end(Cache_Key)
+
+            if len(self.Cache_Entries) > self.Cache_Size:
+                self.Cache_Entries.popitem(last = False)
+
+    def Clear(self):
+
+        with self.Cache_Lock:
+            self.Cache_Entries.clear()
+
+    def __len__(self):
+
+        return len(self.Cache_Entries)
@@ -0,0 +1,45 @@
+def List_Scenario_Data_Vectors(Scenario_Inputs=None, Data_Catalog=None):
+
+    # This function lists the input data vectors used by a model run, as listed in Data_Catalog.json.
+    # Scenario_Inputs is a dictionary of OSESMO keyword arguments.
+
+    # Each data vector is returned as (catalog section, catalog entry name, resampling method, variable name).
+    # Rates with a tariff definition are built in memory, and have no input data vectors.
+
+    # Raises a KeyError if the model run uses an input name that is not listed in the catalog.
+
+    Load_Profile_Catalog_Entry = Data_Catalog["Load Profiles"][Scenario_Inputs["Load_Profile_Name_Input"]]
+    Retail_Rate_Catalog_Entry = Data_Catalog["Retail Rates"][Scenario_Inputs["Retail_Rate_Name_Input"]]
+
+    Data_Vectors = [("Load Profiles", Scenario_Inputs["Load_Profile_Name_Input"], "Mean", None),
+                    ("Generation Cost Regions", Load_Profile_Catalog_Entry["Generation_Cost_Region"], "Mean", None),
+                    ("Distribution Cost Profiles", Load_Profile_Catalog_Entry["Representative_Distribution_Cost_Profile"], "Mean", None)]
+
+    if "Files" in Retail_Rate_Catalog_Entry:
+        Data_Vectors.extend(("Retail Rates", Scenario_Inputs["Retail_Rate_Name_Input"], "Hold", Variable_Name)
+                            for Variable_Name in ["Volumetric_Rate_Data", "Month_Data",
+                                                  "Summer_Peak_Binary_Data", "Summer_Part_Peak_Binary_Data",
+                                                  "Winter_Peak_Binary_Data", "Winter_Part_Peak_Binary_Data"])
+
+    if Load_Profile_Catalog_Entry["Emissions_Evaluation_Signal"] is not None:
+        Data_Vectors.append(("Emissions Signals", Load_Profile_Catalog_Entry["Emissions_Evaluation_Signal"], "Mean", None))
+
+    if Scenario_Inputs["Emissions_Forecast_Signal_Input"] != "No Emissions Forecast Signal":
+        Data_Vectors.append(("Emissions Signals", Scenario_Inputs["Emissions_Forecast_Signal_Input"], "Mean", None))
+
+    if Scenario_Inputs["Model_Type_Input"] == "Solar Plus Storage":
+        Data_Vectors.append(("Solar Profiles", Scenario_Inputs["Solar_Profile_Name_Input"], "Mean", None))
+
+    if Scenario_Inputs["GHG_Reduction_Solution_Input"] == "IOU-Proposed Charge-Discharge Time Constraints":
+        Data_Vectors.extend(("Time Constraint Binary Data", "IOU-Proposed Charge-Discharge Time Constraints", "Hold", Variable_Name)
+                            for Variable_Name in ["IOU_Charge_Hour_Binary_Data", "IOU_Discharge_Hour_Binary_Data"])
+
+    elif Scenario_Inputs["GHG_Reduction_Solution_Input"] in ["No-Charging Time Constraint", "Charging and Discharging Time Constraints"]:
+        Data_Vectors.extend(("Time Constraint Binary Data", "PG&E-Proposed Charge-Discharge Time Constraints", "Hold", Variable_Name)
+                            for Variable_Name in ["PGE_Charge_Hour_Binary_Data", "PGE_No_Charge_Hour_Binary_Data",
+                                                  "PGE_Discharge_Hour_Binary_Data"])
+
+    # Check that every catalog entry exists.
+    [Data_Catalog[Catalog_Section][Catalog_Entry_Name]["Files"] for Catalog_Section, Catalog_Entry_Name, _, _ in Data_Vectors]
+
+    return Data_Vectors
@@ -0,0 +1,260 @@
+## Model Run Memo
+
+# Results of OSESMO model runs are saved in the memo directory below, identified by a SHA-256 hash (the memo key) of:
+#  * every OSESMO input that affects model results. Modeling_Team_Input and Model_Run_Number_Input only label
+#    the results, and are excluded, along with plot/data export toggles, the number of month solve workers,
+#    and the model run metrics log file.
+#  * the Data_Catalog.json entries used by the model run (metadata, demand charges, and tariff definitions),
+#    and the contents (SHA-256 hashes) of all of their input data files.
+#  * the contents of the model modules (OSESMO.py and the OSESMO Python modules it imports, directly or indirectly),
+#    and the versions of the numerical and solver packages. Driver and sweep scripts (ex. Model_Input_Single_Run.py,
+#    Residential_All_Iterations.py, and Build_Scenario_Grid.py) aren't imported by OSESMO, so editing their inputs
+#    doesn't change the memo key of unchanged model runs.
+# If any of these change, the memo key changes, and the model is run again.
+# Re-running a partially changed scenario sweep only re-runs the model runs whose memo keys have changed.
+
+# Input data file hashes are reused within a Python process while a file's size and modification time are unchanged.
+
+# Memo entries that haven't been used recently are evicted once the memo directory is larger than Model_Run_Memo_Size_Limit.
+# Entries for old model code or input data are never used again, so they are evicted first.
+
+# The memo directory can be changed using the OSESMO_MODEL_RUN_MEMO_DIRECTORY environment variable.
+
+import os
+import threading
+
+Model_Run_Memo_Directory = os.environ.get("OSESMO_MODEL_RUN_MEMO_DIRECTORY",
+                                          os.path.join(os.path.expanduser("~"), ".cache", "OSESMO Model Run Memo"))
+
+Model_Run_Memo_Size_Limit = 4 * 1024 ** 3  # Maximum memo directory size, in bytes.
+
+# Version of the memo entry format. Changing it invalidates all existing memo entries.
+Model_Run_Memo_Version = 1
+
+# OSESMO inputs that don't affect model results.
+Model_Run_Memo_Excluded_Inputs = ["Modeling_Team_Input", "Model_Run_Number_Input", "OSESMO_Git_Repo_Directory",
+                                  "Show_Plots", "Export_Plots", "Export_Data", "Month_Solve_Workers", "Use_Model_Run_Memo",
+                                  "Model_Run_Metrics_Log_Filepath"]
+
+Input_File_Hash_Cache = {}
+
+Model_Code_Hash = None
+
+# The hash caches are shared by model runs in different threads, and are only accessed while holding this lock.
+Model_Run_Memo_Lock = threading.Lock()
+
+
+def Memoize_Model_Run(OSESMO_Inputs=None):
+
+    # Load Python Packages
+    import ast
+    import hashlib
+    import json
+    import pickle
+    import importlib.metadata
+    from OSESMO import OSESMO
+    from Import_Data_Catalog import Import_Data_Catalog
+    from List_Scenario_Data_Vectors import List_Scenario_Data_Vectors
+    from Export_Model_Data import Export_Model_Data
+
+    global Model_Code_Hash
+
+    # This function runs OSESMO with the keyword arguments in OSESMO_Inputs, or returns the memoized results
+    # of a previous model run with the same memo key. It is called by OSESMO when Use_Model_Run_Memo is 1.
+
+    # Memoized results are returned with the current Modeling_Team_Input and Model_Run_Number_Input,
+    # and with the Model_Run_Date_Time, runtime, model run metrics, and solver statistics of the original model run.
+    # Model run metrics are only logged to Model_Run_Metrics_Log_Filepath when the model is run.
+    # If Export_Data is 1, the output .csv files are written from the memoized results.
+    # Model runs that show or export plots are always run, so that the plots are drawn, and their results are memoized.
+
+    def Hash_File(File_Path):
+
+        File_Status = os.stat(File_Path)
+        File_Hash_Key = (os.path.abspath(File_Path), File_Status.st_size, File_Status.st_mtime_ns)
+
+        with Model_Run_Memo_Lock:
+            if File_Hash_Key in Input_File_Hash_Cache:
+                return Input_File_Hash_Cache[File_Hash_Key]
+
+        File_Hash = hashlib.sha256()
+
+        with open(File_Path, "rb") as Hashed_File:
+            for File_Block in iter(lambda: Hashed_File.read(1 << 20), b""):
+                File_Hash.update(File_Block)
+
+        with Model_Run_Memo_Lock:
+            Input_File_Hash_Cache[File_Hash_Key] = File_Hash.hexdigest()
+
+        return File_Hash.hexdigest()
+
+
+    ## Model Code Version
+
+    # Model modules are found by following the import statements of OSESMO.py to other modules in this directory.
+
+    if Model_Code_Hash is None:
+
+        Model_Code_Directory = os.path.dirname(os.path.abspath(__file__))
+
+        Model_Module_Names = set()
+        Modules_to_Search = ["OSESMO"]
+
+        while len(Modules_to_Search) > 0:
+
+            Module_Name = Modules_to_Search.pop()
+            Module_File_Path = os.path.join(Model_Code_Directory, Module_Name + ".py")
+
+            if Module_Name in Model_Module_Names or not os.path.isfile(Module_File_Path):
+                continue
+
+            Model_Module_Names.add(Module_Name)
+
+            with open(Module_File_Path, "r", encoding = "utf-8") as Module_File:
+                Module_Syntax_Tree = ast.parse(Module_File.read())
+
+            for Syntax_Node in ast.walk(Module_Syntax_Tree):
+                if isinstance(Syntax_Node, ast.Import):
+                    Modules_to_Search.extend(Imported_Name.name.split(".")[0] for Imported_Name in Syntax_Node.names)
+                elif isinstance(Syntax_Node, ast.ImportFrom) and Syntax_Node.module is not None and Syntax_Node.level == 0:
+                    Modules_to_Search.append(Syntax_Node.module.split(".")[0])
+
+        Code_Hash = hashlib.sha256()
+
+        for Module_Name in sorted(Model_Module_Names):
+            Code_Hash.update((Module_Name + ".py").encode("utf-8"))
+            Code_Hash.update(Hash_File(os.path.join(Model_Code_Directory, Module_Name + ".py")).encode("utf-8"))
+
+        for Package_Name in ["numpy", "scipy", "cvxopt", "highspy"]:
+            try:
+                Code_Hash.update((Package_Name + " " + importlib.metadata.version(Package_Name)).encode("utf-8"))
+            except importlib.metadata.PackageNotFoundError:
+                pass
+
+        with Model_Run_Memo_Lock:
+            Model_Code_Hash = Code_Hash.hexdigest()
+
+
+    ## Input Data Version
+
+    # If an input name is not listed in the catalog, the model is run without the memo, so that OSESMO reports the error.
+
+    Data_Catalog = Import_Data_Catalog()
+
+    try:
+
+        Catalog_Entries = sorted(set([("Retail Rates", OSESMO_Inputs["Retail_Rate_Name_Input"])] +
+                                     [(Catalog_Section, Catalog_Entry_Name) for Catalog_Section, Catalog_Entry_Name, _, _
+                                      in List_Scenario_Data_Vectors(OSESMO_Inputs, Data_Catalog)]))
+
+        Input_Data_Versions = []
+
+        for Catalog_Section, Catalog_Entry_Name in Catalog_Entries:
+
+            Catalog_Entry = Data_Catalog[Catalog_Section][Catalog_Entry_Name]
+
+            # File paths are listed by timestep resolution, and by variable name for retail rates.
+            File_Paths = []
+
+            for Files in Catalog_Entry.get("Files", {}).values():
+                File_Paths.extend(Files.values() if isinstance(Files, dict) else [Files])
+
+            File_Hashes = {}
+
+            for File_Path in sorted(File_Path for File_Path in File_Paths if File_Path is not None):
+                Input_File_Path = os.path.join(OSESMO_Inputs["Input_Output_Data_Directory_Location"], File_Path)
+                File_Hashes[File_Path] = Hash_File(Input_File_Path) if os.path.isfile(Input_File_Path) else None
+
+            Input_Data_Versions.append([Catalog_Section, Catalog_Entry_Name, Catalog_Entry, File_Hashes])
+
+    except KeyError:
+        return OSESMO(**OSESMO_Inputs)
+
+
+    ## Memo Key
+
+    Model_Inputs = {Input_Name: Input_Value for Input_Name, Input_Value in OSESMO_Inputs.items()
+                    if Input_Name not in Model_Run_Memo_Excluded_Inputs}
+
+    Memo_Key = hashlib.sha256(json.dumps([Model_Run_Memo_Version, Model_Code_Hash, Model_Inputs, Input_Data_Versions],
+                                         sort_keys = True, default = repr).encode("utf-8")).hexdigest()
+
+    Memo_File_Path = os.path.join(Model_Run_Memo_Directory, Memo_Key + ".pkl")
+
+
+    ## Load Memoized Results
+
+    if OSESMO_Inputs["Show_Plots"] != 1 and OSESMO_Inputs["Export_Plots"] != 1:
+
+        try:
+
+            with open(Memo_File_Path, "rb") as Memo_File:
+                OSESMO_Results = pickle.load(Memo_File)
+
+            # Mark the memo entry as recently used.
+            os.utime(Memo_File_Path)
+
+        except (OSError, EOFError, pickle.UnpicklingError):
+            OSESMO_Results = None
+
+        if OSESMO_Results is not None:
+
+            OSESMO_Results["Model_Inputs_and_Outputs"]["Modeling_Team_Input"] = OSESMO_Inputs["Modeling_Team_Input"]
+            OSESMO_Results["Model_Inputs_and_Outputs"]["Model_Run_Number_Input"] = OSESMO_Inputs["Model_Run_Number_Input"]
+
+            print("Model Run %s results loaded from model run memo." % OSESMO_Inputs["Model_Run_Number_Input"])
+
+            if OSESMO_Inputs["Export_Data"] == 1:
+                Export_Model_Data(OSESMO_Results)
+
+            return OSESMO_Results
+
+
+    ## Run Model and Save Results
+
+    OSESMO_Results = OSESMO(**OSESMO_Inputs)
+
+    try:
+
+        os.makedirs(Model_Run_Memo_Directory, exist_ok = True)
+
+        # Memo entries are written to a temporary file and then renamed,
+        # so that other processes never read a partially-written entry.
+        Temporary_Memo_File_Path = Memo_File_Path + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp"
+
+        with open(Temporary_Memo_File_Path, "wb") as Memo_File:
+            pickle.dump(OSESMO_Results, Memo_File, protocol = pickle.HIGHEST_PROTOCOL)
+
+        os.replace(Temporary_Memo_File_Path, Memo_File_Path)
+
+
+        ## Evict Least Recently Used Entries
+
+        Memo_Entries = []
+
+        for Memo_Entry in os.scandir(Model_Run_Memo_Directory):
+            if Memo_Entry.name.endswith(".pkl"):
+                Memo_Entry_Status = Memo_Entry.stat()
+                Memo_Entries.append((Memo_Entry_Status.st_mtime, Memo_Entry_Status.st_size, Memo_Entry.path))
+
+        Memo_Directory_Size = sum(Memo_Entry_Size for _, Memo_Entry_Size, _ in Memo_Entries)
+
+        for _, Memo_Entry_Size, Memo_Entry_Path in sorted(Memo_Entries):
+
+            if Memo_Directory_Size <= Model_Run_Memo_Size_Limit:
+                break
+
+            if Memo_Entry_Path != Memo_File_Path:
+
+                # Another process may have evicted the same entry.
+                try:
+                    os.remove(Memo_Entry_Path)
+                except FileNotFoundError:
+                    pass
+
+                Memo_Directory_Size = Memo_Directory_Size - Memo_Entry_Size
+
+    except OSError:
+        print("Could not write model run memo entry for Model Run %s." % OSESMO_Inputs["Model_Run_Number_Input"])
+
+    return OSESMO_Results
@@ -7,9 +7,6 @@
 
 ## Model Inputs - Setup Parameters and Run Options
 import datetime as dt
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
 
 # OSESMO Git Repository Directory Location
 OSESMO_Git_Repo_Directory = '/Users/Ryan/Library/Mobile Documents/com~apple~CloudDocs/Ryan\'s Stuff/2018/OSESMO/OSESMO Python'
@@ -238,20 +235,86 @@ Initial_Final_SOC = 0.3
 # of simulation results given by optimization algorithm.
 End_of_Month_Padding_Days = 3
 
+# Linear Program Solver Backend
+# Solver used to solve the monthly linear programs.
+#  * "cvxopt" - cvxopt interior-point solver (default).
+#  * "HiGHS" - HiGHS solver, called through highspy (or scipy.optimize.linprog if highspy is not installed).
+Solver_Backend = "cvxopt"
+
+# Linear Program Solver Options
+# Dictionary of options passed to the selected solver backend,
+# ex. {"reltol": 1e-7} for cvxopt, or {"method": "highs-ds", "presolve": True} for HiGHS.
+# The cvxopt KKT solver can be selected using {"kktsolver": "banded"} (default) or {"kktsolver": "sparse"}.
+Solver_Options = {}
+
+# Linear Program Solver Fallback
+# List of fallback steps tried in order if the solver doesn't find an optimal solution (see Solve_LP_with_Fallback.py).
+#  * "Rescaled" - the same solver, with the linear program's constraint rows and cost vector rescaled.
+#  * "More Iterations" - the rescaled linear program, with 4 times the solver's iteration limit.
+#  * "Alternate Backend" - the other solver backend ("HiGHS" for "cvxopt", and "cvxopt" for "HiGHS").
+# "More Iterations" is skipped if the solver is stalled at its iteration limit, with dual infeasibility that isn't decreasing.
+# If no step finds an optimal solution, the model run stops with an LP_Solver_Failure error.
+# None uses all three steps, with "Alternate Backend" before "More Iterations" for cvxopt when highspy is installed,
+# and [] disables fallback.
+Solver_Fallback_Input = None
+
+# Linear Program Warm Start
+# Starting point used for each monthly linear program.
+#  * "No Warm Start" - each month is solved from scratch (default).
+#  * "Neighbouring Scenario" - start from the same month of the previous model run in this Python session.
+#    This is useful when running the same load profile and rate with several storage sizes or carbon adder values.
+#  * "Previous Month" - start from the previous month's solution, shifted forward in time.
+#  * "Neighbouring Scenario or Previous Month" - use the previous month's solution if there is no neighbouring scenario.
+LP_Warm_Start_Input = "No Warm Start"
+
+# Month Solve Mode
+# How the monthly linear programs are linked by the battery energy level at the start of each month.
+#  * "Sequential" - months are solved in order, each starting at the previous month's final energy level (default).
+#  * "Fixed Boundary" - every month starts at Initial_Final_SOC, so all months are solved in parallel.
+#  * "Speculative" - all months are solved in parallel, then months whose starting energy level changed
+#    by more than Month_Boundary_Tolerance (kWh) are solved again, until the results match "Sequential".
+#  * "Annual" - the whole year is solved as one linear program, with no padding days.
+Month_Solve_Mode_Input = "Sequential"
+
+# Number of worker processes used by the "Fixed Boundary" and "Speculative" month solve modes (None = number of CPUs).
+Month_Solve_Workers = None
+
+# Month Boundary Tolerance (kWh)
+Month_Boundary_Tolerance = 0.01
+
+# Model Run Memo
+# If 1, the results of a previous model run with the same inputs, input data, and model code are reused
+# instead of re-running the model (see Memoize_Model_Run.py). If 0, the model is always run.
+# Model runs that show or export plots are always run, so that the plots are drawn.
+Use_Model_Run_Memo = 0
+
+# Model Run Metrics Log
+# If a file path is provided, the time taken by each phase of the model run, solver statistics, and peak memory
+# are appended to this file as one line of JSON. Model run metrics are also returned in the model results.
+Model_Run_Metrics_Log_Filepath = None
+
 
 ## Run Storage Model
 
-from OSESMO import OSESMO
-
-OSESMO(Modeling_Team_Input, Model_Run_Number_Input, Model_Type_Input,
-    Model_Timestep_Resolution, Customer_Class_Input, Load_Profile_Name_Input,
-    Retail_Rate_Name_Input, Solar_Profile_Name_Input, Solar_Size_Input,
-    Storage_Type_Input, Storage_Power_Rating_Input, Usable_Storage_Capacity_Input,
-    Single_Cycle_RTE_Input, Parasitic_Storage_Load_Input,
-    Storage_Control_Algorithm_Name, GHG_Reduction_Solution_Input, Equivalent_Cycling_Constraint_Input,
-    Annual_RTE_Constraint_Input, ITC_Constraint_Input,
-    Carbon_Adder_Incentive_Value_Input, Emissions_Forecast_Signal_Input,
-    OSESMO_Git_Repo_Directory, Input_Output_Data_Directory_Location, Start_Time_Input,
-    Show_Plots, Export_Plots, Export_Data,
-    Solar_Installed_Cost_per_kW, Storage_Installed_Cost_per_kWh, Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh,
-    Cycle_Life, Storage_Depth_of_Discharge, Initial_Final_SOC, End_of_Month_Padding_Days)
\ No newline at end of file
+# The "Fixed Boundary" and "Speculative" month solve modes start worker processes,
+# which import this file on some operating systems, so the model is only run from the main process.
+
+if __name__ == "__main__":
+
+    from OSESMO import OSESMO
+
+    OSESMO_Results = OSESMO(Modeling_Team_Input, Model_Run_Number_Input, Model_Type_Input,
+        Model_Timestep_Resolution, Customer_Class_Input, Load_Profile_Name_Input,
+        Retail_Rate_Name_Input, Solar_Profile_Name_Input, Solar_Size_Input,
+        Storage_Type_Input, Storage_Power_Rating_Input, Usable_Storage_Capacity_Input,
+        Single_Cycle_RTE_Input, Parasitic_Storage_Load_Input,
+        Storage_Control_Algorithm_Name, GHG_Reduction_Solution_Input, Equivalent_Cycling_Constraint_Input,
+        Annual_RTE_Constraint_Input, ITC_Constraint_Input,
+        Carbon_Adder_Incentive_Value_Input, Emissions_Forecast_Signal_Input,
+        OSESMO_Git_Repo_Directory, Input_Output_Data_Directory_Location, Start_Time_Input,
+        Show_Plots, Export_Plots, Export_Data,
+        Solar_Installed_Cost_per_kW, Storage_Installed_Cost_per_kWh, Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh,
+        Cycle_Life, Storage_Depth_of_Discharge, Initial_Final_SOC, End_of_Month_Padding_Days,
+        Solver_Backend, Solver_Options, LP_Warm_Start_Input,
+        Month_Solve_Mode_Input, Month_Solve_Workers, Month_Boundary_Tolerance,
+        Use_Model_Run_Memo, Model_Run_Metrics_Log_Filepath, Solver_Fallback_Input)
@@ -6,15 +6,16 @@
 # Description: Simulates operation of energy storage system, and calculates GHG impact.
 
 import os
+import sys
 import math as math
 import time as time
 import datetime as datetime
 import numpy as np
 import pandas as pd
 from cvxopt import matrix, sparse, solvers
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
+
+# matplotlib is imported when the model run shows or exports plots,
+# so that importing OSESMO_EST stays fast, and works on servers without a display.
 
 
 def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
@@ -89,6 +90,16 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
     os.chdir(Input_Output_Data_Directory_Location)
 
 
+    ## Import Banded KKT Solver
+
+    # Banded_KKT_Solver.py is located in the main OSESMO Python folder (OSESMO_Git_Repo_Directory).
+
+    if OSESMO_Git_Repo_Directory not in sys.path:
+        sys.path.append(OSESMO_Git_Repo_Directory)
+
+    from Banded_KKT_Solver import Banded_KKT_Solver
+
+
     ## Iterate Through Time Intervals & Filter Data to Selected Time Interval
     # The time interval used in each iteration is 1 (padded) month.
 
@@ -162,11 +173,8 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
 
         # E[t] - E[t+1] + Eff_c * P_ES_in[t] * delta_t - (1/Eff_d) * P_ES_out[t] * delta_t = 0
 
-        # An equality constraint can be transformed into two inequality constraints
-        # Ax = 0 -> Ax <=0 , -Ax <=0
-
-        # Number of rows in each inequality constraint matrix = (numtsteps - 1)
-        # Number of columns in each inequality constraint matrix = number of
+        # Number of rows in equality constraint matrix = (numtsteps - 1)
+        # Number of columns in equality constraint matrix = number of
         # decision variables = length_x
 
         A_E = sparse(matrix(0., (numtsteps - 1, length_x), tc = 'd'), tc = 'd')
@@ -178,11 +186,9 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
             A_E[n, n] = Eff_c * delta_t  # Eff_c * P_ES_in[t] * delta_t
             A_E[n, n + numtsteps] = (-1 / Eff_d) * delta_t  # - (1/Eff_d) * P_ES_out[t] * delta_t
 
-        A_Interval = sparse([A_E,
-                          -A_E], tc = 'd')
+        A_Eq_Interval = A_E
 
-        b_Interval = sparse([b_E,
-                          -b_E], tc = 'd')
+        b_Eq_Interval = b_E
 
 
         ## Energy Storage Charging Power Constraint
@@ -201,12 +207,10 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
         for n in range(0, numtsteps): # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
             A_P_ES_in[n, n] = -1.
 
-        A_Interval = sparse([A_Interval,
-                          A_P_ES_in,
+        A_Interval = sparse([A_P_ES_in,
                           -A_P_ES_in], tc = 'd')
 
-        b_Interval = sparse([b_Interval,
-                         sparse(matrix(0., (numtsteps, 1), tc = 'd'), tc = 'd'),
+        b_Interval = sparse([sparse(matrix(0., (numtsteps, 1), tc = 'd'), tc = 'd'),
                          sparse(matrix(Storage_Power_Rating_Input, (numtsteps, 1), tc = 'd'), tc = 'd')], tc = 'd')
 
 
@@ -278,10 +282,8 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
         # the battery at the final battery level from the previous interval.
 
         # E(0) = Initial_Final_SOC * Usable_Storage_Capacity_Input
-        # E(0) <= Initial_Final_SOC * Usable_Storage_Capacity_Input, -E(0) <= Initial_Final_SOC * Usable_Storage_Capacity_Input
 
         # E(0) = Previous_Interval_Final_Energy_Level
-        # E(0) <= Previous_Interval_Final_Energy_Level, -E(0) <= Previous_Interval_Final_Energy_Level
 
         A_Ene_Lvl_0 = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
 
@@ -295,13 +297,11 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
 
             b_Ene_Lvl_0 = matrix(Next_Interval_Initial_Energy_Level, tc = 'd')
 
-        A_Interval = sparse([A_Interval,
-                          A_Ene_Lvl_0,
-                          -A_Ene_Lvl_0], tc = 'd')
+        A_Eq_Interval = sparse([A_Eq_Interval,
+                                A_Ene_Lvl_0], tc = 'd')
 
-        b_Interval = sparse([b_Interval,
-                          b_Ene_Lvl_0,
-                          -b_Ene_Lvl_0], tc = 'd')
+        b_Eq_Interval = sparse([b_Eq_Interval,
+                                b_Ene_Lvl_0], tc = 'd')
 
 
         ## Final State of Charge Constraints (for Quick Forecasts only)
@@ -311,7 +311,6 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
         # to prevent it from discharging completely in the final timesteps.
 
         # E(N) = Initial_Final_SOC * Usable_Storage_Capacity_Input
-        # E(N) <= Initial_Final_SOC * Usable_Storage_Capacity_Input, -E(N) <= Initial_Final_SOC * Usable_Storage_Capacity_Input
 
         A_Ene_Lvl_N = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
 
@@ -319,13 +318,11 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
 
         b_Ene_Lvl_N = matrix(Initial_Final_SOC * Usable_Storage_Capacity_Input, tc = 'd')
 
-        A_Interval = sparse([A_Interval,
-                             A_Ene_Lvl_N,
-                             -A_Ene_Lvl_N], tc = 'd')
+        A_Eq_Interval = sparse([A_Eq_Interval,
+                                A_Ene_Lvl_N], tc = 'd')
 
-        b_Interval = sparse([b_Interval,
-                             b_Ene_Lvl_N,
-                             -b_Ene_Lvl_N], tc = 'd')
+        b_Eq_Interval = sparse([b_Eq_Interval,
+                                b_Ene_Lvl_N], tc = 'd')
 
 
         ## Run LP Optimization Algorithm
@@ -333,9 +330,14 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
         # Check that number of rows in A_Interval.size == number of rows in b_Interval.size
         # Check that A_Interval.typecode, b_Interval.typecode, c_Interval.typecode == 'd'
 
+        # The equality constraints are handled using the banded KKT solver from the main OSESMO model
+        # (see Banded_KKT_Solver.py), which exploits the time structure of the linear program.
+
         b_Interval = matrix(b_Interval, tc = 'd') # Convert from sparse to dense matrix
+        b_Eq_Interval = matrix(b_Eq_Interval, tc = 'd')
 
-        lp_solution = solvers.lp(c_Interval, A_Interval, b_Interval)
+        lp_solution = solvers.lp(c_Interval, A_Interval, b_Interval, A_Eq_Interval, b_Eq_Interval,
+                                 kktsolver = Banded_KKT_Solver(A_Interval, A_Eq_Interval))
 
         x_Interval = lp_solution['x']
 
@@ -438,6 +440,24 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
         os.makedirs(Output_Directory_Filepath)
 
 
+    ## Load Plotting Packages
+
+    # Plots are drawn using the interactive TkAgg backend if they are shown,
+    # or the non-interactive Agg backend if they are only exported (unless pyplot has already been loaded).
+
+    if Show_Plots == True or Export_Plots == True:
+
+        import matplotlib
+
+        if Show_Plots == True:
+            matplotlib.use('TkAgg')
+        elif "matplotlib.pyplot" not in sys.modules:
+            matplotlib.use('Agg')
+
+        import matplotlib.dates
+        import matplotlib.pyplot as plt
+
+
     ## Plot Energy Storage Dispatch Schedule and Marginal Emissions
 
     numtsteps_year = len(Marginal_Emissions_Rate_Evaluation_Data)
@@ -632,7 +652,7 @@ def OSESMO_EST(Modeling_Team_Input=None, Model_Run_Number_Input=None,
 
     ## Close All Figures
 
-    if Show_Plots == 0:
+    if Show_Plots == 0 and Export_Plots == True:
         plt.close('all')
 
 
@@ -7,15 +7,14 @@
 # Calculates customer savings, GHG reduction, and battery cycling.
 
 import os
+import sys
 import math as math
 import time as time
 import datetime as datetime
 import numpy as np
-import pandas as pd
-from cvxopt import matrix, sparse, solvers
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
+
+# matplotlib and pandas are imported when the model run needs them (to plot or export outputs),
+# so that importing OSESMO stays fast in scenario sweep worker processes, and works on servers without a display.
 
 
 def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Input=None,
@@ -29,7 +28,35 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
            OSESMO_Git_Repo_Directory=None, Input_Output_Data_Directory_Location=None, Start_Time_Input=None,
            Show_Plots=None, Export_Plots=None, Export_Data=None,
            Solar_Installed_Cost_per_kW=None, Storage_Installed_Cost_per_kWh=None, Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh=None,
-           Cycle_Life=None, Storage_Depth_of_Discharge=None, Initial_Final_SOC=None, End_of_Month_Padding_Days=None):
+           Cycle_Life=None, Storage_Depth_of_Discharge=None, Initial_Final_SOC=None, End_of_Month_Padding_Days=None,
+           Solver_Backend=None, Solver_Options=None, LP_Warm_Start_Input=None,
+           Month_Solve_Mode_Input=None, Month_Solve_Workers=None, Month_Boundary_Tolerance=None,
+           Use_Model_Run_Memo=None, Model_Run_Metrics_Log_Filepath=None, Solver_Fallback_Input=None):
+
+
+    ## Model Run Memo
+
+    # If Use_Model_Run_Memo is 1, the results of a previous model run with the same inputs, input data,
+    # and model code are returned instead of re-running the model. See Memoize_Model_Run.py.
+
+    # At this point, the local variables are the model inputs.
+    OSESMO_Inputs = dict(locals())
+
+    if Use_Model_Run_Memo == 1:
+
+        from Memoize_Model_Run import Memoize_Model_Run
+
+        return Memoize_Model_Run(dict(OSESMO_Inputs, Use_Model_Run_Memo = 0))
+
+
+    ## Scenario ID
+
+    # Model runs with the same result-affecting inputs have the same scenario ID (see Calculate_Scenario_ID.py),
+    # which identifies their results in a results store.
+
+    from Calculate_Scenario_ID import Calculate_Scenario_ID
+
+    Scenario_ID = Calculate_Scenario_ID(OSESMO_Inputs)
 
 
     ## Calculate Model Variable Values from User-Specified Input Values
@@ -104,37 +131,14 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     # Real-time five-minute marginal emissions signal used to evaluate emission impacts.
     # Available for both NP15 (Northern California congestion zone)
     # and SP15 (Southern California congestion zone).
-    # Mapped based on load profile site location (Northern or Southern CA).
-
-    if Load_Profile_Name_Input == "WattTime GreenButton Residential Berkeley" or \
-        Load_Profile_Name_Input == "WattTime GreenButton Residential Coulterville" or \
-        Load_Profile_Name_Input == "PG&E GreenButton E-6 Residential" or \
-        Load_Profile_Name_Input == "PG&E GreenButton Central Valley Residential CARE" or \
-        Load_Profile_Name_Input == "PG&E GreenButton Central Valley Residential Non-CARE" or \
-        Load_Profile_Name_Input == "Custom Power Solar GreenButton PG&E Albany Residential with EV" or \
-        Load_Profile_Name_Input == "Custom Power Solar GreenButton PG&E Crockett Residential with EV" or \
-        Load_Profile_Name_Input == "Avalon GreenButton East Bay Light Industrial" or \
-        Load_Profile_Name_Input == "Avalon GreenButton South Bay Education" or \
-        Load_Profile_Name_Input == "EnerNOC GreenButton San Francisco Office" or \
-        Load_Profile_Name_Input == "EnerNOC GreenButton San Francisco Industrial" or \
-        Load_Profile_Name_Input == "PG&E GreenButton A-6 SMB" or \
-        Load_Profile_Name_Input == "PG&E GreenButton A-10S MLB" or \
-        Load_Profile_Name_Input == "PG&E GreenButton Central Valley Residential Non-CARE" or \
-        Load_Profile_Name_Input == "PG&E GreenButton Central Valley Residential CARE":
-
-        Emissions_Evaluation_Signal_Input = "NP15 RT5M"
-
-    elif Load_Profile_Name_Input == "WattTime GreenButton Residential Long Beach" or\
-        Load_Profile_Name_Input == "Stem GreenButton SCE TOU-8B Office" or\
-        Load_Profile_Name_Input == "Stem GreenButton SDG&E G-16 Manufacturing" or\
-        Load_Profile_Name_Input == "Stem GreenButton SCE GS-3B Food Processing" or\
-        Load_Profile_Name_Input == "EnerNOC GreenButton Los Angeles Grocery" or\
-        Load_Profile_Name_Input == "EnerNOC GreenButton Los Angeles Industrial" or\
-        Load_Profile_Name_Input == "EnerNOC GreenButton San Diego Office":
-
-        Emissions_Evaluation_Signal_Input = "SP15 RT5M"
+    # Mapped based on load profile site location (Northern or Southern CA),
+    # as listed in Data_Catalog.json.
 
-    else:
+    from Import_Data_Catalog import Import_Data_Catalog
+
+    Emissions_Evaluation_Signal_Input = Import_Data_Catalog()["Load Profiles"][Load_Profile_Name_Input]["Emissions_Evaluation_Signal"]
+
+    if Emissions_Evaluation_Signal_Input is None:
 
         print("This load profile name input has not been mapped to an emissions evaluation signal (NP15 or SP15).")
 
@@ -173,6 +177,24 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     # Begin script runtime timer
     tstart = time.time()
 
+    # Model Run Phase Times
+    # The time taken by each phase of the model run (in seconds) is recorded by calling Record_Model_Run_Phase
+    # at the end of the phase. Phases that are recorded more than once (ex. in every month) are added together.
+
+    Model_Run_Phase_Times = {}
+    Model_Run_Phase_Start_Time = time.perf_counter()
+
+    def Record_Model_Run_Phase(Model_Run_Phase_Name):
+
+        nonlocal Model_Run_Phase_Start_Time
+
+        Model_Run_Phase_End_Time = time.perf_counter()
+
+        Model_Run_Phase_Times[Model_Run_Phase_Name] = Model_Run_Phase_Times.get(Model_Run_Phase_Name, 0.) + \
+                                                      (Model_Run_Phase_End_Time - Model_Run_Phase_Start_Time)
+
+        Model_Run_Phase_Start_Time = Model_Run_Phase_End_Time
+
 
     # Import Load Profile Data
     # Call Import_Load_Profile_Data function.
@@ -182,8 +204,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     [Load_Profile_Data, Load_Profile_Master_Index] = Import_Load_Profile_Data(Input_Output_Data_Directory_Location, OSESMO_Git_Repo_Directory,
                                                  delta_t, Load_Profile_Name_Input)
 
-    Annual_Peak_Demand_Baseline = np.max(Load_Profile_Data)
-    Annual_Total_Energy_Consumption_Baseline = np.sum(Load_Profile_Data) * delta_t
+    Record_Model_Run_Phase("Import Load Profile Data")
 
 
     # Import Marginal Emissions Rate Data Used as Forecast
@@ -195,6 +216,8 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
         Input_Output_Data_Directory_Location, OSESMO_Git_Repo_Directory,
         delta_t, Load_Profile_Data, Emissions_Forecast_Signal_Input)
 
+    Record_Model_Run_Phase("Import Marginal Emissions Rate Forecast Data")
+
 
     # Import Marginal Emissions Rate Data Used for Evaluation
     # Call Import_Marginal_Emissions_Rate_Forecast_Data function.
@@ -205,6 +228,8 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
         Input_Output_Data_Directory_Location, OSESMO_Git_Repo_Directory,
         delta_t, Emissions_Evaluation_Signal_Input)
 
+    Record_Model_Run_Phase("Import Marginal Emissions Rate Evaluation Data")
+
 
     # Import Carbon Adder Data
 
@@ -227,7 +252,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
      Summer_Peak_Binary_Data, Summer_Part_Peak_Binary_Data,
      Winter_Peak_Binary_Data, Winter_Part_Peak_Binary_Data] = Import_Retail_Rate_Data(
         Input_Output_Data_Directory_Location, OSESMO_Git_Repo_Directory,
-        delta_t, Retail_Rate_Name_Input)
+        delta_t, Retail_Rate_Name_Input, Start_Time_Input)
 
     Month_Data = Month_Data.astype(int)
     Summer_Peak_Binary_Data = Summer_Peak_Binary_Data.astype(int)
@@ -235,6 +260,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     Winter_Peak_Binary_Data = Winter_Peak_Binary_Data.astype(int)
     Winter_Part_Peak_Binary_Data = Winter_Part_Peak_Binary_Data.astype(int)
 
+    Record_Model_Run_Phase("Import Retail Rate Data")
 
 
     # Import IOU-Proposed Charge and Discharge Hour Flag Vectors
@@ -257,6 +283,9 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
             Input_Output_Data_Directory_Location, OSESMO_Git_Repo_Directory, delta_t)
 
 
+    Record_Model_Run_Phase("Import Time Constraint Data")
+
+
     # Import Solar PV Generation Profile Data
     # Scale base 10-kW or 100-kW profile to match user-input PV system size
 
@@ -274,6 +303,8 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
         Solar_Profile_Description = ""
         Solar_PV_Profile_Data = np.zeros(shape=Load_Profile_Data.shape)
 
+    Record_Model_Run_Phase("Import Solar PV Profile Data")
+
 
     # Import Utility Marginal Cost Data
     # Marginal Costs are mapped to load profile location
@@ -283,9 +314,34 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     [Generation_Cost_Data, Representative_Distribution_Cost_Data] = Import_Utility_Marginal_Cost_Data(Input_Output_Data_Directory_Location,
                                                              OSESMO_Git_Repo_Directory, delta_t, Load_Profile_Name_Input)
 
+    Record_Model_Run_Phase("Import Utility Marginal Cost Data")
+
+
+    ## Calculate Results without Storage
+
+    # Baseline and solar-only bill components, peak demand, energy consumption, grid costs, and GHG emissions
+    # don't depend on the storage system, and are shared by model runs with the same load profile, retail rate,
+    # solar profile and size, start time, and timestep resolution. See Calculate_Without_Storage_Results.py.
+
+    from Calculate_Without_Storage_Results import Calculate_Without_Storage_Results
+
+    Without_Storage_Results = Calculate_Without_Storage_Results(
+        Input_Output_Data_Directory_Location, Load_Profile_Name_Input, Retail_Rate_Name_Input, Start_Time_Input,
+        Model_Type_Input, Solar_Profile_Name_Input, Solar_Size_Input, delta_t,
+        Load_Profile_Data, Solar_PV_Profile_Data, Volumetric_Rate_Data, Month_Data,
+        Summer_Peak_DC, Summer_Part_Peak_DC, Summer_Noncoincident_DC,
+        Winter_Peak_DC, Winter_Part_Peak_DC, Winter_Noncoincident_DC,
+        Fixed_Per_Meter_Day_Charge, Fixed_Per_Meter_Month_Charge,
+        First_Summer_Month, Last_Summer_Month,
+        Summer_Peak_Binary_Data, Summer_Part_Peak_Binary_Data,
+        Winter_Peak_Binary_Data, Winter_Part_Peak_Binary_Data,
+        Generation_Cost_Data, Representative_Distribution_Cost_Data,
+        Marginal_Emissions_Rate_Evaluation_Data)
+
+    Record_Model_Run_Phase("Calculate Results without Storage")
 
-    # Set Directory to Box Sync Folder
-    os.chdir(Input_Output_Data_Directory_Location)
+    Annual_Peak_Demand_Baseline = Without_Storage_Results["Annual_Peak_Demand_Baseline"]
+    Annual_Total_Energy_Consumption_Baseline = Without_Storage_Results["Annual_Total_Energy_Consumption_Baseline"]
 
 
     ## Iterate Through Months & Filter Data to Selected Month
@@ -300,213 +356,190 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
     Ene_Lvl = np.array([])
 
-    P_max_NC = np.array([])
-
-    P_max_peak = np.array([])
-
-    P_max_part_peak = np.array([])
-
 
     # Initialize Monthly Cost Variable Vectors
+    # Monthly costs without storage are loaded from Without_Storage_Results,
+    # and monthly bill costs with storage are calculated after all months have been solved.
 
-    Fixed_Charge_Vector = np.array([])
+    Fixed_Charge_Vector = Without_Storage_Results["Fixed_Charge_Vector"]
 
-    NC_DC_Baseline_Vector = np.array([])
-    NC_DC_with_Solar_Only_Vector = np.array([])
-    NC_DC_with_Solar_and_Storage_Vector = np.array([])
+    NC_DC_Baseline_Vector = Without_Storage_Results["NC_DC_Baseline_Vector"]
+    NC_DC_with_Solar_Only_Vector = Without_Storage_Results["NC_DC_with_Solar_Only_Vector"]
 
-    CPK_DC_Baseline_Vector = np.array([])
-    CPK_DC_with_Solar_Only_Vector = np.array([])
-    CPK_DC_with_Solar_and_Storage_Vector = np.array([])
+    CPK_DC_Baseline_Vector = Without_Storage_Results["CPK_DC_Baseline_Vector"]
+    CPK_DC_with_Solar_Only_Vector = Without_Storage_Results["CPK_DC_with_Solar_Only_Vector"]
 
-    CPP_DC_Baseline_Vector = np.array([])
-    CPP_DC_with_Solar_Only_Vector = np.array([])
-    CPP_DC_with_Solar_and_Storage_Vector = np.array([])
+    CPP_DC_Baseline_Vector = Without_Storage_Results["CPP_DC_Baseline_Vector"]
+    CPP_DC_with_Solar_Only_Vector = Without_Storage_Results["CPP_DC_with_Solar_Only_Vector"]
 
-    Energy_Charge_Baseline_Vector = np.array([])
-    Energy_Charge_with_Solar_Only_Vector = np.array([])
-    Energy_Charge_with_Solar_and_Storage_Vector = np.array([])
+    Energy_Charge_Baseline_Vector = Without_Storage_Results["Energy_Charge_Baseline_Vector"]
+    Energy_Charge_with_Solar_Only_Vector = Without_Storage_Results["Energy_Charge_with_Solar_Only_Vector"]
 
     Cycles_Vector = np.array([])
     Cycling_Penalty_Vector = np.array([])
 
-    for Month_Iter in range(1,13):  # Iterate through all months
-
-        # Filter Load Profile Data to Selected Month
-        Load_Profile_Data_Month = Load_Profile_Data[Month_Data == Month_Iter]
-
-        # Filter PV Production Profile Data to Selected Month
-        Solar_PV_Profile_Data_Month = Solar_PV_Profile_Data[Month_Data == Month_Iter]
+    # Initialize Solver Statistics List
+    Solver_Statistics = []
 
-        # Filter Volumetric Rate Data to Selected Month
-        Volumetric_Rate_Data_Month = Volumetric_Rate_Data[Month_Data == Month_Iter]
+    # Check Linear Program Solutions
+    # Every linear program solution is checked before it is used. If the requested solver and all of the fallback steps
+    # in Solver_Fallback_Input (see Solve_LP_with_Fallback.py) fail to find an optimal solution, the model run stops
+    # with an LP_Solver_Failure exception. Its Solver_Failure_Record describes the failed linear program and each
+    # solve attempt, and is also appended to the model run metrics log, along with the metrics recorded so far.
 
-        # Filter Marginal Emissions Data to Selected Month
+    from Solve_LP_with_Fallback import LP_Solver_Failure
 
-        Marginal_Emissions_Rate_Forecast_Data_Month = Marginal_Emissions_Rate_Forecast_Data[Month_Data == Month_Iter]
+    def Check_LP_Solution(lp_solution, Month_Iter, LP_Solution_Source):
 
-        # Filter Carbon Adder Data to Selected Month
+        if lp_solution['status'] == "optimal":
+            return
 
-        Carbon_Adder_Data_Month = Carbon_Adder_Data[Month_Data == Month_Iter]
+        Solver_Failure_Record = {"Model_Run_Number_Input": Model_Run_Number_Input,
+                                 "Month": Month_Iter,
+                                 "Solution_Source": LP_Solution_Source,
+                                 "Solver_Backend": Solver_Backend,
+                                 "Status": lp_solution['status'],
+                                 "Rows": lp_solution['rows'],
+                                 "Columns": lp_solution['columns'],
+                                 "Nonzeros": lp_solution['nonzeros'],
+                                 "Solver_Attempts": lp_solution.get('attempts', [])}
 
+        if Model_Run_Metrics_Log_Filepath is not None:
 
+            import json
 
-        # Set Demand Charge Values Based on Month
-
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            Peak_DC = Summer_Peak_DC
-            Part_Peak_DC = Summer_Part_Peak_DC
-            Noncoincident_DC = Summer_Noncoincident_DC
-
-        else:
-            Peak_DC = Winter_Peak_DC
-            Part_Peak_DC = Winter_Part_Peak_DC
-            Noncoincident_DC = Winter_Noncoincident_DC
-
-
-        # Filter Peak and Part-Peak Binary Data to Selected Month
+            Record_Model_Run_Phase("Build and Solve Linear Programs")
 
-        if Summer_Peak_DC > 0:
-            Summer_Peak_Binary_Data_Month = Summer_Peak_Binary_Data[Month_Data == Month_Iter]
+            Model_Run_Metrics_Log_Line = json.dumps({"Model_Run_Number_Input": Model_Run_Number_Input,
+                                                     "Scenario_ID": Scenario_ID,
+                                                     "Model_Run_Date_Time": datetime.datetime.now().replace(microsecond=0).isoformat(),
+                                                     "Status": "Failed",
+                                                     "Phase_Times_Seconds": Model_Run_Phase_Times,
+                                                     "Solver_Statistics": Solver_Statistics,
+                                                     "Solver_Failure": Solver_Failure_Record,
+                                                     "Modeling_Team_Input": Modeling_Team_Input},
+                                                    default = lambda Metric_Value: Metric_Value.item() if isinstance(Metric_Value, np.generic) else repr(Metric_Value))
 
-        if Summer_Part_Peak_DC > 0:
-            Summer_Part_Peak_Binary_Data_Month = Summer_Part_Peak_Binary_Data[Month_Data == Month_Iter]
+            with open(Model_Run_Metrics_Log_Filepath, "a") as Model_Run_Metrics_Log_File:
+                Model_Run_Metrics_Log_File.write(Model_Run_Metrics_Log_Line + "\n")
 
-        if Winter_Peak_DC > 0:
-            Winter_Peak_Binary_Data_Month = Winter_Peak_Binary_Data[Month_Data == Month_Iter]
+        raise LP_Solver_Failure("No optimal solution was found for Model Run %s, Month %s (solver status \"%s\" after %d solve attempts)." %
+                                (Model_Run_Number_Input, Month_Iter, lp_solution['status'], len(Solver_Failure_Record["Solver_Attempts"])),
+                                Solver_Failure_Record)
 
-        if Winter_Part_Peak_DC > 0:
-            Winter_Part_Peak_Binary_Data_Month = Winter_Part_Peak_Binary_Data[Month_Data == Month_Iter]
+    # Import Monthly Linear Program Constraint Builder and Solver
+    from Solve_Month_LP import Solve_Month_LP
+    from Solve_LP import LP_Warm_Start_Cache
+    from Shift_LP_Warm_Start import Shift_LP_Warm_Start
+    from Calculate_Bills import Calculate_Bills
+    from Build_Month_Time_Index import Build_Month_Time_Index
 
+    if LP_Warm_Start_Input is None:
+        LP_Warm_Start_Input = "No Warm Start"
 
-        # Filter PG&E-Proposed Charge and Discharge Hour Binary Data to Selected Month
-        if GHG_Reduction_Solution_Input == "No-Charging Time Constraint" or \
-                GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
-            PGE_Charge_Hour_Binary_Data_Month = PGE_Charge_Hour_Binary_Data[Month_Data == Month_Iter]
-            PGE_No_Charge_Hour_Binary_Data_Month = PGE_No_Charge_Hour_Binary_Data[Month_Data == Month_Iter]
-            PGE_Discharge_Hour_Binary_Data_Month = PGE_Discharge_Hour_Binary_Data[Month_Data == Month_Iter]
+    if Month_Solve_Mode_Input is None:
+        Month_Solve_Mode_Input = "Sequential"
 
+    if Month_Boundary_Tolerance is None:
+        Month_Boundary_Tolerance = 0.01
 
-        # Filter IOU-Proposed Charge and Discharge Hour Binary Data to Selected Month
-        if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
-            IOU_Charge_Hour_Binary_Data_Month = IOU_Charge_Hour_Binary_Data[Month_Data == Month_Iter]
-            IOU_Discharge_Hour_Binary_Data_Month = IOU_Discharge_Hour_Binary_Data[Month_Data == Month_Iter]
+    # The "Annual" month solve mode solves all months as one linear program, so no padding days are needed.
 
+    if Month_Solve_Mode_Input == "Annual":
+        End_of_Month_Padding_Days = 0
 
-        ## Add "Padding" to Every Month of Data
-        # Don't pad Month 12, because the final state of charge is constrained
-        # to equal the original state of charge.
+    # Monthly linear program data is prepared for all months first, and saved in this list.
+    # The linear programs are then solved and their results are calculated month by month.
+    Month_LP_Data = []
 
-        if Month_Iter in range(1, 12):  # 1 through 11
+    ## Build Month Time Index
 
-            # Pad Load Profile Data
-            Load_Profile_Data_Month_Padded = np.concatenate((Load_Profile_Data_Month,
-                                                             Load_Profile_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    # Monthly data are taken as slices of padded data vectors, which are built once from the full-year data vectors,
+    # instead of filtering and padding every data vector in every month. See Build_Month_Time_Index.py.
 
-            # Pad PV Production Profile Data
-            Solar_PV_Profile_Data_Month_Padded = np.concatenate((Solar_PV_Profile_Data_Month,
-                                                                 Solar_PV_Profile_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    # Coincident peak and part-peak binary data of each timestep, based on the season of its month.
+    Summer_Timesteps = (Month_Data >= First_Summer_Month) & (Month_Data <= Last_Summer_Month)
 
-            # Pad Volumetric Energy Rate Data
-            Volumetric_Rate_Data_Month_Padded = np.concatenate((Volumetric_Rate_Data_Month,
-                                                                Volumetric_Rate_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    Peak_Binary_Data = np.where(Summer_Timesteps, Summer_Peak_Binary_Data, Winter_Peak_Binary_Data)
+    Part_Peak_Binary_Data = np.where(Summer_Timesteps, Summer_Part_Peak_Binary_Data, Winter_Part_Peak_Binary_Data)
 
-            # Pad Marginal Emissions Data
-            Marginal_Emissions_Rate_Data_Month_Padded = np.concatenate((Marginal_Emissions_Rate_Forecast_Data_Month,
-                                                                        Marginal_Emissions_Rate_Forecast_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    Month_Time_Index = Build_Month_Time_Index(Month_Data, delta_t, End_of_Month_Padding_Days,
+                                              Peak_Binary_Data, Part_Peak_Binary_Data)
 
-            # Pad Carbon Adder Data
-            Carbon_Adder_Data_Month_Padded = np.concatenate((Carbon_Adder_Data_Month,
-                                                             Carbon_Adder_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    Month_Order = Month_Time_Index["Month_Order"]
+    Month_Start = Month_Time_Index["Month_Start"]
+    Month_End = Month_Time_Index["Month_End"]
+    Padded_Start = Month_Time_Index["Padded_Start"]
+    Padded_End = Month_Time_Index["Padded_End"]
 
-            # Pad Peak and Part-Peak Binary Data
+    def Month_Timesteps(Month_Iter):
+        if Month_Order is None:
+            return slice(Month_Start[Month_Iter - 1], Month_End[Month_Iter - 1])
+        else:
+            return Month_Order[Month_Start[Month_Iter - 1]:Month_End[Month_Iter - 1]]
 
-            if Summer_Peak_DC > 0:
-                Summer_Peak_Binary_Data_Month_Padded = np.concatenate((Summer_Peak_Binary_Data_Month,
-                                                                       Summer_Peak_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    def Pad_Year_Data(Year_Data):
+        if Month_Time_Index["Padded_Index"] is None:
+            return Year_Data
+        else:
+            return Year_Data[Month_Time_Index["Padded_Index"]]
+
+    # Pad Load, PV Production, Volumetric Rate, Marginal Emissions, and Carbon Adder Data
+    Load_Profile_Data_Padded = Pad_Year_Data(Load_Profile_Data)
+    Solar_PV_Profile_Data_Padded = Pad_Year_Data(Solar_PV_Profile_Data)
+    Volumetric_Rate_Data_Padded = Pad_Year_Data(Volumetric_Rate_Data)
+    Marginal_Emissions_Rate_Forecast_Data_Padded = Pad_Year_Data(Marginal_Emissions_Rate_Forecast_Data)
+    Carbon_Adder_Data_Padded = Pad_Year_Data(Carbon_Adder_Data)
+
+    # Pad PG&E-Proposed Charge and Discharge Hour Binary Data
+    if GHG_Reduction_Solution_Input == "No-Charging Time Constraint" or \
+            GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
+        PGE_Charge_Hour_Binary_Data_Padded = Pad_Year_Data(PGE_Charge_Hour_Binary_Data)
+        PGE_No_Charge_Hour_Binary_Data_Padded = Pad_Year_Data(PGE_No_Charge_Hour_Binary_Data)
+        PGE_Discharge_Hour_Binary_Data_Padded = Pad_Year_Data(PGE_Discharge_Hour_Binary_Data)
+
+    # Pad IOU-Proposed Charge and Discharge Hour Binary Data
+    if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
+        IOU_Charge_Hour_Binary_Data_Padded = Pad_Year_Data(IOU_Charge_Hour_Binary_Data)
+        IOU_Discharge_Hour_Binary_Data_Padded = Pad_Year_Data(IOU_Discharge_Hour_Binary_Data)
 
-            if Summer_Part_Peak_DC > 0:
-                Summer_Part_Peak_Binary_Data_Month_Padded = np.concatenate((Summer_Part_Peak_Binary_Data_Month,
-                                                                       Summer_Part_Peak_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+    for Month_Iter in range(1,13):  # Iterate through all months
 
-            if Winter_Peak_DC > 0:
-                Winter_Peak_Binary_Data_Month_Padded = np.concatenate((Winter_Peak_Binary_Data_Month,
-                                                                       Winter_Peak_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+        # Select Padded Data for Selected Month
+        # Months 1 through 11 are padded with their last End_of_Month_Padding_Days days.
+        # Month 12 is not padded, because the final state of charge is constrained
+        # to equal the original state of charge.
 
-            if Winter_Part_Peak_DC > 0:
-                Winter_Part_Peak_Binary_Data_Month_Padded = np.concatenate((Winter_Part_Peak_Binary_Data_Month,
-                                                                            Winter_Part_Peak_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
+        Month_Padded_Timesteps = slice(Padded_Start[Month_Iter - 1], Padded_End[Month_Iter - 1])
 
+        Load_Profile_Data_Month_Padded = Load_Profile_Data_Padded[Month_Padded_Timesteps]
+        Solar_PV_Profile_Data_Month_Padded = Solar_PV_Profile_Data_Padded[Month_Padded_Timesteps]
+        Volumetric_Rate_Data_Month_Padded = Volumetric_Rate_Data_Padded[Month_Padded_Timesteps]
+        Marginal_Emissions_Rate_Data_Month_Padded = Marginal_Emissions_Rate_Forecast_Data_Padded[Month_Padded_Timesteps]
+        Carbon_Adder_Data_Month_Padded = Carbon_Adder_Data_Padded[Month_Padded_Timesteps]
 
-            # Pad PG&E-Proposed Charge and Discharge Hour Binary Data
-            if GHG_Reduction_Solution_Input == "No-Charging Time Constraint" or \
+        if GHG_Reduction_Solution_Input == "No-Charging Time Constraint" or \
                 GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
+            PGE_Charge_Hour_Binary_Data_Month_Padded = PGE_Charge_Hour_Binary_Data_Padded[Month_Padded_Timesteps]
+            PGE_No_Charge_Hour_Binary_Data_Month_Padded = PGE_No_Charge_Hour_Binary_Data_Padded[Month_Padded_Timesteps]
+            PGE_Discharge_Hour_Binary_Data_Month_Padded = PGE_Discharge_Hour_Binary_Data_Padded[Month_Padded_Timesteps]
 
-                PGE_Charge_Hour_Binary_Data_Month_Padded = np.concatenate((PGE_Charge_Hour_Binary_Data_Month,
-                                                                           PGE_Charge_Hour_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
-
-                PGE_No_Charge_Hour_Binary_Data_Month_Padded = np.concatenate((PGE_No_Charge_Hour_Binary_Data_Month,
-                                                                              PGE_No_Charge_Hour_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
-
-                PGE_Discharge_Hour_Binary_Data_Month_Padded = np.concatenate((PGE_Discharge_Hour_Binary_Data_Month,
-                                                                              PGE_Discharge_Hour_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
-
-
-            # Pad IOU-Proposed Charge and Discharge Hour Binary Data
-            if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
-                IOU_Charge_Hour_Binary_Data_Month_Padded = np.concatenate((IOU_Charge_Hour_Binary_Data_Month,
-                                                                           IOU_Charge_Hour_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
-
-                IOU_Discharge_Hour_Binary_Data_Month_Padded = np.concatenate((IOU_Discharge_Hour_Binary_Data_Month,
-                                                                              IOU_Discharge_Hour_Binary_Data_Month[-(End_of_Month_Padding_Days * 24 * int(1 / delta_t)):]))
-
-        elif Month_Iter == 12:
-
-            # Don't Pad Load Profile Data
-            Load_Profile_Data_Month_Padded = Load_Profile_Data_Month
-
-            # Don't Pad PV Production Profile Data
-            Solar_PV_Profile_Data_Month_Padded = Solar_PV_Profile_Data_Month
-
-            # Don't Pad Volumetric Rate Data
-            Volumetric_Rate_Data_Month_Padded = Volumetric_Rate_Data_Month
-
-            # Don't Pad Marginal Emissions Data
-
-            Marginal_Emissions_Rate_Data_Month_Padded = Marginal_Emissions_Rate_Forecast_Data_Month
-
-            # Don't Pad Carbon Adder Data
-
-            Carbon_Adder_Data_Month_Padded = Carbon_Adder_Data_Month
-
-            # Don't Pad Peak and Part-Peak Binary Data
-
-            if Summer_Peak_DC > 0:
-                Summer_Peak_Binary_Data_Month_Padded = Summer_Peak_Binary_Data_Month
-
-            if Summer_Part_Peak_DC > 0:
-                Summer_Part_Peak_Binary_Data_Month_Padded = Summer_Part_Peak_Binary_Data_Month
-
-            if Winter_Peak_DC > 0:
-                Winter_Peak_Binary_Data_Month_Padded = Winter_Peak_Binary_Data_Month
-
-            if Winter_Part_Peak_DC > 0:
-                Winter_Part_Peak_Binary_Data_Month_Padded = Winter_Part_Peak_Binary_Data_Month
-
-            # Don't Pad PG&E-Proposed Charge and Discharge Hour Binary Data
-            if GHG_Reduction_Solution_Input == "No-Charging Time Constraint" or \
-                GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
-                PGE_Charge_Hour_Binary_Data_Month_Padded = PGE_Charge_Hour_Binary_Data_Month
+        if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
+            IOU_Charge_Hour_Binary_Data_Month_Padded = IOU_Charge_Hour_Binary_Data_Padded[Month_Padded_Timesteps]
+            IOU_Discharge_Hour_Binary_Data_Month_Padded = IOU_Discharge_Hour_Binary_Data_Padded[Month_Padded_Timesteps]
 
-                PGE_No_Charge_Hour_Binary_Data_Month_Padded = PGE_No_Charge_Hour_Binary_Data_Month
 
-                PGE_Discharge_Hour_Binary_Data_Month_Padded = PGE_Discharge_Hour_Binary_Data_Month
+        # Set Demand Charge Values Based on Month
 
-            # Don't Pad IOU-Proposed Charge and Discharge Hour Binary Data
-            if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
-                IOU_Charge_Hour_Binary_Data_Month_Padded = IOU_Charge_Hour_Binary_Data_Month
+        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
+            Peak_DC = Summer_Peak_DC
+            Part_Peak_DC = Summer_Part_Peak_DC
+            Noncoincident_DC = Summer_Noncoincident_DC
 
-                IOU_Discharge_Hour_Binary_Data_Month_Padded = IOU_Discharge_Hour_Binary_Data_Month
+        else:
+            Peak_DC = Winter_Peak_DC
+            Part_Peak_DC = Winter_Part_Peak_DC
+            Noncoincident_DC = Winter_Noncoincident_DC
 
 
 
@@ -514,8 +547,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
         # nts = numtsteps = number of timesteps
         numtsteps = len(Load_Profile_Data_Month_Padded)
-        all_tsteps = np.array(list(range(0, numtsteps)))
-        numtsteps_unpadded = len(Load_Profile_Data_Month)
+        numtsteps_unpadded = Month_End[Month_Iter - 1] - Month_Start[Month_Iter - 1]
 
 
         # x = np.concatenate((P_ES_in_grid(size nts), P_ES_out(size nts), Ene_Lvl(size nts)
@@ -579,779 +611,335 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
         # This is the length of the vectors c and x, or the total number of decision variables.
         length_x = len(c_Month)
 
-        # Convert from numpy array to cvxopt matrix format
-        c_Month = matrix(c_Month, tc = 'd')
-
-
-
-
-        ## Decision Variable Indices
-
-        # P_ES_in = x(1:numtsteps)
-        # P_ES_out = x(numtsteps+1:2*numtsteps)
-        # Ene_Lvl = x(2*numtsteps+1:3*numtsteps)
-        # P_max_NC = x(3*numtsteps+1)
-        # P_max_peak = x(3*numtsteps+2)
-        # P_max_part_peak = x(3*numsteps+3)
-
-
-        ## State of Charge Constraint
-
-        # This constraint represents conservation of energy as it flows into and out of the
-        # energy storage system, while accounting for efficiency losses.
-
-        # For t in [0, numsteps-1]:
-
-        # E[t+1] = E[t] + [Eff_c * P_ES_in[t] - (1/Eff_d) * P_ES_out[t]] * delta_t
-
-        # E[t] - E[t+1] + Eff_c * P_ES_in[t] * delta_t - (1/Eff_d) * P_ES_out[t] * delta_t = 0
-
-        # An equality constraint can be transformed into two inequality constraints
-        # Ax = 0 -> Ax <=0 , -Ax <=0
-
-        # Number of rows in each inequality constraint matrix = (numtsteps - 1)
-        # Number of columns in each inequality constraint matrix = number of
-        # decision variables = length_x
-
-        A_E = sparse(matrix(0., (numtsteps - 1, length_x), tc = 'd'), tc = 'd')
-        b_E = sparse(matrix(0., (numtsteps - 1, 1), tc = 'd'), tc = 'd')
-
-        for n in range(0, numtsteps - 1): # Iterates from Index 0 to Index (numtsteps-2) - equivalent to Timesteps 1 to (numtsteps-1)
-            A_E[n, n + (2 * numtsteps)] = 1.  # E[t]
-            A_E[n, n + (2 * numtsteps) + 1] = -1.  # -E[t+1]
-            A_E[n, n] = Eff_c * delta_t  # Eff_c * P_ES_in[t] * delta_t
-            A_E[n, n + numtsteps] = (-1 / Eff_d) * delta_t  # - (1/Eff_d) * P_ES_out[t] * delta_t
-
-        A_Month = sparse([A_E,
-                          -A_E], tc = 'd')
-
-        b_Month = sparse([b_E,
-                          -b_E], tc = 'd')
-
-
-        ## Energy Storage Charging Power Constraint
-
-        # This constraint sets maximum and minimum values for P_ES_in.
-        # The minimum is 0 kW, and the maximum is Storage_Power_Rating_Input.
-
-        # P_ES_in >= 0 -> -P_ES_in <= 0
-
-        # P_ES_in <= Storage_Power_Rating_Input
-
-        # Number of rows in inequality constraint matrix = numtsteps
-        # Number of columns in inequality constraint matrix = length_x
-        A_P_ES_in = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-
-        for n in range(0, numtsteps): # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-            A_P_ES_in[n, n] = -1.
-
-        A_Month = sparse([A_Month,
-                          A_P_ES_in,
-                          -A_P_ES_in], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                         sparse(matrix(0., (numtsteps, 1), tc = 'd'), tc = 'd'),
-                         sparse(matrix(Storage_Power_Rating_Input, (numtsteps, 1), tc = 'd'), tc = 'd')], tc = 'd')
-
-
-        ## Energy Storage Discharging Power Constraint
-
-        # This constraint sets maximum and minimum values for P_ES_out.
-        # The minimum is 0 kW, and the maximum is Storage_Power_Rating_Input.
-
-        # P_ES_out >= 0 -> -P_ES_out <= 0
-
-        # P_ES_out <= Storage_Power_Rating_Input
-
-        A_P_ES_out = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-
-        for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-            A_P_ES_out[n, n + numtsteps] = -1.
-
-        A_Month = sparse([A_Month,
-                          A_P_ES_out,
-                          -A_P_ES_out], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          sparse(matrix(0., (numtsteps, 1), tc = 'd'), tc = 'd'),
-                          sparse(matrix(Storage_Power_Rating_Input, (numtsteps, 1), tc = 'd'), tc = 'd')], tc = 'd')
-
-
-        ## State of Charge Minimum/Minimum Constraints
-
-        # This constraint sets maximum and minimum values on the Energy Level.
-        # The minimum value is 0, and the maximum value is Usable_Storage_Capacity, the size of the
-        # battery. Note: this optimization defines the range [0, Usable_Storage_Capacity] as the
-        # effective storage capacity of the battery, without accounting for
-        # depth of discharge.
-
-        # Ene_Lvl(t) >= 0 -> -Ene_Lvl(t) <=0
-
-        A_Ene_Lvl_min = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-        b_Ene_Lvl_min = sparse(matrix(0., (numtsteps, 1), tc = 'd'), tc = 'd')
-
-        for n in range(0, numtsteps): # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-            A_Ene_Lvl_min[n, n + (2 * numtsteps)] = -1.
-
-        A_Month = sparse([A_Month,
-                          A_Ene_Lvl_min], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_Ene_Lvl_min], tc = 'd')
-
-        # Ene_Lvl(t) <= Size_ES
-
-        A_Ene_Lvl_max = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-        b_Ene_Lvl_max = matrix(Usable_Storage_Capacity * np.ones((numtsteps,1)), tc = 'd')
-
-        for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-            A_Ene_Lvl_max[n, n + (2 * numtsteps)] = 1.
-
-        A_Month = sparse([A_Month,
-                          A_Ene_Lvl_max], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_Ene_Lvl_max], tc = 'd')
-
-
-        ## Initial State of Charge Constraint
-
-        # In the first month, this constraint initializes the energy level of the battery at
-        # a user-defined percentage of the original battery capacity.
-        # In all other month, this constraints initializes the energy level of
-        # the battery at the final battery level from the previous month.
-
-        # E(0) = Initial_Final_SOC * Usable_Storage_Capacity_Input
-        # E(0) <= Initial_Final_SOC * Usable_Storage_Capacity_Input, -E(0) <= Initial_Final_SOC * Usable_Storage_Capacity_Input
-
-        # E(0) = Previous_Month_Final_Energy_Level
-        # E(0) <= Previous_Month_Final_Energy_Level, -E(0) <= Previous_Month_Final_Energy_Level
-
-        A_Ene_Lvl_0 = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-
-        A_Ene_Lvl_0[0, (2 * numtsteps)] = 1.
-
-        if Month_Iter == 1:
-
-            b_Ene_Lvl_0 = matrix(Initial_Final_SOC * Usable_Storage_Capacity_Input, tc = 'd')
-
-        elif Month_Iter in range(2, (12 + 1)):
-
-            b_Ene_Lvl_0 = matrix(Next_Month_Initial_Energy_Level, tc = 'd')
-
-        A_Month = sparse([A_Month,
-                          A_Ene_Lvl_0,
-                          -A_Ene_Lvl_0], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_Ene_Lvl_0,
-                          -b_Ene_Lvl_0], tc = 'd')
-
-
-        ## Final State of Charge Constraints
-
-        # This constraint fixes the final state of charge of the battery at a user-defined percentage
-        # of the original battery capacity,
-        # to prevent it from discharging completely in the final timesteps.
-
-        # E(N) = Initial_Final_SOC * Usable_Storage_Capacity_Input
-        # E(N) <= Initial_Final_SOC * Usable_Storage_Capacity_Input, -E(N) <= Initial_Final_SOC * Usable_Storage_Capacity_Input
-
-        A_Ene_Lvl_N = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-
-        A_Ene_Lvl_N[0, (3 * numtsteps) - 1] = 1.
-
-        b_Ene_Lvl_N = matrix(Initial_Final_SOC * Usable_Storage_Capacity_Input, tc = 'd')
-
-        A_Month = sparse([A_Month,
-                          A_Ene_Lvl_N,
-                          -A_Ene_Lvl_N], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_Ene_Lvl_N,
-                          -b_Ene_Lvl_N], tc = 'd')
-
-
-        ## Noncoincident Demand Charge Constraint
-
-        # This constraint linearizes the noncoincident demand charge constraint.
-        # Setting the demand charge value as a decision variable incentivizes
-        # "demand capping" to reduce the value of max(P_load(t)) to an optimal
-        # level without using the nonlinear max() operator.
-        # The noncoincident demand charge applies across all 15-minute intervals.
-
-        # P_load(t) - P_PV(t) + P_ES_in(t) - P_ES_out(t) <= P_max_NC for all t
-        # P_ES_in(t) - P_ES_out(t) - P_max_NC <= - P_load(t) + P_PV(t) for all t
-
-        if Noncoincident_DC > 0:
-
-            A_NC_DC = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-            b_NC_DC = matrix(-Load_Profile_Data_Month_Padded + Solar_PV_Profile_Data_Month_Padded, tc = 'd')
-
-            for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-                A_NC_DC[n, n] = 1.
-                A_NC_DC[n, n + numtsteps] = -1.
-                A_NC_DC[n, (3 * numtsteps)] = -1.
-
-            A_Month = sparse([A_Month,
-                              A_NC_DC], tc = 'd')
-
-            b_Month = sparse([b_Month,
-                              b_NC_DC], tc = 'd')
-
-        # Add P_max_NC >=0 Constraint
-        # -P_max_NC <= 0
-        # Note: this non-negativity constraint is added even if the noncoincident
-        # demand charge is $0/kW for this tariff. This ensures that the
-        # decision variable P_max_NC goes to zero, and is not negative.
-
-        A_NC_DC_gt0 = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-        A_NC_DC_gt0[0, (3 * numtsteps)] = -1.
-        b_NC_DC_gt0 = matrix(0., tc = 'd')
-
-        A_Month = sparse([A_Month,
-                          A_NC_DC_gt0], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_NC_DC_gt0], tc = 'd')
-
-
-
-        ## Coincident Peak Demand Charge Constraint
-
-        # This constraint linearizes the coincident peak demand charge constraint.
-        # This demand charge only applies for peak hours.
-
-        # P_load(t) - P_PV(t) + P_ES_in(t) - P_ES_out(t) <= P_max_peak for Peak t only
-        # P_ES_in(t) - P_ES_out(t) - P_max_peak <= - P_load(t) + P_PV(t) for Peak t only
-
-        if Peak_DC > 0:
-
-            if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-                Peak_Indices = all_tsteps[Summer_Peak_Binary_Data_Month_Padded == 1]
-                A_CPK_DC = sparse(matrix(0., (sum(Summer_Peak_Binary_Data_Month_Padded), length_x), tc = 'd'), tc = 'd')
-                b_CPK_DC = matrix(-Load_Profile_Data_Month_Padded[Summer_Peak_Binary_Data_Month_Padded == 1] + \
-                    Solar_PV_Profile_Data_Month_Padded[Summer_Peak_Binary_Data_Month_Padded == 1], tc = 'd')
-            else:
-                Peak_Indices = all_tsteps[Winter_Peak_Binary_Data_Month_Padded == 1]
-                A_CPK_DC = sparse(matrix(0., (sum(Winter_Peak_Binary_Data_Month_Padded), length_x), tc = 'd'), tc = 'd')
-                b_CPK_DC = matrix(-Load_Profile_Data_Month_Padded[Winter_Peak_Binary_Data_Month_Padded == 1] + \
-                    Solar_PV_Profile_Data_Month_Padded[Winter_Peak_Binary_Data_Month_Padded == 1], tc = 'd')
-
-
-            for n in range(0, len(Peak_Indices)):  # Iterates from Index 0 to Index (len(Peak_Indices)-1) - equivalent to Timesteps 1 to len(Peak_Indices)
-                Peak_Index_n = int(Peak_Indices[n])
-                A_CPK_DC[n, Peak_Index_n] = 1.
-                A_CPK_DC[n, numtsteps + Peak_Index_n] = -1.
-                A_CPK_DC[n, (3 * numtsteps) + 1] = -1.
-
-            A_Month = sparse([A_Month,
-                              A_CPK_DC], tc = 'd')
-
-            b_Month = sparse([b_Month,
-                              b_CPK_DC], tc = 'd')
-
-        # Add P_max_peak >=0 Constraint
-        # -P_max_peak <= 0
-        # Note: this non-negativity constraint is added even if the coincident peak
-        # demand charge is $0/kW for this tariff. This ensures that the
-        # decision variable P_max_peak goes to zero, and is not negative.
-
-        A_CPK_DC_gt0 = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-        A_CPK_DC_gt0[0, (3 * numtsteps) + 1] = -1.
-        b_CPK_DC_gt0 = matrix(0., tc = 'd')
-
-        A_Month = sparse([A_Month,
-                          A_CPK_DC_gt0], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_CPK_DC_gt0], tc = 'd')
-
-
-
-        ## Coincident Part-Peak Demand Charge Constraint
-
-        # This constraint linearizes the coincident part-peak demand charge
-        # constraint.
-        # This demand charge only applies for part-peak hours.
-
-        # P_load(t) - P_PV(t) + P_ES_in(t) - P_ES_out(t) <= P_max_part_peak for Part-Peak t only
-        # P_ES_in(t) - P_ES_out(t) - P_max_part_peak <= - P_load(t) + P_PV(t) for Part-Peak t only
-
-        if Part_Peak_DC > 0:
-
-            if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-                Part_Peak_Indices = all_tsteps[Summer_Part_Peak_Binary_Data_Month_Padded == 1]
-                A_CPP_DC = sparse(matrix(0., (sum(Summer_Part_Peak_Binary_Data_Month_Padded), length_x), tc = 'd'), tc = 'd')
-                b_CPP_DC = matrix(-Load_Profile_Data_Month_Padded[Summer_Part_Peak_Binary_Data_Month_Padded == 1] + \
-                    Solar_PV_Profile_Data_Month_Padded[Summer_Part_Peak_Binary_Data_Month_Padded == 1], tc = 'd')
-            else:
-                Part_Peak_Indices = all_tsteps[Winter_Part_Peak_Binary_Data_Month_Padded == 1]
-                A_CPP_DC = sparse(matrix(0., (sum(Winter_Part_Peak_Binary_Data_Month_Padded), length_x), tc = 'd'), tc = 'd')
-                b_CPP_DC = matrix(-Load_Profile_Data_Month_Padded[Winter_Part_Peak_Binary_Data_Month_Padded == 1] + \
-                    Solar_PV_Profile_Data_Month_Padded[Winter_Part_Peak_Binary_Data_Month_Padded == 1], tc = 'd')
-
-
-            for n in range(0, len(Part_Peak_Indices)):  # Iterates from Index 0 to Index (len(Part_Peak_Indices)-1) - equivalent to Timesteps 1 to len(Part_Peak_Indices)
-                Part_Peak_Index_n = int(Part_Peak_Indices[n])
-                A_CPP_DC[n, Part_Peak_Index_n] = 1.
-                A_CPP_DC[n, numtsteps + Part_Peak_Index_n] = -1.
-                A_CPP_DC[n, (3 * numtsteps) + 2] = -1.
-
-            A_Month = sparse([A_Month,
-                              A_CPP_DC], tc = 'd')
-
-            b_Month = sparse([b_Month,
-                       b_CPP_DC], tc = 'd')
-
-        # Add P_max_part_peak >=0 Constraint
-        # -P_max_part_peak <= 0
-        # Note: this non-negativity constraint is added even if the coincident part-peak
-        # demand charge is $0/kW for this tariff. This ensures that the
-        # decision variable P_max_part_peak goes to zero, and is not negative.
-
-        A_CPP_DC_gt0 = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-        A_CPP_DC_gt0[0, (3 * numtsteps) + 2] = -1.
-        b_CPP_DC_gt0 = matrix(0., tc = 'd')
-
-        A_Month = sparse([A_Month,
-                          A_CPP_DC_gt0], tc = 'd')
-
-        b_Month = sparse([b_Month,
-                          b_CPP_DC_gt0], tc = 'd')
-
-
-
-        ## Optional Constraint - Solar ITC Charging Constraint
 
-        # This constraint requires that the storage system be charged 100% from
-        # solar. This ensures that the customer receives 100% of the
-        # solar Incentive Tax Credit. The ITC amount is prorated by the amount
-        # of energy entering into the battery that comes from solar
-        # (ex. a storage system charged 90% from solar receives 90% of the ITC).
-        # As a result, the optimal amount of solar charging is likely higher
-        # than the minimum requirement of 75%, and likely very close to 100%.
 
-        # P_ES_in(t) <= P_PV(t)
 
-        # Note that P_PV(t) can sometimes be negative for some PV profiles, if
-        # the solar inverter is consuming energy at night. As a result, P_PV(t)
-        # here refers to a modified version of the solar profile where all
-        # negative values are set to 0. Otherwise, the model would break
-        # because P_ES_in must be >= 0, and can't also be <= P_PV(t) if P_PV(t)
-        # <= 0.
+        ## Build Constraint Matrices
 
-        if Model_Type_Input == "Solar Plus Storage" and Solar_Profile_Name_Input != "No Solar" and \
-                Solar_Size_Input > 0 and ITC_Constraint_Input == 1:
+        # The inequality constraints (G_Month * x <= h_Month), equality constraints
+        # (A_Month * x = b_Month), and decision variable bounds are assembled in
+        # Build_Month_LP_Constraints.py. See that function for a description of each constraint.
 
-            Solar_PV_Profile_Data_Month_Padded_Nonnegative = Solar_PV_Profile_Data_Month_Padded
-            Solar_PV_Profile_Data_Month_Padded_Nonnegative[Solar_PV_Profile_Data_Month_Padded_Nonnegative < 0] = 0.
+        # Coincident peak and part-peak timestep indices of the padded month, from the month time index.
 
-            A_ITC = sparse(matrix(0., (numtsteps, length_x)))
-            b_ITC = matrix(Solar_PV_Profile_Data_Month_Padded_Nonnegative, tc = 'd')
+        Peak_Timestep_Indices_Month_Padded = Month_Time_Index["Peak_Indices"][Month_Iter - 1] if Peak_DC > 0 else None
+        Part_Peak_Timestep_Indices_Month_Padded = Month_Time_Index["Part_Peak_Indices"][Month_Iter - 1] if Part_Peak_DC > 0 else None
 
-            for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-                A_ITC[n, n] = 1.
+        if GHG_Reduction_Solution_Input != "No-Charging Time Constraint" and \
+                GHG_Reduction_Solution_Input != "Charging and Discharging Time Constraints":
+            PGE_Charge_Hour_Binary_Data_Month_Padded = None
+            PGE_No_Charge_Hour_Binary_Data_Month_Padded = None
+            PGE_Discharge_Hour_Binary_Data_Month_Padded = None
 
-            A_Month = sparse([A_Month,
-                              A_ITC])
+        if GHG_Reduction_Solution_Input != "IOU-Proposed Charge-Discharge Time Constraints":
+            IOU_Charge_Hour_Binary_Data_Month_Padded = None
+            IOU_Discharge_Hour_Binary_Data_Month_Padded = None
 
-            b_Month = sparse([b_Month,
-                              b_ITC], tc = 'd')
+        ITC_Constraint_Active = Model_Type_Input == "Solar Plus Storage" and Solar_Profile_Name_Input != "No Solar" and \
+            Solar_Size_Input > 0 and ITC_Constraint_Input == 1
 
+        # Build_Month_LP_Constraints inputs for this month. The initial energy level and usable storage capacity
+        # depend on the results of the previous month, and are added when the month is solved.
 
-        ## Optional Constraint - No-Charging Time Constraint
+        Month_Builder_Inputs = dict(Model_Type_Input=Model_Type_Input, Storage_Control_Algorithm_Name=Storage_Control_Algorithm_Name,
+                                    GHG_Reduction_Solution_Input=GHG_Reduction_Solution_Input,
+                                    Equivalent_Cycling_Constraint_Input=Equivalent_Cycling_Constraint_Input,
+                                    Annual_RTE_Constraint_Input=Annual_RTE_Constraint_Input,
+                                    ITC_Constraint_Active=ITC_Constraint_Active, numtsteps=numtsteps,
+                                    numtsteps_unpadded=numtsteps_unpadded, numtsteps_year=len(Load_Profile_Data), delta_t=delta_t,
+                                    Eff_c=Eff_c, Eff_d=Eff_d, Storage_Power_Rating_Input=Storage_Power_Rating_Input,
+                                    Total_Storage_Capacity=Total_Storage_Capacity, Parasitic_Storage_Load=Parasitic_Storage_Load,
+                                    Final_Energy_Level=Initial_Final_SOC * Usable_Storage_Capacity_Input,
+                                    Noncoincident_DC=Noncoincident_DC, Peak_DC=Peak_DC, Part_Peak_DC=Part_Peak_DC,
+                                    Load_Profile_Data_Month_Padded=Load_Profile_Data_Month_Padded,
+                                    Solar_PV_Profile_Data_Month_Padded=Solar_PV_Profile_Data_Month_Padded,
+                                    Marginal_Emissions_Rate_Data_Month_Padded=Marginal_Emissions_Rate_Data_Month_Padded,
+                                    Peak_Timestep_Indices_Month_Padded=Peak_Timestep_Indices_Month_Padded,
+                                    Part_Peak_Timestep_Indices_Month_Padded=Part_Peak_Timestep_Indices_Month_Padded,
+                                    PGE_Charge_Hour_Binary_Data_Month_Padded=PGE_Charge_Hour_Binary_Data_Month_Padded,
+                                    PGE_No_Charge_Hour_Binary_Data_Month_Padded=PGE_No_Charge_Hour_Binary_Data_Month_Padded,
+                                    PGE_Discharge_Hour_Binary_Data_Month_Padded=PGE_Discharge_Hour_Binary_Data_Month_Padded,
+                                    IOU_Charge_Hour_Binary_Data_Month_Padded=IOU_Charge_Hour_Binary_Data_Month_Padded,
+                                    IOU_Discharge_Hour_Binary_Data_Month_Padded=IOU_Discharge_Hour_Binary_Data_Month_Padded)
 
-        if GHG_Reduction_Solution_Input == "No-Charging Time Constraint":
 
-            # PG&E has suggested a set of time-based constraints on storage charging.
-            # One of these constraints is that storage would not be allowed to discharge between 4:00 pm and 9:00 pm.
+        ## Save Monthly Linear Program Data
 
-            # No-Charging Constraint
-            # Charging power in each timestep is set equal to 0 between 4:00 pm and 9:00 pm.
-            # Because charging power is constrained to be greater than
-            # zero, setting the sum of all charging power timesteps to 0 (a
-            # single constraint across all timesteps) ensures that all values will be zero
-            # without needing to set a constraint for each timestep.
+        Month_LP_Data.append({"Month_Builder_Inputs": Month_Builder_Inputs, "c_Month": c_Month, "length_x": length_x,
+                              "numtsteps": numtsteps, "numtsteps_unpadded": numtsteps_unpadded})
 
-            # Sum of all P_ES_in(t) between 4:00 and 9:00 = 0
-            # Because of nonnegative constraint on P_ES_in(t), this is
-            # equivalent to a set of numtsteps constraints stating that
-            # all P_ES_in(t) between 4:00 and 9:00 = 0 for each timestep.
 
-            A_PGE_No_Charge = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-            PGE_No_Charge_Hour_Indices = all_tsteps[PGE_No_Charge_Hour_Binary_Data_Month_Padded == 1]
+    Record_Model_Run_Phase("Prepare Monthly Linear Programs")
 
-            # Sum of all P_ES_in(t) between 4:00 and 9:00
-            A_PGE_No_Charge[0, PGE_No_Charge_Hour_Indices] = 1.
 
-            b_PGE_No_Charge = matrix(0., tc = 'd')
+    ## Solve Monthly Linear Programs in Parallel
 
-            A_Month = sparse([A_Month,
-                              A_PGE_No_Charge], tc = 'd')
+    # The only link between monthly linear programs is the initial energy level of each month, which is equal to
+    # the final energy level of the previous month, and the usable storage capacity, which is reduced
+    # every month by capacity fade. Month_Solve_Mode_Input selects how this link is handled:
+    #  * "Sequential" (default) - months are solved one at a time, in order.
+    #  * "Fixed Boundary" - every month starts at the initial state of charge (Initial_Final_SOC), and uses
+    #    the original usable storage capacity, so all months are solved at the same time in parallel.
+    #    Capacity fade is still calculated and reported, but is not used in the linear programs.
+    #  * "Speculative" - all months are first solved in parallel using a fixed boundary. The initial energy level
+    #    and usable storage capacity of each month are then calculated from the previous month's solution, and
+    #    months where either value changed by more than Month_Boundary_Tolerance (in kWh) are solved again in parallel,
+    #    until no more values change. Any remaining months are solved again in sequence below.
+    #  * "Annual" - all months are solved together as a single linear program, without padding days,
+    #    with one energy level chain across the whole year (see Build_Annual_LP_Constraints.py).
+    #    Each month keeps its own demand charge decision variables. The original usable storage capacity is used
+    #    for all months, because capacity fade is calculated from the optimal dispatch.
+    # Month_Solve_Workers sets the number of worker processes (default: number of CPUs).
 
-            b_Month = sparse([b_Month,
-                              b_PGE_No_Charge], tc = 'd')
+    Parallel_LP_Solutions = {}
 
+    if Month_Solve_Mode_Input in ["Fixed Boundary", "Speculative"]:
 
-        ## Optional Constraint - Charging and Discharging Time Constraints
+        from concurrent.futures import ProcessPoolExecutor
 
-        if GHG_Reduction_Solution_Input == "Charging and Discharging Time Constraints":
+        Month_Boundaries = {Month_Iter: (Initial_Final_SOC * Usable_Storage_Capacity_Input, Usable_Storage_Capacity_Input)
+                            for Month_Iter in range(1, 13)}
 
-            # PG&E has suggested a set of time-based constraints on storage charging.
-            # At least 50% of total charging would need to occur between 9:00 am and 2:00 pm,
-            # and at least 50% of total discharging would need to occur between 4:00 pm and 9:00 pm.
-            # In addition, storage would not be allowed to discharge between 4:00 pm and 9:00 pm.
+        Months_to_Solve = list(range(1, 13))
 
-            # Derivation of charging constraint in standard linear form Ax <= 0:
-            # Sum of all P_ES_in(t) between 9:00 and 2:00/sum of all P_ES_in(t) >= 0.5
-            # Sum of all P_ES_in(t) between 9:00 and 2:00 >= 0.5 * sum of all P_ES_in(t)
-            # 0 >= 0.5 * sum of all P_ES_in(t) - sum of all P_ES_in(t) between 9:00 and 2:00
-            # 0.5 * sum of all P_ES_in(t) - sum of all P_ES_in(t) between 9:00 and 2:00 <= 0
-            # 0.5 * sum of all P_ES_in(t) not between 9:00 and 2:00 - 0.5 * sum of all P_ES_in(t)
-            # between 9:00 and 2:00 <= 0.
+        with ProcessPoolExecutor(max_workers = Month_Solve_Workers) as Month_Solve_Pool:
 
-            # Charging Constraint
-            A_PGE_Charge = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
+            # The boundary of month N is exact after N rounds, so at most 12 rounds are needed.
 
-            # 0.5 * sum of all P_ES_in(t)
-            A_PGE_Charge[0, range(0, numtsteps)] = 0.5
-            PGE_Charge_Hour_Indices = all_tsteps[PGE_Charge_Hour_Binary_Data_Month_Padded == 1]
+            for Speculative_Round in range(12):
 
-            # -0.5 * sum of all P_ES_in(t) between 12:00 and 4:00
-            A_PGE_Charge[0, PGE_Charge_Hour_Indices] = -0.5
+                Month_Solve_Futures = {Month_Iter: Month_Solve_Pool.submit(Solve_Month_LP,
+                                                                           dict(Month_LP_Data[Month_Iter - 1]["Month_Builder_Inputs"],
+                                                                                Initial_Energy_Level = Month_Boundaries[Month_Iter][0],
+                                                                                Usable_Storage_Capacity = Month_Boundaries[Month_Iter][1]),
+                                                                           Month_LP_Data[Month_Iter - 1]["c_Month"],
+                                                                           Solver_Backend, Solver_Options, None, False, Solver_Fallback_Input)
+                                       for Month_Iter in Months_to_Solve}
 
-            b_PGE_Charge = matrix(0., tc = 'd')
+                for Month_Iter, Month_Solve_Future in Month_Solve_Futures.items():
+                    Check_LP_Solution(Month_Solve_Future.result(), Month_Iter, "Parallel")
+                    Parallel_LP_Solutions[Month_Iter] = {"lp_solution": Month_Solve_Future.result(),
+                                                         "Initial_Energy_Level": Month_Boundaries[Month_Iter][0],
+                                                         "Usable_Storage_Capacity": Month_Boundaries[Month_Iter][1]}
 
-            A_Month = sparse([A_Month, A_PGE_Charge], tc = 'd')
-            b_Month = sparse([b_Month, b_PGE_Charge], tc = 'd')
+                if Month_Solve_Mode_Input == "Fixed Boundary":
+                    break
 
+                # Calculate the boundary of each month from the previous month's solution.
+                # These are the same calculations used for the final energy level and capacity fade below.
 
-            # No-Charging Constraint
-            # Charging power in each timestep is set equal to 0 between 4:00 pm and 9:00 pm.
-            # Because charging power is constrained to be greater than
-            # zero, setting the sum of all charging power timesteps to 0 (a
-            # single constraint across all timesteps) ensures that all values will be zero
-            # without needing to set a constraint for each timestep.
+                Speculative_Usable_Storage_Capacity = Usable_Storage_Capacity_Input
 
-            # Sum of all P_ES_in(t) between 4:00 and 9:00 = 0
-            # Because of nonnegative constraint on P_ES_in(t), this is
-            # equivalent to a set of numtsteps constraints stating that
-            # all P_ES_in(t) between 4:00 and 9:00 = 0 for each timestep.
+                for Month_Iter in range(1, 12):
 
-            A_PGE_No_Charge = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-            PGE_No_Charge_Hour_Indices = all_tsteps[PGE_No_Charge_Hour_Binary_Data_Month_Padded == 1]
+                    numtsteps = Month_LP_Data[Month_Iter - 1]["numtsteps"]
+                    numtsteps_unpadded = Month_LP_Data[Month_Iter - 1]["numtsteps_unpadded"]
+                    x_Month = Parallel_LP_Solutions[Month_Iter]["lp_solution"]["x"]
 
-            # Sum of all P_ES_in(t) between 4:00 and 9:00
-            A_PGE_No_Charge[0, PGE_No_Charge_Hour_Indices] = 1.
+                    P_ES_in_Month_Unpadded = x_Month[0:numtsteps_unpadded] + Parasitic_Storage_Load
+                    P_ES_out_Month_Unpadded = x_Month[numtsteps:(numtsteps + numtsteps_unpadded)]
+                    Ene_Lvl_Month_Unpadded = x_Month[(2 * numtsteps):(2 * numtsteps + numtsteps_unpadded)]
 
-            b_PGE_No_Charge = matrix(0., tc = 'd')
+                    Next_Month_Initial_Energy_Level = Ene_Lvl_Month_Unpadded[-1] + \
+                                                      ((Eff_c * P_ES_in_Month_Unpadded[-1]) - \
+                                                       ((1 / Eff_d) * P_ES_out_Month_Unpadded[-1])) * delta_t
 
-            A_Month = sparse([A_Month,
-                              A_PGE_No_Charge], tc = 'd')
+                    if Storage_Type_Input == "Lithium-Ion Battery":
 
-            b_Month = sparse([b_Month,
-                              b_PGE_No_Charge], tc = 'd')
+                        Cycles_Month = np.sum((P_ES_in_Month_Unpadded * (((Eff_c) / (2 * Total_Storage_Capacity)) * delta_t)) + \
+                                              (P_ES_out_Month_Unpadded * ((1 / (Eff_d * 2 * Total_Storage_Capacity)) * delta_t)))
 
-            # Derivation of discharging constraint in standard linear form Ax <= 0:
-            # Sum of all P_ES_out(t) between 4:00 and 9:00/sum of all P_ES_out(t) >= 0.5
-            # Sum of all P_ES_out(t) between 4:00 and 9:00 >= 0.5 * sum of all P_ES_out(t)
-            # 0 >= 0.5 * sum of all P_ES_out(t) - sum of all P_ES_out(t) between 4:00 and 9:00
-            # 0.5 * sum of all P_ES_out(t) - sum of all P_ES_out(t) between 4:00 and 9:00 <= 0
-            # 0.5 * sum of all P_ES_out(t) not between 4:00 and 9:00 - 0.5 * sum of all P_ES_out(t)
-            # between 4:00 and 9:00 <= 0.
+                        Speculative_Usable_Storage_Capacity = Speculative_Usable_Storage_Capacity - \
+                                                              (Usable_Storage_Capacity_Input * (Cycles_Month / Cycle_Life) * 0.2)
 
-            # Discharging Constraint
-            A_PGE_Discharge = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
+                    if Next_Month_Initial_Energy_Level > Speculative_Usable_Storage_Capacity:
+                        Next_Month_Initial_Energy_Level = Speculative_Usable_Storage_Capacity
 
-            # 0.5 * sum of all P_ES_out(t)
-            A_PGE_Discharge[0, range(numtsteps, 2 * numtsteps)] = 0.5
-            PGE_Discharge_Hour_Indices = all_tsteps[PGE_Discharge_Hour_Binary_Data_Month_Padded == 1]
+                    Month_Boundaries[Month_Iter + 1] = (Next_Month_Initial_Energy_Level, Speculative_Usable_Storage_Capacity)
 
-            # -0.5 * sum of all P_ES_out(t) between 12:00 and 4:00
-            A_PGE_Discharge[0, numtsteps + PGE_Discharge_Hour_Indices] = -0.5
+                Months_to_Solve = [Month_Iter for Month_Iter in range(2, 13)
+                                   if abs(Month_Boundaries[Month_Iter][0] - Parallel_LP_Solutions[Month_Iter]["Initial_Energy_Level"]) > Month_Boundary_Tolerance or
+                                   abs(Month_Boundaries[Month_Iter][1] - Parallel_LP_Solutions[Month_Iter]["Usable_Storage_Capacity"]) > Month_Boundary_Tolerance]
 
-            b_PGE_Discharge = matrix(0., tc = 'd')
+                if len(Months_to_Solve) == 0:
+                    break
 
-            A_Month = sparse([A_Month,
-                              A_PGE_Discharge], tc = 'd')
 
-            b_Month = sparse([b_Month,
-                              b_PGE_Discharge], tc = 'd')
+    ## Solve Annual Linear Program
 
-        ## Optional Constraint - Investor-Owned-Utility-Proposed Charge-Discharge Hours
+    if Month_Solve_Mode_Input == "Annual":
 
-        if GHG_Reduction_Solution_Input == "IOU-Proposed Charge-Discharge Time Constraints":
-
-            # The Investor-Owned Utilities have suggested constraints on charging in particular hours
-            # as a proposed method for reducing greenhouse gas emissions associated with storage dispatch.
-            # Specifically, at least 50% of total charging would need to occur between 12:00 noon and 4:00 pm,
-            # and at least 50% of total discharging would need to occur between 4:00 pm and 9:00 pm.
-
-            # Derivation of charging constraint in standard linear form Ax <= 0:
-            # Sum of all P_ES_in(t) between 12:00 and 4:00/sum of all P_ES_in(t) >= 0.5
-            # Sum of all P_ES_in(t) between 12:00 and 4:00 >= 0.5 * sum of all P_ES_in(t)
-            # 0 >= 0.5 * sum of all P_ES_in(t) - sum of all P_ES_in(t) between 12:00 and 4:00
-            # 0.5 * sum of all P_ES_in(t) - sum of all P_ES_in(t) between 12:00 and 4:00 <= 0
-            # 0.5 * sum of all P_ES_in(t) not between 12:00 and 4:00 - 0.5 * sum of all P_ES_in(t)
-            # between 12:00 and 4:00 <= 0.
-
-            # Charging Constraint
-            A_IOU_Charge = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-
-            # 0.5 * sum of all P_ES_in(t)
-            A_IOU_Charge[1, range(0, numtsteps)] = 0.5
-            IOU_Charge_Hour_Indices = all_tsteps[IOU_Charge_Hour_Binary_Data_Month_Padded == 1]
-
-            # -0.5 * sum of all P_ES_in(t) between 12:00 and 4:00
-            A_IOU_Charge[0, IOU_Charge_Hour_Indices] = -0.5
-
-            b_IOU_Charge = matrix(0., tc = 'd')
-
-            A_Month = sparse([A_Month,
-                              A_IOU_Charge], tc = 'd')
-
-            b_Month = sparse([b_Month,
-                              b_IOU_Charge], tc = 'd')
-
-            # Derivation of discharging constraint in standard linear form Ax <= 0:
-            # Sum of all P_ES_out(t) between 4:00 and 9:00/sum of all P_ES_out(t) >= 0.5
-            # Sum of all P_ES_out(t) between 4:00 and 9:00 >= 0.5 * sum of all P_ES_out(t)
-            # 0 >= 0.5 * sum of all P_ES_out(t) - sum of all P_ES_out(t) between 4:00 and 9:00
-            # 0.5 * sum of all P_ES_out(t) - sum of all P_ES_out(t) between 4:00 and 9:00 <= 0
-            # 0.5 * sum of all P_ES_out(t) not between 4:00 and 9:00 - 0.5 * sum of all P_ES_out(t)
-            # between 4:00 and 9:00 <= 0.
-
-            # Discharging Constraint
-            A_IOU_Discharge = sparse(matrix(0., (1, length_x)))
-
-            # 0.5 * sum of all P_ES_out(t)
-            A_IOU_Discharge[0, range(numtsteps, 2 * numtsteps)] = 0.5
-            IOU_Discharge_Hour_Indices = all_tsteps[IOU_Discharge_Hour_Binary_Data_Month_Padded == 1]
-
-            # -0.5 * sum of all P_ES_out(t) between 12:00 and 4:00
-            A_IOU_Discharge[0, numtsteps + IOU_Discharge_Hour_Indices] = -0.5
-
-            b_IOU_Discharge = matrix(0., tc = 'd')
-
-            A_Month = sparse([A_Month,
-                              A_IOU_Discharge], tc = 'd')
-
-            b_Month = sparse([b_Month,
-                              b_IOU_Discharge], tc = 'd')
-
-
-        ## Optional Constraint - Non-Positive GHG Emissions Impact
-
-        # Note - the system is following the forecast signal to obey
-        # this constraint, not the evaluation signal. It may be necessary
-        # to adjust this constraint to aim for a negative GHG impact
-        # based on the forecast signal, in order to achieve a non-positive
-        # GHG impact as measured by the evaluation signal.
-
-        if GHG_Reduction_Solution_Input == "Non-Positive GHG Constraint":
-
-            # The sum of the net battery charge/discharge load in each
-            # timestep, multiplied by the marginal emissions rate in each
-            # timestep, must be less than or equal to 0.
-
-            # A_Non_Positive_GHG is similar to c_Month_Carbon_Only,
-            # but with Marginal Emissions Rate Data instead of Carbon Adder Data and transposed.
-            A_Non_Positive_GHG = matrix(np.concatenate((np.reshape(Marginal_Emissions_Rate_Data_Month_Padded * delta_t, (1, len(Marginal_Emissions_Rate_Data_Month_Padded))), \
-                np.reshape(-Marginal_Emissions_Rate_Data_Month_Padded * delta_t, (1, len(Marginal_Emissions_Rate_Data_Month_Padded))), \
-                np.zeros((1, numtsteps)), \
-                np.reshape(np.array([0., 0., 0.]), (1, 3))), \
-                axis = 1))
-
-            b_Non_Positive_GHG = matrix(0., tc = 'd')
-
-            A_Month = sparse([A_Month, A_Non_Positive_GHG], tc = 'd')
-            b_Month = sparse([b_Month, b_Non_Positive_GHG], tc = 'd')
-
-
-        ## Optional Constraint - Equivalent Cycling Constraint
-
-        # Note: due to the OSESMO model structure, the annual cycling requirement
-        # must be converted to an equivalent monthly cycling requirement.
-	# All cycling must occur outside of the "padding" days at the end, which are removed after optimization.
+        from Build_Annual_LP_Constraints import Build_Annual_LP_Constraints
+        from Solve_LP_with_Fallback import Solve_LP_with_Fallback
 
-        if Equivalent_Cycling_Constraint_Input > 0:
+        # With the "sparse" KKT solver, cvxopt is very slow for the annual linear program.
+        # The default "banded" KKT solver or the HiGHS solver backend should be used instead.
 
-            SGIP_Monthly_Cycling_Requirement = Equivalent_Cycling_Constraint_Input * \
-                                               (numtsteps_unpadded / len(Load_Profile_Data))
+        if (Solver_Backend is None or Solver_Backend == "cvxopt") and \
+                Solver_Options is not None and Solver_Options.get("kktsolver") == "sparse":
+            print("The annual linear program may take a very long time to solve with the sparse cvxopt KKT solver. "
+                  "The banded KKT solver or the HiGHS solver backend is recommended.")
 
-            # Formula for equivalent cycles is identical to the one used to calculate Cycles_Month:
-            # Equivalent Cycles = sum((P_ES_in(t) * (((Eff_c)/(2 * Size_ES)) * delta_t)) + \
-            #    (P_ES_out(t) * ((1/(Eff_d * 2 * Size_ES)) * delta_t)))
+        Annual_LP_Build_Start_Time = time.perf_counter()
 
-            # Equivalent Cycles >= SGIP_Monthly_Cycling Requirement
-            # To convert to standard linear program form, multiply both sides by -1.
-            # -Equivalent Cycles <= -SGIP_Monthly_Cycling_Requirement
+        G_Annual, h_Annual, A_Annual, b_Annual, Lower_Bounds_Annual, Upper_Bounds_Annual = Build_Annual_LP_Constraints(
+            Month_Builder_Inputs = [Month_Data_Dict["Month_Builder_Inputs"] for Month_Data_Dict in Month_LP_Data],
+            Initial_Energy_Level = Initial_Final_SOC * Usable_Storage_Capacity_Input,
+            Usable_Storage_Capacity = Usable_Storage_Capacity_Input)
 
-            A_Equivalent_Cycles = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
+        c_Annual = np.concatenate([Month_Data_Dict["c_Month"] for Month_Data_Dict in Month_LP_Data])
 
-            # sum of all P_ES_in(t) * (((Eff_c)/(2 * Size_ES)) * delta_t)
-            A_Equivalent_Cycles[0, range(0, numtsteps_unpadded)] = -(((Eff_c) / (2 * Total_Storage_Capacity)) * delta_t)
+        Annual_LP_Solve_Start_Time = time.perf_counter()
 
-            # sum of all P_ES_out(t) * ((1/(Eff_d * 2 * Size_ES)) * delta_t)
-            A_Equivalent_Cycles[0, range(numtsteps, numtsteps+numtsteps_unpadded)] = -((1 / (Eff_d * 2 * Total_Storage_Capacity)) * delta_t)
+        Annual_LP_Solution = Solve_LP_with_Fallback(c_Annual, G_Annual, h_Annual, A_Annual, b_Annual, Lower_Bounds_Annual, Upper_Bounds_Annual,
+                                                    Solver_Backend = Solver_Backend, Solver_Options = Solver_Options,
+                                                    Solver_Fallback_Input = Solver_Fallback_Input)
 
-            b_Equivalent_Cycles = matrix(-SGIP_Monthly_Cycling_Requirement, tc = 'd')
+        Annual_LP_Solution['build_time'] = Annual_LP_Solve_Start_Time - Annual_LP_Build_Start_Time
+        Annual_LP_Solution['solve_time'] = time.perf_counter() - Annual_LP_Solve_Start_Time
 
-            A_Month = sparse([A_Month,
-                              A_Equivalent_Cycles], tc = 'd')
+        Check_LP_Solution(Annual_LP_Solution, "All", "Annual")
 
-            b_Month = sparse([b_Month,
-                              b_Equivalent_Cycles], tc = 'd')
+        # Offset of each month's decision variables in the annual decision variable vector.
+        Annual_x_Offsets = np.cumsum([0] + [Month_Data_Dict["length_x"] for Month_Data_Dict in Month_LP_Data])
 
 
-        ## Optional Constraint - Operational/SGIP Round-Trip Efficiency Constraint
+    Record_Model_Run_Phase("Build and Solve Linear Programs")
 
-        # Note: due to the OSESMO model structure, the annual RTE requirement
-        # must be converted to an equivalent monthly RTE requirement.
 
-        if Annual_RTE_Constraint_Input > 0:
+    ## Iterate Through Months & Calculate Monthly Results
 
-            # If it's impossible for the storage system to achieve the RTE requirement
-            # even if it were constantly cycling, stop the model.
-
-            if (Eff_c * Eff_d * Storage_Power_Rating_Input) / (
-                    Storage_Power_Rating_Input + Parasitic_Storage_Load) < Annual_RTE_Constraint_Input:
-
-                print(['No solution - could not achieve SGIP RTE requirement' \
-                       ' with the provided nameplate efficiency and auxiliary storage load values.'])
-
-            # Formula for Annual Operational/SGIP round-trip efficiency is identical to the one
-            # used to calculate Operational_RTE_Percent:
-            # Operational_RTE_Percent = (sum(P_ES_out) * delta_t)/(sum(P_ES_in) * delta_t)
-            # Note that Auxiliary_Storage_Load has to be added to P_ES_in here.
-            # During the calculation of Operational_RTE_Percent, it has already
-            # been added previously, so it does not need to be included in the
-            # formula the way it is here.
-
-            # "The Commission concluded that storage devices should demonstrate
-            # an average RTE of at least 66.5% over ten years (equivalent to a
-            # first-year RTE of 69.6%) in order to qualify for SGIP incentive
-            # payments." (Stem, Inc.'s Petition for Modification of Decision 15-11-027, pg. 2)
-
-            # Operational RTE Percent >= 0.696
-            # (sum(P_ES_out) * delta_t)/((sum(P_ES_in) * delta_t) + (sum(Auxiliary_Storage_Load) * delta_t) >= 0.696
-            # (sum(P_ES_out) * delta_t) >= 0.696 * (sum(P_ES_in) * delta_t) + (sum(Auxiliary_Storage_Load) * delta_t)
-            # To convert to standard linear program form, multiply both sides by -1.
-            # -(sum(P_ES_out) * delta_t) <= -0.696 * (sum(P_ES_in) * delta_t) -(sum(Auxiliary_Storage_Load) * delta_t)
-            # -(sum(P_ES_out) * delta_t) + 0.696 * (sum(P_ES_in) * delta_t) <= -(sum(Auxiliary_Storage_Load) * delta_t)
-            # 0.696 * (sum(P_ES_in) * delta_t) -(sum(P_ES_out) * delta_t) <= -(sum(Auxiliary_Storage_Load) * delta_t)
-
-            A_SGIP_RTE = sparse(matrix(0., (1, length_x), tc = 'd'), tc = 'd')
-
-            # sum of all (P_ES_in(t) * (0.696 * delta_t)
-            A_SGIP_RTE[0, range(0, numtsteps)] = (Annual_RTE_Constraint_Input * delta_t)
-
-            # sum of all P_ES_out(t) * -delta_t
-            A_SGIP_RTE[0, range(numtsteps, 2 * numtsteps)] = -delta_t
+    for Month_Iter in range(1,13):  # Iterate through all months
 
-            # (sum(Auxiliary_Storage_Load) * delta_t)
-            b_SGIP_RTE = matrix(-((numtsteps * Parasitic_Storage_Load) * delta_t), tc = 'd')
+        # Load Monthly Linear Program Data
 
-            A_Month = sparse([A_Month,
-                              A_SGIP_RTE], tc = 'd')
+        Month_Builder_Inputs = Month_LP_Data[Month_Iter - 1]["Month_Builder_Inputs"]
+        c_Month = Month_LP_Data[Month_Iter - 1]["c_Month"]
+        length_x = Month_LP_Data[Month_Iter - 1]["length_x"]
+        numtsteps = Month_LP_Data[Month_Iter - 1]["numtsteps"]
+        numtsteps_unpadded = Month_LP_Data[Month_Iter - 1]["numtsteps_unpadded"]
 
-            b_Month = sparse([b_Month,
-                              b_SGIP_RTE], tc = 'd')
+        # In the first month, the energy level of the battery is initialized at
+        # a user-defined percentage of the original battery capacity.
+        # In all other month, the energy level of the battery is initialized at
+        # the final battery level from the previous month.
 
+        if Month_Iter == 1:
+            Initial_Energy_Level = Initial_Final_SOC * Usable_Storage_Capacity_Input
 
-        ## Optional Constraint - No-Export Constraint
+        elif Month_Iter in range(2, (12 + 1)):
+            Initial_Energy_Level = Next_Month_Initial_Energy_Level
 
-        # This constraint prevents the standalone energy-storage systems from
-        # backfeeding power from the storage system onto the distribution grid.
-        # Solar-plus storage systems are allowed to export to the grid.
+        LP_Usable_Storage_Capacity = Usable_Storage_Capacity
 
-        if Model_Type_Input == "Storage Only":
+        # In the "Fixed Boundary" month solve mode, every month starts at the initial state of charge,
+        # and uses the original usable storage capacity.
 
-            # P_load(t) + P_ES_in(t) - P_ES_out(t) >= 0
-            # -P_ES_in(t) + P_ES_out(t) <= P_load(t)
+        if Month_Solve_Mode_Input == "Fixed Boundary":
+            Initial_Energy_Level = Initial_Final_SOC * Usable_Storage_Capacity_Input
+            LP_Usable_Storage_Capacity = Usable_Storage_Capacity_Input
 
-            A_No_Export = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-            b_No_Export = matrix(Load_Profile_Data_Month_Padded, tc = 'd')
 
-            for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-                A_No_Export[n, n] = -1.
-                A_No_Export[n, n + numtsteps] = 1.
+        ## Run LP Optimization Algorithm
 
-            A_Month = sparse([A_Month,
-                              A_No_Export], tc = 'd')
+        # The constraint matrices are built in Build_Month_LP_Constraints.py, and the linear program is
+        # solved using the solver backend selected by Solver_Backend.
+        # See Solve_LP.py for the available solver backends and solver options.
 
-            b_Month = sparse([b_Month,
-                              b_No_Export], tc = 'd')
+        # In the "Annual" month solve mode, this month's part of the annual solution is used.
+        # If this month was solved in parallel with (nearly) the same initial energy level and usable
+        # storage capacity, that solution is used. Otherwise, the month is solved here.
 
+        if Month_Solve_Mode_Input == "Annual":
 
-        ## Optional Constraint - Solar Self-Supply
+            LP_Solution_Source = "Annual"
 
-        # In the Economic Dispatch mode, this constraint is not necessary -
-        # the presence of a positive cost on battery charging ensures that
-        # simultaneous charging and discharging does not occur.
-        # However, in the Non-Economic Solar Self-Consumption, which negative
-        # costs on both charging and discharging, the battery charges and
-        # discharges simultaneously so as to minimize total cost.
-        # This constraint ensures that simultaneous charging and
-        # discharging does not occur, and ensures that the storage system
-        # only charges when there is excess solar power (net load is negative)
-        # and discharges when net load is positive.
+            lp_solution = dict(Annual_LP_Solution,
+                               x = np.asarray(Annual_LP_Solution['x']).flatten()[Annual_x_Offsets[Month_Iter - 1]:Annual_x_Offsets[Month_Iter]])
 
-        if Storage_Control_Algorithm_Name == "OSESMO Non-Economic Solar Self-Supply":
+        elif Month_Iter in Parallel_LP_Solutions and \
+                abs(Parallel_LP_Solutions[Month_Iter]["Initial_Energy_Level"] - Initial_Energy_Level) <= Month_Boundary_Tolerance and \
+                abs(Parallel_LP_Solutions[Month_Iter]["Usable_Storage_Capacity"] - LP_Usable_Storage_Capacity) <= Month_Boundary_Tolerance:
 
-            # P_ES_in <= Non-negative(P_PV - P_Load)
+            LP_Solution_Source = "Parallel"
 
-            Excess_Solar_Profile_Data_Month_Padded = Solar_PV_Profile_Data_Month_Padded - Load_Profile_Data_Month_Padded
-            Excess_Solar_Profile_Data_Month_Padded[Excess_Solar_Profile_Data_Month_Padded < 0] = 0
+            lp_solution = Parallel_LP_Solutions[Month_Iter]["lp_solution"]
 
-            A_Self_Supply_Charge = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-            b_Self_Supply_Charge = matrix(Excess_Solar_Profile_Data_Month_Padded, tc = 'd')
+        else:
 
-            for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-                A_Self_Supply_Charge[n, n] = 1.
+            LP_Solution_Source = "Sequential"
 
-            A_Month = sparse([A_Month,
-                              A_Self_Supply_Charge], tc = 'd')
+            # Warm Start
+            # "Neighbouring Scenario" starts from the solution for the same month of the last model run
+            # with a linear program of the same size (ex. the previous storage size in a sizing sweep).
+            # "Previous Month" starts from the previous month's solution, shifted forward in time.
+            # "Neighbouring Scenario or Previous Month" uses the previous month's solution only if
+            # no neighbouring scenario solution is available. "No Warm Start" (default) always starts cold.
 
-            b_Month = sparse([b_Month,
-                              b_Self_Supply_Charge], tc = 'd')
+            LP_Warm_Start_Key = (Solver_Backend, Month_Iter, length_x)
 
-            # P_ES_out <= Non-negative(P_Load - P_PV)
+            LP_Warm_Start = None
 
-            Non_Negative_Net_Load_Profile_Data_Month_Padded = Load_Profile_Data_Month_Padded - Solar_PV_Profile_Data_Month_Padded
-            Non_Negative_Net_Load_Profile_Data_Month_Padded[Non_Negative_Net_Load_Profile_Data_Month_Padded < 0] = 0
+            if LP_Warm_Start_Input in ["Neighbouring Scenario", "Neighbouring Scenario or Previous Month"]:
+                LP_Warm_Start = LP_Warm_Start_Cache.Get(LP_Warm_Start_Key)
 
-            A_Self_Supply_Discharge = sparse(matrix(0., (numtsteps, length_x), tc = 'd'), tc = 'd')
-            b_Self_Supply_Discharge = Non_Negative_Net_Load_Profile_Data_Month_Padded
+            if LP_Warm_Start is None and Month_Iter > 1 and \
+                    LP_Warm_Start_Input in ["Previous Month", "Neighbouring Scenario or Previous Month"]:
+                LP_Warm_Start = Shift_LP_Warm_Start(Previous_x_Month = x_Month, Previous_numtsteps = Previous_numtsteps,
+                                                    Previous_numtsteps_unpadded = Previous_numtsteps_unpadded,
+                                                    numtsteps = numtsteps, delta_t = delta_t)
 
-            for n in range(0, numtsteps):  # Iterates from Index 0 to Index (numtsteps-1) - equivalent to Timesteps 1 to (numtsteps)
-                A_Self_Supply_Discharge[n, n + numtsteps] = 1.
+            Record_Model_Run_Phase("Calculate Monthly Results")
 
-            A_Month = sparse([A_Month,
-                              A_Self_Supply_Discharge], tc = 'd')
+            lp_solution = Solve_Month_LP(dict(Month_Builder_Inputs, Initial_Energy_Level = Initial_Energy_Level,
+                                              Usable_Storage_Capacity = LP_Usable_Storage_Capacity),
+                                         c_Month, Solver_Backend = Solver_Backend, Solver_Options = Solver_Options,
+                                         Warm_Start = LP_Warm_Start, Solver_Fallback_Input = Solver_Fallback_Input)
 
-            b_Month = sparse([b_Month,
-                              b_Self_Supply_Discharge], tc = 'd')
+            Record_Model_Run_Phase("Build and Solve Linear Programs")
 
+            Check_LP_Solution(lp_solution, Month_Iter, LP_Solution_Source)
 
-        ## Run LP Optimization Algorithm
+            # Warm starts are only saved if the solution was found by the requested solver backend.
 
-        # Check that number of rows in A_Month.size == number of rows in b_Month.size
-        # Check that A_Month.typecode, b_Month.typecode, c_Month.typecode == 'd'
+            if LP_Warm_Start_Input != "No Warm Start" and lp_solution['warm_start'] is not None and \
+                    lp_solution['solver_backend'] == Solver_Backend:
 
-        b_Month = matrix(b_Month, tc = 'd') # Convert from sparse to dense matrix
+                LP_Warm_Start_Cache.Save(LP_Warm_Start_Key, lp_solution['warm_start'])
 
-        lp_solution = solvers.lp(c_Month, A_Month, b_Month)
+        Previous_numtsteps = numtsteps
+        Previous_numtsteps_unpadded = numtsteps_unpadded
 
         x_Month = lp_solution['x']
 
+        # Record solver statistics for this month. Months taken from the annual linear program
+        # report the statistics of the annual solve, and months solved in parallel report
+        # the build and solve times in their worker process. The fallback step that found the solution
+        # ("Requested" if the requested solver did) and every solve attempt are also recorded.
+
+        Solver_Statistics.append({"Month": Month_Iter,
+                                  "Solution_Source": LP_Solution_Source,
+                                  "Solver_Backend": lp_solution['solver_backend'],
+                                  "Status": lp_solution['status'],
+                                  "Objective": lp_solution['objective'],
+                                  "Iterations": lp_solution['iterations'],
+                                  "Relative_Gap": lp_solution['relative_gap'],
+                                  "Primal_Infeasibility": lp_solution['primal_infeasibility'],
+                                  "Dual_Infeasibility": lp_solution['dual_infeasibility'],
+                                  "Rows": lp_solution['rows'],
+                                  "Columns": lp_solution['columns'],
+                                  "Nonzeros": lp_solution['nonzeros'],
+                                  "Build_Time_Seconds": lp_solution['build_time'],
+                                  "Solve_Time_Seconds": lp_solution['solve_time'],
+                                  "Fallback_Step": lp_solution['fallback_step'],
+                                  "Solver_Attempts": lp_solution['attempts']})
+
         print("Optimization complete for Month %d." % Month_Iter)
 
 
         ## Separate Decision Variable Vectors
 
-        x_Month = np.asarray(x_Month)
+        x_Month = np.reshape(x_Month, (length_x, 1))
 
         P_ES_in_Month_Padded = x_Month[range(0, numtsteps)]
 
@@ -1367,23 +955,14 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
         ## Remove "Padding" from Decision Variables
 
-        # Data is padded in Months 1-11, and not in Month 12
-
-        if Month_Iter in range(1, 12):
-
-            P_ES_in_Month_Unpadded = P_ES_in_Month_Padded[range(0, (len(P_ES_in_Month_Padded)-int(End_of_Month_Padding_Days * 24 * (1 / delta_t))))]
-
-            P_ES_out_Month_Unpadded = P_ES_out_Month_Padded[range(0, (len(P_ES_out_Month_Padded)-int(End_of_Month_Padding_Days * 24 * (1 / delta_t))))]
+        # Data is padded in Months 1-11, and not in Month 12.
+        # The first numtsteps_unpadded timesteps of each padded month are unpadded data.
 
-            Ene_Lvl_Month_Unpadded = Ene_Lvl_Month_Padded[range(0, (len(Ene_Lvl_Month_Padded)-int(End_of_Month_Padding_Days * 24 * (1 / delta_t))))]
+        P_ES_in_Month_Unpadded = P_ES_in_Month_Padded[0:numtsteps_unpadded]
 
-        elif Month_Iter == 12:
+        P_ES_out_Month_Unpadded = P_ES_out_Month_Padded[0:numtsteps_unpadded]
 
-            P_ES_in_Month_Unpadded = P_ES_in_Month_Padded
-
-            P_ES_out_Month_Unpadded = P_ES_out_Month_Padded
-
-            Ene_Lvl_Month_Unpadded = Ene_Lvl_Month_Padded
+        Ene_Lvl_Month_Unpadded = Ene_Lvl_Month_Padded[0:numtsteps_unpadded]
 
 
         # Save Final Energy Level of Battery for use in next month
@@ -1395,306 +974,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
                                            ((1 / Eff_d) * P_ES_out_Month_Unpadded[-1,0])) * delta_t
 
 
-        ## Calculate Monthly Peak Demand Using 15-Minute Intervals
-
-        # Demand Charges are Based on 15-minute interval periods.
-        # If the model has 15-minute timestep resolution, the decision
-        # variables can be used directly as maximum coincident and noncoincident demand values.
-        # Otherwise (such as with 5-minute timestep resolution), maximum
-        # demand must be calculated by taking 15-minute averages of the
-        # demand values, and then calculating the maximum of these averages.
-
-        if delta_t < (15 / 60):
-
-            # Noncoincident Maximum Demand With and Without Solar and Storage
-
-            # Create Net Load Profile After Solar Only
-            Solar_Only_Net_Load_Profile_Data_Month_5_Min = (Load_Profile_Data_Month - Solar_PV_Profile_Data_Month)
-
-            # Create Net Load Profile After Solar and Storage
-            Solar_Storage_Net_Load_Profile_Data_Month_5_Min = (Load_Profile_Data_Month - Solar_PV_Profile_Data_Month + \
-                                                               P_ES_in_Month_Unpadded - P_ES_out_Month_Unpadded)
-
-            # Number of timesteps to average to get 15-minute net load data.
-            Reshaped_Rows_Num = int((15 / 60) / delta_t)
-
-            # Reshape load data so that each 15-minute increment's data
-            # is in the same column. This creates an array with 3 rows for 5-minute data.
-            Load_Profile_Data_Month_Reshaped = np.reshape(Load_Profile_Data_Month, \
-                                                          (Reshaped_Rows_Num, len(Load_Profile_Data_Month) / Reshaped_Rows_Num))
-
-            Solar_Only_Net_Load_Profile_Data_Month_5_Min_Reshaped = np.reshape(Solar_Only_Net_Load_Profile_Data_Month_5_Min, \
-                                                                               (Reshaped_Rows_Num, len(Solar_Only_Net_Load_Profile_Data_Month_5_Min) / Reshaped_Rows_Num))
-
-            Solar_Storage_Net_Load_Profile_Data_Month_5_Min_Reshaped = np.reshape(Solar_Storage_Net_Load_Profile_Data_Month_5_Min, \
-                                                                                  (Reshaped_Rows_Num, len(Solar_Storage_Net_Load_Profile_Data_Month_5_Min) / Reshaped_Rows_Num))
-
-            # Create 15-minute load profiles by calculating the average of each column.
-            Load_Profile_Data_Month_15_Min = np.mean(Load_Profile_Data_Month_Reshaped, 1)
-            Solar_Only_Net_Load_Profile_Data_Month_15_Min = np.mean(Solar_Only_Net_Load_Profile_Data_Month_5_Min_Reshaped, 1)
-            Solar_Storage_Net_Load_Profile_Data_Month_15_Min = np.mean(Solar_Storage_Net_Load_Profile_Data_Month_5_Min_Reshaped, 1)
-
-            # Calculate Noncoincident Maximum Demand
-            P_max_NC_Month_Baseline = np.max(Load_Profile_Data_Month_15_Min)
-            P_max_NC_Month_with_Solar_Only = np.max(Solar_Only_Net_Load_Profile_Data_Month_15_Min)
-            P_max_NC_Month_with_Solar_and_Storage = np.max(Solar_Storage_Net_Load_Profile_Data_Month_15_Min)
-
-            # Coincident Peak Demand With and Without Storage
-
-            if Peak_DC > 0:
-
-                if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-
-                    # Create Coincident Peak Load and Net Load Profiles
-                    CPK_Load_Profile_Data_Month = Load_Profile_Data_Month[Summer_Peak_Binary_Data_Month == 1]
-
-                    CPK_Solar_Only_Net_Load_Profile_Data_Month_5_Min = Solar_Only_Net_Load_Profile_Data_Month_5_Min[Summer_Peak_Binary_Data_Month == 1]
-
-                    CPK_Solar_Storage_Net_Load_Profile_Data_Month_5_Min = Solar_Storage_Net_Load_Profile_Data_Month_5_Min[Summer_Peak_Binary_Data_Month == 1]
-
-                else:
-
-                    # Create Coincident Peak Load and Net Load Profiles
-                    CPK_Load_Profile_Data_Month = Load_Profile_Data_Month[Winter_Peak_Binary_Data_Month == 1]
-
-                    CPK_Solar_Only_Net_Load_Profile_Data_Month_5_Min = Solar_Only_Net_Load_Profile_Data_Month_5_Min[Winter_Peak_Binary_Data_Month == 1]
-
-                    CPK_Solar_Storage_Net_Load_Profile_Data_Month_5_Min = Solar_Storage_Net_Load_Profile_Data_Month_5_Min[Winter_Peak_Binary_Data_Month == 1]
-
-
-
-                # Reshape load data so that each 15-minute increment's data
-                # is in the same column. This creates an array with 3 rows for 5-minute data.
-                CPK_Load_Profile_Data_Month_Reshaped = np.reshape(CPK_Load_Profile_Data_Month, \
-                                                               (Reshaped_Rows_Num, len(CPK_Load_Profile_Data_Month) / Reshaped_Rows_Num))
-
-                CPK_Solar_Only_Net_Load_Profile_Data_Month_5_Min_Reshaped = np.reshape(CPK_Solar_Only_Net_Load_Profile_Data_Month_5_Min, \
-                                                                                       (Reshaped_Rows_Num, len(CPK_Solar_Only_Net_Load_Profile_Data_Month_5_Min) / Reshaped_Rows_Num))
-
-                CPK_Solar_Storage_Net_Load_Profile_Data_Month_5_Min_Reshaped = np.reshape(CPK_Solar_Storage_Net_Load_Profile_Data_Month_5_Min, \
-                                                                                          (Reshaped_Rows_Num, len(CPK_Solar_Storage_Net_Load_Profile_Data_Month_5_Min) / Reshaped_Rows_Num))
-
-                # Create 15-minute load profiles by calculating the average of each column.
-                CPK_Load_Profile_Data_Month_15_Min = np.mean(CPK_Load_Profile_Data_Month_Reshaped, 1)
-
-                CPK_Solar_Only_Net_Load_Profile_Data_Month_15_Min = np.mean(CPK_Solar_Only_Net_Load_Profile_Data_Month_5_Min_Reshaped, 1)
-
-                CPK_Solar_Storage_Net_Load_Profile_Data_Month_15_Min = np.mean(CPK_Solar_Storage_Net_Load_Profile_Data_Month_5_Min_Reshaped, 1)
-
-                # Calculate Coincident Peak Demand
-                P_max_CPK_Month_Baseline = np.max(CPK_Load_Profile_Data_Month_15_Min)
-                P_max_CPK_Month_with_Solar_Only = np.max(CPK_Solar_Only_Net_Load_Profile_Data_Month_15_Min)
-                P_max_CPK_Month_with_Solar_and_Storage = np.max(CPK_Solar_Storage_Net_Load_Profile_Data_Month_15_Min)
-
-            else:
-
-                # If there is no Coincident Peak Demand Period (or if the
-                # corresponding demand charge is $0/kW), set P_max_CPK to 0 kW.
-                P_max_CPK_Month_Baseline = 0
-                P_max_CPK_Month_with_Solar_Only = 0
-                P_max_CPK_Month_with_Solar_and_Storage = 0
-
-                # Coincident Part-Peak Demand With and Without Storage
-
-            if Part_Peak_DC > 0:
-
-                if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-
-                    # Create Coincident Part-Peak Load and Net Load Profiles
-                    CPP_Load_Profile_Data_Month = Load_Profile_Data_Month[Summer_Part_Peak_Binary_Data_Month == 1]
-
-                    CPP_Solar_Only_Net_Load_Profile_Data_Month_5_Min = Solar_Only_Net_Load_Profile_Data_Month_5_Min[Summer_Part_Peak_Binary_Data_Month == 1]
-
-                    CPP_Solar_Storage_Net_Load_Profile_Data_Month_5_Min = Solar_Storage_Net_Load_Profile_Data_Month_5_Min[Summer_Part_Peak_Binary_Data_Month == 1]
-
-                else:
-
-                    # Create Coincident Part-Peak Load and Net Load Profiles
-                    CPP_Load_Profile_Data_Month = Load_Profile_Data_Month[Winter_Part_Peak_Binary_Data_Month == 1]
-
-                    CPP_Solar_Only_Net_Load_Profile_Data_Month_5_Min = Solar_Only_Net_Load_Profile_Data_Month_5_Min[Winter_Part_Peak_Binary_Data_Month == 1]
-
-                    CPP_Solar_Storage_Net_Load_Profile_Data_Month_5_Min = Solar_Storage_Net_Load_Profile_Data_Month_5_Min[Winter_Part_Peak_Binary_Data_Month == 1]
-
-
-
-                # Reshape load data so that each 15-minute increment's data
-                # is in the same column. This creates an array with 3 rows for 5-minute data.
-                Coincident_Part_Peak_Load_Profile_Data_Month_Reshaped = np.reshape(CPP_Load_Profile_Data_Month, \
-                                                                                   (Reshaped_Rows_Num, len(CPP_Load_Profile_Data_Month) / Reshaped_Rows_Num))
-
-                CPP_Solar_Only_Net_Load_Profile_Data_Month_5_Min_Reshaped = np.reshape(CPP_Solar_Only_Net_Load_Profile_Data_Month_5_Min, \
-                                                                                       (Reshaped_Rows_Num, len(CPP_Solar_Only_Net_Load_Profile_Data_Month_5_Min) / Reshaped_Rows_Num))
-
-                CPP_Solar_Storage_Net_Load_Profile_Data_Month_5_Min_Reshaped = np.reshape(CPP_Solar_Storage_Net_Load_Profile_Data_Month_5_Min, \
-                                                                                          (Reshaped_Rows_Num, len(CPP_Solar_Storage_Net_Load_Profile_Data_Month_5_Min) / Reshaped_Rows_Num))
-
-                # Create 15-minute load profiles by calculating the average of each column.
-                CPP_Load_Profile_Data_Month_15_Min = np.mean(Coincident_Part_Peak_Load_Profile_Data_Month_Reshaped, 1)
-
-                CPP_Solar_Only_Net_Load_Profile_Data_Month_15_Min = np.mean(CPP_Solar_Only_Net_Load_Profile_Data_Month_5_Min_Reshaped, 1)
-
-                CPP_Solar_Storage_Net_Load_Profile_Data_Month_15_Min = np.mean(CPP_Solar_Storage_Net_Load_Profile_Data_Month_5_Min_Reshaped, 1)
-
-                # Calculate Coincident Part-Peak Demand
-                P_max_CPP_Month_Baseline = np.max(CPP_Load_Profile_Data_Month_15_Min)
-                P_max_CPP_Month_with_Solar_Only = np.max(CPP_Solar_Only_Net_Load_Profile_Data_Month_15_Min)
-                P_max_CPP_Month_with_Solar_and_Storage = np.max(CPP_Solar_Storage_Net_Load_Profile_Data_Month_15_Min)
-
-            else:
-
-                # If there is no Coincident Part-Peak Demand Period (or if the
-                # corresponding demand charge is $0/kW), set P_max_CPP to 0 kW.
-                P_max_CPP_Month_Baseline = 0
-                P_max_CPP_Month_with_Solar_Only = 0
-                P_max_CPP_Month_with_Solar_and_Storage = 0
-
-
-        elif delta_t == (15 / 60):
-
-            # Noncoincident Maximum Demand With and Without Storage
-
-            P_max_NC_Month_Baseline = np.max(Load_Profile_Data_Month)
-            P_max_NC_Month_with_Solar_Only = np.max(Load_Profile_Data_Month - Solar_PV_Profile_Data_Month)
-            P_max_NC_Month_with_Solar_and_Storage = x_Month[3 * numtsteps, 0]
-
-            # Coincident Peak Demand With and Without Storage
-
-            if Peak_DC > 0:
-
-                if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-                    P_max_CPK_Month_Baseline = np.max(Load_Profile_Data_Month[Summer_Peak_Binary_Data_Month == 1])
-
-                    P_max_CPK_Month_with_Solar_Only = np.max(Load_Profile_Data_Month[Summer_Peak_Binary_Data_Month == 1] - \
-                        Solar_PV_Profile_Data_Month[Summer_Peak_Binary_Data_Month == 1])
-
-                else:
-                    P_max_CPK_Month_Baseline = np.max(Load_Profile_Data_Month[Winter_Peak_Binary_Data_Month == 1])
-
-                    P_max_CPK_Month_with_Solar_Only = np.max(Load_Profile_Data_Month[Winter_Peak_Binary_Data_Month == 1] - \
-                        Solar_PV_Profile_Data_Month[Winter_Peak_Binary_Data_Month == 1])
-
-
-                P_max_CPK_Month_with_Solar_and_Storage = x_Month[3 * numtsteps + 1, 0]
-
-            else:
-
-                # If there is no Coincident Peak Demand Period (or if the
-                # corresponding demand charge is $0/kW), set P_max_CPK to 0 kW.
-                P_max_CPK_Month_Baseline = 0
-                P_max_CPK_Month_with_Solar_Only = 0
-                P_max_CPK_Month_with_Solar_and_Storage = 0
-
-            # Coincident Part-Peak Demand With and Without Storage
-
-            if Part_Peak_DC > 0:
-
-                if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-                    P_max_CPP_Month_Baseline = np.max(Load_Profile_Data_Month[Summer_Part_Peak_Binary_Data_Month == 1])
-
-                    P_max_CPP_Month_with_Solar_Only = np.max(Load_Profile_Data_Month[Summer_Part_Peak_Binary_Data_Month == 1] - \
-                        Solar_PV_Profile_Data_Month[Summer_Part_Peak_Binary_Data_Month == 1])
-
-                else:
-                    P_max_CPP_Month_Baseline = np.max(Load_Profile_Data_Month[Winter_Part_Peak_Binary_Data_Month == 1])
-
-                    P_max_CPP_Month_with_Solar_Only = np.max(Load_Profile_Data_Month[Winter_Part_Peak_Binary_Data_Month == 1] - \
-                        Solar_PV_Profile_Data_Month[Winter_Part_Peak_Binary_Data_Month == 1])
-
-
-                P_max_CPP_Month_with_Solar_and_Storage = x_Month[3 * numtsteps + 2, 0]
-
-            else:
-
-                # If there is no Coincident Part-Peak Demand Period (or if the
-                # corresponding demand charge is $0/kW), set P_max_CPP to 0 kW.
-                P_max_CPP_Month_Baseline = 0
-                P_max_CPP_Month_with_Solar_Only = 0
-                P_max_CPP_Month_with_Solar_and_Storage = 0
-
-        else:
-
-            print('Timestep is larger than 15 minutes. Cannot properly calculate billing demand.')
-
-
-        ## Calculate Monthly Bill Cost with and Without Storage
-
-        # Monthly Cost from Daily Fixed Charge
-        # This value is not affected by the presence of storage.
-        Fixed_Charge_Month = Fixed_Per_Meter_Month_Charge + (
-                Fixed_Per_Meter_Day_Charge * len(Load_Profile_Data_Month) / (24 * (1 / delta_t)))
-
-        # Monthly Cost from Noncoincident Demand Charge - Baseline
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            NC_Demand_Charge_Month_Baseline = Summer_Noncoincident_DC * P_max_NC_Month_Baseline
-        else:
-            NC_Demand_Charge_Month_Baseline = Winter_Noncoincident_DC * P_max_NC_Month_Baseline
-
-        # Monthly Cost from Noncoincident Demand Charge - With Solar Only
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            NC_Demand_Charge_Month_with_Solar_Only = Summer_Noncoincident_DC * P_max_NC_Month_with_Solar_Only
-        else:
-            NC_Demand_Charge_Month_with_Solar_Only = Winter_Noncoincident_DC * P_max_NC_Month_with_Solar_Only
-
-        # Monthly Cost from Noncoincident Demand Charge - With Solar and Storage
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            NC_Demand_Charge_Month_with_Solar_and_Storage = Summer_Noncoincident_DC * P_max_NC_Month_with_Solar_and_Storage
-        else:
-            NC_Demand_Charge_Month_with_Solar_and_Storage = Winter_Noncoincident_DC * P_max_NC_Month_with_Solar_and_Storage
-
-        # Monthly Cost from Coincident Peak Demand Charge - Baseline
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            CPK_Demand_Charge_Month_Baseline = Summer_Peak_DC * P_max_CPK_Month_Baseline
-        else:
-            CPK_Demand_Charge_Month_Baseline = Winter_Peak_DC * P_max_CPK_Month_Baseline
-
-        # Monthly Cost from Coincident Peak Demand Charge - With Solar Only
-
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            CPK_Demand_Charge_Month_with_Solar_Only = Summer_Peak_DC * P_max_CPK_Month_with_Solar_Only
-        else:
-            CPK_Demand_Charge_Month_with_Solar_Only = Winter_Peak_DC * P_max_CPK_Month_with_Solar_Only
-
-        # Monthly Cost from Coincident Peak Demand Charge - With Solar and Storage
-
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            CPK_Demand_Charge_Month_with_Solar_and_Storage = Summer_Peak_DC * P_max_CPK_Month_with_Solar_and_Storage
-        else:
-            CPK_Demand_Charge_Month_with_Solar_and_Storage = Winter_Peak_DC * P_max_CPK_Month_with_Solar_and_Storage
-
-        # Monthly Cost from Coincident Part-Peak Demand Charge - Baseline
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            CPP_Demand_Charge_Month_Baseline = Summer_Part_Peak_DC * P_max_CPP_Month_Baseline
-        else:
-            CPP_Demand_Charge_Month_Baseline = Winter_Part_Peak_DC * P_max_CPP_Month_Baseline
-
-        # Monthly Cost from Coincident Part-Peak Demand Charge - With Solar Only
-
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            CPP_Demand_Charge_Month_with_Solar_Only = Summer_Part_Peak_DC * P_max_CPP_Month_with_Solar_Only
-        else:
-            CPP_Demand_Charge_Month_with_Solar_Only = Winter_Part_Peak_DC * P_max_CPP_Month_with_Solar_Only
-
-        # Monthly Cost from Coincident Part-Peak Demand Charge - With Solar and Storage
-
-        if Month_Iter in range(First_Summer_Month, (Last_Summer_Month + 1)):
-            CPP_Demand_Charge_Month_with_Solar_and_Storage = Summer_Part_Peak_DC * P_max_CPP_Month_with_Solar_and_Storage
-        else:
-            CPP_Demand_Charge_Month_with_Solar_and_Storage = Winter_Part_Peak_DC * P_max_CPP_Month_with_Solar_and_Storage
-
-        # Monthly Cost from Volumetric Energy Rates - Baseline
-        Energy_Charge_Month_Baseline = np.dot(np.transpose(Load_Profile_Data_Month), Volumetric_Rate_Data_Month) * delta_t
-
-        # Monthly Cost from Volumetric Energy Rates - With Solar Only
-        Solar_Only_Net_Load_Profile_Month = Load_Profile_Data_Month - Solar_PV_Profile_Data_Month
-        Energy_Charge_Month_with_Solar_Only = np.dot(np.transpose(Solar_Only_Net_Load_Profile_Month), Volumetric_Rate_Data_Month) * delta_t
-
-        # Monthly Cost from Volumetric Energy Rates - With Solar and Storage
-        Solar_Storage_Net_Load_Profile_Month = Load_Profile_Data_Month - Solar_PV_Profile_Data_Month + np.transpose(P_ES_in_Month_Unpadded) - np.transpose(P_ES_out_Month_Unpadded)
-        Energy_Charge_Month_with_Solar_and_Storage = np.dot(Solar_Storage_Net_Load_Profile_Month, np.reshape(Volumetric_Rate_Data_Month, (len(Volumetric_Rate_Data_Month), 1))) * delta_t
-        Energy_Charge_Month_with_Solar_and_Storage = Energy_Charge_Month_with_Solar_and_Storage[0, 0] # Convert from single-value array to double
-
-        # Monthly Cycling Penalty
+        ## Calculate Monthly Cycling Penalty
 
         Cycles_Month = np.sum((P_ES_in_Month_Unpadded * (((Eff_c) / (2 * Total_Storage_Capacity)) * delta_t)) + \
             (P_ES_out_Month_Unpadded * ((1 / (Eff_d * 2 * Total_Storage_Capacity)) * delta_t)))
@@ -1734,62 +1014,42 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
         Ene_Lvl = np.concatenate((Ene_Lvl, Ene_Lvl_Month_Unpadded)) if Ene_Lvl.size != 0 else Ene_Lvl_Month_Unpadded
 
-        P_max_NC = np.concatenate((P_max_NC, np.asarray(P_max_NC_Month_with_Solar_and_Storage).reshape((-1,1)))) if P_max_NC.size != 0 else np.asarray(P_max_NC_Month_with_Solar_and_Storage).reshape((-1,1))
-
-        P_max_peak = np.concatenate((P_max_peak, np.asarray(P_max_CPK_Month_with_Solar_and_Storage).reshape((-1, 1)))) if P_max_peak.size != 0 else np.asarray(P_max_CPK_Month_with_Solar_and_Storage).reshape((-1, 1))
-
-        P_max_part_peak = np.concatenate((P_max_part_peak, np.asarray(P_max_CPP_Month_with_Solar_and_Storage).reshape((-1, 1)))) if P_max_part_peak.size != 0 else np.asarray(P_max_CPP_Month_with_Solar_and_Storage).reshape((-1, 1))
-
 
         # Monthly Cost Variable Concatenation
-        Fixed_Charge_Vector = np.concatenate((Fixed_Charge_Vector, np.asarray(Fixed_Charge_Month).reshape((-1,1)))) if Fixed_Charge_Vector.size != 0 else  np.asarray(Fixed_Charge_Month).reshape((-1,1))
-
-        NC_DC_Baseline_Vector = np.concatenate((NC_DC_Baseline_Vector,
-                                                np.asarray(NC_Demand_Charge_Month_Baseline).reshape((-1, 1)))) if NC_DC_Baseline_Vector.size != 0 else  np.asarray(NC_Demand_Charge_Month_Baseline).reshape((-1,1))
-
-        NC_DC_with_Solar_Only_Vector = np.concatenate((NC_DC_with_Solar_Only_Vector,
-                                                       np.asarray(NC_Demand_Charge_Month_with_Solar_Only).reshape((-1, 1)))) if NC_DC_with_Solar_Only_Vector.size != 0 else np.asarray(NC_Demand_Charge_Month_with_Solar_Only).reshape((-1,1))
-
-        NC_DC_with_Solar_and_Storage_Vector = np.concatenate((NC_DC_with_Solar_and_Storage_Vector,
-                                                              np.asarray(
-                                                                  NC_Demand_Charge_Month_with_Solar_and_Storage).reshape((-1, 1)))) if NC_DC_with_Solar_and_Storage_Vector.size != 0 else \
-            np.asarray(NC_Demand_Charge_Month_with_Solar_and_Storage).reshape((-1,1))
+        Cycles_Vector = np.concatenate((Cycles_Vector, np.asarray(Cycles_Month).reshape((-1,1)))) if Cycles_Vector.size != 0 else np.asarray(Cycles_Month).reshape((-1,1))
 
-        CPK_DC_Baseline_Vector = np.concatenate((CPK_DC_Baseline_Vector,
-                                                 np.asarray(CPK_Demand_Charge_Month_Baseline).reshape((-1, 1)))) if CPK_DC_Baseline_Vector.size != 0 else np.asarray(CPK_Demand_Charge_Month_Baseline).reshape((-1,1))
+        Cycling_Penalty_Vector = np.concatenate((Cycling_Penalty_Vector, np.asarray(Cycling_Penalty_Month).reshape((-1,1)))) if Cycling_Penalty_Vector.size != 0 else np.asarray(Cycling_Penalty_Month).reshape((-1,1))
 
-        CPK_DC_with_Solar_Only_Vector = np.concatenate((CPK_DC_with_Solar_Only_Vector,
-                                                        np.asarray(CPK_Demand_Charge_Month_with_Solar_Only).reshape((-1, 1)))) if CPK_DC_with_Solar_Only_Vector.size != 0 else np.asarray(CPK_Demand_Charge_Month_with_Solar_Only).reshape((-1,1))
 
-        CPK_DC_with_Solar_and_Storage_Vector = np.concatenate((CPK_DC_with_Solar_and_Storage_Vector,
-                                                               np.asarray(
-                                                                   CPK_Demand_Charge_Month_with_Solar_and_Storage).reshape((-1, 1)))) if CPK_DC_with_Solar_and_Storage_Vector.size != 0 else \
-            np.asarray(CPK_Demand_Charge_Month_with_Solar_and_Storage).reshape((-1,1))
+    Record_Model_Run_Phase("Calculate Monthly Results")
 
-        CPP_DC_Baseline_Vector = np.concatenate((CPP_DC_Baseline_Vector,
-                                                 np.asarray(CPP_Demand_Charge_Month_Baseline).reshape((-1, 1)))) if CPP_DC_Baseline_Vector.size != 0 else np.asarray(CPP_Demand_Charge_Month_Baseline).reshape((-1,1))
 
-        CPP_DC_with_Solar_Only_Vector = np.concatenate((CPP_DC_with_Solar_Only_Vector,
-                                                        np.asarray(CPP_Demand_Charge_Month_with_Solar_Only).reshape((-1, 1)))) if CPP_DC_with_Solar_Only_Vector.size != 0 else np.asarray(CPP_Demand_Charge_Month_with_Solar_Only).reshape((-1,1))
+    ## Calculate Monthly Bill Cost with Storage
 
-        CPP_DC_with_Solar_and_Storage_Vector = np.concatenate((CPP_DC_with_Solar_and_Storage_Vector,
-                                                               np.asarray(CPP_Demand_Charge_Month_with_Solar_and_Storage).reshape((-1, 1)))) if CPP_DC_with_Solar_and_Storage_Vector.size != 0 else \
-            np.asarray(CPP_Demand_Charge_Month_with_Solar_and_Storage).reshape((-1,1))
+    # Monthly peak demand and bill costs with solar and storage are calculated from the net load profile
+    # for all months at once, in Calculate_Bills.py. Demand charges are based on 15-minute interval periods.
 
-        Energy_Charge_Baseline_Vector = np.concatenate((Energy_Charge_Baseline_Vector,
-                                                        np.asarray(Energy_Charge_Month_Baseline).reshape((-1, 1)))) if Energy_Charge_Baseline_Vector.size != 0 else np.asarray(Energy_Charge_Month_Baseline).reshape((-1,1))
+    Solar_Storage_Net_Load_Profile_Data = Load_Profile_Data - Solar_PV_Profile_Data + P_ES_in.reshape((-1,)) - P_ES_out.reshape((-1,))
 
-        Energy_Charge_with_Solar_Only_Vector = np.concatenate((Energy_Charge_with_Solar_Only_Vector,
-                                                               np.asarray(Energy_Charge_Month_with_Solar_Only).reshape((-1, 1)))) if Energy_Charge_with_Solar_Only_Vector.size != 0 else np.asarray(Energy_Charge_Month_with_Solar_Only).reshape((-1,1))
+    Bills_with_Solar_and_Storage = Calculate_Bills(Solar_Storage_Net_Load_Profile_Data, delta_t, Month_Data, Volumetric_Rate_Data,
+                                                   Summer_Peak_DC, Summer_Part_Peak_DC, Summer_Noncoincident_DC,
+                                                   Winter_Peak_DC, Winter_Part_Peak_DC, Winter_Noncoincident_DC,
+                                                   Fixed_Per_Meter_Day_Charge, Fixed_Per_Meter_Month_Charge,
+                                                   First_Summer_Month, Last_Summer_Month,
+                                                   Summer_Peak_Binary_Data, Summer_Part_Peak_Binary_Data,
+                                                   Winter_Peak_Binary_Data, Winter_Part_Peak_Binary_Data)
 
-        Energy_Charge_with_Solar_and_Storage_Vector = np.concatenate((Energy_Charge_with_Solar_and_Storage_Vector,
-                                                                      np.asarray(Energy_Charge_Month_with_Solar_and_Storage).reshape((-1, 1)))) if Energy_Charge_with_Solar_and_Storage_Vector.size != 0 else \
-            np.asarray(Energy_Charge_Month_with_Solar_and_Storage).reshape((-1,1))
+    P_max_NC = Bills_with_Solar_and_Storage["P_max_NC"].reshape((-1, 1))
+    P_max_peak = Bills_with_Solar_and_Storage["P_max_CPK"].reshape((-1, 1))
+    P_max_part_peak = Bills_with_Solar_and_Storage["P_max_CPP"].reshape((-1, 1))
 
-        Cycles_Vector = np.concatenate((Cycles_Vector, np.asarray(Cycles_Month).reshape((-1,1)))) if Cycles_Vector.size != 0 else np.asarray(Cycles_Month).reshape((-1,1))
+    NC_DC_with_Solar_and_Storage_Vector = Bills_with_Solar_and_Storage["NC_DC"].reshape((-1, 1))
+    CPK_DC_with_Solar_and_Storage_Vector = Bills_with_Solar_and_Storage["CPK_DC"].reshape((-1, 1))
+    CPP_DC_with_Solar_and_Storage_Vector = Bills_with_Solar_and_Storage["CPP_DC"].reshape((-1, 1))
+    Energy_Charge_with_Solar_and_Storage_Vector = Bills_with_Solar_and_Storage["Energy_Charge"].reshape((-1, 1))
 
-        Cycling_Penalty_Vector = np.concatenate((Cycling_Penalty_Vector, np.asarray(Cycling_Penalty_Month).reshape((-1,1)))) if Cycling_Penalty_Vector.size != 0 else np.asarray(Cycling_Penalty_Month).reshape((-1,1))
 
+    Record_Model_Run_Phase("Calculate Bills with Storage")
 
     # Report total script runtime.
 
@@ -1813,10 +1073,16 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
         Retail_Rate_Utility = "SCE"
     elif "SDG&E" in Retail_Rate_Name_Input:
         Retail_Rate_Utility = "SDG&E"
+    else:
+        # Rates added to the data catalog for other utilities (ex. synthetic rates) are reported with their full name.
+        Retail_Rate_Utility = ""
 
-    Retail_Rate_Utility_Plus_Space = Retail_Rate_Utility + " "
+    if Retail_Rate_Utility == "":
+        Retail_Rate_Name_Output = Retail_Rate_Name_Input
+    else:
+        Retail_Rate_Utility_Plus_Space = Retail_Rate_Utility + " "
 
-    Retail_Rate_Name_Output = Retail_Rate_Name_Input.replace(Retail_Rate_Utility_Plus_Space, "")
+        Retail_Rate_Name_Output = Retail_Rate_Name_Input.replace(Retail_Rate_Utility_Plus_Space, "")
 
     # If Solar Profile Name is "No Solar", Solar Profile Name Output is Blank
     if Solar_Profile_Name_Input == "No Solar":
@@ -1883,9 +1149,28 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     if Emissions_Forecast_Signal_Input == "No":
         Emissions_Forecast_Signal_Input = "No Emissions Forecast Signal"
 
-    # Create folder if one does not exist already
 
-    if os.path.isdir(Output_Directory_Filepath) == False:
+    ## Load Plotting Packages
+
+    # Plots are drawn using the interactive TkAgg backend if they are shown,
+    # or the non-interactive Agg backend if they are only exported (unless pyplot has already been loaded).
+
+    if Show_Plots == 1 or Export_Plots == 1:
+
+        import matplotlib
+
+        if Show_Plots == 1:
+            matplotlib.use('TkAgg')
+        elif "matplotlib.pyplot" not in sys.modules:
+            matplotlib.use('Agg')
+
+        import matplotlib.dates
+        import matplotlib.pyplot as plt
+
+    # The output folder is only created if plots or data are exported, so that model runs without exports
+    # don't create empty folders. Export_Model_Data.py creates it for data exports.
+
+    if Export_Plots == 1:
         os.makedirs(Output_Directory_Filepath, exist_ok=True)
 
 
@@ -2050,9 +1335,9 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
     elif Model_Type_Input == "Solar Plus Storage":
 
-        Annual_Peak_Demand_with_Solar_Only = np.max(Load_Profile_Data - Solar_PV_Profile_Data)
+        Annual_Peak_Demand_with_Solar_Only = Without_Storage_Results["Annual_Peak_Demand_with_Solar_Only"]
 
-        Annual_Total_Energy_Consumption_with_Solar_Only = np.sum(Load_Profile_Data - Solar_PV_Profile_Data) * delta_t
+        Annual_Total_Energy_Consumption_with_Solar_Only = Without_Storage_Results["Annual_Total_Energy_Consumption_with_Solar_Only"]
 
     Annual_Peak_Demand_with_Solar_and_Storage = np.max(Load_Profile_Data - (Solar_PV_Profile_Data + P_ES))
 
@@ -2448,10 +1733,10 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
     # Calculate Total Annual Grid Costs
 
-    Annual_Grid_Cost_Baseline = np.dot(Generation_Cost_Data + Representative_Distribution_Cost_Data, Load_Profile_Data) * (1 / 1000) * delta_t
+    Annual_Grid_Cost_Baseline = Without_Storage_Results["Annual_Grid_Cost_Baseline"]
 
     if Model_Type_Input == "Solar Plus Storage":
-        Annual_Grid_Cost_with_Solar_Only = np.dot(Generation_Cost_Data + Representative_Distribution_Cost_Data, Load_Profile_Data - Solar_PV_Profile_Data) * (1 / 1000) * delta_t
+        Annual_Grid_Cost_with_Solar_Only = Without_Storage_Results["Annual_Grid_Cost_with_Solar_Only"]
     else:
         Annual_Grid_Cost_with_Solar_Only = ""
 
@@ -2460,24 +1745,9 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
     # Calculate Monthly Grid Costs
 
-    Grid_Cost_Timestep_Baseline = np.concatenate((np.multiply(Generation_Cost_Data, Load_Profile_Data).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t, \
-                                   np.multiply(Representative_Distribution_Cost_Data, Load_Profile_Data).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t), axis = 1)
+    Grid_Cost_Month_Baseline = Without_Storage_Results["Grid_Cost_Month_Baseline"]
 
-    Grid_Cost_Month_Baseline = np.array([])
-
-    for Month_Iter in range(1, 12 + 1):
-        Grid_Cost_Single_Month_Baseline = np.sum(Grid_Cost_Timestep_Baseline[Month_Data == Month_Iter,:], axis = 0).reshape((1,2))
-        Grid_Cost_Month_Baseline = np.concatenate((Grid_Cost_Month_Baseline, Grid_Cost_Single_Month_Baseline), axis = 0) if Grid_Cost_Month_Baseline.size != 0 else Grid_Cost_Single_Month_Baseline
-
-
-    Grid_Cost_Timestep_with_Solar_Only = np.concatenate((np.multiply(Generation_Cost_Data, (Load_Profile_Data - Solar_PV_Profile_Data)).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t, \
-                                                         np.multiply(Representative_Distribution_Cost_Data, (Load_Profile_Data - Solar_PV_Profile_Data)).reshape((numtsteps_year,1)) * (1 / 1000) * delta_t), axis = 1)
-
-    Grid_Cost_Month_with_Solar_Only = np.array([])
-
-    for Month_Iter in range(1, 12 + 1):
-        Grid_Cost_Single_Month_with_Solar_Only = np.sum(Grid_Cost_Timestep_with_Solar_Only[Month_Data == Month_Iter,:], axis = 0).reshape((1,2))
-        Grid_Cost_Month_with_Solar_Only = np.concatenate((Grid_Cost_Month_with_Solar_Only, Grid_Cost_Single_Month_with_Solar_Only), axis = 0) if Grid_Cost_Month_with_Solar_Only.size != 0 else Grid_Cost_Single_Month_with_Solar_Only
+    Grid_Cost_Month_with_Solar_Only = Without_Storage_Results["Grid_Cost_Month_with_Solar_Only"]
 
 
     Grid_Cost_Timestep_with_Solar_and_Storage = np.concatenate((np.multiply(Generation_Cost_Data,
@@ -2490,7 +1760,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     Grid_Cost_Month_with_Solar_and_Storage = np.array([])
 
     for Month_Iter in range(1, 12 + 1):
-        Grid_Cost_Single_Month_with_Solar_and_Storage = np.sum(Grid_Cost_Timestep_with_Solar_and_Storage[Month_Data == Month_Iter,:], axis = 0).reshape((1,2))
+        Grid_Cost_Single_Month_with_Solar_and_Storage = np.sum(Grid_Cost_Timestep_with_Solar_and_Storage[Month_Timesteps(Month_Iter),:], axis = 0).reshape((1,2))
 
         Grid_Cost_Month_with_Solar_and_Storage = np.concatenate((Grid_Cost_Month_with_Solar_and_Storage, Grid_Cost_Single_Month_with_Solar_and_Storage), axis = 0) if \
             Grid_Cost_Month_with_Solar_and_Storage.size != 0 else Grid_Cost_Single_Month_with_Solar_and_Storage
@@ -2542,13 +1812,13 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
     # https://www.pge.com/includes/docs/pdfs/shared/environment/calculator/pge_ghg_emission_factor_info_sheet.pdf
 
     # (tons/kWh) = (tons/MWh) * (MWh/kWh)
-    Annual_GHG_Emissions_Baseline = np.dot(Marginal_Emissions_Rate_Evaluation_Data, Load_Profile_Data) * (1 / 1000) * delta_t
+    Annual_GHG_Emissions_Baseline = Without_Storage_Results["Annual_GHG_Emissions_Baseline"]
 
     if Model_Type_Input == "Storage Only":
         Annual_GHG_Emissions_with_Solar_Only = ""
 
     elif Model_Type_Input == "Solar Plus Storage":
-        Annual_GHG_Emissions_with_Solar_Only = np.dot(Marginal_Emissions_Rate_Evaluation_Data, (Load_Profile_Data - Solar_PV_Profile_Data)) * (1 / 1000) * delta_t
+        Annual_GHG_Emissions_with_Solar_Only = Without_Storage_Results["Annual_GHG_Emissions_with_Solar_Only"]
 
     Annual_GHG_Emissions_with_Solar_and_Storage = np.dot(Marginal_Emissions_Rate_Evaluation_Data,
                                                          (Load_Profile_Data - (Solar_PV_Profile_Data + P_ES_out.reshape((numtsteps_year,)) - P_ES_in.reshape((numtsteps_year,))))) * (1 / 1000) * delta_t
@@ -2780,7 +2050,7 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
         Emissions_Impact_Month = np.array([])
 
         for Month_Iter in range(1, 12+1):
-            Emissions_Impact_Single_Month = np.sum(Emissions_Impact_Timestep[Month_Data == Month_Iter])
+            Emissions_Impact_Single_Month = np.sum(Emissions_Impact_Timestep[Month_Timesteps(Month_Iter)])
             Emissions_Impact_Month = np.concatenate((Emissions_Impact_Month, np.asarray(Emissions_Impact_Single_Month).reshape((-1,1))), axis=0) if \
                 Emissions_Impact_Month.size != 0 else np.asarray(Emissions_Impact_Single_Month).reshape((-1,1))
 
@@ -2817,58 +2087,188 @@ def OSESMO(Modeling_Team_Input=None, Model_Run_Number_Input=None, Model_Type_Inp
 
     ## Close All Figures
 
-    if Show_Plots == 0:
+    if Show_Plots == 0 and Export_Plots == 1:
         plt.close('all')
 
 
-    ## Write Outputs to CSV
+    ## Reported Model Inputs and Outputs
+
+    # Each reported model input/output is listed as (column name, value).
+
+    Model_Inputs_and_Outputs_Items = [("Modeling_Team_Input", Modeling_Team_Input),
+                                      ("Model_Run_Number_Input", Model_Run_Number_Input),
+                                      ("Model_Run_Date_Time", Model_Run_Date_Time),
+                                      ("Model_Type_Input", Model_Type_Input),
+                                      ("Model_Timestep_Resolution", Model_Timestep_Resolution),
+                                      ("Customer_Class_Input", Customer_Class_Input),
+                                      ("Load_Profile_Master_Index", Load_Profile_Master_Index),
+                                      ("Load_Profile_Name_Input", Load_Profile_Name_Input),
+                                      ("Retail_Rate_Master_Index", Retail_Rate_Master_Index),
+                                      ("Retail_Rate_Utility", Retail_Rate_Utility),
+                                      ("Retail_Rate_Name_Output", Retail_Rate_Name_Output),
+                                      ("Retail_Rate_Effective_Date", Retail_Rate_Effective_Date),
+                                      ("Solar_Profile_Master_Index", Solar_Profile_Master_Index),
+                                      ("Solar_Profile_Name_Output", Solar_Profile_Name_Output),
+                                      ("Solar_Profile_Description", Solar_Profile_Description),
+                                      ("Solar_Size_Input", Solar_Size_Input),
+                                      ("Storage_Type_Input", Storage_Type_Input),
+                                      ("Storage_Power_Rating_Input", Storage_Power_Rating_Input),
+                                      ("Usable_Storage_Capacity_Input", Usable_Storage_Capacity_Input),
+                                      ("Single_Cycle_RTE_Input", Single_Cycle_RTE_Input),
+                                      ("Parasitic_Storage_Load_Input", Parasitic_Storage_Load_Input),
+                                      ("Storage_Control_Algorithm_Name", Storage_Control_Algorithm_Name),
+                                      ("Storage_Control_Algorithm_Description", Storage_Control_Algorithm_Description),
+                                      ("Storage_Control_Algorithms_Parameters_Filename", Storage_Control_Algorithms_Parameters_Filename),
+                                      ("GHG_Reduction_Solution_Input", GHG_Reduction_Solution_Input),
+                                      ("Equivalent_Cycling_Constraint_Input", Equivalent_Cycling_Constraint_Input),
+                                      ("Annual_RTE_Constraint_Input", Annual_RTE_Constraint_Input),
+                                      ("ITC_Constraint_Input", ITC_Constraint_Input),
+                                      ("Carbon_Adder_Incentive_Value_Input", Carbon_Adder_Incentive_Value_Input),
+                                      ("Other_Incentives_or_Penalities", Other_Incentives_or_Penalities),
+                                      ("Emissions_Forecast_Signal_Input", Emissions_Forecast_Signal_Input),
+                                      ("Annual_GHG_Emissions_Baseline", Annual_GHG_Emissions_Baseline),
+                                      ("Annual_GHG_Emissions_with_Solar_Only", Annual_GHG_Emissions_with_Solar_Only),
+                                      ("Annual_GHG_Emissions_with_Solar_and_Storage", Annual_GHG_Emissions_with_Solar_and_Storage),
+                                      ("Annual_Customer_Bill_Baseline", Annual_Customer_Bill_Baseline),
+                                      ("Annual_Customer_Bill_with_Solar_Only", Annual_Customer_Bill_with_Solar_Only),
+                                      ("Annual_Customer_Bill_with_Solar_and_Storage", Annual_Customer_Bill_with_Solar_and_Storage),
+                                      ("Annual_Grid_Cost_Baseline", Annual_Grid_Cost_Baseline),
+                                      ("Annual_Grid_Cost_with_Solar_Only", Annual_Grid_Cost_with_Solar_Only),
+                                      ("Annual_Grid_Cost_with_Solar_and_Storage", Annual_Grid_Cost_with_Solar_and_Storage),
+                                      ("Annual_Equivalent_Storage_Cycles", Annual_Equivalent_Storage_Cycles),
+                                      ("Annual_RTE", Annual_RTE),
+                                      ("Operational_Capacity_Factor", Operational_Capacity_Factor),
+                                      ("Annual_Demand_Charge_Cost_Baseline", Annual_Demand_Charge_Cost_Baseline),
+                                      ("Annual_Demand_Charge_Cost_with_Solar_Only", Annual_Demand_Charge_Cost_with_Solar_Only),
+                                      ("Annual_Demand_Charge_Cost_with_Solar_and_Storage", Annual_Demand_Charge_Cost_with_Solar_and_Storage),
+                                      ("Annual_Energy_Charge_Cost_Baseline", Annual_Energy_Charge_Cost_Baseline),
+                                      ("Annual_Energy_Charge_Cost_with_Solar_Only", Annual_Energy_Charge_Cost_with_Solar_Only),
+                                      ("Annual_Energy_Charge_Cost_with_Solar_and_Storage", Annual_Energy_Charge_Cost_with_Solar_and_Storage),
+                                      ("Annual_Peak_Demand_Baseline", Annual_Peak_Demand_Baseline),
+                                      ("Annual_Peak_Demand_with_Solar_Only", Annual_Peak_Demand_with_Solar_Only),
+                                      ("Annual_Peak_Demand_with_Solar_and_Storage", Annual_Peak_Demand_with_Solar_and_Storage),
+                                      ("Annual_Total_Energy_Consumption_Baseline", Annual_Total_Energy_Consumption_Baseline),
+                                      ("Annual_Total_Energy_Consumption_with_Solar_Only", Annual_Total_Energy_Consumption_with_Solar_Only),
+                                      ("Annual_Total_Energy_Consumption_with_Solar_and_Storage", Annual_Total_Energy_Consumption_with_Solar_and_Storage),
+                                      ("Output_Summary_Filename", Output_Summary_Filename),
+                                      ("Output_Description_Filename", Output_Description_Filename),
+                                      ("Output_Visualizations_Filename", Output_Visualizations_Filename),
+                                      ("EV_Use", EV_Use),
+                                      ("EV_Charge", EV_Charge),
+                                      ("EV_Gas_Savings", EV_Gas_Savings),
+                                      ("EV_GHG_Savings", EV_GHG_Savings)]
+
+    Record_Model_Run_Phase("Calculate Reported Outputs and Plots")
+
+
+    ## Return Model Results
+
+    # Model results are returned in memory as a dictionary, so that scenario sweeps and other callers
+    # can use them without reading the exported .csv files. The dictionary contains:
+    #  * "Model_Inputs_and_Outputs" - dictionary of the reported model inputs and annual outputs,
+    #    with the same names and order as the columns of the model output summary .csv file.
+    #  * "Monthly_Costs" - dictionary of 12-element arrays of monthly bill components ($)
+    #    and storage cycling (cycles and cycling penalty), with and without solar and storage.
+    #  * "Time_Series" - dictionary of timestep arrays: timestamps "t" (Pacific time, no DST), load "Load_Profile_Data",
+    #    solar generation "Solar_PV_Profile_Data", storage charging power "P_ES_in" (including parasitic load),
+    #    discharging power "P_ES_out", net storage output "P_ES", net load with solar and storage "Net_Load" (kW),
+    #    and storage energy level "Ene_Lvl" (kWh).
+    #  * "Solver_Statistics" - list of dictionaries, one per month, containing the solution source
+    #    ("Sequential", "Parallel", or "Annual"), solver backend, status, objective value, iterations,
+    #    relative gap, primal and dual infeasibility, linear program size (rows, columns, and nonzeros),
+    #    constraint build and solve times, and the solver fallback step and solve attempts (see Solve_LP_with_Fallback.py).
+    #  * "Model_Runtime_Seconds" - time taken to import data and optimize storage dispatch.
+    #  * "Model_Run_Metrics" - dictionary of the time taken by each phase of the model run "Phase_Times_Seconds",
+    #    the "Total_Time_Seconds" of all phases, the "Peak_Memory_MB" of the Python process
+    #    and of any month solve worker processes "Peak_Worker_Memory_MB", the "Solver_Statistics",
+    #    and the model run "Status" ("Succeeded", or "Failed" in the metrics log of model runs stopped by LP_Solver_Failure).
+    #  * "Scenario_ID" - hash of the model inputs that affect results (see Calculate_Scenario_ID.py).
+    #  * "Output_Directory_Filepath" - directory that plots and .csv files are exported to.
+
+    OSESMO_Results = {"Model_Inputs_and_Outputs": dict(Model_Inputs_and_Outputs_Items),
+                      "Monthly_Costs": {"Fixed_Charge": Fixed_Charge_Vector.flatten(),
+                                        "NC_DC_Baseline": NC_DC_Baseline_Vector.flatten(),
+                                        "NC_DC_with_Solar_Only": NC_DC_with_Solar_Only_Vector.flatten(),
+                                        "NC_DC_with_Solar_and_Storage": NC_DC_with_Solar_and_Storage_Vector.flatten(),
+                                        "CPK_DC_Baseline": CPK_DC_Baseline_Vector.flatten(),
+                                        "CPK_DC_with_Solar_Only": CPK_DC_with_Solar_Only_Vector.flatten(),
+                                        "CPK_DC_with_Solar_and_Storage": CPK_DC_with_Solar_and_Storage_Vector.flatten(),
+                                        "CPP_DC_Baseline": CPP_DC_Baseline_Vector.flatten(),
+                                        "CPP_DC_with_Solar_Only": CPP_DC_with_Solar_Only_Vector.flatten(),
+                                        "CPP_DC_with_Solar_and_Storage": CPP_DC_with_Solar_and_Storage_Vector.flatten(),
+                                        "Energy_Charge_Baseline": Energy_Charge_Baseline_Vector.flatten(),
+                                        "Energy_Charge_with_Solar_Only": Energy_Charge_with_Solar_Only_Vector.flatten(),
+                                        "Energy_Charge_with_Solar_and_Storage": Energy_Charge_with_Solar_and_Storage_Vector.flatten(),
+                                        "Cycles": Cycles_Vector.flatten(),
+                                        "Cycling_Penalty": Cycling_Penalty_Vector.flatten()},
+                      "Time_Series": {"t": np.array(t, dtype = 'datetime64[m]'),
+                                      "Load_Profile_Data": np.asarray(Load_Profile_Data).flatten(),
+                                      "Solar_PV_Profile_Data": np.asarray(Solar_PV_Profile_Data).flatten(),
+                                      "P_ES_in": P_ES_in.flatten(),
+                                      "P_ES_out": P_ES_out.flatten(),
+                                      "P_ES": P_ES,
+                                      "Net_Load": np.asarray(Load_Profile_Data - (Solar_PV_Profile_Data + P_ES)).flatten(),
+                                      "Ene_Lvl": Ene_Lvl.flatten()},
+                      "Solver_Statistics": Solver_Statistics,
+                      "Model_Runtime_Seconds": telapsed,
+                      "Model_Run_Metrics": {"Model_Run_Number_Input": Model_Run_Number_Input,
+                                            "Scenario_ID": Scenario_ID,
+                                            "Model_Run_Date_Time": Model_Run_Date_Time,
+                                            "Status": "Succeeded",
+                                            "Phase_Times_Seconds": Model_Run_Phase_Times,
+                                            "Solver_Statistics": Solver_Statistics},
+                      "Scenario_ID": Scenario_ID,
+                      "Output_Directory_Filepath": Output_Directory_Filepath}
 
-    Model_Inputs_and_Outputs = np.array([Modeling_Team_Input, Model_Run_Number_Input, Model_Run_Date_Time, Model_Type_Input, Model_Timestep_Resolution, \
-                                         Customer_Class_Input, Load_Profile_Master_Index, Load_Profile_Name_Input, \
-                                         Retail_Rate_Master_Index, Retail_Rate_Utility, Retail_Rate_Name_Output, Retail_Rate_Effective_Date, \
-                                         Solar_Profile_Master_Index, Solar_Profile_Name_Output, Solar_Profile_Description, Solar_Size_Input, \
-                                         Storage_Type_Input, Storage_Power_Rating_Input, Usable_Storage_Capacity_Input, Single_Cycle_RTE_Input, Parasitic_Storage_Load_Input, \
-                                         Storage_Control_Algorithm_Name, Storage_Control_Algorithm_Description, Storage_Control_Algorithms_Parameters_Filename, \
-                                         GHG_Reduction_Solution_Input, Equivalent_Cycling_Constraint_Input, Annual_RTE_Constraint_Input, ITC_Constraint_Input, \
-                                         Carbon_Adder_Incentive_Value_Input, Other_Incentives_or_Penalities, Emissions_Forecast_Signal_Input, \
-                                         Annual_GHG_Emissions_Baseline, Annual_GHG_Emissions_with_Solar_Only, Annual_GHG_Emissions_with_Solar_and_Storage, \
-                                         Annual_Customer_Bill_Baseline, Annual_Customer_Bill_with_Solar_Only, Annual_Customer_Bill_with_Solar_and_Storage, \
-                                         Annual_Grid_Cost_Baseline, Annual_Grid_Cost_with_Solar_Only, Annual_Grid_Cost_with_Solar_and_Storage, \
-                                         Annual_Equivalent_Storage_Cycles, Annual_RTE, Operational_Capacity_Factor, \
-                                         Annual_Demand_Charge_Cost_Baseline, Annual_Demand_Charge_Cost_with_Solar_Only, Annual_Demand_Charge_Cost_with_Solar_and_Storage, \
-                                         Annual_Energy_Charge_Cost_Baseline, Annual_Energy_Charge_Cost_with_Solar_Only, Annual_Energy_Charge_Cost_with_Solar_and_Storage, \
-                                         Annual_Peak_Demand_Baseline, Annual_Peak_Demand_with_Solar_Only, Annual_Peak_Demand_with_Solar_and_Storage, \
-                                         Annual_Total_Energy_Consumption_Baseline, Annual_Total_Energy_Consumption_with_Solar_Only, Annual_Total_Energy_Consumption_with_Solar_and_Storage, \
-                                         Output_Summary_Filename, Output_Description_Filename, Output_Visualizations_Filename, \
-                                         EV_Use, EV_Charge, EV_Gas_Savings, EV_GHG_Savings]).reshape((1, 62))
-
-    Model_Inputs_and_Outputs = pd.DataFrame(Model_Inputs_and_Outputs, columns = ["Modeling_Team_Input", "Model_Run_Number_Input", "Model_Run_Date_Time", "Model_Type_Input", "Model_Timestep_Resolution", \
-                                         "Customer_Class_Input", "Load_Profile_Master_Index", "Load_Profile_Name_Input", \
-                                         "Retail_Rate_Master_Index", "Retail_Rate_Utility", "Retail_Rate_Name_Output", "Retail_Rate_Effective_Date", \
-                                         "Solar_Profile_Master_Index", "Solar_Profile_Name_Output", "Solar_Profile_Description", "Solar_Size_Input", \
-                                         "Storage_Type_Input", "Storage_Power_Rating_Input", "Usable_Storage_Capacity_Input", "Single_Cycle_RTE_Input", "Parasitic_Storage_Load_Input", \
-                                         "Storage_Control_Algorithm_Name", "Storage_Control_Algorithm_Description", "Storage_Control_Algorithms_Parameters_Filename", \
-                                         "GHG_Reduction_Solution_Input", "Equivalent_Cycling_Constraint_Input", "Annual_RTE_Constraint_Input", "ITC_Constraint_Input", \
-                                         "Carbon_Adder_Incentive_Value_Input", "Other_Incentives_or_Penalities", "Emissions_Forecast_Signal_Input", \
-                                         "Annual_GHG_Emissions_Baseline", "Annual_GHG_Emissions_with_Solar_Only", "Annual_GHG_Emissions_with_Solar_and_Storage", \
-                                         "Annual_Customer_Bill_Baseline", "Annual_Customer_Bill_with_Solar_Only", "Annual_Customer_Bill_with_Solar_and_Storage", \
-                                         "Annual_Grid_Cost_Baseline", "Annual_Grid_Cost_with_Solar_Only", "Annual_Grid_Cost_with_Solar_and_Storage", \
-                                         "Annual_Equivalent_Storage_Cycles", "Annual_RTE", "Operational_Capacity_Factor", \
-                                         "Annual_Demand_Charge_Cost_Baseline", "Annual_Demand_Charge_Cost_with_Solar_Only", "Annual_Demand_Charge_Cost_with_Solar_and_Storage", \
-                                         "Annual_Energy_Charge_Cost_Baseline", "Annual_Energy_Charge_Cost_with_Solar_Only", "Annual_Energy_Charge_Cost_with_Solar_and_Storage", \
-                                         "Annual_Peak_Demand_Baseline", "Annual_Peak_Demand_with_Solar_Only", "Annual_Peak_Demand_with_Solar_and_Storage", \
-                                         "Annual_Total_Energy_Consumption_Baseline", "Annual_Total_Energy_Consumption_with_Solar_Only", "Annual_Total_Energy_Consumption_with_Solar_and_Storage", \
-                                         "Output_Summary_Filename", "Output_Description_Filename", "Output_Visualizations_Filename", \
-                                         "EV_Use", "EV_Charge", "EV_Gas_Savings", "EV_GHG_Savings"])
-
-    Storage_Dispatch_Outputs = np.array([t, P_ES]).transpose()
-    Storage_Dispatch_Outputs = pd.DataFrame(Storage_Dispatch_Outputs, columns = ["Date_Time_Pacific_No_DST", "Storage_Output_kW"])
+
+    ## Write Outputs to CSV
 
     if Export_Data == 1:
-        Model_Inputs_and_Outputs.to_csv(os.path.join(Output_Directory_Filepath, Output_Summary_Filename), index = False)
-        Storage_Dispatch_Outputs.to_csv(os.path.join(Output_Directory_Filepath, "Storage Dispatch Profile Output.csv"), index = False)
 
+        from Export_Model_Data import Export_Model_Data
+
+        Export_Model_Data(OSESMO_Results)
+
+        Record_Model_Run_Phase("Export Data")
+
+
+    ## Record Model Run Metrics
+
+    # Peak memory is the maximum resident set size of the Python process since it started,
+    # which may include earlier model runs in the same process. Worker process peak memory is
+    # the largest of any finished worker processes (ex. month solve workers). Peak memory is not available on Windows.
+
+    try:
+        import resource
+
+        # Linux reports the maximum resident set size in kB, and macOS reports it in bytes.
+        Maximum_Resident_Set_Size_Units = 1 if sys.platform == "darwin" else 1024
+
+        Peak_Memory_MB = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * Maximum_Resident_Set_Size_Units / (1024 ** 2)
+        Peak_Worker_Memory_MB = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * Maximum_Resident_Set_Size_Units / (1024 ** 2)
+
+    except ImportError:
+        Peak_Memory_MB = None
+        Peak_Worker_Memory_MB = None
+
+    OSESMO_Results["Model_Run_Metrics"].update({"Total_Time_Seconds": sum(Model_Run_Phase_Times.values()),
+                                                "Peak_Memory_MB": Peak_Memory_MB,
+                                                "Peak_Worker_Memory_MB": Peak_Worker_Memory_MB})
+
+    # If Model_Run_Metrics_Log_Filepath is provided, the model run metrics are appended to it as one line of JSON,
+    # so that the metrics of every model run in a scenario sweep are saved in the same log file.
+    # Each line is written in a single write, so that lines from model runs in other threads or processes aren't mixed.
+
+    if Model_Run_Metrics_Log_Filepath is not None:
+
+        import json
+
+        Model_Run_Metrics_Log_Line = json.dumps(dict(OSESMO_Results["Model_Run_Metrics"],
+                                                     Modeling_Team_Input = Modeling_Team_Input,
+                                                     Model_Inputs_and_Outputs = OSESMO_Results["Model_Inputs_and_Outputs"]),
+                                                default = lambda Metric_Value: Metric_Value.item() if isinstance(Metric_Value, np.generic) else repr(Metric_Value))
 
-    ## Return to OSESMO Git Repository Directory
+        with open(Model_Run_Metrics_Log_Filepath, "a") as Model_Run_Metrics_Log_File:
+            Model_Run_Metrics_Log_File.write(Model_Run_Metrics_Log_Line + "\n")
 
-    os.chdir(OSESMO_Git_Repo_Directory)
\ No newline at end of file
+    return OSESMO_Results
@@ -0,0 +1,49 @@
+def Preload_Scenario_Data(Scenario_Grid=None):
+
+    # Load Python Packages
+    from Import_Data_Catalog import Import_Data_Catalog
+    from Import_Resampled_Vector_Data import Import_Resampled_Vector_Data
+    from List_Scenario_Data_Vectors import List_Scenario_Data_Vectors
+
+    # This function looks up the input data vectors used by each model run in a scenario sweep in Data_Catalog.json,
+    # and loads each vector once, so that its source file is converted to the binary input data cache before worker processes start.
+    # Worker processes then load the cached files, instead of each parsing the same .csv files.
+
+    # Model runs with input names that are not listed in the catalog are skipped here,
+    # and reported as failed model runs by the worker process.
+
+    Data_Catalog = Import_Data_Catalog()
+
+    Scenario_Data_Vectors = []
+
+    for Scenario_Inputs in Scenario_Grid:
+
+        try:
+            Data_Vectors = List_Scenario_Data_Vectors(Scenario_Inputs, Data_Catalog)
+        except KeyError:
+            continue
+
+        for Data_Vector in Data_Vectors:
+
+            Scenario_Data_Vector = (Scenario_Inputs["Input_Output_Data_Directory_Location"],
+                                    Scenario_Inputs["Model_Timestep_Resolution"]) + Data_Vector
+
+            if Scenario_Data_Vector not in Scenario_Data_Vectors:
+                Scenario_Data_Vectors.append(Scenario_Data_Vector)
+
+
+    ## Load Input Data Vectors
+
+    for Scenario_Data_Vector in Scenario_Data_Vectors:
+
+        (Input_Output_Data_Directory_Location, Model_Timestep_Resolution,
+         Catalog_Section, Catalog_Entry_Name, Resampling_Method, Variable_Name) = Scenario_Data_Vector
+
+        try:
+            Import_Resampled_Vector_Data(Data_Catalog[Catalog_Section][Catalog_Entry_Name]["Files"],
+                                         Model_Timestep_Resolution / 60, Resampling_Method, Variable_Name,
+                                         Input_Output_Data_Directory_Location)
+        except (OSError, ValueError):
+            print("Could not load " + Catalog_Section.lower() + " input data for " + Catalog_Entry_Name + ".")
+
+    return Scenario_Data_Vectors
@@ -0,0 +1,82 @@
+def Read_Results_Store(Results_Store_Directory=None, Table_Name=None, Filters=None, Columns=None, Latest_Results_Only=None):
+
+    # Load Python Packages
+    import os
+
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError("The results store requires the pyarrow package. Install it using \"pip install pyarrow\".")
+
+    # This function reads model results from a results store written by Write_Results_Store,
+    # and returns them as a pandas DataFrame.
+
+    # Table_Name is "Summary" (default, one row per model run) or "Time_Series" (one row per model run timestep).
+
+    # Filters is a dictionary mapping column names to a value or a list of values to keep
+    # (ex. {"Load_Profile_Name_Input": "EnerNOC GreenButton San Francisco Office", "Model_Run_Number_Input": [1, 2, 3]}).
+    # Filters are applied while reading, so row groups and files that don't match are skipped.
+    # Columns is a list of the columns to read (default all columns).
+
+    # If a scenario (identified by its Scenario_ID) was written to the store more than once, only the results
+    # with the latest Results_Store_Write_Time are returned, unless Latest_Results_Only is False.
+    # The latest results are found in the summary table before Filters are applied, so that filtering by
+    # model run number never returns older results of a scenario that was later written with another run number.
+
+    if Table_Name is None:
+        Table_Name = "Summary"
+
+    if Table_Name not in ["Summary", "Time_Series"]:
+        raise ValueError("Results store table \"" + str(Table_Name) + "\" is not recognized. " +
+                         "Available tables are \"Summary\" and \"Time_Series\".")
+
+    if Filters is None:
+        Filters = {}
+
+    if Latest_Results_Only is None:
+        Latest_Results_Only = True
+
+    # Columns that were empty for every model run in a batch are saved with the null type (see Write_Results_Store.py),
+    # so the schemas of all files in a table are combined before reading.
+
+    def Open_Results_Store_Table(Results_Store_Table_Name):
+
+        Results_Store_Table_Directory = os.path.join(Results_Store_Directory, Results_Store_Table_Name)
+
+        Results_Store_Table_Schema = pa.unify_schemas([Fragment.physical_schema for Fragment in
+                                                       ds.dataset(Results_Store_Table_Directory, format = "parquet").get_fragments()])
+
+        return ds.dataset(Results_Store_Table_Directory, format = "parquet", schema = Results_Store_Table_Schema)
+
+    Results_Store_Dataset = Open_Results_Store_Table(Table_Name)
+
+    Filter_Expression = None
+
+    for Column_Name, Column_Values in Filters.items():
+
+        if not isinstance(Column_Values, (list, tuple, set)):
+            Column_Values = [Column_Values]
+
+        Column_Filter_Expression = ds.field(Column_Name).isin(list(Column_Values))
+
+        Filter_Expression = Column_Filter_Expression if Filter_Expression is None else Filter_Expression & Column_Filter_Expression
+
+    if not Latest_Results_Only:
+        return Results_Store_Dataset.to_table(columns = Columns, filter = Filter_Expression).to_pandas()
+
+
+    ## Latest Results
+
+    Results_Store_Writes = Open_Results_Store_Table("Summary").to_table(columns = ["Scenario_ID", "Results_Store_Write_Time"]).to_pandas()
+
+    Latest_Results_Store_Writes = Results_Store_Writes.groupby("Scenario_ID", as_index = False)["Results_Store_Write_Time"].max()
+
+    Read_Columns = None if Columns is None else list(Columns) + [Column_Name for Column_Name in ["Scenario_ID", "Results_Store_Write_Time"]
+                                                                  if Column_Name not in Columns]
+
+    Results_Store_Data = Results_Store_Dataset.to_table(columns = Read_Columns, filter = Filter_Expression).to_pandas()
+
+    Results_Store_Data = Results_Store_Data.merge(Latest_Results_Store_Writes, on = ["Scenario_ID", "Results_Store_Write_Time"])
+
+    return Results_Store_Data if Columns is None else Results_Store_Data[list(Columns)]
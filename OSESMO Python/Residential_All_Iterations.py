@@ -0,0 +1,132 @@
+## Script Description Header
+
+# File Name: Residential_All_Iterations.py
+# File Location: "~/Desktop/OSESMO Git Repository"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Iterates through all residential model runs, using a pool of worker processes.
+
+## Model Inputs - Setup Parameters and Run Options
+import datetime as dt
+
+# OSESMO Git Repository Directory Location
+OSESMO_Git_Repo_Directory = '/Users/Ryan/Library/Mobile Documents/com~apple~CloudDocs/Ryan\'s Stuff/2018/OSESMO/OSESMO Python'
+
+# Import/Output Data Directory Location
+Input_Output_Data_Directory_Location = '/Users/Ryan/Box Sync/GHG Signal Working Group'
+
+
+## Fixed Model Inputs
+
+Fixed_Inputs = {"Modeling_Team_Input": "Enel EnerNOC/SGIP Working Group",
+                "Model_Run_Number_Input": 0,  # Initialize value, gets updated every model run.
+                "Model_Timestep_Resolution": 15,
+                "Customer_Class_Input": "Residential",
+                "Parasitic_Storage_Load_Input": 0.003,
+                "OSESMO_Git_Repo_Directory": OSESMO_Git_Repo_Directory,
+                "Input_Output_Data_Directory_Location": Input_Output_Data_Directory_Location,
+                "Start_Time_Input": dt.datetime(2017, 1, 1, 0, 0),
+                "Show_Plots": 0,  # 0 == Don't show plots, 1 == show plots
+                "Export_Plots": 1,  # 0 = Don't export plots, 1 = export plots
+                "Export_Data": 1,  # 0 = Don't export data, 1 = export data
+                # 1 = reuse the results of previous model runs with the same inputs (see Memoize_Model_Run.py).
+                # Model runs that export plots are always re-run, so that the plots are drawn, and only memoize their results.
+                # Set Export_Plots to 0 to skip unchanged model runs when the sweep is re-run.
+                "Use_Model_Run_Memo": 0,
+                "Initial_Final_SOC": 0.3,
+                "End_of_Month_Padding_Days": 3}
+
+
+## Load Profile, Retail Rate, Solar, and Storage Size Inputs
+
+# Removed WattTime load profiles - too small, not representative of typical
+# solar or storage customers. Storage systems were oversized, weren't able
+# to meet 52-equivalent-cycling requirement.
+
+# 5 kW, 13.5 kWh is the most common SGIP residential storage size.
+
+Load_Profile_Inputs = {
+
+    "Custom Power Solar GreenButton PG&E Albany Residential with EV": {
+        "Solar_Profile_Name_Input": "CSI PG&E Residential",
+        "Retail_Rate_Name_Inputs": ["PG&E E-1 Tier 1", "PG&E E-1 Tier 1 SmartRate", "PG&E EV-A (NEW)"],
+        "Solar_Plus_Storage_Retail_Rate_Name_Inputs": ["SDG&E DR-SES"],  # Only sites with solar are eligible to go on DR-SES
+        "Storage_Power_Rating_Inputs": [5],
+        "Emissions_Forecast_Signal_Inputs": ["NP15 RT5M", "NP15 DA WattTime"]},
+
+    "Custom Power Solar GreenButton PG&E Crockett Residential with EV": {
+        "Solar_Profile_Name_Input": "CSI PG&E Residential",
+        "Retail_Rate_Name_Inputs": ["PG&E E-1 Tier 1", "PG&E E-1 Tier 1 SmartRate", "PG&E EV-A (NEW)"],
+        "Solar_Plus_Storage_Retail_Rate_Name_Inputs": ["SDG&E DR-SES"],
+        "Storage_Power_Rating_Inputs": [5],
+        "Emissions_Forecast_Signal_Inputs": ["NP15 RT5M", "NP15 DA WattTime"]},
+
+    "PG&E GreenButton Central Valley Residential Non-CARE": {
+        "Solar_Profile_Name_Input": "CSI PG&E Residential",
+        "Retail_Rate_Name_Inputs": ["PG&E E-1 Tier 3", "PG&E E-1 Tier 3 SmartRate", "PG&E EV-A (NEW)"],
+        "Solar_Plus_Storage_Retail_Rate_Name_Inputs": ["SDG&E DR-SES"],
+        "Storage_Power_Rating_Inputs": [5],
+        "Emissions_Forecast_Signal_Inputs": ["NP15 RT5M", "NP15 DA WattTime"]},
+
+    "PG&E GreenButton Central Valley Residential CARE": {
+        "Solar_Profile_Name_Input": "CSI PG&E Residential",
+        "Retail_Rate_Name_Inputs": ["PG&E E-1 Tier 3", "PG&E E-1 Tier 3 SmartRate", "PG&E EV-A (NEW)"],
+        "Solar_Plus_Storage_Retail_Rate_Name_Inputs": ["SDG&E DR-SES"],
+        "Storage_Power_Rating_Inputs": [5],
+        "Emissions_Forecast_Signal_Inputs": ["NP15 RT5M", "NP15 DA WattTime"]}}
+
+# Residential PV systems are sized to meet 80% of annual electricity consumption.
+Solar_Sizing_Fraction = 0.80
+
+Storage_Type_Inputs = {
+
+    # Most common SGIP duration for residential lithium-ion.
+    "Lithium-Ion Battery": {"Storage_Duration": 2.7, "Single_Cycle_RTE_Inputs": [0.7, 0.85]},
+
+    # Flow batteries typically have longer duration.
+    "Flow Battery": {"Storage_Duration": 3, "Single_Cycle_RTE_Inputs": [0.7]}}
+
+
+## Storage Control Algorithm and GHG Reduction Solution Inputs
+
+# Use Non-Economic Solar Self-Supply for E-1 (including E-1 with SmartRate) if Solar Plus Storage
+Self_Supply_Retail_Rate_Name_Inputs = ["PG&E E-1 Tier 1", "PG&E E-1 Tier 1 SmartRate", "PG&E E-1 Tier 3", "PG&E E-1 Tier 3 SmartRate"]
+
+GHG_Reduction_Solution_Inputs = ["No GHG Reduction Solution", "GHG Signal Co-Optimization",
+                                 "No-Charging Time Constraint", "Charging and Discharging Time Constraints"]
+
+# Carbon adder values used for GHG Signal Co-Optimization only ($ per metric ton).
+Carbon_Adder_Incentive_Value_Inputs = [1, 15, 65]
+
+# Reduced cycling and RTE constraint iterations to reduce modeling runtime.
+Equivalent_Cycling_Constraint_Inputs = [0]  # [0, 52, 130]
+
+Annual_RTE_Constraint_Inputs = [0]  # [0, 1]
+
+
+## Scenario Sweep Options
+
+# Number of worker processes (None = number of CPUs).
+Max_Workers = None
+
+# Number of BLAS/LAPACK threads used by each worker process.
+BLAS_Threads_per_Worker = 1
+
+# Model run status log, saved as a .csv file (None = don't save log).
+Sweep_Log_Filename = "Residential_All_Iterations_Log.csv"
+
+
+## Run Scenario Sweep
+
+# Worker processes import this file on some operating systems, so the sweep is only run from the main process.
+
+if __name__ == "__main__":
+
+    from Build_Scenario_Grid import Build_Scenario_Grid
+    from Run_Scenario_Sweep import Run_Scenario_Sweep
+
+    Scenario_Grid = Build_Scenario_Grid(Fixed_Inputs, Load_Profile_Inputs, ["Storage Only", "Solar Plus Storage"],
+                                        Solar_Sizing_Fraction, Storage_Type_Inputs, Self_Supply_Retail_Rate_Name_Inputs,
+                                        GHG_Reduction_Solution_Inputs, Carbon_Adder_Incentive_Value_Inputs,
+                                        Equivalent_Cycling_Constraint_Inputs, Annual_RTE_Constraint_Inputs)
+
+    Run_Scenario_Sweep(Scenario_Grid, Max_Workers, BLAS_Threads_per_Worker, Sweep_Log_Filename)
@@ -0,0 +1,133 @@
+def Run_Scenario_Sweep(Scenario_Grid=None, Max_Workers=None, BLAS_Threads_per_Worker=None,
+                       Sweep_Log_Filename=None, Show_Model_Output=None,
+                       Results_Store_Directory=None, Results_Store_Batch_Size=None):
+
+    # Load Python Packages
+    import os
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+    from Run_Sweep_Scenario import Run_Sweep_Scenario
+    from Preload_Scenario_Data import Preload_Scenario_Data
+    from Scenario_Sweep_Progress import Start_Scenario_Sweep_Progress, Record_Scenario_Sweep_Progress, Finish_Scenario_Sweep_Progress
+
+    # This function runs a scenario sweep (a list of OSESMO keyword argument dictionaries, such as the list
+    # returned by Build_Scenario_Grid) across a pool of worker processes, replacing the MATLAB *_Iterations.m scripts.
+
+    # Each worker runs one model run at a time. The number of threads used by numerical libraries (BLAS/LAPACK)
+    # in each worker is limited to BLAS_Threads_per_Worker (1 by default), so that workers don't compete for CPU cores.
+
+    # Model runs that raise an error are recorded as failed, and the sweep continues.
+    # If a worker process dies (ex. out of memory), the pool is restarted and unfinished model runs are resubmitted,
+    # up to Maximum_Pool_Restarts times.
+
+    # If Results_Store_Directory is provided, the summary and time series results of each successful model run
+    # are appended to a results store in that directory (see Write_Results_Store), in batches of
+    # Results_Store_Batch_Size model runs (50 by default). Use Read_Results_Store to read them.
+
+    # Run_Threaded_Scenario_Sweep runs the same sweep on threads in the current process instead.
+
+    # The function returns a list of model run records (status, error message, runtime, and annual model outputs),
+    # which is also saved to Sweep_Log_Filename as a .csv file if a filename is provided.
+
+    if Max_Workers is None:
+        Max_Workers = os.cpu_count() or 1
+
+    if BLAS_Threads_per_Worker is None:
+        BLAS_Threads_per_Worker = 1
+
+    Maximum_Pool_Restarts = 2
+
+    Number_of_Model_Runs = len(Scenario_Grid)
+
+
+    ## Preload Input Data
+
+    # Input data vectors used by the sweep are converted to the binary input data cache once, before worker processes start.
+
+    Scenario_Data_Vectors = Preload_Scenario_Data(Scenario_Grid)
+
+    print("Loaded " + str(len(Scenario_Data_Vectors)) + " input data vectors.")
+
+
+    ## Pin Worker BLAS Threads
+
+    # Worker processes are started using "spawn", so they import numpy after inheriting these environment variables.
+    # The parent process environment is restored once the sweep is complete.
+
+    BLAS_Thread_Variables = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+                             "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"]
+
+    Original_BLAS_Thread_Settings = {Variable: os.environ.get(Variable) for Variable in BLAS_Thread_Variables}
+
+    for Variable in BLAS_Thread_Variables:
+        os.environ[Variable] = str(BLAS_Threads_per_Worker)
+
+    Pool_Context = multiprocessing.get_context("spawn")
+
+
+    ## Run Scenario Sweep
+
+    Pending_Scenario_Indices = list(range(Number_of_Model_Runs))
+    Pool_Restarts = 0
+
+    Sweep_Progress = Start_Scenario_Sweep_Progress(Number_of_Model_Runs, Results_Store_Directory, Results_Store_Batch_Size)
+
+    print("Running " + str(Number_of_Model_Runs) + " model runs on " + str(Max_Workers) + " worker processes.")
+
+    try:
+
+        while len(Pending_Scenario_Indices) > 0:
+
+            try:
+
+                with ProcessPoolExecutor(max_workers = Max_Workers, mp_context = Pool_Context) as Executor:
+
+                    Future_Scenario_Indices = {Executor.submit(Run_Sweep_Scenario, Scenario_Grid[Scenario_Index],
+                                                               Show_Model_Output, Results_Store_Directory is not None): Scenario_Index
+                                               for Scenario_Index in Pending_Scenario_Indices}
+
+                    for Future in as_completed(Future_Scenario_Indices):
+
+                        Scenario_Index = Future_Scenario_Indices[Future]
+
+                        Record_Scenario_Sweep_Progress(Sweep_Progress, Scenario_Index, Future.result())
+
+                        Pending_Scenario_Indices.remove(Scenario_Index)
+
+            except BrokenProcessPool:
+
+                Pool_Restarts = Pool_Restarts + 1
+
+                if Pool_Restarts > Maximum_Pool_Restarts:
+
+                    print("Worker process pool stopped unexpectedly. " + str(len(Pending_Scenario_Indices)) +
+                          " unfinished model runs have been recorded as failed.")
+
+                    for Scenario_Index in Pending_Scenario_Indices:
+                        Scenario_Inputs = Scenario_Grid[Scenario_Index]
+                        Sweep_Progress["Scenario_Records"][Scenario_Index] = {
+                            "Model_Run_Number_Input": Scenario_Inputs.get("Model_Run_Number_Input"),
+                            "Model_Type_Input": Scenario_Inputs.get("Model_Type_Input"),
+                            "Load_Profile_Name_Input": Scenario_Inputs.get("Load_Profile_Name_Input"),
+                            "Retail_Rate_Name_Input": Scenario_Inputs.get("Retail_Rate_Name_Input"),
+                            "Status": "Failed",
+                            "Error": "Worker process stopped unexpectedly.",
+                            "Traceback": ""}
+
+                    Pending_Scenario_Indices = []
+
+                else:
+
+                    print("Worker process pool stopped unexpectedly. Restarting pool and resubmitting " +
+                          str(len(Pending_Scenario_Indices)) + " unfinished model runs.")
+
+    finally:
+
+        for Variable, Value in Original_BLAS_Thread_Settings.items():
+            if Value is None:
+                os.environ.pop(Variable, None)
+            else:
+                os.environ[Variable] = Value
+
+    return Finish_Scenario_Sweep_Progress(Sweep_Progress, Sweep_Log_Filename)
@@ -0,0 +1,85 @@
+def Run_Sweep_Scenario(Scenario_Inputs=None, Show_Model_Output=None, Return_Model_Results=None):
+
+    # Load Python Packages
+    import contextlib
+    import io
+    import json
+    import os
+    import threading
+    import time
+    import traceback
+    from OSESMO import OSESMO
+
+    # This function runs a single OSESMO model run from a scenario sweep, inside a worker process or thread.
+    # It is kept in its own module, so that it can be sent to worker processes by Run_Scenario_Sweep.
+
+    # The model run record contains the scenario inputs, scenario ID (of successful model runs), status, runtime,
+    # and annual model outputs.
+    # Errors raised by the model run are caught and returned in the model run record,
+    # so that one failed model run does not stop the rest of the sweep. If no optimal solution was found
+    # for a linear program (LP_Solver_Failure), its solver failure record is saved in the model run record
+    # as a JSON string, in "Solver_Failure_Record".
+
+    # If Return_Model_Results is True, the model results dictionary returned by OSESMO is also included
+    # in the record of a successful model run, as "Model_Results", to be saved to a results store by the sweep.
+
+    if Show_Model_Output is None:
+        Show_Model_Output = False
+
+    if Return_Model_Results is None:
+        Return_Model_Results = False
+
+    Scenario_Record = {"Model_Run_Number_Input": Scenario_Inputs.get("Model_Run_Number_Input"),
+                       "Scenario_ID": "",
+                       "Model_Type_Input": Scenario_Inputs.get("Model_Type_Input"),
+                       "Load_Profile_Name_Input": Scenario_Inputs.get("Load_Profile_Name_Input"),
+                       "Retail_Rate_Name_Input": Scenario_Inputs.get("Retail_Rate_Name_Input"),
+                       "Solar_Size_Input": Scenario_Inputs.get("Solar_Size_Input"),
+                       "Storage_Type_Input": Scenario_Inputs.get("Storage_Type_Input"),
+                       "Storage_Power_Rating_Input": Scenario_Inputs.get("Storage_Power_Rating_Input"),
+                       "Usable_Storage_Capacity_Input": Scenario_Inputs.get("Usable_Storage_Capacity_Input"),
+                       "Single_Cycle_RTE_Input": Scenario_Inputs.get("Single_Cycle_RTE_Input"),
+                       "GHG_Reduction_Solution_Input": Scenario_Inputs.get("GHG_Reduction_Solution_Input"),
+                       "Carbon_Adder_Incentive_Value_Input": Scenario_Inputs.get("Carbon_Adder_Incentive_Value_Input"),
+                       "Emissions_Forecast_Signal_Input": Scenario_Inputs.get("Emissions_Forecast_Signal_Input"),
+                       "Status": "Succeeded",
+                       "Error": "",
+                       "Traceback": "",
+                       "Solver_Failure_Record": "",
+                       "Worker_Process_ID": os.getpid(),
+                       "Worker_Thread_Name": threading.current_thread().name}
+
+    Run_Start_Time = time.time()
+
+    try:
+
+        if Show_Model_Output:
+            OSESMO_Results = OSESMO(**Scenario_Inputs)
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):
+                OSESMO_Results = OSESMO(**Scenario_Inputs)
+
+        Scenario_Record["Scenario_ID"] = OSESMO_Results["Scenario_ID"]
+
+        # Annual model outputs are added to the record, so that model runs can be compared
+        # without reading each model run's output summary file.
+        for Output_Name, Output_Value in OSESMO_Results["Model_Inputs_and_Outputs"].items():
+            if (Output_Name.startswith("Annual_") and not Output_Name.endswith("_Input")) or \
+                    Output_Name == "Operational_Capacity_Factor":
+                Scenario_Record[Output_Name] = Output_Value
+
+        if Return_Model_Results:
+            Scenario_Record["Model_Results"] = OSESMO_Results
+
+    except Exception as Model_Run_Error:
+
+        Scenario_Record["Status"] = "Failed"
+        Scenario_Record["Error"] = repr(Model_Run_Error)
+        Scenario_Record["Traceback"] = traceback.format_exc()
+
+        if getattr(Model_Run_Error, "Solver_Failure_Record", None) is not None:
+            Scenario_Record["Solver_Failure_Record"] = json.dumps(Model_Run_Error.Solver_Failure_Record, default = repr)
+
+    Scenario_Record["Runtime_Seconds"] = time.time() - Run_Start_Time
+
+    return Scenario_Record
@@ -0,0 +1,96 @@
+def Run_Threaded_Scenario_Sweep(Scenario_Grid=None, Max_Threads=None, Sweep_Log_Filename=None, Show_Model_Output=None,
+                                Results_Store_Directory=None, Results_Store_Batch_Size=None):
+
+    # Load Python Packages
+    import contextlib
+    import os
+    import sys
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from Run_Sweep_Scenario import Run_Sweep_Scenario
+    from Preload_Scenario_Data import Preload_Scenario_Data
+    from Scenario_Sweep_Progress import Start_Scenario_Sweep_Progress, Record_Scenario_Sweep_Progress, Finish_Scenario_Sweep_Progress
+
+    # This function runs a scenario sweep (a list of OSESMO keyword argument dictionaries, such as the list
+    # returned by Build_Scenario_Grid) across a pool of threads in the current Python process.
+
+    # OSESMO reads input data using absolute paths built from Input_Output_Data_Directory_Location,
+    # and never changes the working directory, so several model runs can share one Python process.
+    # Model runs overlap while one of them is reading input data, writing outputs, or solving a linear program
+    # in code that releases the GIL (NumPy and BLAS operations, and the HiGHS solver).
+    # Input data vectors, tariff vectors, constraint templates, and KKT symbolic analyses are shared between threads,
+    # so threads use less memory than the worker processes of Run_Scenario_Sweep, but CPU-bound Python code
+    # (ex. most of the cvxopt interior-point loop) does not run in parallel. For large cvxopt sweeps, use Run_Scenario_Sweep.
+
+    # pyplot keeps the current figure in global state, so model runs that export plots are run one at a time.
+    # Plots cannot be shown from a thread, so model runs with Show_Plots = 1 are not supported.
+    # Model runs using the "Fixed Boundary" or "Speculative" month solve modes start their own worker processes,
+    # and should be run using Run_Scenario_Sweep instead.
+
+    # Model output printed by OSESMO is discarded during the sweep unless Show_Model_Output is True,
+    # in which case output from different model runs is interleaved.
+
+    # If Results_Store_Directory is provided, the summary and time series results of each successful model run
+    # are appended to a results store in that directory (see Write_Results_Store), in batches of
+    # Results_Store_Batch_Size model runs (50 by default).
+
+    # The function returns a list of model run records (status, error message, runtime, and annual model outputs),
+    # which is also saved to Sweep_Log_Filename as a .csv file if a filename is provided.
+
+    if Max_Threads is None:
+        Max_Threads = os.cpu_count() or 1
+
+    if Show_Model_Output is None:
+        Show_Model_Output = False
+
+    Number_of_Model_Runs = len(Scenario_Grid)
+
+    for Scenario_Inputs in Scenario_Grid:
+        if Scenario_Inputs.get("Show_Plots") == 1:
+            raise ValueError("Model Run " + str(Scenario_Inputs.get("Model_Run_Number_Input")) + " has Show_Plots = 1. " +
+                             "Plots cannot be shown from threaded model runs. Set Show_Plots to 0, or use Run_Scenario_Sweep.")
+
+
+    ## Preload Input Data
+
+    Scenario_Data_Vectors = Preload_Scenario_Data(Scenario_Grid)
+
+    print("Loaded " + str(len(Scenario_Data_Vectors)) + " input data vectors.")
+
+
+    ## Run Scenario Sweep
+
+    Plot_Export_Lock = threading.Lock()
+
+    def Run_Threaded_Scenario(Scenario_Inputs):
+
+        if Scenario_Inputs.get("Export_Plots") == 1:
+            with Plot_Export_Lock:
+                return Run_Sweep_Scenario(Scenario_Inputs, True, Results_Store_Directory is not None)
+        else:
+            return Run_Sweep_Scenario(Scenario_Inputs, True, Results_Store_Directory is not None)
+
+    # Progress messages are printed to the console even while model output is discarded.
+    Console = sys.stdout
+
+    Sweep_Progress = Start_Scenario_Sweep_Progress(Number_of_Model_Runs, Results_Store_Directory, Results_Store_Batch_Size)
+
+    print("Running " + str(Number_of_Model_Runs) + " model runs on " + str(Max_Threads) + " threads.")
+
+    with contextlib.ExitStack() as Model_Output_Context:
+
+        # sys.stdout is shared by all threads, so model output is redirected once for the whole sweep,
+        # rather than separately for each model run.
+        if not Show_Model_Output:
+            Model_Output_Context.enter_context(contextlib.redirect_stdout(Model_Output_Context.enter_context(open(os.devnull, "w"))))
+
+        with ThreadPoolExecutor(max_workers = Max_Threads, thread_name_prefix = "OSESMO") as Executor:
+
+            Future_Scenario_Indices = {Executor.submit(Run_Threaded_Scenario, Scenario_Grid[Scenario_Index]): Scenario_Index
+                                       for Scenario_Index in range(Number_of_Model_Runs)}
+
+            for Future in as_completed(Future_Scenario_Indices):
+
+                Record_Scenario_Sweep_Progress(Sweep_Progress, Future_Scenario_Indices[Future], Future.result(), Console)
+
+    return Finish_Scenario_Sweep_Progress(Sweep_Progress, Sweep_Log_Filename)
@@ -0,0 +1,103 @@
+## Scenario Sweep Progress
+
+# These functions keep track of a scenario sweep's completed model runs. They are shared by
+# Run_Scenario_Sweep (worker processes) and Run_Threaded_Scenario_Sweep (threads).
+# The sweep progress is a dictionary created by Start_Scenario_Sweep_Progress. Each completed model run record
+# is passed to Record_Scenario_Sweep_Progress, and Finish_Scenario_Sweep_Progress returns the list of records.
+
+
+def Start_Scenario_Sweep_Progress(Number_of_Model_Runs=None, Results_Store_Directory=None, Results_Store_Batch_Size=None):
+
+    # Load Python Packages
+    import time
+
+    # Results of successful model runs are appended to the results store in Results_Store_Directory (if provided)
+    # in batches of Results_Store_Batch_Size model runs (50 by default).
+
+    if Results_Store_Batch_Size is None:
+        Results_Store_Batch_Size = 50
+
+    return {"Number_of_Model_Runs": Number_of_Model_Runs,
+            "Results_Store_Directory": Results_Store_Directory,
+            "Results_Store_Batch_Size": Results_Store_Batch_Size,
+            "Scenario_Records": {},
+            "Results_Store_Batch": [],
+            "Sweep_Start_Time": time.time()}
+
+
+def Record_Scenario_Sweep_Progress(Sweep_Progress=None, Scenario_Index=None, Scenario_Record=None, Console=None):
+
+    # Load Python Packages
+    import sys
+    import time
+    from Write_Results_Store import Write_Results_Store
+
+    # Saves a completed model run record, adds its model results (if returned) to the results store batch,
+    # and prints a progress message to Console (default: sys.stdout).
+
+    if Console is None:
+        Console = sys.stdout
+
+    Sweep_Progress["Scenario_Records"][Scenario_Index] = Scenario_Record
+
+
+    ## Results Store
+
+    if "Model_Results" in Scenario_Record:
+        Sweep_Progress["Results_Store_Batch"].append(Scenario_Record.pop("Model_Results"))
+
+    if len(Sweep_Progress["Results_Store_Batch"]) >= Sweep_Progress["Results_Store_Batch_Size"]:
+        Write_Results_Store(Sweep_Progress["Results_Store_Directory"], Sweep_Progress["Results_Store_Batch"])
+        Sweep_Progress["Results_Store_Batch"] = []
+
+
+    ## Progress Reporting
+
+    Number_of_Model_Runs = Sweep_Progress["Number_of_Model_Runs"]
+    Completed_Model_Runs = len(Sweep_Progress["Scenario_Records"])
+    Elapsed_Time = time.time() - Sweep_Progress["Sweep_Start_Time"]
+    Estimated_Time_Remaining = Elapsed_Time / Completed_Model_Runs * (Number_of_Model_Runs - Completed_Model_Runs)
+
+    Progress_Message = "Model Run " + str(Scenario_Record["Model_Run_Number_Input"]) + " " + \
+                       Scenario_Record["Status"].lower() + " (" + str(Completed_Model_Runs) + "/" + \
+                       str(Number_of_Model_Runs) + " complete, " + str(round(Elapsed_Time)) + \
+                       " s elapsed, " + str(round(Estimated_Time_Remaining)) + " s remaining)."
+
+    if Scenario_Record["Status"] == "Failed":
+        Progress_Message = Progress_Message + " " + Scenario_Record["Error"]
+
+    print(Progress_Message, file = Console)
+
+
+def Finish_Scenario_Sweep_Progress(Sweep_Progress=None, Sweep_Log_Filename=None):
+
+    # Load Python Packages
+    import time
+    import pandas as pd
+    from Write_Results_Store import Write_Results_Store
+
+    # Writes the last results store batch, prints the sweep summary, and saves the model run records
+    # to Sweep_Log_Filename as a .csv file if a filename is provided.
+    # Returns the list of model run records, in scenario grid order.
+
+    if len(Sweep_Progress["Results_Store_Batch"]) > 0:
+        Write_Results_Store(Sweep_Progress["Results_Store_Directory"], Sweep_Progress["Results_Store_Batch"])
+        Sweep_Progress["Results_Store_Batch"] = []
+
+
+    ## Sweep Summary
+
+    Number_of_Model_Runs = Sweep_Progress["Number_of_Model_Runs"]
+
+    Scenario_Records = [Sweep_Progress["Scenario_Records"][Scenario_Index] for Scenario_Index in range(Number_of_Model_Runs)]
+
+    Number_of_Failed_Model_Runs = sum(Scenario_Record["Status"] == "Failed" for Scenario_Record in Scenario_Records)
+
+    print("Scenario sweep complete in " + str(round(time.time() - Sweep_Progress["Sweep_Start_Time"])) + " s. " +
+          str(Number_of_Model_Runs - Number_of_Failed_Model_Runs) + " model runs succeeded, " +
+          str(Number_of_Failed_Model_Runs) + " model runs failed.")
+
+    if Sweep_Log_Filename is not None:
+        pd.DataFrame(Scenario_Records).to_csv(Sweep_Log_Filename, index = False)
+
+    return Scenario_Records
@@ -0,0 +1,33 @@
+def Shift_LP_Warm_Start(Previous_x_Month=None, Previous_numtsteps=None, Previous_numtsteps_unpadded=None,
+                        numtsteps=None, delta_t=None):
+
+    # Load Python Packages
+    import numpy as np
+
+    # This function shifts the solution of the previous month's linear program forward in time,
+    # to be used as a starting point for the current month's linear program.
+
+    # The previous month's padding days cover the first days of the current month,
+    # so the previous solution for those timesteps is used directly.
+    # For the rest of the current month, the previous solution from whole weeks earlier is used,
+    # so that weekday and weekend timesteps line up.
+    # The demand charge decision variables are copied from the previous month.
+
+    Timesteps_per_Week = int(round(7 * 24 * (1 / delta_t)))
+
+    Previous_Indices = Previous_numtsteps_unpadded + np.arange(0, numtsteps)
+
+    Weeks_Shifted = np.ceil(np.maximum(Previous_Indices - Previous_numtsteps + 1, 0) / Timesteps_per_Week).astype(int)
+
+    Previous_Indices = np.maximum(Previous_Indices - (Weeks_Shifted * Timesteps_per_Week), 0)
+
+    Previous_x_Month = np.asarray(Previous_x_Month).flatten()
+
+    P_ES_in_Shifted = Previous_x_Month[0:Previous_numtsteps][Previous_Indices]
+    P_ES_out_Shifted = Previous_x_Month[Previous_numtsteps:(2 * Previous_numtsteps)][Previous_Indices]
+    Ene_Lvl_Shifted = Previous_x_Month[(2 * Previous_numtsteps):(3 * Previous_numtsteps)][Previous_Indices]
+
+    x_Shifted = np.concatenate((P_ES_in_Shifted, P_ES_out_Shifted, Ene_Lvl_Shifted,
+                                Previous_x_Month[(3 * Previous_numtsteps):(3 * Previous_numtsteps + 3)]))
+
+    return {"x": x_Shifted}
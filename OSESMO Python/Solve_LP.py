@@ -0,0 +1,397 @@
+## LP Warm Start Cache
+
+# Solutions of previously-solved linear programs, which can be used as warm starts for
+# neighbouring scenarios (ex. the same month of a model run with the same load profile and rate,
+# but a slightly different storage power rating or carbon adder value).
+# Keys are chosen by the caller, and should identify the month and the size of the linear program.
+
+from LRU_Cache import LRU_Cache
+
+# Maximum number of warm starts stored in the cache (see LRU_Cache.py).
+LP_Warm_Start_Cache_Size = 256
+
+LP_Warm_Start_Cache = LRU_Cache(LP_Warm_Start_Cache_Size)
+
+
+## Solver Option Error
+
+# Raised by Solve_LP when a solver option is not recognized by the solver backend, or has an invalid value,
+# so that the option isn't silently ignored. Solve_LP_with_Fallback reports it instead of trying fallback steps.
+
+class Solver_Option_Error(ValueError):
+    pass
+
+
+def Solve_LP(c=None, G=None, h=None, A=None, b=None, Lower_Bounds=None, Upper_Bounds=None,
+             Solver_Backend=None, Solver_Options=None, Warm_Start=None):
+
+    # Load Python Packages
+    import numpy as np
+
+    # This function solves the linear program
+
+    # minimize c' * x
+    # subject to G * x <= h, A * x = b, Lower_Bounds <= x <= Upper_Bounds
+
+    # using the selected solver backend. The constraint matrices G and A are cvxopt sparse matrices,
+    # and the remaining inputs are NumPy arrays. Infinite bounds indicate that a variable is unbounded.
+
+    # Available solver backends:
+    #  * "cvxopt" - cvxopt.solvers.lp interior-point solver, using a structured KKT solver.
+    #    Solver options are passed to cvxopt (ex. "abstol", "reltol", "feastol", "maxiters").
+    #    The "kktsolver" option selects "banded" (default, see Banded_KKT_Solver.py)
+    #    or "sparse" (see Sparse_KKT_Solver.py).
+    #  * "HiGHS" - HiGHS solver, called through the highspy package if it is installed,
+    #    or through scipy.optimize.linprog otherwise. Solver options use the scipy.optimize.linprog names
+    #    (ex. "presolve", "time_limit", "primal_feasibility_tolerance", "dual_feasibility_tolerance").
+    #    The HiGHS algorithm can be selected using the "method" option: "highs" (default), "highs-ds"
+    #    (dual simplex), or "highs-ipm" (interior point). When highspy is installed, other HiGHS option names
+    #    (ex. "simplex_strategy") are passed to HiGHS directly.
+    #    Unrecognized HiGHS options and invalid option values raise a Solver_Option_Error (a ValueError).
+
+    # Warm_Start is the "warm_start" entry of a previous solution returned by this function,
+    # or a dictionary containing only a starting point "x" (ex. a solution shifted from the previous month).
+    # The cvxopt backend uses it as the primal (and dual, if available) starting point of the interior-point method.
+    # The HiGHS backend reuses the simplex basis if available, or otherwise passes "x" to HiGHS as a starting solution.
+    # Warm starts that don't match the size of the linear program are ignored.
+    # Warm starts are not supported when HiGHS is called through scipy.optimize.linprog.
+
+    # The solution is returned as a dictionary containing the optimal decision variable values "x"
+    # (a 1-D NumPy array), the solver "status" ("optimal" if an optimal solution was found),
+    # the "objective" value, the number of "iterations", the "solver_backend" used,
+    # and a "warm_start" that can be used to solve a similar linear program.
+    # It also contains the size of the linear program ("rows" and "nonzeros" of the constraint matrices G and A,
+    # and "columns"), and the "relative_gap", "primal_infeasibility", and "dual_infeasibility" reported by the solver
+    # (None if the solver backend doesn't report them).
+
+    if Solver_Backend is None:
+        Solver_Backend = "cvxopt"
+
+    if Solver_Options is None:
+        Solver_Options = {}
+
+    if Warm_Start is None:
+        Warm_Start = {}
+
+    c = np.asarray(c, dtype = float).flatten()
+    h = np.asarray(h, dtype = float).flatten()
+    b = np.asarray(b, dtype = float).flatten()
+
+    length_x = len(c)
+
+    if Lower_Bounds is None:
+        Lower_Bounds = np.full((length_x,), -np.inf)
+
+    if Upper_Bounds is None:
+        Upper_Bounds = np.full((length_x,), np.inf)
+
+    if Warm_Start.get("x") is not None and len(Warm_Start["x"]) == length_x:
+        Warm_Start_x = np.asarray(Warm_Start["x"], dtype = float)
+    else:
+        Warm_Start_x = None
+
+
+    if Solver_Backend == "cvxopt":
+
+        from cvxopt import matrix, spmatrix, sparse, solvers
+        from Sparse_KKT_Solver import Sparse_KKT_Solver
+        from Banded_KKT_Solver import Banded_KKT_Solver
+
+        # cvxopt does not support variable bounds directly, so finite bounds are added
+        # as inequality constraint rows: -x <= -Lower_Bounds, x <= Upper_Bounds.
+
+        Lower_Bound_Indices = np.flatnonzero(np.isfinite(Lower_Bounds))
+        Upper_Bound_Indices = np.flatnonzero(np.isfinite(Upper_Bounds))
+
+        G_Bounds = spmatrix(np.concatenate((-np.ones(len(Lower_Bound_Indices)), np.ones(len(Upper_Bound_Indices)))),
+                            np.arange(0, len(Lower_Bound_Indices) + len(Upper_Bound_Indices)),
+                            np.concatenate((Lower_Bound_Indices, Upper_Bound_Indices)),
+                            (len(Lower_Bound_Indices) + len(Upper_Bound_Indices), length_x), tc = 'd')
+
+        G_cvxopt = sparse([G, G_Bounds], tc = 'd')
+
+        h_cvxopt = matrix(np.concatenate((h, -Lower_Bounds[Lower_Bound_Indices], Upper_Bounds[Upper_Bound_Indices])), tc = 'd')
+
+        # Warm Start
+        # The interior-point method must start with strictly positive slack (s) and dual (z) variables.
+        # A previous optimal solution lies on the boundary of the feasible region, where many of these are zero,
+        # so they are moved into the interior before being used as a starting point.
+        # If no slack variables are available, they are calculated from the starting point x.
+
+        Warm_Start_Centering = 10.
+
+        primalstart = None
+        dualstart = None
+
+        if Warm_Start_x is not None:
+
+            if Warm_Start.get("s") is not None and len(Warm_Start["s"]) == G_cvxopt.size[0]:
+                Warm_Start_s = np.asarray(Warm_Start["s"], dtype = float)
+            else:
+                Warm_Start_s = np.array(h_cvxopt - G_cvxopt * matrix(Warm_Start_x, tc = 'd')).flatten()
+
+            primalstart = {"x": matrix(Warm_Start_x, tc = 'd'),
+                           "s": matrix(np.maximum(Warm_Start_s, Warm_Start_Centering), tc = 'd')}
+
+            if Warm_Start.get("z") is not None and len(Warm_Start["z"]) == G_cvxopt.size[0] and \
+                    Warm_Start.get("y") is not None and len(Warm_Start["y"]) == A.size[0]:
+
+                dualstart = {"y": matrix(np.asarray(Warm_Start["y"], dtype = float), tc = 'd'),
+                             "z": matrix(np.maximum(np.asarray(Warm_Start["z"], dtype = float), Warm_Start_Centering), tc = 'd')}
+
+        # The equality constraints are handled using a structured KKT solver,
+        # because cvxopt's default KKT solver is very slow for large numbers of equality constraints.
+
+        # Solver options are passed for this solve only, rather than by modifying
+        # the global cvxopt.solvers.options dictionary.
+
+        cvxopt_Options = dict(solvers.options)
+        cvxopt_Options.update(Solver_Options)
+
+        KKT_Solver_Name = cvxopt_Options.pop("kktsolver", "banded")
+
+        if KKT_Solver_Name == "sparse":
+            KKT_Solver = Sparse_KKT_Solver(G_cvxopt, A)
+        else:
+            KKT_Solver = Banded_KKT_Solver(G_cvxopt, A)
+
+        lp_solution = solvers.lp(matrix(c, tc = 'd'), G_cvxopt, h_cvxopt, A, matrix(b, tc = 'd'),
+                                 kktsolver = KKT_Solver, options = cvxopt_Options,
+                                 primalstart = primalstart, dualstart = dualstart)
+
+        if lp_solution['x'] is None:
+            x = None
+            LP_Warm_Start = None
+        else:
+            x = np.array(lp_solution['x']).flatten()
+            LP_Warm_Start = {"x": x,
+                             "s": np.array(lp_solution['s']).flatten(),
+                             "y": np.array(lp_solution['y']).flatten(),
+                             "z": np.array(lp_solution['z']).flatten()}
+
+        LP_Solution = {"x": x,
+                       "status": lp_solution['status'],
+                       "objective": lp_solution['primal objective'],
+                       "iterations": lp_solution['iterations'],
+                       "relative_gap": lp_solution['relative gap'],
+                       "primal_infeasibility": lp_solution['primal infeasibility'],
+                       "dual_infeasibility": lp_solution['dual infeasibility'],
+                       "solver_backend": Solver_Backend,
+                       "warm_start": LP_Warm_Start}
+
+    elif Solver_Backend == "HiGHS":
+
+        HiGHS_Options = dict(Solver_Options)
+        HiGHS_Method = HiGHS_Options.pop("method", "highs")
+
+        HiGHS_Method_Names = ["highs", "highs-ds", "highs-ipm"]
+
+        if HiGHS_Method not in HiGHS_Method_Names:
+            raise Solver_Option_Error("HiGHS method \"" + str(HiGHS_Method) + "\" is not recognized. " +
+                                      "Available HiGHS methods are \"highs\", \"highs-ds\", and \"highs-ipm\".")
+
+        try:
+            import highspy
+        except ImportError:
+            highspy = None
+
+        if highspy is not None:
+
+            from cvxopt import sparse
+
+            # The inequality and equality constraints are passed to HiGHS as a single
+            # constraint matrix with row bounds: -inf <= G * x <= h, b <= A * x <= b.
+
+            Constraint_Matrix = sparse([G, A], tc = 'd')
+
+            Column_Pointers, Row_Indices, Values = Constraint_Matrix.CCS
+
+            HiGHS_LP = highspy.HighsLp()
+            HiGHS_LP.num_col_ = length_x
+            HiGHS_LP.num_row_ = Constraint_Matrix.size[0]
+            HiGHS_LP.col_cost_ = c
+            HiGHS_LP.col_lower_ = Lower_Bounds
+            HiGHS_LP.col_upper_ = Upper_Bounds
+            HiGHS_LP.row_lower_ = np.concatenate((np.full((G.size[0],), -highspy.kHighsInf), b))
+            HiGHS_LP.row_upper_ = np.concatenate((h, b))
+            HiGHS_LP.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+            HiGHS_LP.a_matrix_.start_ = np.array(Column_Pointers).flatten()
+            HiGHS_LP.a_matrix_.index_ = np.array(Row_Indices).flatten()
+            HiGHS_LP.a_matrix_.value_ = np.array(Values).flatten()
+
+            # Translate scipy.optimize.linprog option names into HiGHS option names.
+
+            HiGHS_Solver_Names = {"highs": "choose", "highs-ds": "simplex", "highs-ipm": "ipm"}
+
+            HiGHS_Model = highspy.Highs()
+
+            # HiGHS returns an error status (or highspy raises a TypeError) for an unrecognized option name
+            # or a value of the wrong type. Solver_Option_Name is the name passed in Solver_Options.
+
+            def Set_HiGHS_Option(HiGHS_Option_Name, HiGHS_Option_Value, Solver_Option_Name=None):
+
+                if Solver_Option_Name is None:
+                    Solver_Option_Name = HiGHS_Option_Name
+
+                try:
+                    HiGHS_Option_Status = HiGHS_Model.setOptionValue(HiGHS_Option_Name, HiGHS_Option_Value)
+                except TypeError:
+                    HiGHS_Option_Status = highspy.HighsStatus.kError
+
+                if HiGHS_Option_Status == highspy.HighsStatus.kError:
+                    raise Solver_Option_Error("HiGHS solver option \"" + str(Solver_Option_Name) + "\" is not recognized, " +
+                                              "or its value " + repr(HiGHS_Option_Value) + " is not valid.")
+
+            Set_HiGHS_Option("output_flag", bool(HiGHS_Options.pop("disp", False)), "disp")
+            Set_HiGHS_Option("solver", HiGHS_Solver_Names[HiGHS_Method], "method")
+
+            if "maxiter" in HiGHS_Options:
+                Maximum_Iterations = HiGHS_Options.pop("maxiter")
+                Set_HiGHS_Option("simplex_iteration_limit", Maximum_Iterations, "maxiter")
+                Set_HiGHS_Option("ipm_iteration_limit", Maximum_Iterations, "maxiter")
+
+            if "presolve" in HiGHS_Options:
+                Set_HiGHS_Option("presolve", "on" if HiGHS_Options.pop("presolve") else "off")
+
+            for HiGHS_Option_Name, HiGHS_Option_Value in HiGHS_Options.items():
+                Set_HiGHS_Option(HiGHS_Option_Name, HiGHS_Option_Value)
+
+            HiGHS_Model.passModel(HiGHS_LP)
+
+            # Warm Start
+            # A simplex basis from a linear program of the same size is reused directly.
+            # Otherwise, the starting point x is passed to HiGHS as a starting solution.
+
+            Warm_Start_Basis = Warm_Start.get("basis")
+
+            if Warm_Start_Basis is not None and len(Warm_Start_Basis.col_status) == length_x and \
+                    len(Warm_Start_Basis.row_status) == Constraint_Matrix.size[0]:
+
+                HiGHS_Model.setBasis(Warm_Start_Basis)
+
+            elif Warm_Start_x is not None:
+
+                HiGHS_Warm_Start_Solution = highspy.HighsSolution()
+                HiGHS_Warm_Start_Solution.col_value = Warm_Start_x
+                HiGHS_Warm_Start_Solution.value_valid = True
+
+                HiGHS_Model.setSolution(HiGHS_Warm_Start_Solution)
+
+            HiGHS_Model.run()
+
+            HiGHS_Model_Status = HiGHS_Model.getModelStatus()
+
+            HiGHS_Status_Names = {highspy.HighsModelStatus.kOptimal: "optimal",
+                                  highspy.HighsModelStatus.kIterationLimit: "iteration limit",
+                                  highspy.HighsModelStatus.kTimeLimit: "time limit",
+                                  highspy.HighsModelStatus.kInfeasible: "primal infeasible",
+                                  highspy.HighsModelStatus.kUnbounded: "dual infeasible"}
+
+            HiGHS_Info = HiGHS_Model.getInfo()
+
+            HiGHS_Solution = HiGHS_Model.getSolution()
+
+            if HiGHS_Solution.value_valid:
+                x = np.array(HiGHS_Solution.col_value)
+                LP_Warm_Start = {"x": x, "basis": HiGHS_Model.getBasis()}
+            else:
+                x = None
+                LP_Warm_Start = None
+
+            LP_Solution = {"x": x,
+                           "status": HiGHS_Status_Names.get(HiGHS_Model_Status, "unknown"),
+                           "objective": HiGHS_Info.objective_function_value,
+                           "iterations": HiGHS_Info.simplex_iteration_count + HiGHS_Info.ipm_iteration_count +
+                                         HiGHS_Info.crossover_iteration_count,
+                           "relative_gap": getattr(HiGHS_Info, "primal_dual_objective_error", None),
+                           "primal_infeasibility": HiGHS_Info.max_primal_infeasibility,
+                           "dual_infeasibility": HiGHS_Info.max_dual_infeasibility,
+                           "solver_backend": Solver_Backend,
+                           "warm_start": LP_Warm_Start}
+
+        else:
+
+            import warnings
+            from scipy.optimize import linprog, OptimizeWarning
+            from scipy.sparse import csc_matrix
+
+            # scipy.optimize.linprog only warns about unrecognized options and invalid option values,
+            # so they are checked here, and invalid option value warnings are raised as errors.
+
+            linprog_HiGHS_Option_Names = ["disp", "presolve", "maxiter", "time_limit", "dual_feasibility_tolerance",
+                                          "primal_feasibility_tolerance", "ipm_optimality_tolerance",
+                                          "simplex_dual_edge_weight_strategy"]
+
+            for HiGHS_Option_Name in HiGHS_Options:
+                if HiGHS_Option_Name not in linprog_HiGHS_Option_Names:
+                    raise Solver_Option_Error("HiGHS solver option \"" + str(HiGHS_Option_Name) + "\" is not recognized " +
+                                              "by scipy.optimize.linprog (highspy is not installed). Available solver options are " +
+                                              ", ".join("\"" + Option_Name + "\"" for Option_Name in linprog_HiGHS_Option_Names) + ".")
+
+            # Convert from cvxopt sparse matrix format to SciPy compressed sparse column format.
+
+            def Convert_to_SciPy(cvxopt_Matrix):
+                Column_Pointers, Row_Indices, Values = cvxopt_Matrix.CCS
+                return csc_matrix((np.array(Values).flatten(), np.array(Row_Indices).flatten(), np.array(Column_Pointers).flatten()),
+                                  shape = cvxopt_Matrix.size)
+
+            if G.size[0] > 0:
+                A_ub = Convert_to_SciPy(G)
+                b_ub = h
+            else:
+                A_ub = None
+                b_ub = None
+
+            if A.size[0] > 0:
+                A_eq = Convert_to_SciPy(A)
+                b_eq = b
+            else:
+                A_eq = None
+                b_eq = None
+
+            with warnings.catch_warnings():
+
+                warnings.filterwarnings("error", message = "Invalid option value", category = OptimizeWarning)
+
+                try:
+                    lp_result = linprog(c, A_ub = A_ub, b_ub = b_ub, A_eq = A_eq, b_eq = b_eq,
+                                        bounds = np.column_stack((Lower_Bounds, Upper_Bounds)),
+                                        method = HiGHS_Method, options = HiGHS_Options)
+                except (OptimizeWarning, TypeError) as HiGHS_Option_Value_Error:
+                    raise Solver_Option_Error("HiGHS solver option values " + repr(HiGHS_Options) + " are not valid: " +
+                                              str(HiGHS_Option_Value_Error))
+
+            # SciPy status codes: 0 = optimal, 1 = iteration or time limit reached,
+            # 2 = infeasible, 3 = unbounded, 4 = numerical difficulties.
+
+            HiGHS_Status_Names = {0: "optimal", 1: "iteration limit", 2: "primal infeasible",
+                                  3: "dual infeasible", 4: "numerical difficulties"}
+
+            if lp_result.x is None:
+                LP_Warm_Start = None
+            else:
+                LP_Warm_Start = {"x": lp_result.x}
+
+            LP_Solution = {"x": lp_result.x,
+                           "status": HiGHS_Status_Names.get(lp_result.status, "unknown"),
+                           "objective": lp_result.fun,
+                           "iterations": lp_result.nit,
+                           "relative_gap": None,
+                           "primal_infeasibility": None,
+                           "dual_infeasibility": None,
+                           "solver_backend": Solver_Backend,
+                           "warm_start": LP_Warm_Start}
+
+    else:
+
+        raise ValueError("Solver backend \"" + str(Solver_Backend) + "\" is not available. " +
+                         "Available solver backends are \"cvxopt\" and \"HiGHS\".")
+
+    # Linear Program Size
+    # Variable bounds are not counted as constraint rows.
+
+    LP_Solution["rows"] = G.size[0] + A.size[0]
+    LP_Solution["columns"] = length_x
+    LP_Solution["nonzeros"] = len(G.V) + len(A.V)
+
+    return LP_Solution
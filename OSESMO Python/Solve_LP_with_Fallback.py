@@ -0,0 +1,271 @@
+## LP Solver Failure
+
+# Raised by OSESMO when a linear program is not solved to optimality by the requested solver or any fallback step,
+# so that the model run stops instead of using a missing or non-optimal solution.
+# Solver_Failure_Record is a dictionary describing the failed linear program and each solve attempt,
+# which is saved in the model run metrics log and in scenario sweep model run records.
+
+class LP_Solver_Failure(RuntimeError):
+
+    def __init__(self, Message=None, Solver_Failure_Record=None):
+
+        super().__init__(Message)
+
+        self.Solver_Failure_Record = Solver_Failure_Record
+
+
+def Solve_LP_with_Fallback(c=None, G=None, h=None, A=None, b=None, Lower_Bounds=None, Upper_Bounds=None,
+                           Solver_Backend=None, Solver_Options=None, Warm_Start=None, Solver_Fallback_Input=None):
+
+    # Load Python Packages
+    import time
+    import numpy as np
+    from cvxopt import spmatrix
+    from Solve_LP import Solve_LP, Solver_Option_Error
+
+    # This function solves a linear program using Solve_LP (see Solve_LP.py for the inputs), and checks the solver status.
+    # If the solution is not optimal (ex. cvxopt reaches its iteration limit with status "unknown", or reports numerical
+    # difficulties), the linear program is solved again using each step of the fallback chain in Solver_Fallback_Input,
+    # until an optimal solution is found.
+
+    # Solver_Fallback_Input is a list of fallback steps, tried in order. An empty list disables fallback.
+    # The default is ["Rescaled", "Alternate Backend", "More Iterations"] for the cvxopt backend when highspy is installed,
+    # since HiGHS usually solves a linear program that cvxopt can't much faster than 4 times as many cvxopt iterations,
+    # and ["Rescaled", "More Iterations", "Alternate Backend"] otherwise. Available steps:
+    #  * "Rescaled" - the same solver and options, with each constraint row scaled to a maximum absolute coefficient of 1,
+    #    and the cost vector scaled to a maximum absolute value of 1.
+    #  * "More Iterations" - the rescaled linear program, with 4 times the solver's iteration limit
+    #    ("maxiters" for cvxopt, default 100) and any "maxiter" or "time_limit" HiGHS options.
+    #  * "Alternate Backend" - the other solver backend ("HiGHS" for "cvxopt", and "cvxopt" for "HiGHS"), with its default options.
+    #  * A dictionary containing a "Solver_Backend", "Solver_Options", and optionally "Rescaled" (True or False)
+    #    and a "Name" reported in the solve attempts, for any other solver configuration.
+    # Fallback steps are solved without a warm start, and steps that repeat an earlier attempt are skipped.
+    # "More Iterations" is also skipped if the last two attempts using its solver backend both reached their iteration
+    # (or time) limit, and the dual infeasibility of the last attempt is no lower than the one before it,
+    # since the solver is stalled rather than converging slowly.
+
+    # A solution is optimal if the solver status is "optimal" and all decision variable values are finite.
+    # Numerical errors raised by the solver (ex. a singular KKT system in cvxopt) are recorded
+    # as a "solver error" status, with the error message in the solve attempt's "Error", and the next step is tried.
+    # Unrecognized or invalid solver options (Solver_Option_Error, see Solve_LP.py) are raised instead.
+
+    # Returns the solution dictionary of the first optimal attempt, or of the last attempt if none are optimal,
+    # with two additional entries:
+    #  * "fallback_step" - the fallback step that found the solution ("Requested" for the requested solver).
+    #  * "attempts" - list of dictionaries, one per solve attempt, containing the fallback "Step", "Solver_Backend",
+    #    "Status", "Objective", "Iterations", "Relative_Gap", "Primal_Infeasibility", "Dual_Infeasibility",
+    #    "Solve_Time_Seconds", and "Error". Rescaled attempts report the gap and infeasibility of the rescaled linear program.
+
+    if Solver_Backend is None:
+        Solver_Backend = "cvxopt"
+
+    if Solver_Options is None:
+        Solver_Options = {}
+
+    if Solver_Fallback_Input is None:
+
+        try:
+            import highspy
+            highspy_Installed = True
+        except ImportError:
+            highspy_Installed = False
+
+        if Solver_Backend == "cvxopt" and highspy_Installed:
+            Solver_Fallback_Input = ["Rescaled", "Alternate Backend", "More Iterations"]
+        else:
+            Solver_Fallback_Input = ["Rescaled", "More Iterations", "Alternate Backend"]
+
+    Alternate_Solver_Backends = {"cvxopt": "HiGHS", "HiGHS": "cvxopt"}
+
+    # An unknown solver backend is reported here, instead of being replaced by a fallback step.
+
+    if Solver_Backend not in Alternate_Solver_Backends:
+        raise ValueError("Solver backend \"" + str(Solver_Backend) + "\" is not available. " +
+                         "Available solver backends are \"cvxopt\" and \"HiGHS\".")
+
+
+    ## Rescaled Linear Program
+
+    # Rows are scaled by the reciprocal of their largest absolute coefficient, which doesn't change the solution.
+    # It is only calculated if a rescaled fallback step is used.
+
+    Rescaled_LP = {}
+
+    def Rescale_Constraint_Rows(Constraint_Matrix, Right_Hand_Side):
+
+        Row_Indices = np.array(Constraint_Matrix.I, dtype = int).flatten()
+        Values = np.array(Constraint_Matrix.V).flatten()
+
+        Row_Scale = np.zeros(Constraint_Matrix.size[0])
+        np.maximum.at(Row_Scale, Row_Indices, np.abs(Values))
+        Row_Scale[Row_Scale == 0] = 1
+
+        return spmatrix(Values / Row_Scale[Row_Indices], Row_Indices, np.array(Constraint_Matrix.J, dtype = int).flatten(),
+                        Constraint_Matrix.size, tc = 'd'), \
+               np.asarray(Right_Hand_Side, dtype = float).flatten() / Row_Scale
+
+    def Get_Rescaled_LP():
+
+        if len(Rescaled_LP) == 0:
+
+            Rescaled_LP["G"], Rescaled_LP["h"] = Rescale_Constraint_Rows(G, h)
+            Rescaled_LP["A"], Rescaled_LP["b"] = Rescale_Constraint_Rows(A, b)
+
+            c_Array = np.asarray(c, dtype = float).flatten()
+            Rescaled_LP["c_Scale"] = np.max(np.abs(c_Array)) if np.any(c_Array != 0) else 1.
+            Rescaled_LP["c"] = c_Array / Rescaled_LP["c_Scale"]
+
+        return Rescaled_LP
+
+
+    ## Fallback Steps
+
+    def cvxopt_Maximum_Iterations(cvxopt_Options):
+
+        from cvxopt import solvers
+
+        return cvxopt_Options.get("maxiters", solvers.options.get("maxiters", 100))
+
+    def Fallback_Step_Configuration(Fallback_Step):
+
+        # Returns the solver backend, solver options, and rescaling used by a fallback step.
+
+        if isinstance(Fallback_Step, dict):
+            return Fallback_Step.get("Solver_Backend", Solver_Backend), dict(Fallback_Step.get("Solver_Options", {})), \
+                   bool(Fallback_Step.get("Rescaled", False))
+
+        elif Fallback_Step == "Rescaled":
+            return Solver_Backend, dict(Solver_Options), True
+
+        elif Fallback_Step == "More Iterations":
+
+            More_Iterations_Options = dict(Solver_Options)
+
+            if Solver_Backend == "cvxopt":
+                More_Iterations_Options["maxiters"] = 4 * cvxopt_Maximum_Iterations(More_Iterations_Options)
+            else:
+                for Limit_Option_Name in ["maxiter", "time_limit"]:
+                    if Limit_Option_Name in More_Iterations_Options:
+                        More_Iterations_Options[Limit_Option_Name] = 4 * More_Iterations_Options[Limit_Option_Name]
+
+            return Solver_Backend, More_Iterations_Options, True
+
+        elif Fallback_Step == "Alternate Backend":
+            return Alternate_Solver_Backends.get(Solver_Backend, "cvxopt"), {}, False
+
+        else:
+            raise ValueError("Solver fallback step \"" + str(Fallback_Step) + "\" is not recognized. " +
+                             "Available fallback steps are \"Rescaled\", \"More Iterations\", \"Alternate Backend\", " +
+                             "or a dictionary containing a \"Solver_Backend\" and \"Solver_Options\".")
+
+
+    ## Solve Linear Program
+
+    Solve_Attempts = [("Requested", Solver_Backend, dict(Solver_Options), False)]
+
+    for Fallback_Step in Solver_Fallback_Input:
+        Fallback_Step_Name = Fallback_Step.get("Name", "Custom") if isinstance(Fallback_Step, dict) else Fallback_Step
+        Solve_Attempts.append((Fallback_Step_Name,) + Fallback_Step_Configuration(Fallback_Step))
+
+    Attempted_Configurations = []
+    Attempt_Records = []
+
+    # Solver backend, whether the iteration (or time) limit was reached, and dual infeasibility of each attempt.
+    Attempt_Iteration_Limits = []
+
+    def Stalled_at_Iteration_Limit(Step_Solver_Backend):
+
+        Backend_Iteration_Limits = [(Reached_Iteration_Limit, Dual_Infeasibility) for Attempt_Solver_Backend, Reached_Iteration_Limit,
+                                    Dual_Infeasibility in Attempt_Iteration_Limits if Attempt_Solver_Backend == Step_Solver_Backend]
+
+        if len(Backend_Iteration_Limits) < 2:
+            return False
+
+        (Previous_Reached_Limit, Previous_Dual_Infeasibility), (Last_Reached_Limit, Last_Dual_Infeasibility) = Backend_Iteration_Limits[-2:]
+
+        return Previous_Reached_Limit and Last_Reached_Limit and \
+               Previous_Dual_Infeasibility is not None and Last_Dual_Infeasibility is not None and \
+               Last_Dual_Infeasibility >= Previous_Dual_Infeasibility
+
+    for Step_Name, Step_Solver_Backend, Step_Solver_Options, Step_Rescaled in Solve_Attempts:
+
+        Step_Configuration = (Step_Solver_Backend, repr(sorted(Step_Solver_Options.items())), Step_Rescaled)
+
+        if Step_Configuration in Attempted_Configurations:
+            continue
+
+        if Step_Name == "More Iterations" and Stalled_at_Iteration_Limit(Step_Solver_Backend):
+            continue
+
+        Attempted_Configurations.append(Step_Configuration)
+
+        Solve_Start_Time = time.perf_counter()
+
+        Solver_Error = None
+
+        try:
+
+            if Step_Rescaled:
+
+                Step_LP = Get_Rescaled_LP()
+
+                lp_solution = Solve_LP(Step_LP["c"], Step_LP["G"], Step_LP["h"], Step_LP["A"], Step_LP["b"], Lower_Bounds, Upper_Bounds,
+                                       Solver_Backend = Step_Solver_Backend, Solver_Options = Step_Solver_Options)
+
+                if lp_solution['objective'] is not None:
+                    lp_solution['objective'] = lp_solution['objective'] * Step_LP["c_Scale"]
+
+                # Dual values of the rescaled linear program don't match the original linear program,
+                # so only the primal solution and simplex basis are kept for warm starts.
+                if lp_solution['warm_start'] is not None:
+                    lp_solution['warm_start'] = {Warm_Start_Name: Warm_Start_Value for Warm_Start_Name, Warm_Start_Value
+                                                 in lp_solution['warm_start'].items() if Warm_Start_Name in ["x", "basis"]}
+
+            else:
+
+                lp_solution = Solve_LP(c, G, h, A, b, Lower_Bounds, Upper_Bounds,
+                                       Solver_Backend = Step_Solver_Backend, Solver_Options = Step_Solver_Options,
+                                       Warm_Start = Warm_Start if Step_Name == "Requested" else None)
+
+            if lp_solution['status'] == "optimal" and (lp_solution['x'] is None or not np.all(np.isfinite(lp_solution['x']))):
+                lp_solution['status'] = "numerical difficulties"
+
+        except Solver_Option_Error:
+            raise
+
+        # NumPy and SciPy linear algebra errors are subclasses of ValueError.
+        except (ArithmeticError, ValueError) as Step_Solver_Error:
+
+            Solver_Error = repr(Step_Solver_Error)
+
+            lp_solution = {"x": None, "status": "solver error", "objective": None, "iterations": None,
+                           "relative_gap": None, "primal_infeasibility": None, "dual_infeasibility": None,
+                           "solver_backend": Step_Solver_Backend, "warm_start": None,
+                           "rows": G.size[0] + A.size[0], "columns": len(np.asarray(c).flatten()), "nonzeros": len(G.V) + len(A.V)}
+
+        Attempt_Records.append({"Step": Step_Name,
+                                "Solver_Backend": Step_Solver_Backend,
+                                "Status": lp_solution['status'],
+                                "Objective": lp_solution['objective'],
+                                "Iterations": lp_solution['iterations'],
+                                "Relative_Gap": lp_solution['relative_gap'],
+                                "Primal_Infeasibility": lp_solution['primal_infeasibility'],
+                                "Dual_Infeasibility": lp_solution['dual_infeasibility'],
+                                "Solve_Time_Seconds": time.perf_counter() - Solve_Start_Time,
+                                "Error": Solver_Error})
+
+        if Step_Solver_Backend == "cvxopt":
+            Reached_Iteration_Limit = lp_solution['status'] == "unknown" and lp_solution['iterations'] is not None and \
+                                      lp_solution['iterations'] >= cvxopt_Maximum_Iterations(Step_Solver_Options)
+        else:
+            Reached_Iteration_Limit = lp_solution['status'] in ["iteration limit", "time limit"]
+
+        Attempt_Iteration_Limits.append((Step_Solver_Backend, Reached_Iteration_Limit, lp_solution['dual_infeasibility']))
+
+        lp_solution['fallback_step'] = Step_Name
+        lp_solution['attempts'] = Attempt_Records
+
+        if lp_solution['status'] == "optimal":
+            break
+
+    return lp_solution
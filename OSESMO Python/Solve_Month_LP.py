@@ -0,0 +1,38 @@
+def Solve_Month_LP(Month_Builder_Inputs=None, c_Month=None, Solver_Backend=None, Solver_Options=None, Warm_Start=None,
+                   Return_Warm_Start=True, Solver_Fallback_Input=None):
+
+    # Load Python Packages
+    import time
+    from Build_Month_LP_Constraints import Build_Month_LP_Constraints
+    from Solve_LP_with_Fallback import Solve_LP_with_Fallback
+
+    # This function builds and solves the linear program for a single month.
+    # Month_Builder_Inputs is a dictionary of keyword arguments for Build_Month_LP_Constraints,
+    # and c_Month is the cost vector. The solution dictionary from Solve_LP_with_Fallback is returned,
+    # which falls back to the solver steps in Solver_Fallback_Input if the requested solver doesn't find an optimal solution.
+
+    # This function is defined at the top level of its own module so that it can be run in
+    # worker processes when months are solved in parallel (see Month_Solve_Mode_Input in OSESMO.py).
+    # Warm starts from the HiGHS backend cannot be sent between processes,
+    # so they can be removed from the returned solution using Return_Warm_Start.
+
+    # The time taken to build the constraint matrices ("build_time") and to solve the linear program ("solve_time"),
+    # in seconds, are added to the solution dictionary. The solve time includes any fallback solve attempts.
+
+    Build_Start_Time = time.perf_counter()
+
+    G_Month, h_Month, A_Month, b_Month, Lower_Bounds, Upper_Bounds = Build_Month_LP_Constraints(**Month_Builder_Inputs)
+
+    Solve_Start_Time = time.perf_counter()
+
+    lp_solution = Solve_LP_with_Fallback(c_Month, G_Month, h_Month, A_Month, b_Month, Lower_Bounds, Upper_Bounds,
+                                         Solver_Backend = Solver_Backend, Solver_Options = Solver_Options,
+                                         Warm_Start = Warm_Start, Solver_Fallback_Input = Solver_Fallback_Input)
+
+    lp_solution['build_time'] = Solve_Start_Time - Build_Start_Time
+    lp_solution['solve_time'] = time.perf_counter() - Solve_Start_Time
+
+    if not Return_Warm_Start:
+        lp_solution['warm_start'] = None
+
+    return lp_solution
@@ -0,0 +1,113 @@
+# Rows of G with more nonzero entries than this (ex. monthly cycling and RTE constraints) couple many timesteps together,
+# and are handled in the border of the KKT system instead of being eliminated (as in Banded_KKT_Solver.py).
+Dense_Entry_Threshold = 32
+
+
+def Sparse_KKT_Solver(G=None, A=None):
+
+    # Load Python Packages
+    import numpy as np
+    from cvxopt import matrix, spmatrix, sparse, spdiag, mul, div, umfpack, lapack
+
+    # cvxopt's default KKT solver eliminates the equality constraints A * x = b
+    # using a dense Schur complement, which is very slow for the thousands of
+    # state-of-charge equality constraints in each OSESMO month.
+    # This function returns a custom KKT solver for cvxopt.solvers.lp (passed using the
+    # kktsolver argument), which instead eliminates the inequality constraints and
+    # factors the remaining sparse, symmetric system using UMFPACK sparse LU factorization:
+
+    # [ G' * W^-1 * W^-T * G    A' ] [ ux ]   [ bx + G' * W^-1 * W^-T * bz ]
+    # [ A                       0  ] [ uy ] = [ by ]
+
+    # W * uz = W^-T * (G * ux - bz)
+
+    # Eliminating a dense row of G would fill in a dense block of G' * W^-1 * W^-T * G with every pair of its entries
+    # (ex. the cycling and RTE constraints, summed across every timestep of the month, use several GB of memory).
+    # Only the sparse rows of G (Gs) are eliminated, and each dense row (Gd) keeps its own uzd variable:
+
+    # [ K     C         ] [ u   ]   [ r   ]
+    # [ C'    -Wd' * Wd ] [ uzd ] = [ bzd ]
+
+    # where K is the system above using only the sparse rows, and C = [ Gd' ; 0 ].
+    # K is factored using UMFPACK, and uzd is found using the small dense Schur complement -Wd' * Wd - C' * K^-1 * C.
+
+    # For linear programs, the scaling matrix W is diagonal (W = diag(d)).
+    # The sparsity pattern of this system is the same in every interior-point iteration,
+    # so the symbolic factorization is only calculated once.
+
+    n = G.size[1]
+    m = G.size[0]
+    p = A.size[0]
+
+    G_I = np.array(G.I, dtype = int).flatten()
+    G_J = np.array(G.J, dtype = int).flatten()
+    G_V = np.array(G.V, dtype = float).flatten()
+
+    G_Row_Counts = np.bincount(G_I, minlength = m)
+
+    Is_Dense_G_Row = G_Row_Counts > Dense_Entry_Threshold
+    Is_Dense_G_Entry = Is_Dense_G_Row[G_I]
+
+    # Position of each row of G within Dense_G or Sparse_G.
+
+    G_Row_Positions = np.zeros((m,), dtype = int)
+    G_Row_Positions[Is_Dense_G_Row] = np.arange(0, np.count_nonzero(Is_Dense_G_Row))
+    G_Row_Positions[~Is_Dense_G_Row] = np.arange(0, np.count_nonzero(~Is_Dense_G_Row))
+
+    q = int(np.count_nonzero(Is_Dense_G_Row))
+
+    Dense_G = spmatrix(G_V[Is_Dense_G_Entry], G_Row_Positions[G_I[Is_Dense_G_Entry]], G_J[Is_Dense_G_Entry], (q, n), tc = 'd')
+    Sparse_G = spmatrix(G_V[~Is_Dense_G_Entry], G_Row_Positions[G_I[~Is_Dense_G_Entry]], G_J[~Is_Dense_G_Entry], (m - q, n), tc = 'd')
+
+    Dense_G_Rows = matrix(np.flatnonzero(Is_Dense_G_Row), tc = 'i')
+    Sparse_G_Rows = matrix(np.flatnonzero(~Is_Dense_G_Row), tc = 'i')
+
+    Zero_Block = spmatrix([], [], [], (p, p), tc = 'd')
+
+    Border_Coupling = matrix(sparse([Dense_G.T, spmatrix([], [], [], (p, q), tc = 'd')], tc = 'd'))
+
+    Symbolic_Factorization = []
+
+    def kktsolver(W):
+
+        di = W['di']
+        Sparse_di = di[Sparse_G_Rows]
+        Dense_di = di[Dense_G_Rows]
+
+        Scaled_G = spdiag(Sparse_di) * Sparse_G
+
+        KKT_Matrix = sparse([[Scaled_G.T * Scaled_G, A], [A.T, Zero_Block]], tc = 'd')
+
+        if not Symbolic_Factorization:
+            Symbolic_Factorization.append(umfpack.symbolic(KKT_Matrix))
+
+        Numeric_Factorization = umfpack.numeric(KKT_Matrix, Symbolic_Factorization[0])
+
+        if q > 0:
+
+            Solved_Coupling = matrix(Border_Coupling)
+            umfpack.solve(KKT_Matrix, Numeric_Factorization, Solved_Coupling)
+
+            Schur_Complement = matrix(-spdiag(div(1, Dense_di ** 2)) - Border_Coupling.T * Solved_Coupling)
+            Schur_Pivots = matrix(0, (q, 1), tc = 'i')
+            lapack.getrf(Schur_Complement, Schur_Pivots)
+
+        def f(x, y, z):
+
+            KKT_RHS = matrix([x + Scaled_G.T * mul(Sparse_di, z[Sparse_G_Rows]), y], tc = 'd')
+
+            umfpack.solve(KKT_Matrix, Numeric_Factorization, KKT_RHS)
+
+            if q > 0:
+                Border_Solution = z[Dense_G_Rows] - Border_Coupling.T * KKT_RHS
+                lapack.getrs(Schur_Complement, Schur_Pivots, Border_Solution)
+                KKT_RHS = KKT_RHS - Solved_Coupling * Border_Solution
+                z[Dense_G_Rows] = div(Border_Solution, Dense_di)
+
+            x[:] = KKT_RHS[0:n]
+            y[:] = KKT_RHS[n:(n + p)]
+            z[Sparse_G_Rows] = mul(Sparse_di, Sparse_G * x - z[Sparse_G_Rows])
+
+        return f
+
+    return kktsolver
@@ -0,0 +1,83 @@
+## Script Description Header
+
+# File Name: test_Banded_KKT_Solver.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Tests"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Checks that the default cvxopt solver path (Banded_KKT_Solver) solves every month of the sample scenario
+# with both the cycling and RTE constraints active, without falling back to another solve.
+# Run using pytest, or directly as a script.
+
+import os
+import sys
+import io
+import contextlib
+import datetime as dt
+
+
+## Set Directories
+
+OSESMO_Git_Repo_Directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+Input_Output_Data_Directory_Location = os.path.join(os.path.dirname(OSESMO_Git_Repo_Directory), "Sample Input and Output Data")
+
+sys.path.insert(0, OSESMO_Git_Repo_Directory)
+
+from OSESMO import OSESMO
+
+
+## Test Scenario
+
+# Sample scenario from Model_Input_Single_Run.py, with 130 equivalent cycles per year and a 69.6% annual RTE constraint.
+# Both constraints are single rows summed across the whole month, and are active at the optimum.
+
+Scenario_Inputs = dict(Modeling_Team_Input = "Test", Model_Run_Number_Input = 1, Model_Type_Input = "Solar Plus Storage",
+                       Model_Timestep_Resolution = 15, Customer_Class_Input = "Commercial and Industrial",
+                       Load_Profile_Name_Input = "EnerNOC GreenButton San Francisco Office",
+                       Retail_Rate_Name_Input = "PG&E E-19S (OLD)", Solar_Profile_Name_Input = "CSI PG&E Commercial & Industrial",
+                       Solar_Size_Input = 256, Storage_Type_Input = "Lithium-Ion Battery",
+                       Storage_Power_Rating_Input = 250, Usable_Storage_Capacity_Input = 500,
+                       Single_Cycle_RTE_Input = 0.85, Parasitic_Storage_Load_Input = 0.003,
+                       Storage_Control_Algorithm_Name = "OSESMO Economic Dispatch",
+                       GHG_Reduction_Solution_Input = "GHG Signal Co-Optimization",
+                       Equivalent_Cycling_Constraint_Input = 130, Annual_RTE_Constraint_Input = 0.696, ITC_Constraint_Input = 1,
+                       Carbon_Adder_Incentive_Value_Input = 15, Emissions_Forecast_Signal_Input = "NP15 RT5M",
+                       OSESMO_Git_Repo_Directory = OSESMO_Git_Repo_Directory,
+                       Input_Output_Data_Directory_Location = Input_Output_Data_Directory_Location,
+                       Start_Time_Input = dt.datetime(2017, 1, 1, 0, 0),
+                       Show_Plots = 0, Export_Plots = 0, Export_Data = 0,
+                       Solar_Installed_Cost_per_kW = 3000, Storage_Installed_Cost_per_kWh = 681.5,
+                       Estimated_Future_Lithium_Ion_Battery_Installed_Cost_per_kWh = 100,
+                       Cycle_Life = 10 * 365.25, Storage_Depth_of_Discharge = 0.8, Initial_Final_SOC = 0.3,
+                       End_of_Month_Padding_Days = 3)
+
+
+def Run_Scenario(**Scenario_Changes):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return OSESMO(**dict(Scenario_Inputs, **Scenario_Changes))
+
+
+## Tests
+
+def test_Cycling_and_RTE_Constraints_Solve_Without_Fallback():
+
+    # The solver backend and KKT solver are not specified, so the default cvxopt path is used.
+
+    Model_Results = Run_Scenario()
+
+    for Month_Solver_Statistics in Model_Results["Solver_Statistics"]:
+        assert Month_Solver_Statistics["Solver_Backend"] == "cvxopt"
+        assert Month_Solver_Statistics["Fallback_Step"] == "Requested", Month_Solver_Statistics["Solver_Attempts"]
+        assert Month_Solver_Statistics["Status"] == "optimal"
+
+    # The monthly objective values match the HiGHS solutions.
+
+    HiGHS_Model_Results = Run_Scenario(Solver_Backend = "HiGHS")
+
+    for Month_Solver_Statistics, HiGHS_Month_Solver_Statistics in zip(Model_Results["Solver_Statistics"],
+                                                                      HiGHS_Model_Results["Solver_Statistics"]):
+        assert abs(Month_Solver_Statistics["Objective"] - HiGHS_Month_Solver_Statistics["Objective"]) <= \
+               1e-6 * abs(HiGHS_Month_Solver_Statistics["Objective"])
+
+
+if __name__ == "__main__":
+    test_Cycling_and_RTE_Constraints_Solve_Without_Fallback()
+    print("Passed.")
@@ -0,0 +1,96 @@
+## Script Description Header
+
+# File Name: test_Solve_LP_with_Fallback.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Tests"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Checks the order of the default solver fallback steps, and that the "More Iterations" step is skipped
+# when the solver is stalled at its iteration limit.
+# Run using pytest.
+
+import os
+import sys
+
+import numpy as np
+from cvxopt import spmatrix
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Solve_LP
+from Solve_LP_with_Fallback import Solve_LP_with_Fallback
+
+
+## Test Solver
+
+# Replaces Solve_LP with a solver that reaches its iteration limit for cvxopt, with the dual infeasibility
+# of each cvxopt attempt taken in turn from cvxopt_Dual_Infeasibilities, and finds an optimal solution for HiGHS.
+# Returns the list of (solver backend, solver options) used by each attempt.
+
+def Use_Test_Solver(monkeypatch, cvxopt_Dual_Infeasibilities=None):
+
+    Solver_Calls = []
+
+    def Test_Solve_LP(c=None, G=None, h=None, A=None, b=None, Lower_Bounds=None, Upper_Bounds=None,
+                      Solver_Backend=None, Solver_Options=None, Warm_Start=None):
+
+        Solver_Calls.append((Solver_Backend, dict(Solver_Options)))
+
+        if Solver_Backend == "cvxopt":
+            return {"x": None, "status": "unknown", "objective": None,
+                    "iterations": Solver_Options.get("maxiters", 100), "relative_gap": None, "primal_infeasibility": 1e-3,
+                    "dual_infeasibility": cvxopt_Dual_Infeasibilities[len(Solver_Calls) - 1],
+                    "solver_backend": Solver_Backend, "warm_start": None}
+
+        return {"x": np.zeros((2,)), "status": "optimal", "objective": 0., "iterations": 5, "relative_gap": None,
+                "primal_infeasibility": 0., "dual_infeasibility": 0., "solver_backend": Solver_Backend, "warm_start": None}
+
+    monkeypatch.setattr(Solve_LP, "Solve_LP", Test_Solve_LP)
+
+    return Solver_Calls
+
+
+def Solve_Test_LP(Solver_Fallback_Input=None):
+
+    return Solve_LP_with_Fallback(np.array([-1.0, -2.0]), spmatrix([1.0, 1.0], [0, 0], [0, 1], (1, 2)), np.array([4.0]),
+                                  spmatrix([1.0, -1.0], [0, 0], [0, 1], (1, 2)), np.array([0.0]),
+                                  np.zeros((2,)), np.full((2,), 3.0),
+                                  Solver_Backend = "cvxopt", Solver_Fallback_Input = Solver_Fallback_Input)
+
+
+## Tests
+
+def test_More_Iterations_Skipped_when_Stalled(monkeypatch):
+
+    Solver_Calls = Use_Test_Solver(monkeypatch, [1e-2, 2e-2])
+
+    LP_Solution = Solve_Test_LP(["Rescaled", "More Iterations", "Alternate Backend"])
+
+    assert [Attempt["Step"] for Attempt in LP_Solution["attempts"]] == ["Requested", "Rescaled", "Alternate Backend"]
+    assert LP_Solution["fallback_step"] == "Alternate Backend"
+    assert len(Solver_Calls) == 3
+
+
+def test_More_Iterations_Used_when_Converging(monkeypatch):
+
+    Solver_Calls = Use_Test_Solver(monkeypatch, [1e-2, 1e-3, 1e-4])
+
+    LP_Solution = Solve_Test_LP(["Rescaled", "More Iterations", "Alternate Backend"])
+
+    assert [Attempt["Step"] for Attempt in LP_Solution["attempts"]] == \
+           ["Requested", "Rescaled", "More Iterations", "Alternate Backend"]
+    assert Solver_Calls[2] == ("cvxopt", {"maxiters": 400})
+
+
+def test_Default_Fallback_Order(monkeypatch):
+
+    Solver_Calls = Use_Test_Solver(monkeypatch, [1e-2, 1e-3, 1e-4])
+
+    LP_Solution = Solve_Test_LP()
+
+    try:
+        import highspy
+        assert [Attempt["Step"] for Attempt in LP_Solution["attempts"]] == ["Requested", "Rescaled", "Alternate Backend"]
+    except ImportError:
+        assert [Attempt["Step"] for Attempt in LP_Solution["attempts"]] == \
+               ["Requested", "Rescaled", "More Iterations", "Alternate Backend"]
+
+    assert LP_Solution["fallback_step"] == "Alternate Backend"
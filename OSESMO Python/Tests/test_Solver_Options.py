@@ -0,0 +1,109 @@
+## Script Description Header
+
+# File Name: test_Solver_Options.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Tests"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Checks that unrecognized or invalid HiGHS solver options raise a Solver_Option_Error naming the option,
+# both through highspy and through scipy.optimize.linprog, instead of being silently ignored.
+# Run using pytest, or directly as a script.
+
+import os
+import sys
+import builtins
+
+import numpy as np
+import pytest
+from cvxopt import spmatrix
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Solve_LP import Solve_LP, Solver_Option_Error
+from Solve_LP_with_Fallback import Solve_LP_with_Fallback
+
+
+## Test Linear Program
+
+# minimize -x1 - 2 * x2
+# subject to x1 + x2 <= 4, x1 - x2 = 0, 0 <= x1, x2 <= 3
+
+# The optimal solution is x1 = x2 = 2, with objective value -6.
+
+def Solve_Test_LP(Solver_Options=None, Solve_Function=Solve_LP):
+
+    return Solve_Function(np.array([-1.0, -2.0]), spmatrix([1.0, 1.0], [0, 0], [0, 1], (1, 2)), np.array([4.0]),
+                          spmatrix([1.0, -1.0], [0, 0], [0, 1], (1, 2)), np.array([0.0]),
+                          np.zeros((2,)), np.full((2,), 3.0),
+                          Solver_Backend = "HiGHS", Solver_Options = Solver_Options)
+
+
+def Without_highspy(Test_Function):
+
+    # Runs Test_Function with highspy hidden, so that Solve_LP uses scipy.optimize.linprog.
+
+    def Test_Function_Without_highspy():
+
+        Original_Import = builtins.__import__
+
+        def Import_Without_highspy(Module_Name, *args, **kwargs):
+            if Module_Name == "highspy":
+                raise ImportError("highspy is hidden for this test.")
+            return Original_Import(Module_Name, *args, **kwargs)
+
+        builtins.__import__ = Import_Without_highspy
+
+        try:
+            Test_Function()
+        finally:
+            builtins.__import__ = Original_Import
+
+    return Test_Function_Without_highspy
+
+
+## Tests
+
+def Check_Valid_Solver_Options():
+
+    for Solver_Options in [{}, {"presolve": False}, {"presolve": True, "maxiter": 10000, "time_limit": 60, "disp": False},
+                           {"method": "highs-ipm"}, {"dual_feasibility_tolerance": 1e-8}]:
+        LP_Solution = Solve_Test_LP(Solver_Options)
+        assert LP_Solution["status"] == "optimal"
+        assert abs(LP_Solution["objective"] + 6) <= 1e-6
+
+
+def Check_Invalid_Solver_Options():
+
+    for Solver_Options, Solver_Option_Name in [({"presolv": True}, "presolv"),
+                                               ({"time_limit": "one minute"}, "time_limit"),
+                                               ({"dual_feasibility_tolerance": -1.0}, "dual_feasibility_tolerance"),
+                                               ({"method": "simplex"}, "simplex")]:
+        with pytest.raises(Solver_Option_Error, match = Solver_Option_Name):
+            Solve_Test_LP(Solver_Options)
+
+    # The fallback chain isn't used to work around an invalid option.
+
+    with pytest.raises(Solver_Option_Error, match = "presolv"):
+        Solve_Test_LP({"presolv": True}, Solve_LP_with_Fallback)
+
+
+def test_Valid_Solver_Options():
+    Check_Valid_Solver_Options()
+
+
+def test_Invalid_Solver_Options():
+    Check_Invalid_Solver_Options()
+
+
+def test_Valid_Solver_Options_with_linprog():
+    Without_highspy(Check_Valid_Solver_Options)()
+
+
+def test_Invalid_Solver_Options_with_linprog():
+    Without_highspy(Check_Invalid_Solver_Options)()
+
+
+if __name__ == "__main__":
+    test_Valid_Solver_Options()
+    test_Invalid_Solver_Options()
+    test_Valid_Solver_Options_with_linprog()
+    test_Invalid_Solver_Options_with_linprog()
+    print("Passed.")
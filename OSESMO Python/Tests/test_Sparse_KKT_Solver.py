@@ -0,0 +1,34 @@
+## Script Description Header
+
+# File Name: test_Sparse_KKT_Solver.py
+# File Location: "~/Desktop/OSESMO Git Repository/OSESMO Python/Tests"
+# Project: Open-Source Energy Storage Model (OSESMO)
+# Description: Checks that the "sparse" cvxopt KKT solver (Sparse_KKT_Solver) solves every month of the sample scenario
+# with both the cycling and RTE constraints active, without falling back to another solve.
+# Run using pytest, or directly as a script.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_Banded_KKT_Solver import Run_Scenario
+
+
+## Tests
+
+def test_Cycling_and_RTE_Constraints_Solve_Without_Fallback():
+
+    # The same scenario as test_Banded_KKT_Solver.py. The dense cycling and RTE constraint rows
+    # are handled in the border of the KKT system, rather than filling in a dense block.
+
+    Model_Results = Run_Scenario(Solver_Backend = "cvxopt", Solver_Options = {"kktsolver": "sparse"})
+
+    for Month_Solver_Statistics in Model_Results["Solver_Statistics"]:
+        assert Month_Solver_Statistics["Fallback_Step"] == "Requested", Month_Solver_Statistics["Solver_Attempts"]
+        assert Month_Solver_Statistics["Status"] == "optimal"
+
+
+if __name__ == "__main__":
+    test_Cycling_and_RTE_Constraints_Solve_Without_Fallback()
+    print("Passed.")
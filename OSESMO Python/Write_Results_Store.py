@@ -0,0 +1,115 @@
+def Write_Results_Store(Results_Store_Directory=None, OSESMO_Results_List=None):
+
+    # Load Python Packages
+    import os
+    import uuid
+    import datetime
+    import numpy as np
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("The results store requires the pyarrow package. Install it using \"pip install pyarrow\".")
+
+    # This function appends a batch of model runs to a columnar results store, as Parquet files.
+    # OSESMO_Results_List is a list of model results dictionaries returned by OSESMO.
+
+    # The results store contains two tables, each saved as a directory of Parquet files:
+    #  * "Summary" - one row per model run, with the same columns as the model output summary .csv file.
+    #  * "Time_Series" - one row per model run timestep, containing timestamps, load, solar generation,
+    #    storage charging and discharging power, storage energy level, and net load with solar and storage.
+    #    Each row also contains the scenario ID, model run number, load profile, and retail rate, so that time series
+    #    can be filtered without reading the summary table.
+
+    # Model runs are identified by their "Scenario_ID" (see Calculate_Scenario_ID.py), which is stored in both tables,
+    # along with the time the batch was written to the store, "Results_Store_Write_Time".
+    # Model run numbers are chosen by each sweep, so they may be reused by other sweeps in the same store.
+    # If the same scenario is written more than once (ex. when a sweep is re-run into the same store),
+    # Read_Results_Store returns only the latest results. Within a batch, only the last results of each scenario are written.
+    # Model_Run_Number_Input is stored as an integer in both tables. Other numeric inputs and outputs are stored
+    # as floating-point numbers, and all other values as text. Empty values (ex. solar-only outputs of "Storage Only"
+    # model runs, which are "") are stored as nulls, and columns that are empty for every model run in a batch
+    # are stored with the null type, so that Read_Results_Store can combine them with the types of other batches.
+
+    # Each call writes one new file to each table, and existing files are never modified.
+    # Files are written under a temporary name starting with "_" (which readers skip), and then renamed,
+    # so that a results store can be read while a scenario sweep is still appending to it.
+    # Within a time series file, each model run is saved as a separate row group, so that readers filtering
+    # by model run number, load profile, or retail rate can skip the other model runs using row group statistics.
+
+    if len(OSESMO_Results_List) == 0:
+        return
+
+    OSESMO_Results_List = list({OSESMO_Results["Scenario_ID"]: OSESMO_Results for OSESMO_Results in OSESMO_Results_List}.values())
+
+    Results_Store_Write_Time = np.datetime64(datetime.datetime.now(), 'us')
+
+    Results_Store_File_Name = "Part-" + datetime.datetime.now().strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:8] + ".parquet"
+
+
+    ## Summary Table
+
+    Summary_Column_Names = list(OSESMO_Results_List[0]["Model_Inputs_and_Outputs"].keys())
+
+    Summary_Columns = {"Scenario_ID": pa.array([OSESMO_Results["Scenario_ID"] for OSESMO_Results in OSESMO_Results_List], type = pa.string()),
+                       "Results_Store_Write_Time": pa.array(np.full(len(OSESMO_Results_List), Results_Store_Write_Time))}
+
+    for Column_Name in Summary_Column_Names:
+
+        Column_Values = [OSESMO_Results["Model_Inputs_and_Outputs"][Column_Name] for OSESMO_Results in OSESMO_Results_List]
+        Column_Values = [None if (Value is None or (isinstance(Value, str) and Value == "")) else Value for Value in Column_Values]
+
+        if Column_Name == "Model_Run_Number_Input":
+            Summary_Columns[Column_Name] = pa.array(Column_Values, type = pa.int64())
+        elif all(Value is None for Value in Column_Values):
+            Summary_Columns[Column_Name] = pa.nulls(len(Column_Values))
+        elif all(Value is None or (isinstance(Value, (int, float, np.number)) and not isinstance(Value, (bool, np.bool_))) for Value in Column_Values):
+            Summary_Columns[Column_Name] = pa.array([None if Value is None else float(Value) for Value in Column_Values], type = pa.float64())
+        else:
+            Summary_Columns[Column_Name] = pa.array([None if Value is None else str(Value) for Value in Column_Values], type = pa.string())
+
+    Summary_Table = pa.table(Summary_Columns)
+
+
+    ## Time Series Table
+
+    Time_Series_Tables = []
+
+    for OSESMO_Results in OSESMO_Results_List:
+
+        Model_Inputs_and_Outputs = OSESMO_Results["Model_Inputs_and_Outputs"]
+        Time_Series = OSESMO_Results["Time_Series"]
+
+        numtsteps_year = len(Time_Series["t"])
+
+        Time_Series_Columns = {"Scenario_ID": pa.array([OSESMO_Results["Scenario_ID"]] * numtsteps_year, type = pa.string()),
+                               "Results_Store_Write_Time": pa.array(np.full(numtsteps_year, Results_Store_Write_Time)),
+                               "Model_Run_Number_Input": pa.array(np.full(numtsteps_year, Model_Inputs_and_Outputs["Model_Run_Number_Input"], dtype = np.int64)),
+                               "Load_Profile_Name_Input": pa.array([Model_Inputs_and_Outputs["Load_Profile_Name_Input"]] * numtsteps_year, type = pa.string()),
+                               "Retail_Rate_Utility": pa.array([Model_Inputs_and_Outputs["Retail_Rate_Utility"]] * numtsteps_year, type = pa.string()),
+                               "Retail_Rate_Name_Output": pa.array([Model_Inputs_and_Outputs["Retail_Rate_Name_Output"]] * numtsteps_year, type = pa.string()),
+                               "Date_Time_Pacific_No_DST": pa.array(Time_Series["t"].astype('datetime64[s]'))}
+
+        for Variable_Name in ["Load_Profile_Data", "Solar_PV_Profile_Data", "P_ES_in", "P_ES_out", "P_ES", "Net_Load", "Ene_Lvl"]:
+            Time_Series_Columns[Variable_Name] = pa.array(np.asarray(Time_Series[Variable_Name], dtype = np.float64))
+
+        Time_Series_Tables.append(pa.table(Time_Series_Columns))
+
+
+    ## Write Parquet Files
+
+    for Table_Name, Tables in [("Summary", [Summary_Table]), ("Time_Series", Time_Series_Tables)]:
+
+        Table_Directory = os.path.join(Results_Store_Directory, Table_Name)
+
+        os.makedirs(Table_Directory, exist_ok = True)
+
+        Temporary_File_Path = os.path.join(Table_Directory, "_" + Results_Store_File_Name)
+
+        # Each table written to the file is saved as a separate row group.
+        with pq.ParquetWriter(Temporary_File_Path, Tables[0].schema) as Results_Store_Writer:
+            for Table in Tables:
+                Results_Store_Writer.write_table(Table)
+
+        os.replace(Temporary_File_Path, os.path.join(Table_Directory, Results_Store_File_Name))